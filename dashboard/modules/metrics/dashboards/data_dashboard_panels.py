@@ -258,6 +258,20 @@ DATA_GRAFANA_PANELS = [
         fill=0,
         stack=False,
     ),
+    Panel(
+        id=38,
+        title="Output Blocks Generated by Tasks by Size",
+        description="Number of output blocks generated by tasks, by byte size. The bucket is the inclusive upper bound of the block sizes in bytes.",
+        unit="blocks",
+        targets=[
+            Target(
+                expr="sum(ray_data_block_size_histogram{{{global_filters}}}) by (dataset, operator, bucket)",
+                legend="Blocks of at most {{bucket}} bytes: {{dataset}}, {{operator}}",
+            )
+        ],
+        fill=0,
+        stack=False,
+    ),
     Panel(
         id=25,
         title="Output Blocks Taken by Downstream Operators",
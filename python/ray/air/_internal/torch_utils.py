@@ -1,4 +1,6 @@
+import collections
 import os
+import threading
 import warnings
 from typing import Any, Dict, List, Optional, Union
 
@@ -254,6 +256,155 @@ def convert_ndarray_batch_to_torch_tensor_batch(
     return batch
 
 
+class TorchTensorBatchBuffers:
+    """A ring of reusable CPU tensors that NumPy batches are collated into.
+
+    Each slot of the ring holds one tensor per column. ``convert`` copies the
+    batch into the tensors of a free slot, growing them only when a batch has
+    more rows than any previous batch of the slot, or a different dtype or row
+    shape. So in the steady state, collating a batch doesn't allocate memory.
+
+    A slot is in use until the batch is passed to ``release``. If all the slots
+    are in use, for example because a slow thread holds up the batches collated
+    after it, ``convert`` copies the batch into new tensors instead, so a batch
+    that's still in use is never overwritten.
+    """
+
+    def __init__(
+        self,
+        num_slots: int,
+        dtypes: Optional[Union[torch.dtype, Dict[str, torch.dtype]]] = None,
+        pin_memory: bool = False,
+    ):
+        """
+        Args:
+            num_slots: The number of batches that can be in use at the same time.
+            dtypes: A (dict of) Torch dtype(s) for the tensors; if None, the dtype
+                will be inferred from the NumPy ndarray data.
+            pin_memory: Whether to allocate the tensors in page-locked memory, which
+                speeds up copying them to GPUs.
+        """
+        self._dtypes = dtypes
+        self._pin_memory = pin_memory
+        self._slots: List[Dict[Optional[str], torch.Tensor]] = [
+            {} for _ in range(num_slots)
+        ]
+        self._free_slots = collections.deque(range(num_slots))
+        # The slots in use, by the data pointer of the first tensor of their batch.
+        self._slots_in_use: Dict[int, int] = {}
+        # Batches can be collated concurrently by a threadpool.
+        self._lock = threading.Lock()
+
+    def convert(
+        self, ndarrays: Union[np.ndarray, Dict[str, np.ndarray]]
+    ) -> Union[torch.Tensor, Dict[str, torch.Tensor]]:
+        """Copy a NumPy ndarray batch into a free slot of tensors.
+
+        Args:
+            ndarrays: A (dict of) NumPy ndarray(s) to copy.
+
+        Returns: A (dict of) Torch Tensor(s) that are views of the slot's tensors,
+            or new tensors if no slot is free.
+        """
+        first_ndarray = (
+            ndarrays
+            if isinstance(ndarrays, np.ndarray)
+            else next(iter(ndarrays.values()), None)
+        )
+        slot_index = None
+        # Empty batches don't use a slot, since empty tensors may not have distinct
+        # data pointers.
+        if first_ndarray is not None and len(first_ndarray) > 0:
+            with self._lock:
+                if self._free_slots:
+                    slot_index = self._free_slots.popleft()
+        if slot_index is None:
+            return convert_ndarray_batch_to_torch_tensor_batch(
+                ndarrays, dtypes=self._dtypes
+            )
+        slot = self._slots[slot_index]
+
+        dtypes = self._dtypes
+        if isinstance(ndarrays, np.ndarray):
+            # Single-tensor case.
+            if isinstance(dtypes, dict):
+                if len(dtypes) != 1:
+                    raise ValueError(
+                        "When constructing a single-tensor batch, only a single dtype "
+                        f"should be given, instead got: {dtypes}"
+                    )
+                dtypes = next(iter(dtypes.values()))
+            batch = self._copy_into_slot(slot, None, ndarrays, dtypes)
+        else:
+            # Multi-tensor case.
+            batch = {
+                col_name: self._copy_into_slot(
+                    slot,
+                    col_name,
+                    col_ndarray,
+                    dtypes[col_name] if isinstance(dtypes, dict) else dtypes,
+                )
+                for col_name, col_ndarray in ndarrays.items()
+            }
+
+        with self._lock:
+            self._slots_in_use[_first_tensor(batch).data_ptr()] = slot_index
+        return batch
+
+    def release(self, batch: Union[torch.Tensor, Dict[str, torch.Tensor]]):
+        """Free the slot of a batch returned by ``convert`` to be reused.
+
+        Batches that don't use a slot, such as those copied to another device, are
+        ignored.
+
+        Args:
+            batch: A (dict of) Torch Tensor(s) returned by ``convert``.
+        """
+        tensor = _first_tensor(batch)
+        if tensor is None:
+            return
+        with self._lock:
+            slot_index = self._slots_in_use.pop(tensor.data_ptr(), None)
+            if slot_index is not None:
+                self._free_slots.append(slot_index)
+
+    def _copy_into_slot(
+        self,
+        slot: Dict[Optional[str], torch.Tensor],
+        col_name: Optional[str],
+        ndarray: np.ndarray,
+        dtype: Optional[torch.dtype],
+    ) -> torch.Tensor:
+        # Wrap the ndarray without copying it. This raises for ndarrays that can't be
+        # converted to tensors, such as ragged tensors.
+        source = convert_ndarray_to_torch_tensor(ndarray)
+        if dtype is None:
+            dtype = source.dtype
+        num_rows = source.shape[0]
+        buffer = slot.get(col_name)
+        if (
+            buffer is None
+            or buffer.dtype != dtype
+            or buffer.shape[1:] != source.shape[1:]
+            or buffer.shape[0] < num_rows
+        ):
+            buffer = torch.empty(
+                (num_rows,) + tuple(source.shape[1:]),
+                dtype=dtype,
+                pin_memory=self._pin_memory,
+            )
+            slot[col_name] = buffer
+        return buffer[:num_rows].copy_(source)
+
+
+def _first_tensor(
+    batch: Union[torch.Tensor, Dict[str, torch.Tensor]],
+) -> Optional[torch.Tensor]:
+    if isinstance(batch, torch.Tensor):
+        return batch
+    return next(iter(batch.values()), None)
+
+
 def load_torch_model(
     saved_model: Union[torch.nn.Module, Dict],
     model_definition: Optional[torch.nn.Module] = None,
@@ -410,7 +410,7 @@ class ArrowTensorArray(_ArrowTensorScalarIndexingMixin, pa.ExtensionArray):
 
         # Offset buffer.
         offset_buffer = pa.py_buffer(
-            cls.OFFSET_DTYPE([i * num_items_per_element for i in range(outer_len + 1)])
+            (np.arange(outer_len + 1) * num_items_per_element).astype(cls.OFFSET_DTYPE)
         )
 
         storage = pa.Array.from_buffers(
@@ -841,19 +841,26 @@ class ArrowVariableShapedTensorArray(
         """
         # TODO(Clark): Enforce zero_copy_only.
         # TODO(Clark): Support strides?
+        data = self.storage.field("data")
+        shapes = self.storage.field("shape")
+        value_type = data.type.value_type
+        data_buffer = data.buffers()[3]
         if index is None:
-            # Get individual ndarrays for each tensor element.
-            arrs = [self._to_numpy(i, zero_copy_only) for i in range(len(self))]
+            # Get individual ndarrays for each tensor element, viewing the data
+            # buffer. The shapes and offsets are converted in bulk, rather than
+            # per element.
+            arrs = [
+                _to_ndarray_helper(shape, value_type, offset, data_buffer)
+                for shape, offset in zip(
+                    shapes.to_pylist(), data.offsets.to_numpy()[: len(self)]
+                )
+            ]
             # Return ragged NumPy ndarray in the ndarray of ndarray pointers
             # representation.
             return create_ragged_ndarray(arrs)
-        data = self.storage.field("data")
-        shapes = self.storage.field("shape")
 
         shape = shapes[index].as_py()
-        value_type = data.type.value_type
         offset = data.offsets[index].as_py()
-        data_buffer = data.buffers()[3]
         return _to_ndarray_helper(shape, value_type, offset, data_buffer)
 
     def to_numpy(self, zero_copy_only: bool = True):
@@ -1,3 +1,5 @@
+import numpy as np
+
 try:
     import pyarrow
 except ImportError:
@@ -36,3 +38,42 @@ def _concatenate_extension_column(ca: "pyarrow.ChunkedArray") -> "pyarrow.Array"
         storage = pyarrow.concat_arrays([c.storage for c in ca.chunks])
 
     return ca.type.__arrow_ext_class__().from_storage(ca.type, storage)
+
+
+def _to_numpy_extension_column(
+    ca: "pyarrow.ChunkedArray", zero_copy_batch: bool = False
+) -> "np.ndarray":
+    """Convert an extension column to an ndarray, copying tensor data only when
+    needed.
+
+    A single chunk of tensors is viewed in place. If ``zero_copy_batch`` is False,
+    the view is copied if the chunk's buffers aren't writable, e.g. when they're in
+    the object store, so that the ndarray is always writable. Multiple chunks of
+    fixed-shape tensors are copied once into a single ndarray.
+    """
+    from ray.air.util.tensor_extensions.arrow import (
+        ArrowTensorType,
+        ArrowVariableShapedTensorType,
+    )
+    from ray.air.util.tensor_extensions.utils import create_ragged_ndarray
+
+    chunks = [chunk for chunk in ca.chunks if len(chunk) > 0]
+    if not chunks or not isinstance(
+        ca.type, (ArrowTensorType, ArrowVariableShapedTensorType)
+    ):
+        return _concatenate_extension_column(ca).to_numpy(zero_copy_only=False)
+
+    def ensure_writable(ndarray: np.ndarray) -> np.ndarray:
+        if zero_copy_batch or ndarray.flags.writeable:
+            return ndarray
+        return ndarray.copy()
+
+    if isinstance(ca.type, ArrowTensorType):
+        if len(chunks) > 1:
+            return np.concatenate([chunk.to_numpy() for chunk in chunks])
+        return ensure_writable(chunks[0].to_numpy(zero_copy_only=False))
+
+    # Variable-shaped tensors are viewed per element.
+    return create_ragged_ndarray(
+        [ensure_writable(element) for chunk in chunks for element in chunk.to_numpy()]
+    )
@@ -1,5 +1,7 @@
 import math
-from typing import TYPE_CHECKING, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+import numpy as np
 
 from ray.data._internal.null_aggregate import (
     _null_wrap_accumulate_block,
@@ -359,3 +361,312 @@ class Quantile(_AggregateOnKeyBase):
             finalize=_null_wrap_finalize(percentile),
             name=(self._rs_name),
         )
+
+
+class ApproxDistinct(_AggregateOnKeyBase):
+    """Defines approximate distinct count aggregation.
+
+    Uses the HyperLogLog sketch, whose accumulator is a fixed-size array of
+    ``2**precision`` registers, so that distinct values can be counted without
+    shuffling them. The relative standard error of the count is about
+    ``1.04 / sqrt(2**precision)``, i.e. about 1.6% with the default precision.
+    See https://en.wikipedia.org/wiki/HyperLogLog
+    """
+
+    def __init__(
+        self,
+        on: Optional[str] = None,
+        precision: int = 12,
+        ignore_nulls: bool = True,
+        alias_name: Optional[str] = None,
+    ):
+        if not 4 <= precision <= 18:
+            raise ValueError(f"precision must be between 4 and 18, got {precision}.")
+        self._set_key_fn(on)
+        if alias_name:
+            self._rs_name = alias_name
+        else:
+            self._rs_name = f"approx_distinct({str(on)})"
+
+        null_merge = _null_wrap_merge(
+            ignore_nulls, lambda a1, a2: np.maximum(a1, a2).tolist()
+        )
+
+        def vectorized_registers(block: Block) -> AggType:
+            values = _get_non_null_values(block, on, ignore_nulls)
+            if values is None:
+                return None
+            return _hll_registers(values, precision).tolist()
+
+        super().__init__(
+            init=_null_wrap_init(lambda k: [0]),
+            merge=null_merge,
+            accumulate_block=_null_wrap_accumulate_block(
+                ignore_nulls,
+                vectorized_registers,
+                null_merge,
+            ),
+            finalize=_null_wrap_finalize(_hll_estimate),
+            name=(self._rs_name),
+        )
+
+
+class ApproxQuantile(_AggregateOnKeyBase):
+    """Defines approximate quantile aggregation.
+
+    Uses the t-digest sketch, whose accumulator clusters the values into at most
+    about ``compression`` centroids, so that quantiles can be estimated without
+    gathering all values of each group, unlike :class:`Quantile`. The clusters are
+    smaller near the tails of the distribution, so extreme quantiles like the
+    99th percentile are more accurate than the median. See
+    https://github.com/tdunning/t-digest/blob/main/docs/t-digest-paper/histo.pdf
+
+    Args:
+        on: The numeric column to aggregate.
+        q: The quantile, or a list of quantiles, between 0 and 1. For example,
+            ``0.99`` for the 99th percentile. If a list is given, the result is the
+            list of the estimated quantiles.
+        compression: The accuracy of the sketch. Higher values use more centroids.
+        ignore_nulls: Whether to ignore null values.
+        alias_name: The name of the output column.
+    """
+
+    def __init__(
+        self,
+        on: Optional[str] = None,
+        q: Union[float, List[float]] = 0.5,
+        compression: int = 200,
+        ignore_nulls: bool = True,
+        alias_name: Optional[str] = None,
+    ):
+        quantiles = q if isinstance(q, list) else [q]
+        if any(not 0 <= quantile <= 1 for quantile in quantiles):
+            raise ValueError(f"q must be between 0 and 1, got {q}.")
+        self._set_key_fn(on)
+        if alias_name:
+            self._rs_name = alias_name
+        else:
+            self._rs_name = f"approx_quantile({str(on)})"
+
+        def merge(a: List[float], b: List[float]):
+            return _tdigest_merge([a, b], compression)
+
+        null_merge = _null_wrap_merge(ignore_nulls, merge)
+
+        def vectorized_digest(block: Block) -> AggType:
+            values = _get_non_null_values(block, on, ignore_nulls)
+            if values is None:
+                return None
+            values = values.astype(np.float64)
+            return _tdigest_compress(
+                values.min(), values.max(), values, np.ones(len(values)), compression
+            )
+
+        def finalize(a: List[float]):
+            estimates = [_tdigest_quantile(a, quantile) for quantile in quantiles]
+            return estimates if isinstance(q, list) else estimates[0]
+
+        super().__init__(
+            init=_null_wrap_init(lambda k: [0]),
+            merge=null_merge,
+            accumulate_block=_null_wrap_accumulate_block(
+                ignore_nulls,
+                vectorized_digest,
+                null_merge,
+            ),
+            finalize=_null_wrap_finalize(finalize),
+            name=(self._rs_name),
+        )
+
+
+class ApproxTopK(_AggregateOnKeyBase):
+    """Defines approximate top-k aggregation of the most frequent values.
+
+    Uses the Misra-Gries summary, whose accumulator counts at most ``capacity``
+    values, so that heavy hitters can be found without shuffling all values. The
+    counts are lower bounds, which are off by at most ``N / (capacity + 1)`` for
+    ``N`` non-null values, and any value that occurs more often than that is
+    guaranteed to be counted. Null values aren't counted.
+    See https://en.wikipedia.org/wiki/Misra%E2%80%93Gries_summary
+
+    The result is a list of ``{"value": value, "count": count}`` dicts, ordered by
+    descending count.
+    """
+
+    def __init__(
+        self,
+        on: Optional[str] = None,
+        k: int = 10,
+        capacity: Optional[int] = None,
+        alias_name: Optional[str] = None,
+    ):
+        if capacity is None:
+            capacity = max(10 * k, 100)
+        if k <= 0 or capacity < k:
+            raise ValueError(
+                "k must be positive and capacity must be at least k, got "
+                f"k={k} and capacity={capacity}."
+            )
+        self._set_key_fn(on)
+        if alias_name:
+            self._rs_name = alias_name
+        else:
+            self._rs_name = f"approx_top_k({str(on)})"
+
+        def merge(a: Dict[str, list], b: Dict[str, list]):
+            counts = dict(zip(a["values"], a["counts"]))
+            for value, count in zip(b["values"], b["counts"]):
+                counts[value] = counts.get(value, 0) + count
+            return _misra_gries_reduce(counts, capacity)
+
+        def accumulate_block(a: Dict[str, list], block: Block):
+            values = _get_non_null_values(block, on, ignore_nulls=True)
+            if values is None:
+                return a
+            unique_values, counts = np.unique(values, return_counts=True)
+            block_counts = dict(zip(unique_values.tolist(), counts.tolist()))
+            return merge(a, _misra_gries_reduce(block_counts, capacity))
+
+        def finalize(a: Dict[str, list]):
+            top_k = sorted(zip(a["values"], a["counts"]), key=lambda vc: -vc[1])[:k]
+            return [{"value": value, "count": count} for value, count in top_k]
+
+        super().__init__(
+            init=lambda k: {"values": [], "counts": []},
+            merge=merge,
+            accumulate_block=accumulate_block,
+            finalize=finalize,
+            name=(self._rs_name),
+        )
+
+
+def _get_non_null_values(
+    block: Block, on: str, ignore_nulls: bool
+) -> Optional[np.ndarray]:
+    """Return the non-null values of a column of a block.
+
+    Returns None if the column is empty or all null, or if it has nulls and
+    ``ignore_nulls`` is False.
+    """
+    import pyarrow.compute as pac
+
+    block_acc = BlockAccessor.for_block(block)
+    if block_acc.num_rows() == 0:
+        return None
+    column = BlockAccessor.for_block(block_acc.select([on])).to_arrow()[on]
+    if column.null_count > 0:
+        if not ignore_nulls or column.null_count == len(column):
+            return None
+        column = pac.drop_null(column)
+    return column.to_numpy()
+
+
+def _hll_registers(values: np.ndarray, precision: int) -> np.ndarray:
+    """Return the HyperLogLog registers of the given values."""
+    import pandas as pd
+
+    hashes = pd.util.hash_array(values)
+    # The first `precision` bits of the hash select the register, and the register
+    # keeps the maximum position of the first 1 bit in the remaining bits.
+    num_rank_bits = 64 - precision
+    indices = (hashes >> np.uint64(num_rank_bits)).astype(np.int64)
+    rank_bits = hashes & np.uint64((1 << num_rank_bits) - 1)
+    ranks = num_rank_bits + 1 - _bit_length(rank_bits)
+    registers = np.zeros(1 << precision, dtype=np.int64)
+    np.maximum.at(registers, indices, ranks)
+    return registers
+
+
+def _bit_length(x: np.ndarray) -> np.ndarray:
+    """Return the bit length of each of the given unsigned 64-bit integers."""
+    # Split the integers into halves, which float64 represents exactly.
+    high = (x >> np.uint64(32)).astype(np.float64)
+    low = (x & np.uint64(0xFFFFFFFF)).astype(np.float64)
+    return np.where(high > 0, 32 + np.frexp(high)[1], np.frexp(low)[1])
+
+
+def _hll_estimate(registers: List[int]) -> int:
+    """Estimate the number of distinct values from the HyperLogLog registers."""
+    registers = np.asarray(registers, dtype=np.float64)
+    m = len(registers)
+    alpha = 0.7213 / (1 + 1.079 / m)
+    estimate = alpha * m * m / np.sum(np.exp2(-registers))
+    num_zeros = np.count_nonzero(registers == 0)
+    if estimate <= 2.5 * m and num_zeros > 0:
+        # Use linear counting for small cardinalities.
+        estimate = m * math.log(m / num_zeros)
+    return int(round(estimate))
+
+
+def _tdigest_merge(digests: List[List[float]], compression: int) -> List[float]:
+    """Merge t-digests, and compress the result to about ``compression`` centroids.
+
+    Each digest is a flat list of ``[min, max, mean_1, weight_1, mean_2, ...]``.
+    """
+    centroids = np.concatenate(
+        [np.asarray(digest[2:], dtype=np.float64).reshape(-1, 2) for digest in digests]
+    )
+    return _tdigest_compress(
+        min(digest[0] for digest in digests),
+        max(digest[1] for digest in digests),
+        centroids[:, 0],
+        centroids[:, 1],
+        compression,
+    )
+
+
+def _tdigest_compress(
+    min_: float,
+    max_: float,
+    means: np.ndarray,
+    weights: np.ndarray,
+    compression: int,
+) -> List[float]:
+    """Cluster weighted values into a t-digest of about ``compression`` centroids."""
+    order = np.argsort(means, kind="stable")
+    means, weights = means[order], weights[order]
+
+    # Group the values by the integer part of the k1 scale function at their left
+    # edge, so that each group spans at most one unit of the scale. The scale
+    # function is steeper near the tails, which keeps the centroids there small.
+    left_quantiles = (np.cumsum(weights) - weights) / weights.sum()
+    k = compression / (2 * math.pi) * np.arcsin(2 * left_quantiles - 1)
+    groups = np.floor(k - k[0]).astype(np.int64)
+    starts = np.flatnonzero(np.diff(groups, prepend=-1))
+    group_weights = np.add.reduceat(weights, starts)
+    group_means = np.add.reduceat(means * weights, starts) / group_weights
+
+    digest = [float(min_), float(max_)]
+    digest.extend(np.column_stack([group_means, group_weights]).ravel().tolist())
+    return digest
+
+
+def _tdigest_quantile(digest: List[float], q: float) -> float:
+    """Estimate a quantile from a t-digest."""
+    min_, max_ = digest[0], digest[1]
+    centroids = np.asarray(digest[2:], dtype=np.float64).reshape(-1, 2)
+    means, weights = centroids[:, 0], centroids[:, 1]
+    total_weight = weights.sum()
+    # Interpolate between the centers of the centroids, and the min and max values.
+    centers = np.cumsum(weights) - weights / 2
+    xs = np.concatenate([[0], centers, [total_weight]])
+    ys = np.concatenate([[min_], means, [max_]])
+    return float(np.interp(q * total_weight, xs, ys))
+
+
+def _misra_gries_reduce(counts: Dict[Any, int], capacity: int) -> Dict[str, list]:
+    """Reduce value counts to a Misra-Gries summary of at most ``capacity`` values.
+
+    If there are more values, the count of the ``capacity + 1``-th most frequent
+    value is subtracted from all counts, and the values with non-positive counts
+    are dropped.
+    """
+    values = list(counts.keys())
+    value_counts = np.fromiter(counts.values(), dtype=np.int64, count=len(counts))
+    if len(values) > capacity:
+        order = np.argsort(-value_counts, kind="stable")
+        value_counts = value_counts - value_counts[order[capacity]]
+        kept = [i for i in order[:capacity] if value_counts[i] > 0]
+        values = [values[i] for i in kept]
+        value_counts = value_counts[kept]
+    return {"values": values, "counts": value_counts.tolist()}
@@ -263,10 +263,20 @@ class ArrowBlockAccessor(TableBlockAccessor):
 
     def to_numpy(
         self, columns: Optional[Union[str, List[str]]] = None
+    ) -> Union[np.ndarray, Dict[str, np.ndarray]]:
+        return self._to_numpy(columns)
+
+    def _to_numpy_zero_copy(self) -> Dict[str, np.ndarray]:
+        return self._to_numpy(None, zero_copy_batch=True)
+
+    def _to_numpy(
+        self,
+        columns: Optional[Union[str, List[str]]],
+        zero_copy_batch: bool = False,
     ) -> Union[np.ndarray, Dict[str, np.ndarray]]:
         from ray.air.util.transform_pyarrow import (
-            _concatenate_extension_column,
             _is_column_extension_type,
+            _to_numpy_extension_column,
         )
 
         if columns is None:
@@ -289,7 +299,10 @@ class ArrowBlockAccessor(TableBlockAccessor):
         for column in columns:
             array = self._table[column]
             if _is_column_extension_type(array):
-                array = _concatenate_extension_column(array)
+                arrays.append(
+                    _to_numpy_extension_column(array, zero_copy_batch=zero_copy_batch)
+                )
+                continue
             elif array.num_chunks == 0:
                 array = pyarrow.array([], type=array.type)
             else:
@@ -357,6 +370,26 @@ class ArrowBlockAccessor(TableBlockAccessor):
             )
         return self._table.select(columns)
 
+    def filter(self, predicate: "pyarrow.dataset.Expression") -> "pyarrow.Table":
+        """Select the rows of the underlying table that satisfy ``predicate``."""
+        import pyarrow.dataset as pds
+
+        return pds.dataset(self._table).to_table(filter=predicate)
+
+    def add_column(
+        self, name: str, expr: "pyarrow.dataset.Expression"
+    ) -> "pyarrow.Table":
+        """Add or overwrite the column ``name`` with the values of ``expr``.
+
+        The other columns are passed through without copying them.
+        """
+        import pyarrow.compute as pac
+        import pyarrow.dataset as pds
+
+        columns = {col: pac.field(col) for col in self._table.column_names}
+        columns[name] = expr
+        return pds.dataset(self._table).to_table(columns=columns)
+
     def _sample(self, n_samples: int, sort_key: "SortKey") -> "pyarrow.Table":
         indices = random.sample(range(self._table.num_rows), n_samples)
         table = self._table.select(sort_key.get_columns())
@@ -1,4 +1,6 @@
-from typing import Optional
+from typing import List, Optional
+
+import numpy as np
 
 from ray.data._internal.arrow_block import ArrowBlockAccessor
 from ray.data._internal.arrow_ops import transform_pyarrow
@@ -169,20 +171,25 @@ class ShufflingBatcher(BatcherInterface):
 
     # Implementation Note:
     #
-    # This shuffling batcher lazily builds a shuffle buffer from added blocks, and once
-    # a batch is requested via .next_batch(), it concatenates the blocks into a concrete
-    # shuffle buffer and randomly shuffles the entire buffer.
+    # The shuffle buffer is a list of blocks (chunks) rather than one concatenated
+    # block. Once a batch is requested via .next_batch(), the buffer is "built": a
+    # random permutation of the indices of its live (not yet yielded) rows is drawn.
+    # Batches are then sliced from a "window" of rows, which is built by taking the
+    # next indices of the permutation from the chunks they fall in, and putting the
+    # taken rows back in the order of the permutation. So neither the buffer nor its
+    # chunks are concatenated or copied as a whole: a window only copies its rows.
     #
-    # Adding of more blocks can be intermixed with retrieving batches, but it should be
-    # noted that we can end up performing two expensive operations on each retrieval:
-    #  1. Build added blocks into a concrete shuffle buffer.
-    #  2. Shuffling the entire buffer.
-    # To amortize the overhead of this process, we only shuffle the blocks after a
-    # delay designated by SHUFFLE_BUFFER_COMPACTION_RATIO.
+    # Adding of more blocks can be intermixed with retrieving batches. Added blocks
+    # are appended to a list of pending chunks, and only join the shuffle buffer
+    # when the buffer is rebuilt. To amortize the cost of drawing a new permutation,
+    # we only rebuild the buffer after a delay designated by
+    # SHUFFLE_BUFFER_COMPACTION_RATIO. For the same reason, a window spans all the
+    # rows that can be yielded before the buffer would be rebuilt.
     #
-    # Similarly, adding blocks is very cheap. Each added block will be appended to a
-    # list, with concatenation of the underlying data delayed until the next batch
-    # compaction.
+    # When the buffer is rebuilt, its chunks are kept as long as most of their rows
+    # are still live. Otherwise, the live rows are compacted into a single chunk, so
+    # that yielded rows are released. Because a compaction copies at most as many
+    # rows as were yielded since the last one, it adds at most one copy per row.
 
     def __init__(
         self,
@@ -206,18 +213,26 @@ class ShufflingBatcher(BatcherInterface):
         if batch_size is None:
             raise ValueError("Must specify a batch_size if using a local shuffle.")
         self._batch_size = batch_size
-        self._shuffle_seed = shuffle_seed
+        self._rng = np.random.default_rng(shuffle_seed)
         if shuffle_buffer_min_size < batch_size:
             # Round it up internally to `batch_size` since our algorithm requires it.
             # This is harmless since it only offers extra randomization.
             shuffle_buffer_min_size = batch_size
-        self._buffer_capacity = max(
-            2 * shuffle_buffer_min_size,
-            shuffle_buffer_min_size + batch_size,
-        )
         self._buffer_min_size = shuffle_buffer_min_size
-        self._builder = DelegatingBlockBuilder()
-        self._shuffle_buffer: Block = None
+        # Blocks added since the shuffle buffer was last built.
+        self._pending_blocks: List[Block] = []
+        self._num_pending_rows = 0
+        # The chunks of the shuffle buffer, and the offsets of their first rows,
+        # followed by the total number of rows.
+        self._shuffle_buffer: List[Block] = []
+        self._chunk_offsets = np.zeros(1, dtype=np.int64)
+        # The random order of the live rows of the shuffle buffer that aren't in the
+        # window yet, starting at `self._permutation_head`.
+        self._permutation = np.zeros(0, dtype=np.int64)
+        self._permutation_head = 0
+        # The shuffled rows that batches are currently sliced from.
+        self._window: Optional[Block] = None
+        self._window_size = 0
         self._batch_head = 0
         self._done_adding = False
 
@@ -229,8 +244,10 @@ class ShufflingBatcher(BatcherInterface):
         Args:
             block: Block to add to the shuffle buffer.
         """
-        if BlockAccessor.for_block(block).num_rows() > 0:
-            self._builder.add_block(block)
+        num_rows = BlockAccessor.for_block(block).num_rows()
+        if num_rows > 0:
+            self._pending_blocks.append(_combine_chunks_if_needed(block))
+            self._num_pending_rows += num_rows
 
     def done_adding(self) -> bool:
         """Indicate to the batcher that no more blocks will be added to the batcher.
@@ -259,20 +276,15 @@ class ShufflingBatcher(BatcherInterface):
 
     def _buffer_size(self) -> int:
         """Return shuffle buffer size."""
-        buffer_size = self._builder.num_rows()
-        buffer_size += self._materialized_buffer_size()
-        return buffer_size
+        return self._num_pending_rows + self._materialized_buffer_size()
 
     def _materialized_buffer_size(self) -> int:
-        """Return materialized (compacted portion of) shuffle buffer size."""
-        if self._shuffle_buffer is None:
-            return 0
-        # The size of the concrete (materialized) shuffle buffer, adjusting
-        # for the batch head position, which also serves as a counter of the number
-        # of already-yielded rows from the current concrete shuffle buffer.
-        return max(
-            0,
-            BlockAccessor.for_block(self._shuffle_buffer).num_rows() - self._batch_head,
+        """Return the number of rows of the built shuffle buffer not yielded yet."""
+        return (
+            len(self._permutation)
+            - self._permutation_head
+            + self._window_size
+            - self._batch_head
         )
 
     def next_batch(self) -> Block:
@@ -282,51 +294,107 @@ class ShufflingBatcher(BatcherInterface):
             A batch represented as a Block.
         """
         assert self.has_batch() or (self._done_adding and self.has_any())
-        # Add rows in the builder to the shuffle buffer. Note that we delay compaction
-        # as much as possible to amortize the concatenation overhead. Compaction is
-        # only necessary when the materialized buffer size falls below the min size.
-        if self._builder.num_rows() > 0 and (
+        # Add the pending rows to the shuffle buffer. Note that we delay this as
+        # much as possible to amortize the overhead. It's only necessary when the
+        # materialized buffer size falls below the min size.
+        if self._num_pending_rows > 0 and (
             self._done_adding
             or self._materialized_buffer_size() <= self._buffer_min_size
         ):
-            if self._shuffle_buffer is not None:
-                if self._batch_head > 0:
-                    # Compact the materialized shuffle buffer.
-                    block = BlockAccessor.for_block(self._shuffle_buffer)
-                    self._shuffle_buffer = block.slice(
-                        self._batch_head, block.num_rows()
-                    )
-                # Add the unyielded rows from the existing shuffle buffer.
-                self._builder.add_block(self._shuffle_buffer)
-            # Build the new shuffle buffer.
-            self._shuffle_buffer = self._builder.build()
-            self._shuffle_buffer = BlockAccessor.for_block(
-                self._shuffle_buffer
-            ).random_shuffle(self._shuffle_seed)
-            if self._shuffle_seed is not None:
-                self._shuffle_seed += 1
-            if (
-                isinstance(
-                    BlockAccessor.for_block(self._shuffle_buffer), ArrowBlockAccessor
-                )
-                and self._shuffle_buffer.num_columns > 0
-                and self._shuffle_buffer.column(0).num_chunks
-                >= MIN_NUM_CHUNKS_TO_TRIGGER_COMBINE_CHUNKS
-            ):
-                self._shuffle_buffer = transform_pyarrow.combine_chunks(
-                    self._shuffle_buffer
-                )
-            # Reset the builder.
-            self._builder = DelegatingBlockBuilder()
-            self._batch_head = 0
-
-        assert self._shuffle_buffer is not None
-        buffer_size = BlockAccessor.for_block(self._shuffle_buffer).num_rows()
-        # Truncate the batch to the buffer size, if necessary.
-        batch_size = min(self._batch_size, buffer_size)
+            self._build_shuffle_buffer()
+
+        if self._batch_head == self._window_size:
+            self._take_window()
+
+        # Truncate the batch to the window size, if necessary.
+        batch_size = min(self._batch_size, self._window_size - self._batch_head)
         slice_start = self._batch_head
         self._batch_head += batch_size
         # Yield the shuffled batch.
-        return BlockAccessor.for_block(self._shuffle_buffer).slice(
+        return BlockAccessor.for_block(self._window).slice(
             slice_start, self._batch_head
         )
+
+    def _build_shuffle_buffer(self):
+        """Add the pending blocks to the shuffle buffer and draw a new permutation."""
+        live_indices = self._permutation[self._permutation_head :]
+        num_released_rows = self._chunk_offsets[-1] - len(live_indices)
+        if num_released_rows >= len(live_indices):
+            # Most rows of the current chunks were yielded or moved to the window, so
+            # compact the live rows.
+            if len(live_indices) > 0:
+                compacted = _combine_chunks_if_needed(self._take(live_indices))
+                self._shuffle_buffer = [compacted]
+            else:
+                self._shuffle_buffer = []
+            live_indices = np.arange(len(live_indices), dtype=np.int64)
+
+        self._shuffle_buffer.extend(self._pending_blocks)
+        self._chunk_offsets = np.cumsum(
+            [0]
+            + [
+                BlockAccessor.for_block(chunk).num_rows()
+                for chunk in self._shuffle_buffer
+            ],
+            dtype=np.int64,
+        )
+        num_rows = self._chunk_offsets[-1]
+        new_indices = np.arange(
+            num_rows - self._num_pending_rows, num_rows, dtype=np.int64
+        )
+        self._permutation = np.concatenate([live_indices, new_indices])
+        self._rng.shuffle(self._permutation)
+        self._permutation_head = 0
+        self._pending_blocks = []
+        self._num_pending_rows = 0
+
+    def _take_window(self):
+        """Take the next window of shuffled rows from the shuffle buffer."""
+        num_rows = len(self._permutation) - self._permutation_head
+        if not self._done_adding:
+            # Take the rows that can be yielded before the buffer is rebuilt, rounded
+            # up to whole batches.
+            num_batches = -(-(num_rows - self._buffer_min_size) // self._batch_size)
+            num_rows = min(num_rows, max(num_batches, 1) * self._batch_size)
+        start = self._permutation_head
+        self._permutation_head += num_rows
+        self._window = self._take(self._permutation[start : self._permutation_head])
+        self._window_size = num_rows
+        self._batch_head = 0
+
+    def _take(self, indices: np.ndarray) -> Block:
+        """Take the rows at ``indices`` of the shuffle buffer, in order."""
+        if len(self._shuffle_buffer) == 1:
+            return BlockAccessor.for_block(self._shuffle_buffer[0]).take(indices)
+
+        # Group the indices by the chunk they fall in, and take them from each chunk
+        # separately, since a take over all the chunks would concatenate them.
+        chunk_ids = np.searchsorted(self._chunk_offsets, indices, side="right") - 1
+        order = np.argsort(chunk_ids, kind="stable")
+        chunk_bounds = np.searchsorted(
+            chunk_ids[order], np.arange(len(self._shuffle_buffer) + 1)
+        )
+        builder = DelegatingBlockBuilder()
+        for i, chunk in enumerate(self._shuffle_buffer):
+            start, end = chunk_bounds[i], chunk_bounds[i + 1]
+            if start < end:
+                chunk_indices = indices[order[start:end]] - self._chunk_offsets[i]
+                builder.add_block(BlockAccessor.for_block(chunk).take(chunk_indices))
+        grouped = _combine_chunks_if_needed(builder.build())
+
+        # Put the taken rows back in the order of ``indices``.
+        inverse_order = np.empty_like(order)
+        inverse_order[order] = np.arange(len(order))
+        return BlockAccessor.for_block(grouped).take(inverse_order)
+
+
+def _combine_chunks_if_needed(block: Block) -> Block:
+    """Combine the chunks of an Arrow block, because taking rows from a table with
+    many chunks concatenates them on every call."""
+    if (
+        isinstance(BlockAccessor.for_block(block), ArrowBlockAccessor)
+        and block.num_columns > 0
+        and block.column(0).num_chunks >= MIN_NUM_CHUNKS_TO_TRIGGER_COMBINE_CHUNKS
+    ):
+        return transform_pyarrow.combine_chunks(block)
+    return block
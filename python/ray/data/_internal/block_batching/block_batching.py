@@ -24,6 +24,7 @@ def batch_blocks(
     shuffle_buffer_min_size: Optional[int] = None,
     shuffle_seed: Optional[int] = None,
     ensure_copy: bool = False,
+    zero_copy_batch: bool = False,
 ) -> Iterator[DataBatch]:
     """Create formatted batches of data from 1 or more blocks.
 
@@ -44,6 +45,7 @@ def batch_blocks(
             ),
             batch_format=batch_format,
             stats=stats,
+            zero_copy_batch=zero_copy_batch,
         )
 
         if collate_fn is not None:
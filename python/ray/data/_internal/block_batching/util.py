@@ -145,6 +145,7 @@ def format_batches(
     block_iter: Iterator[Batch],
     batch_format: Optional[str],
     stats: Optional[DatasetStats] = None,
+    zero_copy_batch: bool = False,
 ) -> Iterator[Batch]:
     """Given an iterator of blocks, returns an iterator of formatted batches.
 
@@ -152,15 +153,19 @@ def format_batches(
         block_iter: An iterator over blocks.
         batch_format: The batch format to use.
         stats: An optional stats object to record formatting times.
+        zero_copy_batch: Whether NumPy batches can be read-only views of the
+            blocks, because they aren't mutated.
 
     Returns:
         An iterator over batch index and the formatted batch.
     """
     for batch in block_iter:
         with stats.iter_format_batch_s.timer() if stats else nullcontext():
-            formatted_batch = BlockAccessor.for_block(batch.data).to_batch_format(
-                batch_format
-            )
+            accessor = BlockAccessor.for_block(batch.data)
+            if zero_copy_batch and batch_format == "numpy":
+                formatted_batch = accessor._to_numpy_zero_copy()
+            else:
+                formatted_batch = accessor.to_batch_format(batch_format)
         yield Batch(batch.batch_idx, formatted_batch)
 
 
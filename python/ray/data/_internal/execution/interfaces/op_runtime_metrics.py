@@ -1,3 +1,4 @@
+import bisect
 import time
 from dataclasses import dataclass, field, fields
 from typing import TYPE_CHECKING, Any, Dict, Optional
@@ -11,6 +12,22 @@ if TYPE_CHECKING:
         PhysicalOperator,
     )
 
+# Upper bounds (inclusive) in bytes of the buckets of the output block size
+# histogram. Blocks larger than the last bound go into an overflow bucket.
+BLOCK_SIZE_HISTOGRAM_BOUNDARIES = [
+    1024**1,  # 1 KiB
+    1024**2,  # 1 MiB
+    8 * 1024**2,
+    32 * 1024**2,
+    64 * 1024**2,
+    128 * 1024**2,
+    256 * 1024**2,
+    512 * 1024**2,
+    1024**3,  # 1 GiB
+]
+
+_BLOCK_SIZE_HISTOGRAM_UPPER_BOUNDS = BLOCK_SIZE_HISTOGRAM_BOUNDARIES + [float("inf")]
+
 
 @dataclass
 class RunningTaskInfo:
@@ -35,6 +52,9 @@ class OpRuntimeMetrics:
     - metrics_group (required): The group of the metric, used to organize metrics
         into groups in StatsActor and on the Ray Data dashboard.
     - map_only (optional): Whether the metric is only measured for MapOperators.
+    - histogram_buckets (optional): The inclusive upper bounds of the buckets, if
+        the metric is a histogram. Histograms are dicts from the upper bound of
+        each bucket to its count, and are exported with a "bucket" tag.
     """
 
     # TODO(hchen): Fields tagged with "map_only" currently only work for MapOperator.
@@ -111,6 +131,15 @@ class OpRuntimeMetrics:
             "map_only": True,
         },
     )
+    block_size_histogram: Dict[float, int] = field(
+        default_factory=dict,
+        metadata={
+            "description": "Number of output blocks generated by tasks, by byte size.",
+            "metrics_group": "outputs",
+            "map_only": True,
+            "histogram_buckets": _BLOCK_SIZE_HISTOGRAM_UPPER_BOUNDS,
+        },
+    )
     num_outputs_taken: int = field(
         default=0,
         metadata={
@@ -284,6 +313,9 @@ class OpRuntimeMetrics:
         self._is_map = isinstance(op, MapOperator)
         self._running_tasks: Dict[int, RunningTaskInfo] = {}
         self._extra_metrics: Dict[str, Any] = {}
+        self.block_size_histogram = {
+            upper_bound: 0 for upper_bound in _BLOCK_SIZE_HISTOGRAM_UPPER_BOUNDS
+        }
         # Start time of current pause due to task submission backpressure
         self._task_submission_backpressure_start_time = -1
 
@@ -299,6 +331,9 @@ class OpRuntimeMetrics:
             if not self._is_map and f.metadata.get("map_only", False):
                 continue
             value = getattr(self, f.name)
+            if isinstance(value, dict):
+                # Don't expose the histograms that are still being updated.
+                value = dict(value)
             result.append((f.name, value))
 
         # TODO: record resource usage in OpRuntimeMetrics,
@@ -487,6 +522,12 @@ class OpRuntimeMetrics:
             self.block_generation_time += meta.exec_stats.wall_time_s
             assert meta.num_rows is not None
             self.rows_task_outputs_generated += meta.num_rows
+            if meta.size_bytes is not None:
+                bucket = bisect.bisect_left(
+                    BLOCK_SIZE_HISTOGRAM_BOUNDARIES, meta.size_bytes
+                )
+                upper_bound = _BLOCK_SIZE_HISTOGRAM_UPPER_BOUNDS[bucket]
+                self.block_size_histogram[upper_bound] += 1
             trace_allocation(block_ref, "operator_output")
 
     def on_task_finished(self, task_index: int, exception: Optional[Exception]):
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
 
 from ray.data._internal.progress_bar import ProgressBar
 
@@ -39,3 +39,11 @@ class TaskContext:
 
     # The target maximum number of bytes to include in the task's output block.
     target_max_block_size: Optional[int] = None
+
+    # The input files of the read tasks run by this task, if the read is followed
+    # by a write with a checkpoint. See `WriteCheckpointRule`.
+    read_input_files: Optional[List[str]] = None
+
+    # Called with the path of each file that a write task is about to write, if the
+    # write has a checkpoint. See `WriteCheckpoint`.
+    on_write_file: Optional[Callable[[str], None]] = None
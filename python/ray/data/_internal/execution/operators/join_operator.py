@@ -0,0 +1,83 @@
+from typing import Callable, List, Optional, Tuple
+
+from ray.data._internal.execution.interfaces import (
+    PhysicalOperator,
+    RefBundle,
+    TaskContext,
+)
+from ray.data._internal.execution.operators.base_physical_operator import (
+    AllToAllOperator,
+)
+from ray.data._internal.stats import StatsDict
+
+# Bulk join function. The inputs are the left and right input ref bundles, and the
+# outputs are the output ref bundles and a stats dict.
+JoinTransformFn = Callable[
+    [List[RefBundle], List[RefBundle], TaskContext],
+    Tuple[List[RefBundle], StatsDict],
+]
+
+
+class JoinOperator(AllToAllOperator):
+    """A blocking operator that joins its two inputs once they are complete.
+
+    This reuses the AllToAllOperator machinery (e.g., sub progress bars for the
+    shuffle stages), but buffers the left and right inputs separately.
+    """
+
+    def __init__(
+        self,
+        bulk_fn: JoinTransformFn,
+        left_input_op: PhysicalOperator,
+        right_input_op: PhysicalOperator,
+        num_outputs: Optional[int] = None,
+        sub_progress_bar_names: Optional[List[str]] = None,
+    ):
+        """Create a JoinOperator.
+
+        Args:
+            bulk_fn: The blocking join function to run.
+            left_input_op: The input operator at left hand side.
+            right_input_op: The input operator at right hand side.
+            num_outputs: The number of expected output bundles for progress bar.
+            sub_progress_bar_names: The names of internal sub progress bars.
+        """
+        super().__init__(
+            bulk_fn,
+            left_input_op,
+            target_max_block_size=None,
+            num_outputs=num_outputs,
+            sub_progress_bar_names=sub_progress_bar_names,
+            name="Join",
+        )
+        self._input_dependencies.append(right_input_op)
+        right_input_op._output_dependencies.append(self)
+        self._right_input_buffer: List[RefBundle] = []
+
+    def _add_input_inner(self, refs: RefBundle, input_index: int) -> None:
+        assert not self.completed()
+        assert input_index == 0 or input_index == 1, input_index
+        if input_index == 0:
+            self._input_buffer.append(refs)
+        else:
+            self._right_input_buffer.append(refs)
+
+    def all_inputs_done(self) -> None:
+        ctx = TaskContext(
+            task_idx=self._next_task_index,
+            sub_progress_bar_dict=self._sub_progress_bar_dict,
+            target_max_block_size=self.actual_target_max_block_size,
+        )
+        self._output_buffer, self._stats = self._bulk_fn(
+            self._input_buffer, self._right_input_buffer, ctx
+        )
+        # Whether the join is broadcast can be decided at runtime, so only now is
+        # the number of outputs known.
+        self._num_outputs = len(self._output_buffer)
+        self._next_task_index += 1
+        self._input_buffer.clear()
+        self._right_input_buffer.clear()
+        PhysicalOperator.all_inputs_done(self)
+
+    def supports_fusion(self):
+        return False
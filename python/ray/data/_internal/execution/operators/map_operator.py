@@ -1,6 +1,7 @@
 import copy
 import functools
 import itertools
+import logging
 from abc import ABC, abstractmethod
 from collections import defaultdict, deque
 from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Set, Union
@@ -33,10 +34,13 @@ from ray.data._internal.execution.operators.map_transformer import (
     MapTransformer,
 )
 from ray.data._internal.stats import StatsDict
+from ray.data._internal.task_profiler import TaskProfiler
 from ray.data.block import Block, BlockAccessor, BlockExecStats, BlockMetadata
 from ray.data.context import DataContext
 from ray.util.scheduling_strategies import NodeAffinitySchedulingStrategy
 
+logger = logging.getLogger(__name__)
+
 
 class MapOperator(OneToOneOperator, ABC):
     """A streaming operator that maps input bundles 1:1 to output bundles.
@@ -97,6 +101,12 @@ class MapOperator(OneToOneOperator, ABC):
     def set_additional_split_factor(self, k: int):
         self._additional_split_factor = k
 
+    def get_block_ref_bundler(self) -> "_BlockRefBundler":
+        return self._block_ref_bundler
+
+    def set_block_ref_bundler(self, bundler: "_BlockRefBundler"):
+        self._block_ref_bundler = bundler
+
     @property
     def name(self) -> str:
         name = super().name
@@ -233,9 +243,9 @@ class MapOperator(OneToOneOperator, ABC):
         # Add RefBundle to the bundler.
         self._block_ref_bundler.add_bundle(refs)
         self._metrics.on_input_queued(refs)
-        if self._block_ref_bundler.has_bundle():
+        while self._block_ref_bundler.has_bundle():
             # If the bundler has a full bundle, add it to the operator's task submission
-            # queue.
+            # queue. It can have several, if its target bundle size shrank.
             bundle = self._block_ref_bundler.get_next_bundle()
             self._metrics.on_input_dequeued(bundle)
             self._add_bundled_input(bundle)
@@ -303,11 +313,21 @@ class MapOperator(OneToOneOperator, ABC):
         task_index = self._next_data_task_idx
         self._next_data_task_idx += 1
         self._metrics.on_task_submitted(task_index, inputs)
+        # The size of the outputs of the task, and the time taken to generate them.
+        task_output_bytes = 0
+        task_time_s = 0.0
 
         def _output_ready_callback(task_index, output: RefBundle):
+            nonlocal task_output_bytes, task_time_s
             # Since output is streamed, it should only contain one block.
             assert len(output) == 1
             self._metrics.on_task_output_generated(task_index, output)
+            task_output_bytes += output.size_bytes()
+            task_time_s += sum(
+                meta.exec_stats.wall_time_s
+                for _, meta in output.blocks
+                if meta.exec_stats is not None
+            )
 
             # Notify output queue that the task has produced an new output.
             self._output_queue.notify_task_output_ready(task_index, output)
@@ -315,6 +335,10 @@ class MapOperator(OneToOneOperator, ABC):
 
         def _task_done_callback(task_index: int, exception: Optional[Exception]):
             self._metrics.on_task_finished(task_index, exception)
+            if exception is None:
+                self._block_ref_bundler.on_task_finished(
+                    inputs, task_output_bytes, task_time_s
+                )
 
             # Estimate number of tasks from inputs received and tasks submitted so far
             estimated_num_tasks = (
@@ -362,7 +386,7 @@ class MapOperator(OneToOneOperator, ABC):
 
     def all_inputs_done(self):
         self._block_ref_bundler.done_adding_bundles()
-        if self._block_ref_bundler.has_bundle():
+        while self._block_ref_bundler.has_bundle():
             # Handle any leftover bundles in the bundler.
             bundle = self._block_ref_bundler.get_next_bundle()
             self._add_bundled_input(bundle)
@@ -433,17 +457,29 @@ def _map_task(
         as the last generator return.
     """
     DataContext._set_current(data_context)
-    stats = BlockExecStats.builder()
-    map_transformer.set_target_max_block_size(ctx.target_max_block_size)
-    for b_out in map_transformer.apply_transform(iter(blocks), ctx):
-        # TODO(Clark): Add input file propagation from input blocks.
-        m_out = BlockAccessor.for_block(b_out).get_metadata()
-        m_out.exec_stats = stats.build()
-        m_out.exec_stats.udf_time_s = map_transformer.udf_time()
-        m_out.exec_stats.task_idx = ctx.task_idx
-        yield b_out
-        yield m_out
+    profiler = None
+    if data_context.enable_task_profiling:
+        profiler = TaskProfiler(data_context.task_profiling_interval_s)
+        profiler.start()
+    try:
         stats = BlockExecStats.builder()
+        map_transformer.set_target_max_block_size(ctx.target_max_block_size)
+        for b_out in map_transformer.apply_transform(iter(blocks), ctx):
+            # TODO(Clark): Add input file propagation from input blocks.
+            m_out = BlockAccessor.for_block(b_out).get_metadata()
+            m_out.exec_stats = stats.build()
+            m_out.exec_stats.udf_time_s = map_transformer.udf_time()
+            m_out.exec_stats.task_idx = ctx.task_idx
+            yield b_out
+            if profiler is not None:
+                # Collect the profile after yielding the block, so that it covers
+                # storing the block in the object store.
+                m_out.exec_stats.profile = profiler.collect()
+            yield m_out
+            stats = BlockExecStats.builder()
+    finally:
+        if profiler is not None:
+            profiler.stop()
 
 
 class _BlockRefBundler:
@@ -518,11 +554,111 @@ class _BlockRefBundler:
         """Indicate that no more RefBundles will be added to this bundler."""
         self._finalized = True
 
+    def on_task_finished(
+        self, inputs: RefBundle, output_size_bytes: int, task_time_s: float
+    ):
+        """Called when a task of a bundle from this bundler finishes.
+
+        Args:
+            inputs: The bundle that the task processed.
+            output_size_bytes: The total size of the outputs of the task.
+            task_time_s: The time the task took to generate its outputs.
+        """
+        pass
+
     @staticmethod
     def _get_bundle_size(bundle: RefBundle):
         return bundle.num_rows() if bundle.num_rows() is not None else float("inf")
 
 
+class _AdaptiveReadTaskBundler(_BlockRefBundler):
+    """Bundles read tasks into map tasks sized from the observed read throughput.
+
+    Read tasks are sent one at a time until ``num_warmup_tasks`` tasks finish.
+    From then on, they're bundled up to the estimated in-memory size that tasks
+    read in ``target_task_duration_s``, based on the total size and time of the
+    finished tasks. Bundles are capped so that the outputs of each task are at most
+    ``max_task_output_bytes``, given the observed ratio of output size to estimated
+    size, and at most ``max_bundle_size_bytes`` of estimated size.
+    """
+
+    def __init__(
+        self,
+        target_task_duration_s: float,
+        max_task_output_bytes: int,
+        max_bundle_size_bytes: Optional[int] = None,
+        num_warmup_tasks: int = 4,
+    ):
+        super().__init__(min_rows_per_bundle=None)
+        self._target_task_duration_s = target_task_duration_s
+        self._max_task_output_bytes = max_task_output_bytes
+        self._max_bundle_size_bytes = max_bundle_size_bytes
+        self._num_warmup_tasks = num_warmup_tasks
+        # The totals of the finished tasks.
+        self._num_finished_tasks = 0
+        self._finished_input_bytes = 0
+        self._finished_output_bytes = 0
+        self._finished_time_s = 0.0
+        # The estimated size to bundle read tasks up to, or None before warmup.
+        self._target_bundle_size_bytes: Optional[float] = None
+
+    def has_bundle(self) -> bool:
+        return bool(self._bundle_buffer) and (
+            self._target_bundle_size_bytes is None
+            or self._bundle_buffer_size >= self._target_bundle_size_bytes
+            or self._finalized
+        )
+
+    def get_next_bundle(self) -> RefBundle:
+        assert self.has_bundle()
+        output_buffer = []
+        output_buffer_size = 0
+        while self._bundle_buffer:
+            bundle_size = self._get_bundle_size(self._bundle_buffer[0])
+            if output_buffer and (
+                self._target_bundle_size_bytes is None
+                or output_buffer_size + bundle_size > self._target_bundle_size_bytes
+            ):
+                break
+            output_buffer.append(self._bundle_buffer.pop(0))
+            output_buffer_size += bundle_size
+        self._bundle_buffer_size -= output_buffer_size
+        return _merge_ref_bundles(*output_buffer)
+
+    def on_task_finished(
+        self, inputs: RefBundle, output_size_bytes: int, task_time_s: float
+    ):
+        self._num_finished_tasks += 1
+        self._finished_input_bytes += inputs.size_bytes()
+        self._finished_output_bytes += output_size_bytes
+        self._finished_time_s += task_time_s
+        if (
+            self._num_finished_tasks < self._num_warmup_tasks
+            or self._finished_time_s <= 0
+            or self._finished_input_bytes <= 0
+        ):
+            return
+
+        throughput = self._finished_input_bytes / self._finished_time_s
+        target_size = throughput * self._target_task_duration_s
+        if self._finished_output_bytes > 0:
+            expansion = self._finished_output_bytes / self._finished_input_bytes
+            target_size = min(target_size, self._max_task_output_bytes / expansion)
+        if self._max_bundle_size_bytes is not None:
+            target_size = min(target_size, self._max_bundle_size_bytes)
+        if self._target_bundle_size_bytes is None:
+            logger.debug(
+                f"Bundling read tasks up to {target_size} bytes, based on a "
+                f"throughput of {throughput} bytes/s over "
+                f"{self._num_finished_tasks} tasks."
+            )
+        self._target_bundle_size_bytes = target_size
+
+    @staticmethod
+    def _get_bundle_size(bundle: RefBundle):
+        return bundle.size_bytes()
+
+
 def _merge_ref_bundles(*bundles: RefBundle) -> RefBundle:
     """Merge N ref bundles into a single bundle of multiple blocks."""
     # Check that at least one bundle is non-null.
@@ -294,6 +294,7 @@ class BlocksToBatchesMapTransformFn(MapTransformFn):
         self._batch_size = batch_size
         self._batch_format = batch_format
         self._ensure_copy = not zero_copy_batch and batch_size is not None
+        self._zero_copy_batch = zero_copy_batch
         super().__init__(
             MapTransformFnDataType.Block,
             MapTransformFnDataType.Batch,
@@ -321,6 +322,7 @@ class BlocksToBatchesMapTransformFn(MapTransformFn):
             batch_size=self._batch_size,
             batch_format=self._batch_format,
             ensure_copy=self._ensure_copy,
+            zero_copy_batch=self._zero_copy_batch,
         )
 
         first = next(formatted_batch_iter, None)
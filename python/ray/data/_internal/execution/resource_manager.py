@@ -69,7 +69,16 @@ class ResourceManager:
                 op.implements_accurate_memory_accounting() for op in topology
             )
             if should_enable:
-                self._op_resource_allocator = ReservationOpResourceAllocator(
+                if ctx.op_resource_allocator == "reservation":
+                    allocator_cls = ReservationOpResourceAllocator
+                elif ctx.op_resource_allocator == "throughput":
+                    allocator_cls = ThroughputOpResourceAllocator
+                else:
+                    raise ValueError(
+                        "DataContext.op_resource_allocator must be 'reservation' or "
+                        f"'throughput', got {ctx.op_resource_allocator!r}."
+                    )
+                self._op_resource_allocator = allocator_cls(
                     self, ctx.op_resource_reservation_ratio
                 )
 
@@ -532,6 +541,24 @@ class ReservationOpResourceAllocator(OpResourceAllocator):
             else:
                 yield from self._get_downstream_eligible_ops(next_op)
 
+    def _get_op_shared(
+        self,
+        op: PhysicalOperator,
+        remaining_shared: ExecutionResources,
+        remaining_ops: List[PhysicalOperator],
+    ) -> ExecutionResources:
+        """Return the portion of the remaining shared resources to allocate to the
+        given operator.
+
+        Args:
+            op: The operator to allocate shared resources to.
+            remaining_shared: The shared resources that haven't been allocated yet.
+            remaining_ops: The operators that haven't been allocated shared
+                resources yet, including `op`.
+        """
+        # Divide the remaining shared resources equally.
+        return remaining_shared.scale(1.0 / len(remaining_ops))
+
     def update_usages(self):
         self._update_reservation()
 
@@ -570,9 +597,9 @@ class ReservationOpResourceAllocator(OpResourceAllocator):
         remaining_shared = remaining_shared.max(ExecutionResources.zero())
 
         # Allocate the remaining shared resources to each operator.
-        for i, op in enumerate(reversed(eligible_ops)):
-            # By default, divide the remaining shared resources equally.
-            op_shared = remaining_shared.scale(1.0 / (len(eligible_ops) - i))
+        remaining_ops = list(reversed(eligible_ops))
+        for i, op in enumerate(remaining_ops):
+            op_shared = self._get_op_shared(op, remaining_shared, remaining_ops[i:])
             # But if the op's budget is less than `incremental_resource_usage`,
             # it will be useless. So we'll let the downstream operator
             # borrow some resources from the upstream operator, if remaining_shared
@@ -597,3 +624,173 @@ class ReservationOpResourceAllocator(OpResourceAllocator):
             # We don't limit GPU resources, as not all operators
             # use GPU resources.
             self._op_budgets[op].gpu = float("inf")
+
+
+class ThroughputOpResourceAllocator(ReservationOpResourceAllocator):
+    """An OpResourceAllocator that divides the shared resources by measured throughput.
+
+    Resources are reserved for each operator in the same way as
+    `ReservationOpResourceAllocator`. But instead of dividing the shared resources
+    equally, they are divided in proportion to what each operator needs to keep up
+    with the rest of the pipeline, based on the `OpRuntimeMetrics` observed so far:
+
+    1. All quantities are normalized to one byte of pipeline input. The number of
+       bytes an operator receives per byte of pipeline input is the product of the
+       output/input byte ratios of its upstream operators.
+    2. The CPU (GPU) weight of an operator is the CPU (GPU) time its tasks spend per
+       byte of pipeline input. Dividing processor slots in proportion to these
+       weights equalizes the throughputs of the operators, which maximizes the
+       throughput of the slowest one, i.e., the end-to-end throughput.
+    3. The object store memory weight of an operator is the number of bytes it
+       outputs per byte of pipeline input, so that operators that expand data get
+       more room to buffer their outputs.
+
+    Operators without measurements yet get the average weight, and every operator
+    gets at least `MIN_WEIGHT_FRACTION` of the average weight, so that no operator
+    is starved of the shared resources. The weights are recomputed on every
+    `update_usages` call. Use a lower `reservation_ratio` to let the allocator
+    rebalance a larger fraction of the resources.
+
+    To use this allocator, set `DataContext.op_resource_allocator` to
+    ``"throughput"``.
+    """
+
+    # The minimum weight of an operator, as a fraction of the average weight.
+    MIN_WEIGHT_FRACTION = 0.1
+
+    def __init__(self, resource_manager: ResourceManager, reservation_ratio: float):
+        super().__init__(resource_manager, reservation_ratio)
+        # Per-op weights of the shared CPU, GPU, and object store memory.
+        self._cpu_weights: Dict[PhysicalOperator, float] = {}
+        self._gpu_weights: Dict[PhysicalOperator, float] = {}
+        self._object_store_memory_weights: Dict[PhysicalOperator, float] = {}
+
+    @staticmethod
+    def _get_output_ratio(op: PhysicalOperator) -> Optional[float]:
+        """Return the ratio of output bytes to input bytes of the finished tasks of
+        the given operator, or None if it hasn't been measured yet."""
+        metrics = op.metrics
+        if metrics.bytes_task_inputs_processed <= 0:
+            return None
+        return (
+            metrics.bytes_outputs_of_finished_tasks
+            / metrics.bytes_task_inputs_processed
+        )
+
+    @staticmethod
+    def _get_time_per_output_byte(op: PhysicalOperator) -> Optional[float]:
+        """Return the task time spent per output byte of the given operator, or None
+        if it hasn't been measured yet."""
+        metrics = op.metrics
+        if metrics.bytes_task_outputs_generated <= 0:
+            return None
+        return metrics.block_generation_time / metrics.bytes_task_outputs_generated
+
+    def _get_input_ratios(self) -> Dict[PhysicalOperator, float]:
+        """Return the number of bytes that each operator receives per byte of
+        pipeline input."""
+        input_ratios: Dict[PhysicalOperator, float] = {}
+        # The topology is in topological order.
+        for op in self._resource_manager._topology:
+            if not op.input_dependencies:
+                input_ratios[op] = 1.0
+                continue
+            input_ratios[op] = sum(
+                input_ratios[dep] * (self._get_output_ratio(dep) or 1.0)
+                for dep in op.input_dependencies
+            )
+        return input_ratios
+
+    def _normalize_weights(
+        self, weights: Dict[PhysicalOperator, Optional[float]]
+    ) -> Dict[PhysicalOperator, float]:
+        """Fill in the missing weights with the average weight, and raise the weights
+        to at least `MIN_WEIGHT_FRACTION` of the average weight.
+
+        Zero weights are kept, as they mean that the operator doesn't use the
+        resource at all.
+        """
+        measured = [w for w in weights.values() if w is not None and w > 0]
+        if not measured:
+            return {op: 1.0 if w is None else w for op, w in weights.items()}
+        avg_weight = sum(measured) / len(measured)
+        min_weight = self.MIN_WEIGHT_FRACTION * avg_weight
+        return {
+            op: avg_weight if w is None else (max(w, min_weight) if w > 0 else 0.0)
+            for op, w in weights.items()
+        }
+
+    def _update_weights(self, eligible_ops: List[PhysicalOperator]):
+        input_ratios = self._get_input_ratios()
+        cpu_weights = {}
+        gpu_weights = {}
+        object_store_memory_weights = {}
+        for op in eligible_ops:
+            resources_per_task = op.incremental_resource_usage()
+            time_per_output_byte = self._get_time_per_output_byte(op)
+            output_ratio = self._get_output_ratio(op)
+            if output_ratio is None:
+                output_bytes = None
+            else:
+                # Output bytes per byte of pipeline input.
+                output_bytes = input_ratios[op] * output_ratio
+            if time_per_output_byte is None or output_bytes is None:
+                task_time = None
+            else:
+                # Task time per byte of pipeline input.
+                task_time = time_per_output_byte * output_bytes
+            cpu_weights[op] = (
+                0.0
+                if resources_per_task.cpu == 0
+                else None
+                if task_time is None
+                else task_time * resources_per_task.cpu
+            )
+            gpu_weights[op] = (
+                0.0
+                if resources_per_task.gpu == 0
+                else None
+                if task_time is None
+                else task_time * resources_per_task.gpu
+            )
+            object_store_memory_weights[op] = output_bytes
+        self._cpu_weights = self._normalize_weights(cpu_weights)
+        self._gpu_weights = self._normalize_weights(gpu_weights)
+        self._object_store_memory_weights = self._normalize_weights(
+            object_store_memory_weights
+        )
+
+    def _get_op_shared(
+        self,
+        op: PhysicalOperator,
+        remaining_shared: ExecutionResources,
+        remaining_ops: List[PhysicalOperator],
+    ) -> ExecutionResources:
+        fractions = []
+        for weights in [
+            self._cpu_weights,
+            self._gpu_weights,
+            self._object_store_memory_weights,
+        ]:
+            total_weight = sum(weights[next_op] for next_op in remaining_ops)
+            if total_weight > 0:
+                fractions.append(weights[op] / total_weight)
+            else:
+                fractions.append(1.0 / len(remaining_ops))
+        # Explicitly handle the zero case, because `0 * inf` is undefined.
+        cpu, gpu, object_store_memory = (
+            value * fraction if fraction > 0 else 0.0
+            for value, fraction in zip(
+                [
+                    remaining_shared.cpu,
+                    remaining_shared.gpu,
+                    remaining_shared.object_store_memory,
+                ],
+                fractions,
+            )
+        )
+        return ExecutionResources(cpu, gpu, object_store_memory)
+
+    def update_usages(self):
+        self._update_weights(self._get_eligible_ops())
+        super().update_usages()
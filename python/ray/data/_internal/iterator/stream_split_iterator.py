@@ -1,3 +1,4 @@
+import collections
 import copy
 import logging
 import threading
@@ -38,6 +39,7 @@ class StreamSplitDataIterator(DataIterator):
         n: int,
         equal: bool,
         locality_hints: Optional[List[NodeIdStr]],
+        prefetch_bytes: Optional[int] = None,
     ) -> List["StreamSplitDataIterator"]:
         """Create a split iterator from the given base Dataset and options.
 
@@ -52,7 +54,8 @@ class StreamSplitDataIterator(DataIterator):
         ).remote(base_dataset, n, equal, locality_hints)
 
         return [
-            StreamSplitDataIterator(base_dataset, coord_actor, i, n) for i in range(n)
+            StreamSplitDataIterator(base_dataset, coord_actor, i, n, prefetch_bytes)
+            for i in range(n)
         ]
 
     def __init__(
@@ -61,11 +64,13 @@ class StreamSplitDataIterator(DataIterator):
         coord_actor: ray.actor.ActorHandle,
         output_split_idx: int,
         world_size: int,
+        prefetch_bytes: Optional[int] = None,
     ):
         self._base_dataset = base_dataset
         self._coord_actor = coord_actor
         self._output_split_idx = output_split_idx
         self._world_size = world_size
+        self._prefetch_bytes = prefetch_bytes
         self._iter_stats = DatasetStats(metadata={}, parent=None)
 
     def _to_block_iterator(
@@ -79,6 +84,9 @@ class StreamSplitDataIterator(DataIterator):
             cur_epoch = ray.get(
                 self._coord_actor.start_epoch.remote(self._output_split_idx)
             )
+            if self._prefetch_bytes:
+                yield from self._gen_prefetched_blocks(cur_epoch)
+                return
             future: ObjectRef[
                 Optional[ObjectRef[Block]]
             ] = self._coord_actor.get.remote(cur_epoch, self._output_split_idx)
@@ -96,6 +104,72 @@ class StreamSplitDataIterator(DataIterator):
 
         return gen_blocks(), self._iter_stats, False
 
+    def _gen_prefetched_blocks(
+        self, epoch_id: int
+    ) -> Iterator[Tuple[ObjectRef[Block], BlockMetadata]]:
+        """Yield the blocks of this split, fetching upcoming blocks ahead of time.
+
+        A background thread gets the next block refs from the coordinator and pulls
+        the blocks to this node, while the caller consumes the previous blocks. The
+        thread stops fetching when the blocks that are fetched but not yet yielded
+        exceed ``self._prefetch_bytes``.
+        """
+        prefetched = collections.deque()
+        cv = threading.Condition()
+        # Guarded by `cv`.
+        state = {"bytes": 0, "done": False, "stopped": False, "error": None}
+
+        def has_budget() -> bool:
+            return state["stopped"] or state["bytes"] < self._prefetch_bytes
+
+        def prefetch():
+            try:
+                while True:
+                    with cv:
+                        cv.wait_for(has_budget)
+                        if state["stopped"]:
+                            return
+                    block_ref = ray.get(
+                        self._coord_actor.get.remote(epoch_id, self._output_split_idx)
+                    )
+                    if not block_ref:
+                        return
+                    # Blocks until the block is in this node's object store.
+                    ray.wait([block_ref[0]], fetch_local=True)
+                    with cv:
+                        prefetched.append(block_ref)
+                        state["bytes"] += block_ref[1].size_bytes or 0
+                        cv.notify_all()
+            except Exception as e:
+                with cv:
+                    state["error"] = e
+            finally:
+                with cv:
+                    state["done"] = True
+                    cv.notify_all()
+
+        thread = threading.Thread(
+            target=prefetch, name="StreamSplitPrefetcher", daemon=True
+        )
+        thread.start()
+        try:
+            while True:
+                with cv:
+                    cv.wait_for(lambda: prefetched or state["done"])
+                    if prefetched:
+                        block_ref = prefetched.popleft()
+                        state["bytes"] -= block_ref[1].size_bytes or 0
+                        cv.notify_all()
+                    elif state["error"] is not None:
+                        raise state["error"]
+                    else:
+                        return
+                yield block_ref
+        finally:
+            with cv:
+                state["stopped"] = True
+                cv.notify_all()
+
     def stats(self) -> str:
         """Implements DataIterator."""
         # Merge the locally recorded iter stats and the remotely recorded
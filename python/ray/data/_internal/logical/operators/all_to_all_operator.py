@@ -1,6 +1,9 @@
 from typing import Any, Dict, List, Optional
 
 from ray.data._internal.logical.interfaces import LogicalOperator
+from ray.data._internal.planner.exchange.hash_shuffle_task_spec import (
+    HashShuffleTaskSpec,
+)
 from ray.data._internal.planner.exchange.interfaces import ExchangeTaskSpec
 from ray.data._internal.planner.exchange.shuffle_task_spec import ShuffleTaskSpec
 from ray.data._internal.planner.exchange.sort_task_spec import SortKey, SortTaskSpec
@@ -89,8 +92,15 @@ class Repartition(AbstractAllToAll):
         input_op: LogicalOperator,
         num_outputs: int,
         shuffle: bool,
+        keys: Optional[List[str]] = None,
     ):
-        if shuffle:
+        if keys:
+            sub_progress_bar_names = [
+                HashShuffleTaskSpec.KEY_SAMPLE_SUB_PROGRESS_BAR_NAME,
+                ExchangeTaskSpec.MAP_SUB_PROGRESS_BAR_NAME,
+                ExchangeTaskSpec.REDUCE_SUB_PROGRESS_BAR_NAME,
+            ]
+        elif shuffle:
             sub_progress_bar_names = [
                 ExchangeTaskSpec.MAP_SUB_PROGRESS_BAR_NAME,
                 ExchangeTaskSpec.REDUCE_SUB_PROGRESS_BAR_NAME,
@@ -106,6 +116,7 @@ class Repartition(AbstractAllToAll):
             sub_progress_bar_names=sub_progress_bar_names,
         )
         self._shuffle = shuffle
+        self._keys = keys
 
 
 class Sort(AbstractAllToAll):
@@ -147,3 +158,5 @@ class Aggregate(AbstractAllToAll):
         )
         self._key = key
         self._aggs = aggs
+        # Whether the outputs must be sorted by key. See `HashAggregateRule`.
+        self._ordered = True
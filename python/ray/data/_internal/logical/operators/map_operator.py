@@ -1,14 +1,17 @@
 import inspect
 import logging
-from typing import Any, Callable, Dict, Iterable, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Union
 
 from ray.data._internal.compute import ComputeStrategy, TaskPoolStrategy
 from ray.data._internal.logical.interfaces import LogicalOperator
 from ray.data._internal.logical.operators.one_to_one_operator import AbstractOneToOne
-from ray.data.block import UserDefinedFunction
+from ray.data.block import Block, BlockAccessor, UserDefinedFunction
 from ray.data.context import DEFAULT_BATCH_SIZE
 from ray.data.preprocessor import Preprocessor
 
+if TYPE_CHECKING:
+    import pyarrow
+
 logger = logging.getLogger(__name__)
 
 
@@ -210,16 +213,24 @@ class MapRows(AbstractUDFMap):
 
 
 class Filter(AbstractUDFMap):
-    """Logical operator for filter."""
+    """Logical operator for filter.
+
+    Rows are filtered either with a user-defined predicate ``fn``, or with an Arrow
+    expression ``filter_expr``. Expressions are inspectable, so the optimizer can
+    push them down into datasources.
+    """
 
     def __init__(
         self,
         input_op: LogicalOperator,
-        fn: UserDefinedFunction,
+        fn: Optional[UserDefinedFunction] = None,
+        filter_expr: Optional["pyarrow.dataset.Expression"] = None,
         compute: Optional[Union[str, ComputeStrategy]] = None,
         ray_remote_args_fn: Optional[Callable[[], Dict[str, Any]]] = None,
         ray_remote_args: Optional[Dict[str, Any]] = None,
     ):
+        assert (fn is None) != (filter_expr is None), (fn, filter_expr)
+        self._filter_expr = filter_expr
         super().__init__(
             "Filter",
             input_op,
@@ -229,11 +240,131 @@ class Filter(AbstractUDFMap):
             ray_remote_args=ray_remote_args,
         )
 
+    def _get_operator_name(self, op_name: str, fn: UserDefinedFunction):
+        if self._filter_expr is not None:
+            return f"{op_name}({self._filter_expr})"
+        return super()._get_operator_name(op_name, fn)
+
     @property
     def can_modify_num_rows(self) -> bool:
         return True
 
 
+class Project(AbstractUDFMap):
+    """Logical operator for select_columns and drop_columns.
+
+    The projection is recorded as data rather than hidden in a UDF, so the
+    optimizer can push it down into datasources.
+    """
+
+    def __init__(
+        self,
+        input_op: LogicalOperator,
+        cols: List[str],
+        drop: bool = False,
+        compute: Optional[Union[str, ComputeStrategy]] = None,
+        ray_remote_args: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Args:
+            input_op: The operator preceding this operator in the plan DAG.
+            cols: The columns to keep or, if ``drop`` is set, to remove.
+            drop: Whether ``cols`` names the columns to remove rather than the
+                columns to keep.
+            compute: The compute strategy.
+            ray_remote_args: Args to provide to ray.remote.
+        """
+        super().__init__(
+            "Project",
+            input_op,
+            _make_project_fn(cols, drop),
+            compute=compute,
+            ray_remote_args=ray_remote_args,
+        )
+        self._cols = cols
+        self._drop = drop
+
+    def _get_operator_name(self, op_name: str, fn: UserDefinedFunction):
+        return op_name
+
+    @property
+    def can_modify_num_rows(self) -> bool:
+        return False
+
+    def output_columns(self, input_columns: List[str]) -> List[str]:
+        """Return the columns this operator outputs, given its input columns."""
+        if self._drop:
+            return [col for col in input_columns if col not in self._cols]
+        return list(self._cols)
+
+
+def _make_project_fn(cols: List[str], drop: bool) -> Callable[[Block], Block]:
+    def project(block: Block) -> Block:
+        accessor = BlockAccessor.for_block(block)
+        if not drop:
+            return accessor.select(columns=cols)
+        names = accessor.schema().names
+        missing = [col for col in cols if col not in names]
+        if missing:
+            raise KeyError(f"Columns {missing} not found in dataset columns {names}.")
+        return accessor.select(columns=[col for col in names if col not in cols])
+
+    return project
+
+
+class AddColumn(AbstractUDFMap):
+    """Logical operator for add_column with an Arrow expression.
+
+    The column values are computed from ``expr`` with vectorized Arrow kernels on
+    whole blocks, without converting them to pandas.
+    """
+
+    def __init__(
+        self,
+        input_op: LogicalOperator,
+        col: str,
+        expr: "pyarrow.dataset.Expression",
+        compute: Optional[Union[str, ComputeStrategy]] = None,
+        ray_remote_args: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Args:
+            input_op: The operator preceding this operator in the plan DAG.
+            col: The name of the column to add or overwrite.
+            expr: The Arrow expression that computes the column values.
+            compute: The compute strategy.
+            ray_remote_args: Args to provide to ray.remote.
+        """
+        super().__init__(
+            "AddColumn",
+            input_op,
+            _make_add_column_fn(col, expr),
+            compute=compute,
+            ray_remote_args=ray_remote_args,
+        )
+        self._col = col
+        self._expr = expr
+
+    def _get_operator_name(self, op_name: str, fn: UserDefinedFunction):
+        return f"{op_name}({self._col}={self._expr})"
+
+    @property
+    def can_modify_num_rows(self) -> bool:
+        return False
+
+
+def _make_add_column_fn(
+    col: str, expr: "pyarrow.dataset.Expression"
+) -> Callable[[Block], Block]:
+    def add_column(block: Block) -> Block:
+        from ray.data._internal.arrow_block import ArrowBlockAccessor
+
+        table = BlockAccessor.for_block(block).to_arrow()
+        return ArrowBlockAccessor(table).add_column(col, expr)
+
+    return add_column
+
+
 class FlatMap(AbstractUDFMap):
     """Logical operator for flat_map."""
 
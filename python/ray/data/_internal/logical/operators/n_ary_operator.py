@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 
 from ray.data._internal.logical.interfaces import LogicalOperator
 
@@ -58,3 +58,37 @@ class Union(NAry):
                 return None
             total_num_outputs += num_outputs
         return total_num_outputs
+
+
+class Join(NAry):
+    """Logical operator for join."""
+
+    def __init__(
+        self,
+        left_input_op: LogicalOperator,
+        right_input_op: LogicalOperator,
+        key: List[str],
+        how: str,
+        broadcast: Optional[bool] = None,
+        num_partitions: Optional[int] = None,
+        right_suffix: Optional[str] = None,
+    ):
+        """
+        Args:
+            left_input_op: The input operator at left hand side.
+            right_input_op: The input operator at right hand side.
+            key: The names of the columns to join on.
+            how: The type of join. One of "inner", "left", or "outer".
+            broadcast: Whether to broadcast the right hand side to every left
+                block instead of hash-partitioning both sides. If ``None``, it's
+                decided at execution time based on the size of the right side.
+            num_partitions: The number of hash partitions for a shuffle join.
+            right_suffix: The suffix to append to right columns with colliding
+                names.
+        """
+        super().__init__(left_input_op, right_input_op)
+        self._key = key
+        self._how = how
+        self._broadcast = broadcast
+        self._num_partitions = num_partitions
+        self._right_suffix = right_suffix
@@ -1,8 +1,11 @@
-from typing import Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 from ray.data._internal.logical.operators.map_operator import AbstractMap
 from ray.data.datasource.datasource import Datasource, Reader
 
+if TYPE_CHECKING:
+    from ray.data._internal.write_checkpoint import WriteCheckpoint
+
 
 class Read(AbstractMap):
     """Logical operator for read."""
@@ -29,6 +32,9 @@ class Read(AbstractMap):
         self._mem_size = mem_size
         self._concurrency = concurrency
         self._detected_parallelism = None
+        # The checkpoint of the write that consumes this read, if any. See
+        # `WriteCheckpointRule`.
+        self._write_checkpoint: Optional["WriteCheckpoint"] = None
 
     def set_detected_parallelism(self, parallelism: int):
         """
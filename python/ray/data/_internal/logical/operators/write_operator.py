@@ -1,10 +1,13 @@
-from typing import Any, Dict, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union
 
 from ray.data._internal.logical.interfaces import LogicalOperator
 from ray.data._internal.logical.operators.map_operator import AbstractMap
 from ray.data.datasource.datasink import Datasink
 from ray.data.datasource.datasource import Datasource
 
+if TYPE_CHECKING:
+    from ray.data._internal.write_checkpoint import WriteCheckpoint
+
 
 class Write(AbstractMap):
     """Logical operator for write."""
@@ -15,6 +18,7 @@ class Write(AbstractMap):
         datasink_or_legacy_datasource: Union[Datasink, Datasource],
         ray_remote_args: Optional[Dict[str, Any]] = None,
         concurrency: Optional[int] = None,
+        checkpoint: Optional["WriteCheckpoint"] = None,
         **write_args,
     ):
         if isinstance(datasink_or_legacy_datasource, Datasink):
@@ -33,3 +37,4 @@ class Write(AbstractMap):
         self._datasink_or_legacy_datasource = datasink_or_legacy_datasource
         self._write_args = write_args
         self._concurrency = concurrency
+        self._checkpoint = checkpoint
@@ -10,12 +10,18 @@ from ray.data._internal.logical.rules._user_provided_optimizer_rules import (
     add_user_provided_logical_rules,
     add_user_provided_physical_rules,
 )
+from ray.data._internal.logical.rules.hash_aggregate import HashAggregateRule
 from ray.data._internal.logical.rules.inherit_target_max_block_size import (
     InheritTargetMaxBlockSizeRule,
 )
 from ray.data._internal.logical.rules.operator_fusion import OperatorFusionRule
 from ray.data._internal.logical.rules.randomize_blocks import ReorderRandomizeBlocksRule
+from ray.data._internal.logical.rules.read_pushdown import ReadPushdownRule
 from ray.data._internal.logical.rules.set_read_parallelism import SetReadParallelismRule
+from ray.data._internal.logical.rules.write_checkpoint import (
+    WarnUnfusedWriteCheckpointRule,
+    WriteCheckpointRule,
+)
 from ray.data._internal.logical.rules.zero_copy_map_fusion import (
     EliminateBuildOutputBlocks,
 )
@@ -23,6 +29,9 @@ from ray.data._internal.planner.planner import Planner
 
 DEFAULT_LOGICAL_RULES = [
     ReorderRandomizeBlocksRule,
+    ReadPushdownRule,
+    HashAggregateRule,
+    WriteCheckpointRule,
 ]
 
 DEFAULT_PHYSICAL_RULES = [
@@ -30,6 +39,7 @@ DEFAULT_PHYSICAL_RULES = [
     SetReadParallelismRule,
     OperatorFusionRule,
     EliminateBuildOutputBlocks,
+    WarnUnfusedWriteCheckpointRule,
 ]
 
 
@@ -0,0 +1,53 @@
+import copy
+
+from ray.data._internal.logical.interfaces import LogicalOperator, LogicalPlan, Rule
+from ray.data._internal.logical.operators.all_to_all_operator import (
+    Aggregate,
+    RandomShuffle,
+    Repartition,
+    Sort,
+)
+
+
+class HashAggregateRule(Rule):
+    """Rule for using hash-based aggregation when the output order isn't observed.
+
+    A groupby `Aggregate` outputs its groups sorted by key, which requires sampling
+    the key boundaries. If the `Aggregate` is followed by an operator whose outputs
+    don't depend on the order of its inputs, such as `Sort`, `RandomShuffle`, or
+    another `Aggregate`, the `Aggregate` is marked as unordered, so that it's
+    planned as a hash-based aggregation instead.
+    """
+
+    def apply(self, plan: LogicalPlan) -> LogicalPlan:
+        return LogicalPlan(dag=self._apply(plan.dag))
+
+    def _apply(self, op: LogicalOperator) -> LogicalOperator:
+        """Rewrite the DAG rooted at `op` in post-order.
+
+        Operators are shallow-copied rather than modified in place, because the
+        same logical operators can be shared by the lineage of other datasets.
+        """
+        input_ops = [self._apply(input_op) for input_op in op.input_dependencies]
+        if self._ignores_input_order(op):
+            input_ops = [self._unordered(input_op) for input_op in input_ops]
+        if any(new is not old for new, old in zip(input_ops, op.input_dependencies)):
+            op = copy.copy(op)
+            op._input_dependencies = input_ops
+            for input_op in input_ops:
+                input_op._output_dependencies = [op]
+        return op
+
+    @staticmethod
+    def _ignores_input_order(op: LogicalOperator) -> bool:
+        if isinstance(op, (Sort, RandomShuffle, Aggregate)):
+            return True
+        return isinstance(op, Repartition) and op._shuffle
+
+    @staticmethod
+    def _unordered(op: LogicalOperator) -> LogicalOperator:
+        if not isinstance(op, Aggregate) or op._key is None or not op._ordered:
+            return op
+        op = copy.copy(op)
+        op._ordered = False
+        return op
@@ -185,8 +185,11 @@ class OperatorFusionRule(Rule):
             return False
 
         # Do not fuse Repartition operator if shuffle is disabled
-        # (i.e. using split shuffle).
-        if isinstance(down_logical_op, Repartition) and not down_logical_op._shuffle:
+        # (i.e. using split shuffle), or if it's by keys, which samples the keys of
+        # its input blocks before shuffling them.
+        if isinstance(down_logical_op, Repartition) and (
+            not down_logical_op._shuffle or down_logical_op._keys
+        ):
             return False
 
         if isinstance(down_logical_op, AbstractUDFMap) and isinstance(
@@ -325,6 +328,10 @@ class OperatorFusionRule(Rule):
             ray_remote_args=ray_remote_args,
             ray_remote_args_fn=ray_remote_args_fn,
         )
+        if min_rows_per_bundled_input is None:
+            # Keep the upstream bundler, which may bundle read tasks by their
+            # observed throughput.
+            op.set_block_ref_bundler(up_op.get_block_ref_bundler())
 
         # Build a map logical operator to be used as a reference for further fusion.
         # TODO(Scott): This is hacky, remove this once we push fusion to be purely based
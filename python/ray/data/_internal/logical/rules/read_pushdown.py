@@ -0,0 +1,158 @@
+import copy
+from typing import TYPE_CHECKING, List, Optional
+
+from ray.data._internal.compute import TaskPoolStrategy, get_compute
+from ray.data._internal.logical.interfaces import LogicalOperator, LogicalPlan, Rule
+from ray.data._internal.logical.operators.map_operator import (
+    AbstractUDFMap,
+    Filter,
+    Project,
+)
+from ray.data._internal.logical.operators.read_operator import Read
+from ray.data.datasource.datasource import Datasource
+
+if TYPE_CHECKING:
+    import pyarrow
+
+
+class ReadPushdownRule(Rule):
+    """Rule for pushing down projections and filter expressions into reads.
+
+    `Read -> Project` and `Read -> Filter` (with an Arrow filter expression) are
+    rewritten into a single `Read` whose datasource only reads the needed columns
+    and rows, if the datasource supports it. For example, `ParquetDatasource`
+    prunes columns and skips row groups while scanning files, so bytes that aren't
+    needed are never fetched or decoded.
+
+    Chains such as `Read -> Filter -> Project -> Filter` are absorbed into the
+    `Read` one operator at a time.
+    """
+
+    def apply(self, plan: LogicalPlan) -> LogicalPlan:
+        # The reads created by pushing down a projection, which no longer read all
+        # the columns of the files.
+        self._projected_reads: List[Read] = []
+        return LogicalPlan(dag=self._apply(plan.dag))
+
+    def _apply(self, op: LogicalOperator) -> LogicalOperator:
+        """Rewrite the DAG rooted at `op` in post-order.
+
+        Operators are shallow-copied rather than modified in place, because the
+        same logical operators can be shared by the lineage of other datasets.
+        """
+        input_ops = [self._apply(input_op) for input_op in op.input_dependencies]
+        if any(new is not old for new, old in zip(input_ops, op.input_dependencies)):
+            op = copy.copy(op)
+            op._input_dependencies = input_ops
+            for new, old in zip(input_ops, op.input_dependencies):
+                # Only rewire the copies. The original operators might still be
+                # referenced by the lineage of other datasets.
+                if new is not old:
+                    new._output_dependencies = [op]
+
+        if len(input_ops) != 1 or not isinstance(input_ops[0], Read):
+            return op
+        read_op = input_ops[0]
+        if not self._is_pushdown_candidate(op, read_op):
+            return op
+
+        datasource = read_op._datasource_or_legacy_reader
+        if isinstance(op, Project):
+            columns = self._get_projected_columns(op, read_op)
+            if columns is None or not datasource.supports_projection_pushdown():
+                return op
+            new_read_op = self._copy_read(read_op, datasource.apply_projection(columns))
+            # The datasource might not be able to preserve the column order (e.g.,
+            # if it appends columns after reading). Keep the projection to restore
+            # the order in that case. It's zero-copy.
+            output_columns = _get_names(new_read_op.schema())
+            if output_columns is not None and output_columns != columns:
+                op = copy.copy(op)
+                op._input_dependencies = [new_read_op]
+                new_read_op._output_dependencies = [op]
+                self._projected_reads.append(new_read_op)
+                return op
+            self._projected_reads.append(new_read_op)
+        else:
+            if not datasource.supports_predicate_pushdown():
+                return op
+            if any(read_op is r for r in self._projected_reads) and not (
+                _binds_to_schema(op._filter_expr, read_op.schema())
+            ):
+                # The datasource evaluates the filter against the files, so it
+                # could reference columns that were projected away. Leave the
+                # error to the filter itself.
+                return op
+            new_read_op = self._copy_read(
+                read_op, datasource.apply_predicate(op._filter_expr)
+            )
+
+        new_read_op._output_dependencies = list(op.output_dependencies)
+        return new_read_op
+
+    def _is_pushdown_candidate(self, op: LogicalOperator, read_op: Read) -> bool:
+        if isinstance(op, Filter):
+            if op._filter_expr is None:
+                return False
+        elif not isinstance(op, Project):
+            return False
+
+        # Don't drop the resources or concurrency the user asked for.
+        assert isinstance(op, AbstractUDFMap)
+        compute = get_compute(op._compute)
+        if not isinstance(compute, TaskPoolStrategy) or compute.size is not None:
+            return False
+        if op._ray_remote_args or op._ray_remote_args_fn is not None:
+            return False
+
+        # Legacy readers are opaque, so we can't push anything into them.
+        return isinstance(read_op._datasource_or_legacy_reader, Datasource)
+
+    def _get_projected_columns(self, op: Project, read_op: Read) -> Optional[List[str]]:
+        """Return the columns to read, or ``None`` if they can't be determined."""
+        input_columns = _get_names(read_op.schema())
+        if input_columns is None:
+            # Without a schema, we can't resolve dropped columns or validate the
+            # selected columns. Validation happens when the read tasks run.
+            if op._drop:
+                return None
+            columns = list(op._cols)
+        else:
+            if any(col not in input_columns for col in op._cols):
+                # Leave the error to the projection itself.
+                return None
+            columns = op.output_columns(input_columns)
+        if not columns:
+            return None
+        return columns
+
+    def _copy_read(self, read_op: Read, datasource: Datasource) -> Read:
+        new_read_op = copy.copy(read_op)
+        new_read_op._datasource = datasource
+        new_read_op._datasource_or_legacy_reader = datasource
+        new_read_op._input_dependencies = []
+        new_read_op._output_dependencies = []
+        return new_read_op
+
+
+def _binds_to_schema(expr: "pyarrow.dataset.Expression", schema) -> bool:
+    """Return whether the filter expression only references fields of the schema.
+
+    Arrow expressions don't expose the fields they reference, so the expression
+    is evaluated against an empty table instead. Returns ``False`` if the schema
+    is unknown.
+    """
+    import pyarrow as pa
+
+    if not isinstance(schema, pa.Schema):
+        return False
+    try:
+        schema.empty_table().filter(expr)
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+        return False
+    return True
+
+
+def _get_names(schema) -> Optional[List[str]]:
+    names = getattr(schema, "names", None)
+    return list(names) if names is not None else None
@@ -5,6 +5,10 @@ from typing import Optional, Tuple, Union
 from ray import available_resources as ray_available_resources
 from ray.data._internal.execution.interfaces import PhysicalOperator
 from ray.data._internal.execution.operators.input_data_buffer import InputDataBuffer
+from ray.data._internal.execution.operators.map_operator import (
+    MapOperator,
+    _AdaptiveReadTaskBundler,
+)
 from ray.data._internal.logical.interfaces import PhysicalPlan, Rule
 from ray.data._internal.logical.operators.read_operator import Read
 from ray.data._internal.util import _autodetect_parallelism
@@ -13,6 +17,13 @@ from ray.data.datasource.datasource import Datasource, Reader
 
 logger = logging.getLogger(__name__)
 
+# With adaptive read parallelism, the factor to split the data into finer read tasks
+# by, so that they can be bundled into evenly sized tasks.
+ADAPTIVE_READ_SPLIT_FACTOR = 4
+# With adaptive read parallelism, the maximum number of output blocks of the target
+# max block size that each read task is sized to produce.
+ADAPTIVE_READ_MAX_BLOCKS_PER_TASK = 8
+
 
 def compute_additional_split_factor(
     datasource_or_legacy_reader: Union[Datasource, Reader],
@@ -82,6 +93,10 @@ class SetReadParallelismRule(Rule):
     If the parallelism is lower than requested, this rule also sets a split
     factor to split the output blocks of the read task, so that the following
     operator will have the desired parallelism.
+
+    If ``DataContext.enable_adaptive_read_parallelism`` is set and the parallelism
+    isn't specified, the data is instead split into finer read tasks, which the
+    read operator bundles into tasks sized from their observed throughput.
     """
 
     def apply(self, plan: PhysicalPlan) -> PhysicalPlan:
@@ -93,7 +108,10 @@ class SetReadParallelismRule(Rule):
                 continue
             logical_op = plan.op_map[op]
             if isinstance(logical_op, Read):
-                self._apply(op, logical_op)
+                if logical_op._write_checkpoint is not None:
+                    self._apply_checkpointed(op, logical_op)
+                else:
+                    self._apply(op, logical_op)
             ops += op.input_dependencies
 
         return plan
@@ -118,6 +136,13 @@ class SetReadParallelismRule(Rule):
                 f"Using autodetected parallelism={detected_parallelism} "
                 f"for operator {logical_op.name} to satisfy {reason}."
             )
+        if (
+            DataContext.get_current().enable_adaptive_read_parallelism
+            and logical_op._parallelism == -1
+            and k is None
+        ):
+            self._apply_adaptive(op, logical_op, detected_parallelism)
+            return
         logical_op.set_detected_parallelism(detected_parallelism)
 
         if k is not None:
@@ -130,3 +155,53 @@ class SetReadParallelismRule(Rule):
             op.set_additional_split_factor(k)
 
         logger.debug(f"Estimated num output blocks {estimated_num_blocks}")
+
+    def _apply_checkpointed(self, op: PhysicalOperator, logical_op: Read):
+        """Use the read parallelism of the first execution of a checkpointed write.
+
+        The checkpoint records the input files of whole read tasks. If a resumed
+        write grouped the files differently, for example because the cluster has
+        fewer CPUs, the rows of files recorded with other files of a read task
+        would be written again.
+        """
+        checkpoint = logical_op._write_checkpoint
+        parallelism = checkpoint.read_parallelism()
+        if parallelism is None:
+            self._apply(op, logical_op)
+            checkpoint.record_read_parallelism(logical_op.get_detected_parallelism())
+        else:
+            logger.debug(
+                f"Using the parallelism={parallelism} of the checkpoint at "
+                f"{checkpoint.path} for operator {logical_op.name}."
+            )
+            logical_op.set_detected_parallelism(parallelism)
+
+    def _apply_adaptive(
+        self, op: PhysicalOperator, logical_op: Read, detected_parallelism: int
+    ):
+        assert isinstance(op, MapOperator), op
+        ctx = DataContext.get_current()
+        fine_parallelism = detected_parallelism * ADAPTIVE_READ_SPLIT_FACTOR
+        logical_op.set_detected_parallelism(fine_parallelism)
+
+        # Don't bundle read tasks into fewer tasks than there are CPU slots, so
+        # that the read can still use the whole cluster.
+        max_bundle_size_bytes = None
+        if logical_op._mem_size:
+            available_cpu_slots = max(ray_available_resources().get("CPU", 1), 1)
+            max_bundle_size_bytes = math.ceil(
+                logical_op._mem_size / available_cpu_slots
+            )
+        op.set_block_ref_bundler(
+            _AdaptiveReadTaskBundler(
+                target_task_duration_s=ctx.read_task_target_duration_s,
+                max_task_output_bytes=(
+                    op.actual_target_max_block_size * ADAPTIVE_READ_MAX_BLOCKS_PER_TASK
+                ),
+                max_bundle_size_bytes=max_bundle_size_bytes,
+            )
+        )
+        logger.debug(
+            f"Splitting operator {logical_op.name} into up to {fine_parallelism} "
+            "read tasks, which are bundled by their observed throughput."
+        )
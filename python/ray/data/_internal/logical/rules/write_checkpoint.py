@@ -0,0 +1,94 @@
+import copy
+import logging
+from typing import List, Optional
+
+from ray.data._internal.execution.operators.input_data_buffer import InputDataBuffer
+from ray.data._internal.logical.interfaces import (
+    LogicalOperator,
+    LogicalPlan,
+    PhysicalPlan,
+    Rule,
+)
+from ray.data._internal.logical.operators.map_operator import AbstractMap
+from ray.data._internal.logical.operators.read_operator import Read
+from ray.data._internal.logical.operators.write_operator import Write
+from ray.data._internal.write_checkpoint import WriteCheckpoint
+
+logger = logging.getLogger(__name__)
+
+
+class WriteCheckpointRule(Rule):
+    """Rule for resuming a checkpointed `Write` from the inputs it hasn't written.
+
+    If a `Write` with a checkpoint reads from a `Read` through a chain of map
+    operators, its checkpoint is passed to the `Read`. The `Read` skips the read
+    tasks whose input files are already recorded by the checkpoint, and passes the
+    input files of the remaining read tasks to the `Write` through the task
+    context, which records them once it has written all of their rows.
+
+    Progress is only recorded if the `Read` and the `Write` are fused into the
+    same tasks. Otherwise, the `Write` doesn't know which input files its rows
+    came from, and the checkpoint stays empty, so a warning is logged. See
+    `WarnUnfusedWriteCheckpointRule`.
+    """
+
+    def apply(self, plan: LogicalPlan) -> LogicalPlan:
+        write_op = plan.dag
+        if not isinstance(write_op, Write) or write_op._checkpoint is None:
+            return plan
+
+        chain: List[LogicalOperator] = [write_op]
+        while not isinstance(chain[-1], Read):
+            input_ops = chain[-1].input_dependencies
+            if len(input_ops) != 1 or not isinstance(input_ops[0], AbstractMap):
+                _warn_unfused(write_op._checkpoint)
+                return plan
+            chain.append(input_ops[0])
+
+        # Operators are shallow-copied rather than modified in place, because the
+        # same logical operators can be shared by the lineage of other datasets.
+        chain = [copy.copy(op) for op in chain]
+        for op, input_op in zip(chain, chain[1:]):
+            op._input_dependencies = [input_op]
+            input_op._output_dependencies = [op]
+        chain[-1]._write_checkpoint = write_op._checkpoint
+        return LogicalPlan(dag=chain[0])
+
+
+class WarnUnfusedWriteCheckpointRule(Rule):
+    """Rule for warning that a checkpointed `Write` wasn't fused with its `Read`.
+
+    This must run after `OperatorFusionRule`. If the `Read` that `WriteCheckpointRule`
+    passed the checkpoint to runs in other tasks than the `Write`, for example
+    because an operator in between runs on an actor pool, no progress is recorded.
+    """
+
+    def apply(self, plan: PhysicalPlan) -> PhysicalPlan:
+        checkpoint = _find_read_checkpoint(plan.op_map.get(plan.dag))
+        if checkpoint is not None and not all(
+            isinstance(input_op, InputDataBuffer)
+            for input_op in plan.dag.input_dependencies
+        ):
+            _warn_unfused(checkpoint)
+        return plan
+
+
+def _find_read_checkpoint(
+    op: Optional[LogicalOperator],
+) -> Optional[WriteCheckpoint]:
+    while op is not None:
+        if isinstance(op, Read):
+            return op._write_checkpoint
+        if len(op.input_dependencies) != 1:
+            return None
+        op = op.input_dependencies[0]
+    return None
+
+
+def _warn_unfused(checkpoint: WriteCheckpoint):
+    logger.warning(
+        f"The write checkpoint at {checkpoint.path} won't record any progress, "
+        "because the write doesn't run in the same tasks as a file-based read. "
+        "Remove all-to-all operations and actor-based transforms between the read "
+        "and the write to checkpoint it."
+    )
@@ -57,6 +57,8 @@ _op_name_white_list = [
     "MapBatches",
     "Filter",
     "FlatMap",
+    "Project",
+    "AddColumn",
     # All-to-all
     "RandomizeBlockOrder",
     "RandomShuffle",
@@ -66,6 +68,7 @@ _op_name_white_list = [
     # N-ary
     "Zip",
     "Union",
+    "Join",
 ]
 
 
@@ -1,4 +1,6 @@
-from typing import Any
+import collections
+import math
+from typing import Any, Deque, Optional, Tuple
 
 from ray.data._internal.delegating_block_builder import DelegatingBlockBuilder
 from ray.data.block import Block, BlockAccessor, DataBatch
@@ -36,6 +38,10 @@ class BlockOutputBuffer:
         self._buffer = DelegatingBlockBuilder()
         self._returned_at_least_one_block = False
         self._finalized = False
+        # An oversized block that is being emitted in slices, and the
+        # (start, end) row offsets of the slices that haven't been emitted yet.
+        self._split_block: Optional[BlockAccessor] = None
+        self._split_offsets: Deque[Tuple[int, int]] = collections.deque()
 
     def add(self, item: Any) -> None:
         """Add a single item to this output buffer."""
@@ -59,6 +65,8 @@ class BlockOutputBuffer:
 
     def has_next(self) -> bool:
         """Returns true when a complete output block is produced."""
+        if self._split_offsets:
+            return True
         if self._finalized:
             return not self._returned_at_least_one_block or self._buffer.num_rows() > 0
         else:
@@ -70,34 +78,61 @@ class BlockOutputBuffer:
         """Returns the next complete output block."""
         assert self.has_next()
 
-        block_to_yield = self._buffer.build()
-        block_remainder = None
-        block = BlockAccessor.for_block(block_to_yield)
-        if (
-            block.size_bytes()
-            >= MAX_SAFE_BLOCK_SIZE_FACTOR * self._target_max_block_size
-        ):
-            # Slice a block to respect the target max block size.  We only do
-            # this if we are more than 50% above the target block size, because
-            # this ensures that the last block produced will be at least half
-            # the block size.
-            num_bytes_per_row = block.size_bytes() // block.num_rows()
-            target_num_rows = self._target_max_block_size // num_bytes_per_row
-            target_num_rows = max(1, target_num_rows)
-
-            # TODO(swang): If the buffer is finalized, try to create even
-            # blocks?
-
-            if target_num_rows < block.num_rows():
-                # Use copy=True to avoid holding the entire block in memory.
-                block_to_yield = block.slice(0, target_num_rows, copy=True)
-                block_remainder = block.slice(
-                    target_num_rows, block.num_rows(), copy=True
-                )
-
-        self._buffer = DelegatingBlockBuilder()
-        if block_remainder is not None:
-            self._buffer.add_block(block_remainder)
+        if not self._split_offsets:
+            block_to_yield = self._buffer.build()
+            self._buffer = DelegatingBlockBuilder()
+            block = BlockAccessor.for_block(block_to_yield)
+            if (
+                block.size_bytes()
+                >= MAX_SAFE_BLOCK_SIZE_FACTOR * self._target_max_block_size
+                and block.num_rows() > 1
+            ):
+                self._split(block)
+
+        if self._split_offsets:
+            # Use copy=True to avoid holding the entire block in memory once all
+            # of its slices have been yielded.
+            start, end = self._split_offsets.popleft()
+            block_to_yield = self._split_block.slice(start, end, copy=True)
+            if not self._split_offsets:
+                self._split_block = None
 
         self._returned_at_least_one_block = True
         return block_to_yield
+
+    def _split(self, block: BlockAccessor) -> None:
+        """Plan the slices of an oversized block, based on its measured bytes per
+        row.
+
+        We only split blocks that are more than 50% above the target block size,
+        because this ensures that the blocks produced are at least half the target
+        block size. The whole block is split at once, so that each row is copied
+        only once no matter how large the block is.
+        """
+        num_rows = block.num_rows()
+        bytes_per_row = block.size_bytes() / num_rows
+        target_num_rows = max(1, int(self._target_max_block_size // bytes_per_row))
+        if target_num_rows >= num_rows:
+            return
+
+        if self._finalized:
+            # This is the last block, so balance the rows evenly across the
+            # slices instead of producing a small trailing block.
+            num_slices = math.ceil(num_rows / target_num_rows)
+            boundaries = [num_rows * i // num_slices for i in range(num_slices + 1)]
+        else:
+            # Only yield full slices. A small remainder is merged into the last
+            # slice, and a larger one is put back into the buffer, so that it can
+            # be combined with the following inputs.
+            num_slices = num_rows // target_num_rows
+            boundaries = [target_num_rows * i for i in range(num_slices + 1)]
+            remainder_bytes = (num_rows - boundaries[-1]) * bytes_per_row
+            if remainder_bytes < (
+                (MAX_SAFE_BLOCK_SIZE_FACTOR - 1) * self._target_max_block_size
+            ):
+                boundaries[-1] = num_rows
+            else:
+                self._buffer.add_block(block.slice(boundaries[-1], num_rows, copy=True))
+
+        self._split_block = block
+        self._split_offsets.extend(zip(boundaries[:-1], boundaries[1:]))
@@ -0,0 +1,267 @@
+import functools
+import hashlib
+import logging
+import types
+from typing import Any, Dict, List, Optional, Set
+
+import numpy as np
+
+import ray
+from ray.data._internal.logical.interfaces import LogicalOperator
+from ray.data._internal.logical.operators.read_operator import Read
+from ray.data.datasource.path_util import _resolve_paths_and_filesystem
+from ray.data.datasource.range_datasource import RangeDatasource
+
+logger = logging.getLogger(__name__)
+
+# Attributes of logical operators that don't affect their outputs, or that are
+# fingerprinted separately.
+_IGNORED_OP_ATTRS = {
+    "_input_dependencies",
+    "_output_dependencies",
+    "_datasource",
+    "_datasource_or_legacy_reader",
+    "_detected_parallelism",
+}
+
+# Attributes of datasources that are derived from the input files, or that
+# are estimated by sampling the input files. The input files are fingerprinted by
+# their paths, sizes, and modification times instead.
+_IGNORED_DATASOURCE_ATTRS = {
+    "_paths_ref",
+    "_file_sizes_ref",
+    "_pq_fragments",
+    "_pq_paths",
+    "_metadata",
+    "_encoding_ratio",
+    "_default_read_batch_size_rows",
+    # Scheduling strategies pinned to the driver's node.
+    "_local_scheduling",
+}
+
+# Datasources without input files whose outputs only depend on their arguments.
+_DETERMINISTIC_DATASOURCES = (RangeDatasource,)
+
+
+class _UnfingerprintableError(Exception):
+    """Raised when a value has no stable fingerprint across processes."""
+
+
+def fingerprint_plan(dag: LogicalOperator, key: Optional[str] = None) -> Optional[str]:
+    """Return a fingerprint of the outputs of a logical plan.
+
+    The fingerprint covers the operators and their arguments, the bytecode,
+    defaults, closures, and referenced globals of UDFs, and the paths, sizes, and
+    modification times of the input files. So it stays the same across driver
+    processes as long as the plan would produce the same data.
+
+    Args:
+        dag: The logical plan to fingerprint.
+        key: A user-provided key that identifies the data of datasources without
+            input files, whose changes can't be detected otherwise.
+
+    Returns:
+        The hex digest of the fingerprint, or None if the plan has values without
+        a stable fingerprint, like in-memory input data or object refs, or reads
+        from a datasource without input files and no key is given.
+    """
+    hasher = hashlib.sha256()
+    hasher.update(ray.__version__.encode())
+    if key is not None:
+        hasher.update(f"key:{key}".encode())
+    try:
+        # The post-order traversal and the number of inputs of each operator
+        # determine the shape of the DAG.
+        for op in dag.post_order_iter():
+            hasher.update(_fingerprint_op(op, key).encode())
+    except _UnfingerprintableError as e:
+        logger.debug(f"Plan {dag} can't be fingerprinted: {e}")
+        return None
+    return hasher.hexdigest()
+
+
+def _fingerprint_op(op: LogicalOperator, key: Optional[str]) -> str:
+    attrs = {k: v for k, v in vars(op).items() if k not in _IGNORED_OP_ATTRS}
+    parts = [
+        _qualname(type(op)),
+        str(len(op.input_dependencies)),
+        _fingerprint_value(attrs, set()),
+    ]
+    if isinstance(op, Read):
+        parts.append(_fingerprint_datasource(op._datasource, key))
+    return "|".join(parts)
+
+
+def _fingerprint_datasource(datasource: Any, key: Optional[str]) -> str:
+    attrs = {}
+    for name, value in vars(datasource).items():
+        if name in _IGNORED_DATASOURCE_ATTRS:
+            continue
+        if _is_filesystem(value):
+            attrs[name] = _qualname(type(value))
+        else:
+            attrs[name] = value
+    parts = [_qualname(type(datasource)), _fingerprint_value(attrs, set())]
+
+    input_files = datasource.input_files()
+    if input_files:
+        parts.append(
+            _fingerprint_files(input_files, getattr(datasource, "_filesystem", None))
+        )
+    elif key is None and not isinstance(datasource, _DETERMINISTIC_DATASOURCES):
+        # The data of other sources, like databases, can change between runs
+        # without any change to the plan.
+        raise _UnfingerprintableError(
+            f"{_qualname(type(datasource))} has no input files, and no key is given"
+        )
+    return "|".join(parts)
+
+
+def _fingerprint_files(paths: List[str], filesystem: Optional[Any]) -> str:
+    from pyarrow.fs import FileType
+
+    if filesystem is None:
+        paths, filesystem = _resolve_paths_and_filesystem(paths)
+    try:
+        file_infos = filesystem.get_file_info(paths)
+    except OSError as e:
+        raise _UnfingerprintableError(f"Failed to get file info: {e}")
+    files = []
+    for file_info in file_infos:
+        if file_info.type == FileType.NotFound:
+            raise _UnfingerprintableError(f"File {file_info.path} not found")
+        files.append(f"{file_info.path}:{file_info.size}:{file_info.mtime_ns}")
+    return repr(sorted(files))
+
+
+def _fingerprint_value(value: Any, seen: Set[int]) -> str:
+    """Return a string that identifies the value across processes.
+
+    Args:
+        value: The value to fingerprint.
+        seen: The IDs of the objects being fingerprinted, to break cycles.
+    """
+    if value is None or isinstance(value, (bool, int, float, str, bytes)):
+        return repr(value)
+    if id(value) in seen:
+        return "<cycle>"
+    seen = seen | {id(value)}
+
+    if isinstance(value, (list, tuple)):
+        items = [_fingerprint_value(v, seen) for v in value]
+        return f"{type(value).__name__}[{','.join(items)}]"
+    if isinstance(value, (set, frozenset)):
+        return f"set[{','.join(sorted(_fingerprint_value(v, seen) for v in value))}]"
+    if isinstance(value, dict):
+        items = sorted(
+            f"{_fingerprint_value(k, seen)}:{_fingerprint_value(v, seen)}"
+            for k, v in value.items()
+        )
+        return f"dict[{','.join(items)}]"
+    if isinstance(value, ray.ObjectRef):
+        raise _UnfingerprintableError("Object refs differ across processes")
+    if isinstance(value, np.ndarray):
+        return f"ndarray[{value.dtype},{value.shape},{_hash_bytes(value.tobytes())}]"
+    if isinstance(value, types.ModuleType):
+        return f"module[{value.__name__}]"
+    if isinstance(value, types.FunctionType):
+        return _fingerprint_function(value, seen)
+    if isinstance(value, types.MethodType):
+        return (
+            f"method[{_fingerprint_value(value.__func__, seen)},"
+            f"{_fingerprint_value(value.__self__, seen)}]"
+        )
+    if isinstance(value, functools.partial):
+        return (
+            f"partial[{_fingerprint_value(value.func, seen)},"
+            f"{_fingerprint_value(value.args, seen)},"
+            f"{_fingerprint_value(value.keywords, seen)}]"
+        )
+    if isinstance(value, type):
+        return _fingerprint_class(value, seen)
+    if hasattr(value, "__dict__"):
+        return f"{_qualname(type(value))}" f"[{_fingerprint_value(vars(value), seen)}]"
+
+    # Values without attributes, like Arrow schemas and expressions, are
+    # identified by their representation, unless it includes a memory address.
+    value_repr = repr(value)
+    if " at 0x" in value_repr:
+        raise _UnfingerprintableError(f"{value_repr} has no stable representation")
+    return f"{_qualname(type(value))}[{value_repr}]"
+
+
+def _fingerprint_function(fn: types.FunctionType, seen: Set[int]) -> str:
+    code = fn.__code__
+    parts = [
+        _qualname(fn),
+        _fingerprint_code(code),
+        _fingerprint_value(fn.__defaults__, seen),
+        _fingerprint_value(fn.__kwdefaults__, seen),
+    ]
+    if fn.__closure__:
+        cells = []
+        for cell in fn.__closure__:
+            try:
+                cells.append(cell.cell_contents)
+            except ValueError:
+                # Empty cell.
+                cells.append(None)
+        parts.append(_fingerprint_value(cells, seen))
+    # The globals that the function references, including those referenced by
+    # nested functions and comprehensions.
+    referenced_globals: Dict[str, Any] = {}
+    for name in _referenced_names(code):
+        if name in fn.__globals__:
+            referenced_globals[name] = fn.__globals__[name]
+    parts.append(_fingerprint_value(referenced_globals, seen))
+    return f"function[{','.join(parts)}]"
+
+
+def _fingerprint_code(code: types.CodeType) -> str:
+    consts = [
+        _fingerprint_code(c) if isinstance(c, types.CodeType) else repr(c)
+        for c in code.co_consts
+    ]
+    return _hash_bytes(
+        code.co_code + repr((consts, code.co_names, code.co_varnames)).encode()
+    )
+
+
+def _referenced_names(code: types.CodeType) -> List[str]:
+    names = list(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names.extend(_referenced_names(const))
+    return names
+
+
+def _fingerprint_class(cls: type, seen: Set[int]) -> str:
+    if cls.__module__ == "builtins":
+        return f"class[{cls.__qualname__}]"
+    members = {
+        name: member
+        for name, member in vars(cls).items()
+        if isinstance(member, (types.FunctionType, staticmethod, classmethod, property))
+    }
+    members = {
+        name: getattr(member, "__func__", getattr(member, "fget", member))
+        for name, member in members.items()
+    }
+    bases = [_qualname(base) for base in cls.__bases__]
+    return f"class[{_qualname(cls)},{bases},{_fingerprint_value(members, seen)}]"
+
+
+def _is_filesystem(value: Any) -> bool:
+    from pyarrow.fs import FileSystem
+
+    return isinstance(value, FileSystem) or type(value).__name__ == (
+        "_S3FileSystemWrapper"
+    )
+
+
+def _qualname(obj: Any) -> str:
+    return f"{obj.__module__}.{obj.__qualname__}"
+
+
+def _hash_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
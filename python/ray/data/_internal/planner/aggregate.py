@@ -6,6 +6,7 @@ from ray.data._internal.execution.interfaces import (
     TaskContext,
 )
 from ray.data._internal.planner.exchange.aggregate_task_spec import (
+    HashAggregateTaskSpec,
     SortAggregateTaskSpec,
 )
 from ray.data._internal.planner.exchange.pull_based_shuffle_task_scheduler import (
@@ -24,10 +25,14 @@ from ray.data.context import DataContext
 def generate_aggregate_fn(
     key: Optional[str],
     aggs: List[AggregateFn],
+    ordered: bool = True,
     _debug_limit_shuffle_execution_to_num_blocks: Optional[int] = None,
 ) -> AllToAllTransformFn:
     """Generate function to aggregate blocks by the specified key column or key
     function.
+
+    If ``ordered`` is False, the output blocks don't need to be sorted by key, and
+    hash-based aggregation is used.
     """
     if len(aggs) == 0:
         raise ValueError("Aggregate requires at least one aggregation")
@@ -55,18 +60,22 @@ def generate_aggregate_fn(
         else:
             # Use same number of output partitions.
             num_outputs = num_mappers
-            # Sample boundaries for aggregate key.
-            boundaries = SortTaskSpec.sample_boundaries(
-                blocks,
-                SortKey(key),
-                num_outputs,
-            )
 
-        agg_spec = SortAggregateTaskSpec(
-            boundaries=boundaries,
-            key=key,
-            aggs=aggs,
-        )
+        if key is not None and not ordered:
+            agg_spec = HashAggregateTaskSpec(key=key, aggs=aggs)
+        else:
+            if key is not None:
+                # Sample boundaries for aggregate key.
+                boundaries = SortTaskSpec.sample_boundaries(
+                    blocks,
+                    SortKey(key),
+                    num_outputs,
+                )
+            agg_spec = SortAggregateTaskSpec(
+                boundaries=boundaries,
+                key=key,
+                aggs=aggs,
+            )
         if DataContext.get_current().use_push_based_shuffle:
             scheduler = PushBasedShuffleTaskScheduler(agg_spec)
         else:
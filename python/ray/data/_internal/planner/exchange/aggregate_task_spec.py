@@ -1,6 +1,7 @@
 from typing import List, Optional, Tuple, Union
 
 from ray.data._internal.aggregate import Count, _AggregateOnKeyBase
+from ray.data._internal.planner.exchange.hash_shuffle_task_spec import hash_partition
 from ray.data._internal.planner.exchange.interfaces import ExchangeTaskSpec
 from ray.data._internal.planner.exchange.sort_task_spec import SortKey
 from ray.data._internal.table_block import TableBlockAccessor
@@ -102,3 +103,64 @@ class SortAggregateTaskSpec(ExchangeTaskSpec):
             return block_accessor.select(list(columns))
         else:
             return block
+
+
+class HashAggregateTaskSpec(ExchangeTaskSpec):
+    """
+    The implementation for hash-based aggregate tasks.
+
+    This works like `SortAggregateTaskSpec`, except that rows are partitioned by the
+    hash of their keys instead of sampled key ranges. So no sampling pass is needed,
+    and low-cardinality keys are spread evenly over the partitions. But the output
+    blocks are only sorted by key within each block, not across blocks.
+
+    Partial aggregate (`map`): each block is sorted locally, then hash-partitioned
+    into smaller blocks, which stay sorted. Each partitioned block is combined
+    separately, then passed to a final aggregate task.
+
+    Final aggregate (`reduce`): each task would receive a block from every worker
+    that consists of the items with the same key hashes. It then merges the sorted
+    blocks and aggregates on-the-fly.
+    """
+
+    def __init__(
+        self,
+        key: Union[str, List[str]],
+        aggs: List[AggregateFn],
+    ):
+        super().__init__(
+            map_args=[key, aggs],
+            reduce_args=[key, aggs],
+        )
+
+    @staticmethod
+    def map(
+        idx: int,
+        block: Block,
+        output_num_blocks: int,
+        key: Union[str, List[str]],
+        aggs: List[AggregateFn],
+    ) -> List[Union[BlockMetadata, Block]]:
+        stats = BlockExecStats.builder()
+
+        block = SortAggregateTaskSpec._prune_unused_columns(block, key, aggs)
+        # `combine` requires the rows to be sorted by key. Hash partitioning
+        # preserves the order of the rows within each partition.
+        block = BlockAccessor.for_block(block).sort_and_partition([], SortKey(key))[0]
+        partitions = hash_partition(
+            block, [key] if isinstance(key, str) else key, output_num_blocks
+        )
+        parts = [BlockAccessor.for_block(p).combine(key, aggs) for p in partitions]
+        meta = BlockAccessor.for_block(block).get_metadata(exec_stats=stats.build())
+        return parts + [meta]
+
+    @staticmethod
+    def reduce(
+        key: Union[str, List[str]],
+        aggs: List[AggregateFn],
+        *mapper_outputs: List[Block],
+        partial_reduce: bool = False,
+    ) -> Tuple[Block, BlockMetadata]:
+        return SortAggregateTaskSpec.reduce(
+            key, aggs, *mapper_outputs, partial_reduce=partial_reduce
+        )
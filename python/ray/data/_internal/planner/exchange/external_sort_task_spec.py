@@ -0,0 +1,186 @@
+import os
+import tempfile
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple, TypeVar, Union
+
+import numpy as np
+
+import ray
+from ray.data._internal.arrow_block import ArrowBlockAccessor
+from ray.data._internal.arrow_ops import transform_pyarrow
+from ray.data._internal.planner.exchange.sort_task_spec import SortKey, SortTaskSpec
+from ray.data.block import Block, BlockAccessor, BlockExecStats, BlockMetadata
+from ray.types import ObjectRef
+
+T = TypeVar("T")
+
+if TYPE_CHECKING:
+    import pyarrow
+
+# The total size in bytes of the batches read from the sorted runs of a merge task
+# at a time.
+EXTERNAL_SORT_MERGE_BUFFER_SIZE = 256 * 1024 * 1024
+
+
+class ExternalSortTaskSpec(SortTaskSpec):
+    """
+    The implementation for distributed sort tasks that merge on local disk.
+
+    The sampling and sorting steps are the same as `SortTaskSpec`. In the merging
+    step, the merge task fetches the sorted blocks it receives one at a time, writes
+    each of them to local disk as an Arrow IPC file, and releases it. The files are
+    then memory-mapped and k-way merged one bounded window of batches at a time. So
+    the merge only holds one input block, a window of each sorted run, and its
+    output in memory, instead of all of its inputs.
+
+    The pull-based shuffle passes the inputs of the merge tasks as ObjectRefs, so
+    that they aren't fetched before the task starts. The push-based shuffle passes
+    them as blocks.
+    """
+
+    REDUCE_FETCHES_INPUTS = True
+
+    def __init__(
+        self,
+        boundaries: List[T],
+        sort_key: SortKey,
+        spill_dir: Optional[str] = None,
+    ):
+        super().__init__(boundaries=boundaries, sort_key=sort_key)
+        self._reduce_args = [sort_key, spill_dir]
+
+    @staticmethod
+    def reduce(
+        sort_key: SortKey,
+        spill_dir: Optional[str],
+        *mapper_outputs: Union[Block, List[ObjectRef[Block]]],
+        partial_reduce: bool = False,
+    ) -> Tuple[Block, BlockMetadata]:
+        if len(mapper_outputs) == 1 and isinstance(mapper_outputs[0], list):
+            inputs = list(mapper_outputs[0])
+        else:
+            inputs = list(mapper_outputs)
+        del mapper_outputs
+        return external_merge_sorted_blocks(inputs, sort_key, spill_dir)
+
+
+def external_merge_sorted_blocks(
+    blocks: List[Union[Block, ObjectRef[Block]]],
+    sort_key: SortKey,
+    spill_dir: Optional[str] = None,
+) -> Tuple[Block, BlockMetadata]:
+    """Merge sorted blocks into one sorted block through local disk.
+
+    The blocks are fetched and written to disk one at a time, and the list items
+    are cleared as they're written, so that the blocks can be released.
+
+    Args:
+        blocks: The sorted blocks to merge, or their ObjectRefs.
+        sort_key: The key the blocks are sorted by.
+        spill_dir: The directory to write the sorted runs to. Defaults to the system
+            temporary directory.
+    """
+    stats = BlockExecStats.builder()
+    # Read each sorted run in batches of about the same size in bytes, so that the
+    # merge window stays within `EXTERNAL_SORT_MERGE_BUFFER_SIZE`.
+    batch_size = EXTERNAL_SORT_MERGE_BUFFER_SIZE / max(len(blocks), 1)
+    output_format = None
+    with tempfile.TemporaryDirectory(prefix="ray_data_sort_", dir=spill_dir) as tmp_dir:
+        runs = []
+        for i in range(len(blocks)):
+            block, blocks[i] = blocks[i], None
+            if isinstance(block, ray.ObjectRef):
+                block = ray.get(block)
+            accessor = BlockAccessor.for_block(block)
+            if output_format is None:
+                # Like `SortTaskSpec.reduce`, output blocks in the format of the
+                # first input.
+                output_format = (
+                    "arrow" if isinstance(accessor, ArrowBlockAccessor) else "pandas"
+                )
+            if accessor.num_rows() == 0:
+                continue
+            table = accessor.to_arrow()
+            path = os.path.join(tmp_dir, f"run_{i}.arrow")
+            bytes_per_row = max(table.nbytes / table.num_rows, 1)
+            _write_run(table, path, max(int(batch_size // bytes_per_row), 1))
+            del block, accessor, table
+            runs.append(_read_run(path))
+
+        if not runs:
+            ret = ArrowBlockAccessor._empty_table()
+        else:
+            ret = _merge_runs(runs, sort_key)
+    if output_format == "pandas":
+        ret = BlockAccessor.for_block(ret).to_pandas()
+    return ret, BlockAccessor.for_block(ret).get_metadata(exec_stats=stats.build())
+
+
+def _write_run(table: "pyarrow.Table", path: str, batch_num_rows: int):
+    import pyarrow as pa
+
+    with pa.OSFile(path, "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table, max_chunksize=batch_num_rows)
+
+
+def _read_run(path: str) -> Iterator["pyarrow.Table"]:
+    """Yield the batches of a sorted run zero-copy from the memory-mapped file."""
+    import pyarrow as pa
+
+    with pa.memory_map(path) as source:
+        reader = pa.ipc.open_file(source)
+        for i in range(reader.num_record_batches):
+            batch = reader.get_batch(i)
+            if batch.num_rows > 0:
+                yield pa.Table.from_batches([batch])
+
+
+def _merge_runs(
+    runs: List[Iterator["pyarrow.Table"]], sort_key: SortKey
+) -> "pyarrow.Table":
+    """K-way merge sorted runs, one window of batches at a time.
+
+    Each window takes the rows of the current batches of the runs up to the
+    smallest last key of these batches (in sort order). All the rows of the
+    following batches come after that key, so each window can be sorted on its own.
+
+    Keys are compared with Arrow's stable sort, which the runs are sorted with, so
+    nulls and NaNs are placed at the end, as in the runs.
+    """
+    import pyarrow.compute as pc
+
+    sort_keys = sort_key.to_arrow_sort_args()
+    columns = sort_key.get_columns()
+
+    heads = [next(run, None) for run in runs]
+    merged = []
+    while True:
+        active = [head for head in heads if head is not None]
+        if not active:
+            break
+        active_runs = [i for i, head in enumerate(heads) if head is not None]
+
+        # The run whose current batch ends with the smallest key.
+        last_keys = transform_pyarrow.concat(
+            [head.select(columns).slice(head.num_rows - 1) for head in active]
+        )
+        bound_run = pc.sort_indices(last_keys, sort_keys=sort_keys)[0].as_py()
+
+        window = transform_pyarrow.concat(active)
+        indices = pc.sort_indices(window, sort_keys=sort_keys).to_numpy()
+        ends = np.cumsum([head.num_rows for head in active])
+        # Merge the rows up to the last row of the bound run. Because the sort is
+        # stable, the merged rows of each batch are a prefix of it.
+        num_merged = np.flatnonzero(indices == ends[bound_run] - 1)[0] + 1
+        merged.append(transform_pyarrow.take_table(window, indices[:num_merged]))
+
+        num_taken = np.bincount(
+            np.searchsorted(ends, indices[:num_merged], side="right"),
+            minlength=len(active),
+        )
+        for i, head, taken in zip(active_runs, active, num_taken):
+            if taken == head.num_rows:
+                heads[i] = next(runs[i], None)
+            else:
+                heads[i] = head.slice(taken)
+    return transform_pyarrow.concat(merged)
@@ -0,0 +1,280 @@
+from typing import TYPE_CHECKING, List, Optional, Tuple, Union
+
+import numpy as np
+
+from ray.data._internal.delegating_block_builder import DelegatingBlockBuilder
+from ray.data._internal.planner.exchange.interfaces import ExchangeTaskSpec
+from ray.data._internal.planner.exchange.sort_task_spec import SortKey
+from ray.data._internal.progress_bar import ProgressBar
+from ray.data._internal.remote_fn import cached_remote_fn
+from ray.data.block import Block, BlockAccessor, BlockExecStats, BlockMetadata
+
+if TYPE_CHECKING:
+    import pandas
+
+    from ray.data._internal.execution.interfaces import RefBundle
+
+# The number of keys to sample per output partition, to estimate the size of the
+# keys. See `sample_key_partitions`.
+NUM_KEY_SAMPLES_PER_PARTITION = 10
+
+# The names of the columns of the key partitions returned by
+# `sample_key_partitions`, besides the key columns.
+PARTITION_COLUMN = "__partition__"
+SALT_COLUMN = "__salt__"
+NUM_SALTS_COLUMN = "__num_salts__"
+_BYTES_COLUMN = "__bytes__"
+_ROW_COLUMN = "__row__"
+
+
+class HashShuffleTaskSpec(ExchangeTaskSpec):
+    """
+    The implementation for hash-partitioned shuffle tasks.
+
+    Rows are assigned to output blocks by the hash of their key columns, so rows
+    with equal keys end up in the output block with the same index. This is used
+    by join() to co-partition both sides of the join, and by repartition() with
+    keys.
+
+    If key partitions from `sample_key_partitions` are given, the sampled keys are
+    assigned to their partitions instead, and the rows of hot keys are split
+    round-robin over the key's partitions. If ``replicate_split_keys`` is set, the
+    rows of hot keys are copied to all of their partitions instead, e.g. for the
+    right side of a join whose left side is split.
+    """
+
+    KEY_SAMPLE_SUB_PROGRESS_BAR_NAME = "Key Sample"
+
+    def __init__(
+        self,
+        key: List[str],
+        key_partitions: Optional["pandas.DataFrame"] = None,
+        replicate_split_keys: bool = False,
+    ):
+        super().__init__(map_args=[key, key_partitions, replicate_split_keys])
+
+    @staticmethod
+    def map(
+        idx: int,
+        block: Block,
+        output_num_blocks: int,
+        key: List[str],
+        key_partitions: Optional["pandas.DataFrame"] = None,
+        replicate_split_keys: bool = False,
+    ) -> List[Union[BlockMetadata, Block]]:
+        stats = BlockExecStats.builder()
+        slices = hash_partition(
+            block,
+            key,
+            output_num_blocks,
+            key_partitions=key_partitions,
+            replicate_split_keys=replicate_split_keys,
+        )
+        meta = BlockAccessor.for_block(block).get_metadata(
+            input_files=None, exec_stats=stats.build()
+        )
+        return slices + [meta]
+
+    @staticmethod
+    def reduce(
+        *mapper_outputs: List[Block],
+        partial_reduce: bool = False,
+    ) -> Tuple[Block, BlockMetadata]:
+        stats = BlockExecStats.builder()
+        builder = DelegatingBlockBuilder()
+        for block in mapper_outputs:
+            builder.add_block(block)
+        new_block = builder.build()
+        accessor = BlockAccessor.for_block(new_block)
+        new_metadata = BlockMetadata(
+            num_rows=accessor.num_rows(),
+            size_bytes=accessor.size_bytes(),
+            schema=accessor.schema(),
+            input_files=None,
+            exec_stats=stats.build(),
+        )
+        return new_block, new_metadata
+
+
+def hash_partition(
+    block: Block,
+    key: List[str],
+    num_partitions: int,
+    key_partitions: Optional["pandas.DataFrame"] = None,
+    replicate_split_keys: bool = False,
+) -> List[Block]:
+    """Split a block into ``num_partitions`` blocks by the hash of the key columns.
+
+    The hash only depends on the key values, so it's consistent across blocks
+    with different schemas (e.g., the left and right sides of a join). See
+    `HashShuffleTaskSpec` for ``key_partitions`` and ``replicate_split_keys``.
+    """
+    accessor = BlockAccessor.for_block(block)
+    num_rows = accessor.num_rows()
+    if num_rows == 0:
+        return [accessor.slice(0, 0, copy=False)] * num_partitions
+
+    keys = BlockAccessor.for_block(accessor.select(key)).to_pandas()
+    partitions = hash_partition_ids(keys, num_partitions).astype(np.int64)
+    if key_partitions is None:
+        indices = np.arange(num_rows)
+    else:
+        indices, partitions = _assign_key_partitions(
+            keys, partitions, key_partitions, replicate_split_keys
+        )
+
+    # Sort the rows by partition so that each partition is a contiguous
+    # zero-copy slice.
+    order = np.lexsort((indices, partitions))
+    block = accessor.take(indices[order])
+    accessor = BlockAccessor.for_block(block)
+    counts = np.bincount(partitions, minlength=num_partitions)
+    offsets = [0] + np.cumsum(counts).tolist()
+    return [
+        accessor.slice(offsets[i], offsets[i + 1], copy=False)
+        for i in range(num_partitions)
+    ]
+
+
+def hash_partition_ids(keys: "pandas.DataFrame", num_partitions: int) -> np.ndarray:
+    """Return the index of the partition that each row of ``keys`` belongs to."""
+    import pandas as pd
+
+    hashes = pd.util.hash_pandas_object(_normalize_keys(keys), index=False).to_numpy()
+    return hashes % np.uint64(num_partitions)
+
+
+def _normalize_keys(keys: "pandas.DataFrame") -> "pandas.DataFrame":
+    import pandas as pd
+
+    keys = keys.copy(deep=False)
+    for col in keys.columns:
+        # Hash integers and floats the same way, so that e.g. an int64 key on one
+        # side matches a float64 key on the other side. Note that pandas converts
+        # integer columns with nulls to floats.
+        if pd.api.types.is_numeric_dtype(keys[col].dtype):
+            keys[col] = keys[col].astype("float64")
+    return keys
+
+
+def sample_key_partitions(
+    refs: List["RefBundle"],
+    key: List[str],
+    num_partitions: int,
+    hot_key_threshold: Optional[float],
+) -> Optional["pandas.DataFrame"]:
+    """Sample the keys of the blocks, and assign the large keys to partitions so
+    that the partitions have about the same number of bytes.
+
+    Each sampled row stands for an equal share of the bytes of its block. Keys that
+    are sampled only once are likely small and many, so they're left to the hash
+    partitioning, which spreads their bytes evenly. From the largest key to the
+    smallest, the other keys are assigned to the partition with the fewest bytes
+    so far. A hot key that's larger than ``hot_key_threshold`` times the average
+    partition is split (salted) over as many of the smallest partitions as it
+    takes to fill them up to the average partition.
+
+    Returns:
+        The normalized key columns, and the partition, salt, and number of salts of
+        each partition of each assigned key. None if no key is assigned.
+    """
+    import pandas as pd
+
+    blocks = []
+    metadata = []
+    for bundle in refs:
+        for block, meta in bundle.blocks:
+            if meta.num_rows != 0:
+                blocks.append(block)
+                metadata.append(meta)
+    if not blocks:
+        return None
+
+    n_samples = max(NUM_KEY_SAMPLES_PER_PARTITION * num_partitions // len(blocks), 1)
+    sample_keys = cached_remote_fn(_sample_keys)
+    sample_results = [sample_keys.remote(block, n_samples, key) for block in blocks]
+    sample_bar = ProgressBar(
+        HashShuffleTaskSpec.KEY_SAMPLE_SUB_PROGRESS_BAR_NAME, len(sample_results)
+    )
+    samples = sample_bar.fetch_until_complete(sample_results)
+    sample_bar.close()
+    del sample_results
+
+    frames = []
+    for sample, meta in zip(samples, metadata):
+        if len(sample) > 0:
+            bytes_per_sample = (meta.size_bytes or len(sample)) / len(sample)
+            frames.append(sample.assign(**{_BYTES_COLUMN: bytes_per_sample}))
+    if not frames:
+        return None
+    samples = pd.concat(frames, ignore_index=True)
+    key_bytes = samples.groupby(key, dropna=False, sort=False)[_BYTES_COLUMN].agg(
+        ["sum", "size"]
+    )
+    total_bytes = key_bytes["sum"].sum()
+    partition_bytes = total_bytes / num_partitions
+    key_bytes = key_bytes[key_bytes["size"] > 1]["sum"].sort_values(
+        ascending=False, kind="stable"
+    )
+    if key_bytes.empty:
+        return None
+
+    partition_loads = np.full(
+        num_partitions, (total_bytes - key_bytes.sum()) / num_partitions
+    )
+    rows = []
+    for key_values, nbytes in key_bytes.items():
+        if not isinstance(key_values, tuple):
+            key_values = (key_values,)
+        partitions = np.argsort(partition_loads, kind="stable")
+        num_salts = 1
+        if hot_key_threshold is not None and nbytes > (
+            hot_key_threshold * partition_bytes
+        ):
+            room = np.cumsum(
+                np.maximum(partition_bytes - partition_loads[partitions], 0)
+            )
+            num_salts = min(int(np.searchsorted(room, nbytes)) + 1, num_partitions)
+        partitions = partitions[:num_salts]
+        partition_loads[partitions] += nbytes / num_salts
+        for salt, partition in enumerate(partitions):
+            rows.append(key_values + (partition, salt, num_salts))
+    return pd.DataFrame(
+        rows, columns=key + [PARTITION_COLUMN, SALT_COLUMN, NUM_SALTS_COLUMN]
+    ).astype(samples[key].dtypes.to_dict())
+
+
+def _sample_keys(block: Block, n_samples: int, key: List[str]) -> "pandas.DataFrame":
+    sample = BlockAccessor.for_block(block).sample(n_samples, SortKey(key))
+    return _normalize_keys(BlockAccessor.for_block(sample).to_pandas())
+
+
+def _assign_key_partitions(
+    keys: "pandas.DataFrame",
+    hash_partitions: np.ndarray,
+    key_partitions: "pandas.DataFrame",
+    replicate_split_keys: bool,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the indices of the rows to output and the partition of each of them.
+
+    A row is output once per partition of its key if its key is replicated.
+    """
+    on = list(keys.columns)
+    keys = _normalize_keys(keys).assign(**{_ROW_COLUMN: np.arange(len(keys))})
+    matches = keys.merge(key_partitions, on=on, how="inner")
+    if not replicate_split_keys:
+        # Split the rows of hot keys round-robin over their partitions.
+        matches = matches[
+            matches[_ROW_COLUMN] % matches[NUM_SALTS_COLUMN] == matches[SALT_COLUMN]
+        ]
+    matched_rows = matches[_ROW_COLUMN].to_numpy()
+    unmatched = np.ones(len(keys), dtype=bool)
+    unmatched[matched_rows] = False
+    indices = np.concatenate([np.flatnonzero(unmatched), matched_rows])
+    partitions = np.concatenate(
+        [
+            hash_partitions[unmatched],
+            matches[PARTITION_COLUMN].to_numpy(dtype=np.int64),
+        ]
+    )
+    return indices, partitions
@@ -32,6 +32,11 @@ class ExchangeTaskSpec:
     MAP_SUB_PROGRESS_BAR_NAME = "Shuffle Map"
     REDUCE_SUB_PROGRESS_BAR_NAME = "Shuffle Reduce"
 
+    # Whether `reduce` can take a list of the ObjectRefs of the map outputs, instead
+    # of the blocks. Schedulers that support it pass the ObjectRefs, so that the
+    # reduce task can fetch and release its inputs one at a time.
+    REDUCE_FETCHES_INPUTS = False
+
     def __init__(self, map_args: List[Any] = None, reduce_args: List[Any] = None):
         self._map_args = map_args or []
         self._reduce_args = reduce_args or []
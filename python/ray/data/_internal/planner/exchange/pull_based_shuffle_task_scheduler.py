@@ -110,13 +110,19 @@ class PullBasedShuffleTaskScheduler(ExchangeTaskScheduler):
         if _debug_limit_execution_to_num_blocks is not None:
             output_num_blocks = _debug_limit_execution_to_num_blocks
             logger.debug(f"Limiting execution to {output_num_blocks} reduce tasks")
-        shuffle_reduce_out = [
-            shuffle_reduce.options(**reduce_ray_remote_args, num_returns=2).remote(
-                *self._exchange_spec._reduce_args,
-                *[shuffle_map_out[i][j] for i in range(input_num_blocks)],
+        shuffle_reduce_out = []
+        for j in range(output_num_blocks):
+            reduce_inputs = [shuffle_map_out[i][j] for i in range(input_num_blocks)]
+            if self._exchange_spec.REDUCE_FETCHES_INPUTS:
+                # ObjectRefs nested in arguments aren't fetched before the task
+                # starts.
+                reduce_inputs = [reduce_inputs]
+            shuffle_reduce_out.append(
+                shuffle_reduce.options(**reduce_ray_remote_args, num_returns=2).remote(
+                    *self._exchange_spec._reduce_args,
+                    *reduce_inputs,
+                )
             )
-            for j in range(output_num_blocks)
-        ]
 
         # Release map task outputs from the Ray object store.
         del shuffle_map_out
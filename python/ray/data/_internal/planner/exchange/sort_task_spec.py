@@ -1,3 +1,4 @@
+import collections
 from typing import TYPE_CHECKING, List, Optional, Tuple, TypeVar, Union
 
 import numpy as np
@@ -14,6 +15,10 @@ T = TypeVar("T")
 if TYPE_CHECKING:
     import pyarrow
 
+# The maximum number of sampled boundaries to cache. See
+# `SortTaskSpec.sample_boundaries`.
+SAMPLE_BOUNDARIES_CACHE_SIZE = 16
+
 
 class SortKey:
     """SortKey class to convert between different sort args formats."""
@@ -111,6 +116,12 @@ class SortTaskSpec(ExchangeTaskSpec):
 
     SORT_SAMPLE_SUB_PROGRESS_BAR_NAME = "Sort Sample"
 
+    # Sampled boundaries, keyed by the IDs of the input blocks, the key columns,
+    # and the number of reducers.
+    _sample_boundaries_cache: "collections.OrderedDict[tuple, List[T]]" = (
+        collections.OrderedDict()
+    )
+
     def __init__(
         self,
         boundaries: List[T],
@@ -152,7 +163,31 @@ class SortTaskSpec(ExchangeTaskSpec):
         Return (num_reducers - 1) items in ascending order from the blocks that
         partition the domain into ranges with approximately equally many elements.
         Each boundary item is a tuple of a form (col1_value, col2_value, ...).
+
+        The boundaries are cached by the input blocks, so that repeated sorts on the
+        same key of a materialized dataset skip the sampling pass.
         """
+        columns = sort_key.get_columns()
+        cache = SortTaskSpec._sample_boundaries_cache
+        cache_key = (
+            tuple(block.hex() for block in blocks),
+            tuple(columns),
+            num_reducers,
+        )
+        if cache_key in cache:
+            cache.move_to_end(cache_key)
+            # Return a copy, because callers may reverse the boundaries in place.
+            return list(cache[cache_key])
+        boundaries = SortTaskSpec._sample_boundaries(blocks, sort_key, num_reducers)
+        cache[cache_key] = boundaries
+        if len(cache) > SAMPLE_BOUNDARIES_CACHE_SIZE:
+            cache.popitem(last=False)
+        return list(boundaries)
+
+    @staticmethod
+    def _sample_boundaries(
+        blocks: List[ObjectRef[Block]], sort_key: SortKey, num_reducers: int
+    ) -> List[T]:
         columns = sort_key.get_columns()
         n_samples = int(num_reducers * 10 / len(blocks))
 
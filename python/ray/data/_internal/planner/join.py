@@ -0,0 +1,280 @@
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+import ray
+from ray.data._internal.delegating_block_builder import DelegatingBlockBuilder
+from ray.data._internal.execution.interfaces import RefBundle, TaskContext
+from ray.data._internal.planner.exchange.hash_shuffle_task_spec import (
+    HashShuffleTaskSpec,
+    sample_key_partitions,
+)
+from ray.data._internal.planner.exchange.pull_based_shuffle_task_scheduler import (
+    PullBasedShuffleTaskScheduler,
+)
+from ray.data._internal.planner.exchange.push_based_shuffle_task_scheduler import (
+    PushBasedShuffleTaskScheduler,
+)
+from ray.data._internal.remote_fn import cached_remote_fn
+from ray.data._internal.stats import StatsDict
+from ray.data._internal.util import unify_block_metadata_schema
+from ray.data.block import Block, BlockAccessor, BlockExecStats, BlockMetadata
+from ray.data.context import DataContext
+
+if TYPE_CHECKING:
+    import pyarrow
+
+    from ray.data._internal.progress_bar import ProgressBar
+
+# Maps the `how` argument of `Dataset.join` to Arrow join types.
+_ARROW_JOIN_TYPES = {
+    "inner": "inner",
+    "left": "left outer",
+    "outer": "full outer",
+}
+
+# Join types that are supported when broadcasting the right side.
+BROADCAST_JOIN_TYPES = ["inner", "left"]
+
+
+class JoinFn:
+    """The bulk function of a join.
+
+    Depending on the size of the right side, the join either broadcasts the right
+    side to a join task per left block, or hash-partitions both sides with the
+    exchange schedulers and joins the co-located partitions.
+    """
+
+    JOIN_SUB_PROGRESS_BAR_NAME = "Join"
+
+    def __init__(
+        self,
+        key: List[str],
+        how: str,
+        broadcast: Optional[bool] = None,
+        num_partitions: Optional[int] = None,
+        right_suffix: Optional[str] = None,
+    ):
+        self._key = key
+        self._how = how
+        self._broadcast = broadcast
+        self._num_partitions = num_partitions
+        self._right_suffix = right_suffix
+
+    def __call__(
+        self,
+        left_refs: List[RefBundle],
+        right_refs: List[RefBundle],
+        ctx: TaskContext,
+    ) -> Tuple[List[RefBundle], StatsDict]:
+        left_metadata = [meta for bundle in left_refs for meta in bundle.metadata]
+        right_metadata = [meta for bundle in right_refs for meta in bundle.metadata]
+        _validate_key(self._key, unify_block_metadata_schema(left_metadata), "left")
+        _validate_key(self._key, unify_block_metadata_schema(right_metadata), "right")
+
+        if not left_metadata and self._how != "outer":
+            return [], {}
+        if not right_metadata and self._how == "inner":
+            return [], {}
+
+        if self._should_broadcast(right_metadata):
+            return self._broadcast_join(left_refs, right_refs, ctx)
+        return self._hash_join(left_refs, right_refs, ctx)
+
+    def _should_broadcast(self, right_metadata: List[BlockMetadata]) -> bool:
+        if self._broadcast is not None:
+            return self._broadcast
+        if self._how not in BROADCAST_JOIN_TYPES:
+            return False
+        right_size = 0
+        for meta in right_metadata:
+            if meta.size_bytes is None:
+                return False
+            right_size += meta.size_bytes
+        return right_size <= DataContext.get_current().broadcast_join_threshold_bytes
+
+    def _broadcast_join(
+        self,
+        left_refs: List[RefBundle],
+        right_refs: List[RefBundle],
+        ctx: TaskContext,
+    ) -> Tuple[List[RefBundle], StatsDict]:
+        # Combine the right side into a single block once, so that every join task
+        # reads the same object instead of fetching and concatenating all the
+        # right blocks by itself.
+        concat_blocks = cached_remote_fn(_concat_blocks)
+        right_block = concat_blocks.remote(
+            *[block for bundle in right_refs for block in bundle.block_refs]
+        )
+
+        join_blocks = cached_remote_fn(_join_blocks, num_returns=2)
+        join_out = [
+            join_blocks.remote(
+                left_block,
+                right_block,
+                self._key,
+                self._how,
+                self._right_suffix,
+            )
+            for bundle in left_refs
+            for left_block in bundle.block_refs
+        ]
+        output, metadata = self._collect_outputs(join_out, ctx)
+        return output, {"join": metadata}
+
+    def _hash_join(
+        self,
+        left_refs: List[RefBundle],
+        right_refs: List[RefBundle],
+        ctx: TaskContext,
+    ) -> Tuple[List[RefBundle], StatsDict]:
+        num_partitions = self._num_partitions
+        if num_partitions is None:
+            num_partitions = max(
+                sum(len(bundle.blocks) for bundle in left_refs),
+                sum(len(bundle.blocks) for bundle in right_refs),
+                1,
+            )
+
+        # Split the hot keys of the left side over several partitions, and copy the
+        # right rows of those keys to each of them. Outer joins can't split keys,
+        # because the unmatched right rows would be output once per partition.
+        key_partitions = None
+        hot_key_threshold = DataContext.get_current().shuffle_hot_key_threshold
+        if hot_key_threshold is not None and self._how in BROADCAST_JOIN_TYPES:
+            key_partitions = sample_key_partitions(
+                left_refs, self._key, num_partitions, hot_key_threshold
+            )
+
+        # Both sides are shuffled with the same hash function, key partitions and
+        # number of partitions, so the i-th partitions of the two sides hold the
+        # same keys.
+        left_spec = HashShuffleTaskSpec(self._key, key_partitions=key_partitions)
+        right_spec = HashShuffleTaskSpec(
+            self._key, key_partitions=key_partitions, replicate_split_keys=True
+        )
+        if DataContext.get_current().use_push_based_shuffle:
+            scheduler_cls = PushBasedShuffleTaskScheduler
+        else:
+            scheduler_cls = PullBasedShuffleTaskScheduler
+        left_partitions, left_stats = scheduler_cls(left_spec).execute(
+            left_refs, num_partitions, ctx
+        )
+        right_partitions, right_stats = scheduler_cls(right_spec).execute(
+            right_refs, num_partitions, ctx
+        )
+
+        join_blocks = cached_remote_fn(_join_blocks, num_returns=2)
+        join_out = [
+            join_blocks.remote(
+                left.blocks[0][0],
+                right.blocks[0][0],
+                self._key,
+                self._how,
+                self._right_suffix,
+            )
+            for left, right in zip(left_partitions, right_partitions)
+        ]
+        # Release the shuffled partitions from the Ray object store.
+        del left_partitions, right_partitions
+
+        output, metadata = self._collect_outputs(join_out, ctx)
+        stats = {stage: left_stats[stage] + right_stats[stage] for stage in left_stats}
+        stats["join"] = metadata
+        return output, stats
+
+    def _collect_outputs(
+        self,
+        join_out: List[Tuple[ray.ObjectRef, ray.ObjectRef]],
+        ctx: TaskContext,
+    ) -> Tuple[List[RefBundle], List[BlockMetadata]]:
+        if not join_out:
+            return [], []
+        blocks, metadata = zip(*join_out)
+        join_bar: Optional["ProgressBar"] = None
+        if ctx.sub_progress_bar_dict is not None:
+            join_bar = ctx.sub_progress_bar_dict.get(self.JOIN_SUB_PROGRESS_BAR_NAME)
+        if join_bar is not None:
+            metadata = join_bar.fetch_until_complete(list(metadata))
+        else:
+            metadata = ray.get(list(metadata))
+        output = [
+            RefBundle([(block, meta)], owns_blocks=True)
+            for block, meta in zip(blocks, metadata)
+        ]
+        return output, metadata
+
+
+def _validate_key(
+    key: List[str], schema: Optional["pyarrow.lib.Schema"], side: str
+) -> None:
+    if schema is None or not hasattr(schema, "names"):
+        return
+    missing = [k for k in key if k not in schema.names]
+    if missing:
+        raise ValueError(
+            f"The join key {missing} isn't a column of the {side} dataset. Valid "
+            f"columns are: {schema.names}."
+        )
+
+
+def _concat_blocks(*blocks: Block) -> Block:
+    builder = DelegatingBlockBuilder()
+    for block in blocks:
+        builder.add_block(block)
+    return builder.build()
+
+
+def _join_blocks(
+    left: Block,
+    right: Block,
+    key: List[str],
+    how: str,
+    right_suffix: Optional[str],
+) -> Tuple[Block, BlockMetadata]:
+    stats = BlockExecStats.builder()
+    left = BlockAccessor.for_block(left).to_arrow()
+    right = BlockAccessor.for_block(right).to_arrow()
+
+    # Empty partitions built from no input blocks don't have a schema.
+    if not all(k in right.column_names for k in key):
+        result = left if how != "inner" else left.slice(0, 0)
+    elif not all(k in left.column_names for k in key):
+        result = right if how == "outer" else right.slice(0, 0)
+    else:
+        result = _join_tables(left, right, key, how, right_suffix)
+
+    accessor = BlockAccessor.for_block(result)
+    meta = accessor.get_metadata(input_files=None, exec_stats=stats.build())
+    return result, meta
+
+
+def _join_tables(
+    left: "pyarrow.Table",
+    right: "pyarrow.Table",
+    key: List[str],
+    how: str,
+    right_suffix: Optional[str],
+) -> "pyarrow.Table":
+    import pyarrow as pa
+
+    try:
+        return left.join(
+            right,
+            keys=key,
+            join_type=_ARROW_JOIN_TYPES[how],
+            right_suffix=right_suffix,
+            use_threads=False,
+        )
+    except (pa.ArrowNotImplementedError, pa.ArrowInvalid):
+        # Arrow can't join some column types (e.g., lists and tensor extension
+        # types), so fall back to pandas.
+        pass
+
+    left_df = BlockAccessor.for_block(left).to_pandas()
+    right_df = BlockAccessor.for_block(right).to_pandas()
+    df = left_df.merge(
+        right_df,
+        on=key,
+        how=how,
+        suffixes=("", right_suffix or ""),
+    )
+    return BlockAccessor.for_block(df).to_arrow()
@@ -64,6 +64,7 @@ def plan_all_to_all_op(
             op._num_outputs,
             op._shuffle,
             debug_limit_shuffle_execution_to_num_blocks,
+            keys=op._keys,
         )
     elif isinstance(op, Sort):
         debug_limit_shuffle_execution_to_num_blocks = (
@@ -80,7 +81,12 @@ def plan_all_to_all_op(
             )
         )
         fn = generate_aggregate_fn(
-            op._key, op._aggs, debug_limit_shuffle_execution_to_num_blocks
+            op._key,
+            op._aggs,
+            ordered=op._ordered and DataContext.get_current().sort_groupby_outputs,
+            _debug_limit_shuffle_execution_to_num_blocks=(
+                debug_limit_shuffle_execution_to_num_blocks
+            ),
         )
         target_max_block_size = DataContext.get_current().target_shuffle_max_block_size
     else:
@@ -53,6 +53,7 @@ def plan_read_op(
     See Planner.plan() for more details.
     """
     assert len(physical_children) == 0
+    write_checkpoint = op._write_checkpoint
 
     def get_input_data(target_max_block_size) -> List[RefBundle]:
         parallelism = op.get_detected_parallelism()
@@ -61,6 +62,8 @@ def plan_read_op(
         ), "Read parallelism must be set by the optimizer before execution"
         read_tasks = op._datasource_or_legacy_reader.get_read_tasks(parallelism)
         _warn_on_high_parallelism(parallelism, len(read_tasks))
+        if write_checkpoint is not None:
+            read_tasks = write_checkpoint.filter_read_tasks(read_tasks)
 
         return [
             RefBundle(
@@ -84,10 +87,16 @@ def plan_read_op(
         input_data_factory=get_input_data,
     )
 
-    def do_read(blocks: Iterable[ReadTask], _: TaskContext) -> Iterable[Block]:
+    def do_read(blocks: Iterable[ReadTask], ctx: TaskContext) -> Iterable[Block]:
         """Yield from read tasks, with retry logic upon transient read errors."""
         for read_task in blocks:
             read_fn_name = read_task._read_fn.__name__
+            if write_checkpoint is not None:
+                # Pass the input files to the checkpointed write. See
+                # `WriteCheckpointRule`.
+                if ctx.read_input_files is None:
+                    ctx.read_input_files = []
+                ctx.read_input_files.extend(read_task.get_metadata().input_files or [])
 
             yield from call_with_retry(
                 f=read_task,
@@ -17,6 +17,7 @@ from ray.data._internal.execution.interfaces.task_context import TaskContext
 from ray.data._internal.execution.operators.map_operator import MapOperator
 from ray.data._internal.execution.operators.map_transformer import (
     BatchMapTransformFn,
+    BlockMapTransformFn,
     BlocksToBatchesMapTransformFn,
     BlocksToRowsMapTransformFn,
     BuildOutputBlocksMapTransformFn,
@@ -28,10 +29,12 @@ from ray.data._internal.execution.operators.map_transformer import (
 from ray.data._internal.execution.util import make_callable_class_concurrent
 from ray.data._internal.logical.operators.map_operator import (
     AbstractUDFMap,
+    AddColumn,
     Filter,
     FlatMap,
     MapBatches,
     MapRows,
+    Project,
 )
 from ray.data._internal.numpy_support import is_valid_udf_return
 from ray.data._internal.util import _truncated_repr
@@ -105,14 +108,27 @@ def plan_udf_map_op(
             transform_fn = _generate_transform_fn_for_map_rows(fn)
         elif isinstance(op, FlatMap):
             transform_fn = _generate_transform_fn_for_flat_map(fn)
+        elif isinstance(op, Filter) and op._filter_expr is not None:
+            transform_fn = _generate_transform_fn_for_filter_expr(op._filter_expr)
         elif isinstance(op, Filter):
             transform_fn = _generate_transform_fn_for_filter(fn)
+        elif isinstance(op, (Project, AddColumn)):
+            transform_fn = _generate_transform_fn_for_blocks(fn)
         else:
             raise ValueError(f"Found unknown logical operator during planning: {op}")
 
-        map_transformer = _create_map_transformer_for_row_based_map_op(
-            transform_fn, init_fn
-        )
+        if isinstance(op, (Project, AddColumn)) or (
+            isinstance(op, Filter) and op._filter_expr is not None
+        ):
+            # Projections and Arrow expressions operate on whole blocks, so skip
+            # the conversion to rows.
+            map_transformer = _create_map_transformer_for_block_based_map_op(
+                transform_fn, init_fn
+            )
+        else:
+            map_transformer = _create_map_transformer_for_row_based_map_op(
+                transform_fn, init_fn
+            )
 
     return MapOperator.create(
         map_transformer,
@@ -403,6 +419,34 @@ def _generate_transform_fn_for_filter(
 # Following are util functions for creating `MapTransformer`s.
 
 
+def _generate_transform_fn_for_filter_expr(
+    filter_expr: "pa.dataset.Expression",
+) -> MapTransformCallable[Block, Block]:
+    from ray.data._internal.arrow_block import ArrowBlockAccessor
+
+    def transform_fn(blocks: Iterable[Block], _: TaskContext) -> Iterable[Block]:
+        for block in blocks:
+            table = BlockAccessor.for_block(block).to_arrow()
+            yield ArrowBlockAccessor(table).filter(filter_expr)
+
+    return transform_fn
+
+
+def _generate_transform_fn_for_blocks(
+    fn: UserDefinedFunction,
+) -> MapTransformCallable[Block, Block]:
+    def transform_fn(blocks: Iterable[Block], _: TaskContext) -> Iterable[Block]:
+        for block in blocks:
+            # Like `map_batches`, pass empty blocks through without calling `fn`,
+            # because some all-to-all operators output empty blocks with no schema.
+            if BlockAccessor.for_block(block).num_rows() == 0:
+                yield block
+            else:
+                yield fn(block)
+
+    return transform_fn
+
+
 def _create_map_transformer_for_map_batches_op(
     batch_fn: MapTransformCallable[DataBatch, DataBatch],
     batch_size: Optional[int] = None,
@@ -443,6 +487,21 @@ def _create_map_transformer_for_row_based_map_op(
     return MapTransformer(transform_fns, init_fn=init_fn)
 
 
+def _create_map_transformer_for_block_based_map_op(
+    block_fn: MapTransformCallable[Block, Block],
+    init_fn: Optional[Callable[[], None]] = None,
+) -> MapTransformer:
+    """Create a MapTransformer for a block-based map operator
+    (e.g. projections and filter expressions)."""
+    transform_fns = [
+        # Apply the transform to input blocks directly.
+        BlockMapTransformFn(block_fn),
+        # Convert output blocks to blocks of the target size.
+        BuildOutputBlocksMapTransformFn.for_blocks(),
+    ]
+    return MapTransformer(transform_fns, init_fn=init_fn)
+
+
 # Following are util functions for the legacy code path.
 
 
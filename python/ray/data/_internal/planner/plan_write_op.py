@@ -1,4 +1,5 @@
-from typing import Callable, Iterator, List, Union
+import uuid
+from typing import Callable, Iterator, List, Optional, Union
 
 from ray.data._internal.compute import TaskPoolStrategy
 from ray.data._internal.execution.interfaces import PhysicalOperator
@@ -9,19 +10,37 @@ from ray.data._internal.execution.operators.map_transformer import (
     MapTransformer,
 )
 from ray.data._internal.logical.operators.write_operator import Write
+from ray.data._internal.write_checkpoint import WriteCheckpoint
 from ray.data.block import Block
 from ray.data.datasource.datasink import Datasink
 from ray.data.datasource.datasource import Datasource
 
 
 def generate_write_fn(
-    datasink_or_legacy_datasource: Union[Datasink, Datasource], **write_args
+    datasink_or_legacy_datasource: Union[Datasink, Datasource],
+    checkpoint: Optional[WriteCheckpoint] = None,
+    **write_args,
 ) -> Callable[[Iterator[Block], TaskContext], Iterator[Block]]:
     # If the write op succeeds, the resulting Dataset is a list of
     # arbitrary objects (one object per write task). Otherwise, an error will
     # be raised. The Datasource can handle execution outcomes with the
     # on_write_complete() and on_write_failed().
     def fn(blocks: Iterator[Block], ctx) -> Iterator[Block]:
+        output_files = []
+        attempt_id = uuid.uuid4().hex
+
+        def on_write_file(path: str):
+            # Record each output file before it's written, so that it's deleted if
+            # this attempt doesn't complete.
+            if ctx.read_input_files:
+                output_files.append(path)
+                checkpoint.record_pending(
+                    attempt_id, ctx.read_input_files, output_files
+                )
+
+        if checkpoint is not None:
+            ctx.on_write_file = on_write_file
+
         if isinstance(datasink_or_legacy_datasource, Datasink):
             write_result = datasink_or_legacy_datasource.write(blocks, ctx)
         else:
@@ -29,6 +48,10 @@ def generate_write_fn(
                 blocks, ctx, **write_args
             )
 
+        if checkpoint is not None and ctx.read_input_files:
+            # All the rows of the input files of this task are written now.
+            checkpoint.record(attempt_id, ctx.read_input_files, output_files)
+
         # NOTE: Write tasks can return anything, so we need to wrap it in a valid block
         # type.
         import pandas as pd
@@ -45,7 +68,9 @@ def plan_write_op(
     assert len(physical_children) == 1
     input_physical_dag = physical_children[0]
 
-    write_fn = generate_write_fn(op._datasink_or_legacy_datasource, **op._write_args)
+    write_fn = generate_write_fn(
+        op._datasink_or_legacy_datasource, op._checkpoint, **op._write_args
+    )
     # Create a MapTransformer for a write operator
     transform_fns = [
         BlockMapTransformFn(write_fn),
@@ -29,6 +29,7 @@ def register_plan_logical_op_fn(
 
 def _register_default_plan_logical_op_fns():
     from ray.data._internal.execution.operators.input_data_buffer import InputDataBuffer
+    from ray.data._internal.execution.operators.join_operator import JoinOperator
     from ray.data._internal.execution.operators.limit_operator import LimitOperator
     from ray.data._internal.execution.operators.union_operator import UnionOperator
     from ray.data._internal.execution.operators.zip_operator import ZipOperator
@@ -38,10 +39,12 @@ def _register_default_plan_logical_op_fns():
     from ray.data._internal.logical.operators.from_operators import AbstractFrom
     from ray.data._internal.logical.operators.input_data_operator import InputData
     from ray.data._internal.logical.operators.map_operator import AbstractUDFMap
-    from ray.data._internal.logical.operators.n_ary_operator import Union, Zip
+    from ray.data._internal.logical.operators.n_ary_operator import Join, Union, Zip
     from ray.data._internal.logical.operators.one_to_one_operator import Limit
     from ray.data._internal.logical.operators.read_operator import Read
     from ray.data._internal.logical.operators.write_operator import Write
+    from ray.data._internal.planner.exchange.interfaces import ExchangeTaskSpec
+    from ray.data._internal.planner.join import BROADCAST_JOIN_TYPES, JoinFn
     from ray.data._internal.planner.plan_all_to_all_op import plan_all_to_all_op
     from ray.data._internal.planner.plan_read_op import plan_read_op
     from ray.data._internal.planner.plan_udf_map_op import plan_udf_map_op
@@ -85,6 +88,38 @@ def _register_default_plan_logical_op_fns():
 
     register_plan_logical_op_fn(Union, plan_union_op)
 
+    def plan_join_op(logical_op: Join, physical_children):
+        assert len(physical_children) == 2
+        join_fn = JoinFn(
+            key=logical_op._key,
+            how=logical_op._how,
+            broadcast=logical_op._broadcast,
+            num_partitions=logical_op._num_partitions,
+            right_suffix=logical_op._right_suffix,
+        )
+        # A broadcast join outputs a block per block of the left side, which isn't
+        # broadcast, so the number of partitions only applies to shuffle joins.
+        # Otherwise, the number of outputs defaults to that of the left side.
+        num_outputs = None
+        if logical_op._broadcast is False or (
+            logical_op._broadcast is None
+            and logical_op._how not in BROADCAST_JOIN_TYPES
+        ):
+            num_outputs = logical_op._num_partitions
+        return JoinOperator(
+            join_fn,
+            physical_children[0],
+            physical_children[1],
+            num_outputs=num_outputs,
+            sub_progress_bar_names=[
+                ExchangeTaskSpec.MAP_SUB_PROGRESS_BAR_NAME,
+                ExchangeTaskSpec.REDUCE_SUB_PROGRESS_BAR_NAME,
+                JoinFn.JOIN_SUB_PROGRESS_BAR_NAME,
+            ],
+        )
+
+    register_plan_logical_op_fn(Join, plan_join_op)
+
     def plan_limit_op(logical_op, physical_children):
         assert len(physical_children) == 1
         return LimitOperator(logical_op._limit, physical_children[0])
@@ -6,6 +6,10 @@ from ray.data._internal.execution.interfaces import (
     TaskContext,
 )
 from ray.data._internal.execution.operators.map_transformer import MapTransformer
+from ray.data._internal.planner.exchange.hash_shuffle_task_spec import (
+    HashShuffleTaskSpec,
+    sample_key_partitions,
+)
 from ray.data._internal.planner.exchange.pull_based_shuffle_task_scheduler import (
     PullBasedShuffleTaskScheduler,
 )
@@ -24,9 +28,35 @@ def generate_repartition_fn(
     num_outputs: int,
     shuffle: bool,
     _debug_limit_shuffle_execution_to_num_blocks: Optional[int] = None,
+    keys: Optional[List[str]] = None,
 ) -> AllToAllTransformFn:
     """Generate function to partition each records of blocks."""
 
+    def hash_repartition_fn(
+        refs: List[RefBundle],
+        ctx: TaskContext,
+    ) -> Tuple[List[RefBundle], StatsDict]:
+        # Balance the partitions by the sampled bytes of the keys. Hot keys are
+        # never split, so that each key's rows stay in a single block.
+        key_partitions = sample_key_partitions(
+            refs, keys, num_outputs, hot_key_threshold=None
+        )
+        shuffle_spec = HashShuffleTaskSpec(keys, key_partitions=key_partitions)
+
+        if DataContext.get_current().use_push_based_shuffle:
+            scheduler = PushBasedShuffleTaskScheduler(shuffle_spec)
+        else:
+            scheduler = PullBasedShuffleTaskScheduler(shuffle_spec)
+
+        return scheduler.execute(
+            refs,
+            num_outputs,
+            ctx,
+            _debug_limit_execution_to_num_blocks=(
+                _debug_limit_shuffle_execution_to_num_blocks
+            ),
+        )
+
     def shuffle_repartition_fn(
         refs: List[RefBundle],
         ctx: TaskContext,
@@ -77,6 +107,8 @@ def generate_repartition_fn(
         scheduler = SplitRepartitionTaskScheduler(shuffle_spec)
         return scheduler.execute(refs, num_outputs, ctx)
 
+    if keys:
+        return hash_repartition_fn
     if shuffle:
         return shuffle_repartition_fn
     return split_repartition_fn
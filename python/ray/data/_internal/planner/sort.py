@@ -1,3 +1,4 @@
+import math
 from functools import partial
 from typing import List, Optional, Tuple
 
@@ -6,6 +7,9 @@ from ray.data._internal.execution.interfaces import (
     RefBundle,
     TaskContext,
 )
+from ray.data._internal.planner.exchange.external_sort_task_spec import (
+    ExternalSortTaskSpec,
+)
 from ray.data._internal.planner.exchange.pull_based_shuffle_task_scheduler import (
     PullBasedShuffleTaskScheduler,
 )
@@ -38,9 +42,18 @@ def generate_sort_fn(
             return (blocks, {})
         sort_key.validate_schema(unify_block_metadata_schema(metadata))
 
+        data_context = DataContext.get_current()
         num_mappers = len(blocks)
         # Use same number of output partitions.
         num_outputs = num_mappers
+        if data_context.use_external_sort:
+            # Use enough output partitions for each of them to fit in a shuffle
+            # block.
+            total_size = sum(meta.size_bytes or 0 for meta in metadata)
+            num_outputs = max(
+                num_outputs,
+                math.ceil(total_size / data_context.target_shuffle_max_block_size),
+            )
 
         # Sample boundaries for sort key.
         if not sort_key.boundaries:
@@ -51,9 +64,18 @@ def generate_sort_fn(
         _, ascending = sort_key.to_pandas_sort_args()
         if not ascending:
             boundaries.reverse()
-        sort_spec = SortTaskSpec(boundaries=boundaries, sort_key=sort_key)
+        if data_context.use_external_sort and not data_context.use_polars:
+            # The merge compares keys like Arrow sorts them, so the runs can't be
+            # sorted with Polars, which places nulls differently.
+            sort_spec = ExternalSortTaskSpec(
+                boundaries=boundaries,
+                sort_key=sort_key,
+                spill_dir=data_context.external_sort_spill_dir,
+            )
+        else:
+            sort_spec = SortTaskSpec(boundaries=boundaries, sort_key=sort_key)
 
-        if DataContext.get_current().use_push_based_shuffle:
+        if data_context.use_push_based_shuffle:
             scheduler = PushBasedShuffleTaskScheduler(sort_spec)
         else:
             scheduler = PullBasedShuffleTaskScheduler(sort_spec)
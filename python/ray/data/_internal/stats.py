@@ -13,6 +13,7 @@ import ray
 from ray.actor import ActorHandle
 from ray.data._internal.block_list import BlockList
 from ray.data._internal.execution.interfaces.op_runtime_metrics import OpRuntimeMetrics
+from ray.data._internal.task_profiler import TaskProfile, profiles_to_speedscope
 from ray.data._internal.util import capfirst
 from ray.data.block import BlockMetadata
 from ray.data.context import DataContext
@@ -206,6 +207,11 @@ class _StatsActor:
         )
 
         # === Metrics from OpRuntimeMetrics ===
+        self._histogram_buckets: Dict[str, List[float]] = {
+            field.name: field.metadata["histogram_buckets"]
+            for field in fields(OpRuntimeMetrics)
+            if "histogram_buckets" in field.metadata
+        }
         # Inputs-related metrics
         self.execution_metrics_inputs = (
             self._create_prometheus_metrics_for_execution_metrics(
@@ -272,13 +278,31 @@ class _StatsActor:
                 continue
             metric_name = f"data_{field.name}"
             metric_description = field.metadata.get("description")
+            metric_tag_keys = tag_keys
+            if "histogram_buckets" in field.metadata:
+                metric_tag_keys = tag_keys + ("bucket",)
             metrics[field.name] = Gauge(
                 metric_name,
                 description=metric_description,
-                tag_keys=tag_keys,
+                tag_keys=metric_tag_keys,
             )
         return metrics
 
+    def _set_execution_metric(
+        self,
+        field_name: str,
+        prom_metric: Gauge,
+        value: Union[int, float, Dict[float, int]],
+        tags: Dict[str, str],
+    ):
+        if field_name in self._histogram_buckets:
+            # Histograms are exported as a gauge per bucket.
+            for upper_bound in self._histogram_buckets[field_name]:
+                count = value.get(upper_bound, 0) if isinstance(value, dict) else 0
+                prom_metric.set(count, {**tags, "bucket": str(upper_bound)})
+        else:
+            prom_metric.set(value, tags)
+
     def record_start(self, stats_uuid):
         self.start_time[stats_uuid] = time.perf_counter()
         self.fifo_queue.append(stats_uuid)
@@ -328,7 +352,7 @@ class _StatsActor:
     def update_execution_metrics(
         self,
         dataset_tag: str,
-        op_metrics: List[Dict[str, Union[int, float]]],
+        op_metrics: List[Dict[str, Union[int, float, Dict[float, int]]]],
         operator_tags: List[str],
         state: Dict[str, Any],
     ):
@@ -344,22 +368,32 @@ class _StatsActor:
             self.gpu_usage_cores.set(stats.get("gpu_usage", 0), tags)
 
             for field_name, prom_metric in self.execution_metrics_inputs.items():
-                prom_metric.set(stats.get(field_name, 0), tags)
+                self._set_execution_metric(
+                    field_name, prom_metric, stats.get(field_name, 0), tags
+                )
 
             for field_name, prom_metric in self.execution_metrics_outputs.items():
-                prom_metric.set(stats.get(field_name, 0), tags)
+                self._set_execution_metric(
+                    field_name, prom_metric, stats.get(field_name, 0), tags
+                )
 
             for field_name, prom_metric in self.execution_metrics_tasks.items():
-                prom_metric.set(stats.get(field_name, 0), tags)
+                self._set_execution_metric(
+                    field_name, prom_metric, stats.get(field_name, 0), tags
+                )
 
             for (
                 field_name,
                 prom_metric,
             ) in self.execution_metrics_obj_store_memory.items():
-                prom_metric.set(stats.get(field_name, 0), tags)
+                self._set_execution_metric(
+                    field_name, prom_metric, stats.get(field_name, 0), tags
+                )
 
             for field_name, prom_metric in self.execution_metrics_misc.items():
-                prom_metric.set(stats.get(field_name, 0), tags)
+                self._set_execution_metric(
+                    field_name, prom_metric, stats.get(field_name, 0), tags
+                )
 
         # This update is called from a dataset's executor,
         # so all tags should contain the same dataset
@@ -387,20 +421,23 @@ class _StatsActor:
             self.cpu_usage_cores.set(0, tags)
             self.gpu_usage_cores.set(0, tags)
 
-            for prom_metric in self.execution_metrics_inputs.values():
-                prom_metric.set(0, tags)
+            for field_name, prom_metric in self.execution_metrics_inputs.items():
+                self._set_execution_metric(field_name, prom_metric, 0, tags)
 
-            for prom_metric in self.execution_metrics_outputs.values():
-                prom_metric.set(0, tags)
+            for field_name, prom_metric in self.execution_metrics_outputs.items():
+                self._set_execution_metric(field_name, prom_metric, 0, tags)
 
-            for prom_metric in self.execution_metrics_tasks.values():
-                prom_metric.set(0, tags)
+            for field_name, prom_metric in self.execution_metrics_tasks.items():
+                self._set_execution_metric(field_name, prom_metric, 0, tags)
 
-            for prom_metric in self.execution_metrics_obj_store_memory.values():
-                prom_metric.set(0, tags)
+            for (
+                field_name,
+                prom_metric,
+            ) in self.execution_metrics_obj_store_memory.items():
+                self._set_execution_metric(field_name, prom_metric, 0, tags)
 
-            for prom_metric in self.execution_metrics_misc.values():
-                prom_metric.set(0, tags)
+            for field_name, prom_metric in self.execution_metrics_misc.items():
+                self._set_execution_metric(field_name, prom_metric, 0, tags)
 
     def clear_iteration_metrics(self, dataset_tag: str):
         tags = self._create_tags(dataset_tag)
@@ -1043,6 +1080,29 @@ class DatasetStatsSummary:
             for summ in summaries
         )
 
+    def to_speedscope(self) -> Dict[str, Any]:
+        """Return the sampled stacks of the tasks of each operator of this Dataset
+        and its parents in the speedscope file format, to view them as flame graphs
+        at https://www.speedscope.app.
+
+        The stacks are only sampled if ``DataContext.enable_task_profiling`` is set.
+        """
+        profiles = []
+        seen = set()
+
+        def collect(summary: "DatasetStatsSummary"):
+            for parent in summary.parents:
+                collect(parent)
+            for operator_stats in summary.operators_stats:
+                operator_uuid = summary.dataset_uuid + operator_stats.operator_name
+                if operator_stats.profile is None or operator_uuid in seen:
+                    continue
+                seen.add(operator_uuid)
+                profiles.append((operator_stats.operator_name, operator_stats.profile))
+
+        collect(self)
+        return profiles_to_speedscope(profiles)
+
     def get_total_cpu_time(self) -> float:
         parent_sum = sum(p.get_total_cpu_time() for p in self.parents)
         return parent_sum + sum(
@@ -1089,6 +1149,8 @@ class OperatorStatsSummary:
     # node_count: "count" stat instead of "sum"
     node_count: Optional[Dict[str, float]] = None
     task_rows: Optional[Dict[str, float]] = None
+    # The sampled stacks of the tasks of the operator, if task profiling is enabled.
+    profile: Optional[TaskProfile] = None
 
     @classmethod
     def from_block_metadata(
@@ -1218,6 +1280,13 @@ class OperatorStatsSummary:
                 "count": len(node_counts),
             }
 
+        profile = None
+        for e in exec_stats:
+            if e.profile is not None:
+                if profile is None:
+                    profile = TaskProfile()
+                profile.merge(e.profile)
+
         return OperatorStatsSummary(
             operator_name=operator_name,
             is_sub_operator=is_sub_operator,
@@ -1233,6 +1302,7 @@ class OperatorStatsSummary:
             output_size_bytes=output_size_bytes_stats,
             node_count=node_counts_stats,
             task_rows=task_rows_stats,
+            profile=profile,
         )
 
     def __str__(self) -> str:
@@ -1330,6 +1400,17 @@ class OperatorStatsSummary:
                 node_count_stats["mean"],
                 node_count_stats["count"],
             )
+
+        profile = self.profile
+        if profile and profile.total_time_s() > 0:
+            total_time_s = profile.total_time_s()
+            out += indent
+            out += "* Sampled task time: {} total\n".format(fmt(total_time_s))
+            for category, time_s in profile.category_time_s().items():
+                out += indent
+                out += "\t* {}: {} ({:.1f}%)\n".format(
+                    category, fmt(time_s), time_s / total_time_s * 100
+                )
         if output_num_rows_stats and self.time_total_s and wall_time_stats:
             # For throughput, we compute both an observed Ray Data operator throughput
             # and an estimated single node operator throughput.
@@ -0,0 +1,223 @@
+import os
+import sys
+import threading
+import time
+import types
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import ray
+
+# The categories that the sampled time of tasks is attributed to.
+UDF = "UDF"
+FORMAT_CONVERSION = "Format conversion"
+SERIALIZATION = "Serialization"
+OBJECT_STORE = "Object store"
+OTHER = "Other"
+CATEGORIES = [UDF, FORMAT_CONVERSION, SERIALIZATION, OBJECT_STORE, OTHER]
+
+# The maximum number of innermost frames kept for each sampled stack.
+MAX_STACK_DEPTH = 128
+
+# A frame of a sampled stack: (function name, file name, first line number).
+Frame = Tuple[str, str, int]
+# A sampled stack, from the outermost frame to the innermost one.
+Stack = Tuple[Frame, ...]
+
+_RAY_DIR = os.path.dirname(os.path.abspath(ray.__file__)) + os.sep
+_RAY_DATA_DIR = os.path.join(_RAY_DIR, "data") + os.sep
+
+# Methods of block accessors that convert blocks between formats.
+_BLOCK_FILES = {
+    os.path.join(_RAY_DATA_DIR, "block.py"),
+    os.path.join(_RAY_DATA_DIR, "_internal", "arrow_block.py"),
+    os.path.join(_RAY_DATA_DIR, "_internal", "pandas_block.py"),
+    os.path.join(_RAY_DATA_DIR, "_internal", "table_block.py"),
+}
+_SERIALIZATION_FILE = os.path.join(_RAY_DIR, "_private", "serialization.py")
+_WORKER_FILE = os.path.join(_RAY_DIR, "_private", "worker.py")
+_OBJECT_STORE_FUNCTIONS = {"get", "put", "wait", "get_objects", "put_object"}
+_UDF_PLANNER_FILE = os.path.join(
+    _RAY_DATA_DIR, "_internal", "planner", "plan_udf_map_op.py"
+)
+
+
+class TaskProfile:
+    """The sampled stacks of one or more tasks, and the time attributed to them."""
+
+    def __init__(self):
+        # The sampled time of each stack, and the category of each stack.
+        self.stack_time_s: Dict[Stack, float] = {}
+        self.stack_category: Dict[Stack, str] = {}
+
+    def add(self, stack: Stack, category: str, time_s: float):
+        self.stack_time_s[stack] = self.stack_time_s.get(stack, 0) + time_s
+        self.stack_category[stack] = category
+
+    def merge(self, other: "TaskProfile"):
+        for stack, time_s in other.stack_time_s.items():
+            self.add(stack, other.stack_category[stack], time_s)
+
+    def total_time_s(self) -> float:
+        return sum(self.stack_time_s.values())
+
+    def category_time_s(self) -> Dict[str, float]:
+        """Return the sampled time of each category, in the order of ``CATEGORIES``."""
+        times = {category: 0.0 for category in CATEGORIES}
+        for stack, time_s in self.stack_time_s.items():
+            times[self.stack_category[stack]] += time_s
+        return times
+
+
+class TaskProfiler:
+    """Samples the stack of the calling thread from a background thread.
+
+    Each sample is attributed the time since the previous sample, and is
+    categorized by its innermost frame that belongs to a category:
+
+    * Format conversion: the ``to_*`` and ``batch_to_block`` methods of block
+      accessors.
+    * Serialization: Ray's serialization context, which also covers
+      deserialization when getting objects.
+    * Object store: ``ray.get``, ``ray.put``, and ``ray.wait``.
+    * UDF: the user-defined function of a map operator.
+
+    Samples without any of these frames are attributed to other Ray Data code.
+    """
+
+    def __init__(self, interval_s: float):
+        self._interval_s = interval_s
+        self._thread_id = threading.get_ident()
+        self._profile = TaskProfile()
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._sampler = threading.Thread(
+            target=self._run, name="RayDataTaskProfiler", daemon=True
+        )
+        self._udf_entry_codes = _get_udf_entry_codes()
+
+    def start(self):
+        self._sampler.start()
+
+    def stop(self):
+        self._stopped.set()
+        self._sampler.join()
+
+    def collect(self) -> TaskProfile:
+        """Return the profile sampled since the last call, and start a new one."""
+        with self._lock:
+            profile = self._profile
+            self._profile = TaskProfile()
+        return profile
+
+    def _run(self):
+        last_sample_time = time.perf_counter()
+        while not self._stopped.wait(self._interval_s):
+            frame = sys._current_frames().get(self._thread_id)
+            now = time.perf_counter()
+            if frame is None:
+                break
+            stack, category = self._sample(frame)
+            with self._lock:
+                self._profile.add(stack, category, now - last_sample_time)
+            last_sample_time = now
+
+    def _sample(self, frame: types.FrameType) -> Tuple[Stack, str]:
+        codes: List[types.CodeType] = []
+        while frame is not None:
+            codes.append(frame.f_code)
+            frame = frame.f_back
+        codes.reverse()
+
+        category = OTHER
+        caller_file = None
+        for code in codes:
+            file = code.co_filename
+            if code in self._udf_entry_codes or (
+                # The frames of generator UDFs are resumed by the planner directly.
+                caller_file == _UDF_PLANNER_FILE
+                and not file.startswith(_RAY_DIR)
+            ):
+                category = UDF
+            frame_category = _categorize_frame(code)
+            if frame_category is not None:
+                category = frame_category
+            caller_file = file
+
+        stack = tuple(
+            (code.co_name, code.co_filename, code.co_firstlineno)
+            for code in codes[-MAX_STACK_DEPTH:]
+        )
+        return stack, category
+
+
+def _categorize_frame(code: types.CodeType) -> Optional[str]:
+    file = code.co_filename
+    name = code.co_name
+    if file in _BLOCK_FILES and (name.startswith("to_") or name == "batch_to_block"):
+        return FORMAT_CONVERSION
+    if file == _SERIALIZATION_FILE:
+        return SERIALIZATION
+    if file == _WORKER_FILE and name in _OBJECT_STORE_FUNCTIONS:
+        return OBJECT_STORE
+    return None
+
+
+def _get_udf_entry_codes() -> Set[types.CodeType]:
+    """Return the code of the functions that call the UDFs of map operators."""
+    from ray.data._internal.planner.plan_udf_map_op import _parse_op_fn
+
+    return {
+        const
+        for const in _parse_op_fn.__code__.co_consts
+        if isinstance(const, types.CodeType) and const.co_name == "fn"
+    }
+
+
+def profiles_to_speedscope(profiles: List[Tuple[str, TaskProfile]]) -> Dict[str, Any]:
+    """Convert profiles to the speedscope file format (https://www.speedscope.app).
+
+    Each profile is exported as a sampled profile, whose stacks are rooted at
+    their category, so that the flame graph groups them by category.
+
+    Args:
+        profiles: The names of the profiles, and the profiles.
+    """
+    frames: List[Dict[str, Any]] = []
+    frame_indices: Dict[Frame, int] = {}
+
+    def frame_index(frame: Frame) -> int:
+        if frame not in frame_indices:
+            frame_indices[frame] = len(frames)
+            name, file, line = frame
+            if file:
+                frames.append({"name": name, "file": file, "line": line})
+            else:
+                frames.append({"name": name})
+        return frame_indices[frame]
+
+    speedscope_profiles = []
+    for name, profile in profiles:
+        samples = []
+        weights = []
+        for stack, time_s in profile.stack_time_s.items():
+            category_frame = (f"[{profile.stack_category[stack]}]", "", 0)
+            samples.append([frame_index(f) for f in (category_frame,) + stack])
+            weights.append(time_s)
+        speedscope_profiles.append(
+            {
+                "type": "sampled",
+                "name": name,
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": sum(weights),
+                "samples": samples,
+                "weights": weights,
+            }
+        )
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "shared": {"frames": frames},
+        "profiles": speedscope_profiles,
+        "name": "Ray Data task profile",
+        "exporter": "ray.data",
+    }
@@ -711,7 +711,12 @@ def find_partition_index(
     table: Union["pyarrow.Table", "pandas.DataFrame"],
     desired: List[Any],
     sort_key: "SortKey",
+    include_equal: bool = False,
 ) -> int:
+    """Return the number of items in the sorted table that come before ``desired``.
+
+    If ``include_equal`` is True, the items equal to ``desired`` are counted too.
+    """
     columns = sort_key.get_columns()
     descending = sort_key.get_descending()
 
@@ -746,6 +751,8 @@ def find_partition_index(
         else:
             left = prevleft + np.searchsorted(col_vals, desired_val, side="left")
             right = prevleft + np.searchsorted(col_vals, desired_val, side="right")
+    if include_equal:
+        return right
     return right if descending is True else left
 
 
@@ -0,0 +1,207 @@
+import json
+import logging
+import posixpath
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
+
+if TYPE_CHECKING:
+    import pyarrow
+
+    from ray.data.datasource.datasource import ReadTask
+
+logger = logging.getLogger(__name__)
+
+# The suffix of the records of the output files that a write task attempt is
+# writing, before the attempt completes.
+_PENDING_SUFFIX = ".pending.json"
+
+# The name of the file that records the read parallelism of the first execution of
+# the write.
+_READ_PARALLELISM_FILENAME = "_read_parallelism.json"
+
+
+class WriteCheckpoint:
+    """Records the input files whose rows a write has fully written, so that the
+    write can skip reading them again when it's restarted.
+
+    Each write task records the input files of the read tasks that it was fused
+    with, and the output files it wrote, in a JSON file in the checkpoint
+    directory once all of its output is written. Before a task attempt opens an
+    output file, it records the file as pending, so that the outputs of attempts
+    that didn't complete can be deleted when the write is resumed. Files are
+    never appended to, so the checkpoint works on any ``pyarrow.fs`` filesystem,
+    including object stores.
+
+    Since the input files are recorded by read task, the checkpoint also records
+    the read parallelism of the first execution of the write, so that a resumed
+    write splits the files into the same read tasks.
+    """
+
+    def __init__(self, path: str, filesystem: Optional["pyarrow.fs.FileSystem"] = None):
+        from ray.data.datasource.path_util import _resolve_paths_and_filesystem
+
+        paths, self._filesystem = _resolve_paths_and_filesystem(path, filesystem)
+        self._path = paths[0]
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def create(self):
+        """Create the checkpoint directory, if it doesn't exist yet."""
+        self._filesystem.create_dir(self._path, recursive=True)
+
+    def completed_input_files(self) -> Set[str]:
+        """Return the input files recorded by all the completed write tasks."""
+        input_files = set()
+        for record in self._read_records(pending=False).values():
+            input_files.update(record["input_files"])
+        return input_files
+
+    def read_parallelism(self) -> Optional[int]:
+        """Return the recorded read parallelism, or None if it isn't recorded yet."""
+        path = posixpath.join(self._path, _READ_PARALLELISM_FILENAME)
+        try:
+            with self._filesystem.open_input_stream(path) as f:
+                return json.loads(f.read())["parallelism"]
+        except FileNotFoundError:
+            return None
+
+    def record_read_parallelism(self, parallelism: int):
+        """Record the read parallelism, to read with it when the write is resumed."""
+        self._write_record(_READ_PARALLELISM_FILENAME, {"parallelism": parallelism})
+
+    def record_pending(
+        self, attempt_id: str, input_files: List[str], output_files: List[str]
+    ):
+        """Record the output files that a write task attempt is about to write.
+
+        Args:
+            attempt_id: A unique ID of the write task attempt.
+            input_files: The input files read by the attempt so far.
+            output_files: The output files written by the attempt so far, including
+                the one it's about to write.
+        """
+        self._write_record(
+            f"{attempt_id}{_PENDING_SUFFIX}",
+            {"input_files": input_files, "output_files": output_files},
+        )
+
+    def record(
+        self,
+        attempt_id: str,
+        input_files: List[str],
+        output_files: Optional[List[str]] = None,
+    ):
+        """Record that the rows of the input files are fully written to the output
+        files, and delete the pending record of the attempt that wrote them.
+        """
+        self._write_record(
+            f"{attempt_id}.json",
+            {"input_files": input_files, "output_files": output_files or []},
+        )
+        try:
+            self._filesystem.delete_file(
+                posixpath.join(self._path, f"{attempt_id}{_PENDING_SUFFIX}")
+            )
+        except FileNotFoundError:
+            pass
+
+    def delete_incomplete_outputs(self, filesystem: "pyarrow.fs.FileSystem"):
+        """Delete the output files that write task attempts recorded as pending,
+        but that no completed attempt recorded.
+
+        This is called before the write is resumed, so that the rows of the
+        attempts that were interrupted aren't written twice, and after it
+        completes, to delete the outputs of attempts that failed and were retried.
+
+        Args:
+            filesystem: The filesystem of the output files.
+        """
+        from pyarrow.fs import FileType
+
+        completed_outputs = set()
+        for record in self._read_records(pending=False).values():
+            completed_outputs.update(record["output_files"])
+        for record_path, record in self._read_records(pending=True).items():
+            for output_file in record["output_files"]:
+                if output_file in completed_outputs:
+                    continue
+                if filesystem.get_file_info(output_file).type == FileType.File:
+                    logger.info(
+                        f"Deleting {output_file}, which was written by a write task "
+                        "that didn't complete."
+                    )
+                    filesystem.delete_file(output_file)
+            self._filesystem.delete_file(record_path)
+
+    def filter_read_tasks(self, read_tasks: List["ReadTask"]) -> List["ReadTask"]:
+        """Return the read tasks whose input files aren't recorded yet.
+
+        Read tasks without input files are always kept, because they can't be
+        identified across executions.
+
+        Raises:
+            ValueError: If only some of the input files of a read task are
+                recorded, because the rows of the recorded files would be written
+                again. This happens if the input files changed since the first
+                execution of the write.
+        """
+        completed = self.completed_input_files()
+        if not completed:
+            return read_tasks
+        remaining = []
+        for read_task in read_tasks:
+            input_files = read_task.get_metadata().input_files
+            if not input_files:
+                remaining.append(read_task)
+                continue
+            recorded = completed.intersection(input_files)
+            if not recorded:
+                remaining.append(read_task)
+            elif len(recorded) < len(set(input_files)):
+                not_recorded = sorted(set(input_files) - recorded)
+                raise ValueError(
+                    f"The write checkpoint at {self._path} records only some of the "
+                    "input files of a read task, so resuming the write would write "
+                    f"the rows of {sorted(recorded)} again. The files "
+                    f"{not_recorded} aren't recorded. This happens if the input "
+                    "files changed since the write was first run."
+                )
+        logger.info(
+            f"Skipping {len(read_tasks) - len(remaining)} of {len(read_tasks)} read "
+            f"tasks, whose input files were already written according to the "
+            f"write checkpoint at {self._path}."
+        )
+        return remaining
+
+    def _write_record(self, filename: str, record: Dict[str, Any]):
+        path = posixpath.join(self._path, filename)
+        with self._filesystem.open_output_stream(path) as f:
+            f.write(json.dumps(record).encode("utf-8"))
+
+    def _read_records(self, pending: bool) -> Dict[str, Dict[str, Any]]:
+        """Return the completed or pending records by their paths."""
+        from pyarrow.fs import FileSelector, FileType
+
+        selector = FileSelector(self._path, allow_not_found=True)
+        records = {}
+        for file_info in self._filesystem.get_file_info(selector):
+            path = file_info.path
+            if (
+                file_info.type != FileType.File
+                or not path.endswith(".json")
+                or posixpath.basename(path) == _READ_PARALLELISM_FILENAME
+                or path.endswith(_PENDING_SUFFIX) != pending
+            ):
+                continue
+            try:
+                with self._filesystem.open_input_stream(path) as f:
+                    record = json.loads(f.read())
+                if "input_files" not in record:
+                    raise KeyError("input_files")
+            except (ValueError, KeyError) as e:
+                logger.warning(f"Ignoring invalid write checkpoint file {path}: {e}")
+                continue
+            record.setdefault("output_files", [])
+            records[path] = record
+        return records
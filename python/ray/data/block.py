@@ -40,6 +40,7 @@ if TYPE_CHECKING:
 
     from ray.data._internal.block_builder import BlockBuilder
     from ray.data._internal.planner.exchange.sort_task_spec import SortKey
+    from ray.data._internal.task_profiler import TaskProfile
     from ray.data.aggregate import AggregateFn
 
 
@@ -142,6 +143,9 @@ class BlockExecStats:
         # differentiate from previous tasks on the same worker.
         self.max_rss_bytes: int = 0
         self.task_idx: Optional[int] = None
+        # The sampled stacks of the task while computing this block, if task
+        # profiling is enabled.
+        self.profile: Optional["TaskProfile"] = None
 
     @staticmethod
     def builder() -> "_BlockExecStatsBuilder":
@@ -285,6 +289,15 @@ class BlockAccessor:
         """
         raise NotImplementedError
 
+    def _to_numpy_zero_copy(self) -> Dict[str, np.ndarray]:
+        """Convert this block into NumPy ndarrays, which may be read-only views of
+        the block's data.
+
+        This is used for ``zero_copy_batch=True`` batches, whose UDFs don't mutate
+        them.
+        """
+        return self.to_numpy()
+
     def to_arrow(self) -> "pyarrow.Table":
         """Convert this block into an Arrow table."""
         raise NotImplementedError
@@ -49,6 +49,8 @@ DEFAULT_USE_PUSH_BASED_SHUFFLE = bool(
     os.environ.get("RAY_DATA_PUSH_BASED_SHUFFLE", None)
 )
 
+DEFAULT_USE_EXTERNAL_SORT = bool(os.environ.get("RAY_DATA_EXTERNAL_SORT", None))
+
 DEFAULT_SCHEDULING_STRATEGY = "SPREAD"
 
 # This default enables locality-based scheduling in Ray for tasks where arg data
@@ -59,6 +61,10 @@ DEFAULT_LARGE_ARGS_THRESHOLD = 50 * 1024 * 1024
 
 DEFAULT_USE_POLARS = False
 
+DEFAULT_BROADCAST_JOIN_THRESHOLD_BYTES = 32 * 1024 * 1024
+
+DEFAULT_SHUFFLE_HOT_KEY_THRESHOLD = None
+
 DEFAULT_EAGER_FREE = bool(int(os.environ.get("RAY_DATA_EAGER_FREE", "1")))
 
 DEFAULT_DECODING_SIZE_ESTIMATION_ENABLED = True
@@ -73,6 +79,16 @@ DEFAULT_VERBOSE_STATS_LOG = False
 
 DEFAULT_TRACE_ALLOCATIONS = bool(int(os.environ.get("RAY_DATA_TRACE_ALLOCATIONS", "0")))
 
+DEFAULT_ENABLE_TASK_PROFILING = env_bool("RAY_DATA_ENABLE_TASK_PROFILING", False)
+
+DEFAULT_TASK_PROFILING_INTERVAL_S = 0.01
+
+DEFAULT_ENABLE_ADAPTIVE_READ_PARALLELISM = env_bool(
+    "RAY_DATA_ENABLE_ADAPTIVE_READ_PARALLELISM", False
+)
+
+DEFAULT_READ_TASK_TARGET_DURATION_S = 5.0
+
 DEFAULT_LOG_INTERNAL_STACK_TRACE_TO_STDOUT = env_bool(
     "RAY_DATA_LOG_INTERNAL_STACK_TRACE_TO_STDOUT", False
 )
@@ -104,6 +120,10 @@ DEFAULT_OP_RESOURCE_RESERVATION_RATIO = float(
     os.environ.get("RAY_DATA_OP_RESERVATION_RATIO", "0.5")
 )
 
+DEFAULT_OP_RESOURCE_ALLOCATOR = os.environ.get(
+    "RAY_DATA_OP_RESOURCE_ALLOCATOR", "reservation"
+)
+
 DEFAULT_MAX_ERRORED_BLOCKS = 0
 
 # Use this to prefix important warning messages for the user.
@@ -173,6 +193,19 @@ class DataContext:
         actor_prefetcher_enabled: Whether to use actor based block prefetcher.
         use_push_based_shuffle: Whether to use push-based shuffle.
         pipeline_push_based_shuffle_reduce_tasks:
+        use_external_sort: Whether ``sort`` merges the sorted runs of each output
+            partition from memory-mapped files on local disk, and uses enough output
+            partitions for each of them to fit in ``target_shuffle_max_block_size``.
+            With the pull-based shuffle, each merge task fetches its inputs one at a
+            time, and releases them once they're written to disk. The runs aren't
+            merged from disk if ``use_polars`` is set.
+        external_sort_spill_dir: The local directory to write the sorted runs of
+            external sorts to. Defaults to the system temporary directory.
+        sort_groupby_outputs: Whether groupby aggregations output their groups sorted
+            by key. If ``False``, they use hash-based aggregation, which skips the
+            sampling pass, and output the groups in arbitrary order. Hash-based
+            aggregation is always used when the output order can't be observed, for
+            example when the aggregation is followed by a sort.
         scheduling_strategy: The global scheduling strategy. For tasks with large args,
             ``scheduling_strategy_large_args`` takes precedence.
         scheduling_strategy_large_args: Scheduling strategy for tasks with large args.
@@ -215,6 +248,12 @@ class DataContext:
         enable_op_resource_reservation: Whether to reserve resources for each operator.
         op_resource_reservation_ratio: The ratio of the total resources to reserve for
             each operator.
+        op_resource_allocator: How the resources that aren't reserved are divided
+            among operators when ``enable_op_resource_reservation`` is set. With
+            ``"reservation"``, the default, they're divided equally. With
+            ``"throughput"``, they're divided in proportion to what each operator
+            needs to keep up with the rest of the pipeline, based on the
+            throughput measured so far.
         max_errored_blocks: Max number of blocks that are allowed to have errors,
             unlimited if negative. This option allows application-level exceptions in
             block processing tasks. These exceptions may be caused by UDFs (e.g., due to
@@ -230,6 +269,30 @@ class DataContext:
             call is made with a S3 URI.
         wait_for_min_actors_s: The default time to wait for minimum requested
             actors to start before raising a timeout, in seconds.
+        broadcast_join_threshold_bytes: The maximum size of the right dataset of a
+            join for it to be broadcast to every left block, instead of shuffling
+            both datasets. Only applies when ``broadcast`` isn't specified.
+        enable_task_profiling: Whether to sample the stacks of map tasks, to break
+            down their time into UDF code, block format conversion, serialization,
+            object store access, and other Ray Data code in ``Dataset.stats()``. This
+            adds some overhead to the tasks, so it should only be used for debugging.
+            The sampled stacks can be exported as a flame graph with
+            ``DatasetStatsSummary.to_speedscope()``.
+        task_profiling_interval_s: The interval between samples of the stacks of map
+            tasks when ``enable_task_profiling`` is set.
+        enable_adaptive_read_parallelism: Whether to size read tasks from their
+            observed throughput, instead of only from the estimated in-memory size
+            of the data. The data is split into finer read tasks, which are sent
+            one at a time until a few of them finish, and are then bundled to take
+            about ``read_task_target_duration_s`` each. This only applies when the
+            number of output blocks of the read isn't specified.
+        read_task_target_duration_s: The target duration of each read task when
+            ``enable_adaptive_read_parallelism`` is set.
+        shuffle_hot_key_threshold: The estimated size of a key, relative to the
+            average output partition, above which inner and left shuffle joins
+            split the key's left rows over several partitions. The sizes of keys
+            are estimated by sampling the input blocks. If ``None``, the default,
+            keys aren't split.
     """
 
     target_max_block_size: int = DEFAULT_TARGET_MAX_BLOCK_SIZE
@@ -240,6 +303,9 @@ class DataContext:
     actor_prefetcher_enabled: bool = DEFAULT_ACTOR_PREFETCHER_ENABLED
     use_push_based_shuffle: bool = DEFAULT_USE_PUSH_BASED_SHUFFLE
     pipeline_push_based_shuffle_reduce_tasks: bool = True
+    use_external_sort: bool = DEFAULT_USE_EXTERNAL_SORT
+    external_sort_spill_dir: Optional[str] = None
+    sort_groupby_outputs: bool = True
     scheduling_strategy: SchedulingStrategyT = DEFAULT_SCHEDULING_STRATEGY
     scheduling_strategy_large_args: SchedulingStrategyT = (
         DEFAULT_SCHEDULING_STRATEGY_LARGE_ARGS
@@ -269,6 +335,7 @@ class DataContext:
     ] = DEFAULT_ACTOR_TASK_RETRY_ON_ERRORS
     op_resource_reservation_enabled: bool = DEFAULT_ENABLE_OP_RESOURCE_RESERVATION
     op_resource_reservation_ratio: float = DEFAULT_OP_RESOURCE_RESERVATION_RATIO
+    op_resource_allocator: str = DEFAULT_OP_RESOURCE_ALLOCATOR
     max_errored_blocks: int = DEFAULT_MAX_ERRORED_BLOCKS
     log_internal_stack_trace_to_stdout: bool = (
         DEFAULT_LOG_INTERNAL_STACK_TRACE_TO_STDOUT
@@ -276,6 +343,12 @@ class DataContext:
     print_on_execution_start: bool = True
     s3_try_create_dir: bool = DEFAULT_S3_TRY_CREATE_DIR
     wait_for_min_actors_s: int = DEFAULT_WAIT_FOR_MIN_ACTORS_S
+    broadcast_join_threshold_bytes: int = DEFAULT_BROADCAST_JOIN_THRESHOLD_BYTES
+    enable_task_profiling: bool = DEFAULT_ENABLE_TASK_PROFILING
+    task_profiling_interval_s: float = DEFAULT_TASK_PROFILING_INTERVAL_S
+    enable_adaptive_read_parallelism: bool = DEFAULT_ENABLE_ADAPTIVE_READ_PARALLELISM
+    read_task_target_duration_s: float = DEFAULT_READ_TASK_TARGET_DURATION_S
+    shuffle_hot_key_threshold: Optional[float] = DEFAULT_SHUFFLE_HOT_KEY_THRESHOLD
 
     def __post_init__(self):
         # The additonal ray remote args that should be added to
@@ -43,15 +43,17 @@ from ray.data._internal.logical.operators.all_to_all_operator import (
 )
 from ray.data._internal.logical.operators.input_data_operator import InputData
 from ray.data._internal.logical.operators.map_operator import (
+    AddColumn,
     Filter,
     FlatMap,
     MapBatches,
     MapRows,
+    Project,
 )
 from ray.data._internal.logical.operators.n_ary_operator import (
     Union as UnionLogicalOperator,
 )
-from ray.data._internal.logical.operators.n_ary_operator import Zip
+from ray.data._internal.logical.operators.n_ary_operator import Join, Zip
 from ray.data._internal.logical.operators.one_to_one_operator import Limit
 from ray.data._internal.logical.operators.write_operator import Write
 from ray.data._internal.logical.optimizers import LogicalPlan
@@ -62,6 +64,7 @@ from ray.data._internal.remote_fn import cached_remote_fn
 from ray.data._internal.split import _get_num_rows, _split_at_indices
 from ray.data._internal.stats import DatasetStats, DatasetStatsSummary, StatsManager
 from ray.data._internal.util import AllToAllAPI, ConsumptionAPI, get_compute_strategy
+from ray.data._internal.write_checkpoint import WriteCheckpoint
 from ray.data.aggregate import AggregateFn
 from ray.data.block import (
     VALID_BATCH_FORMATS,
@@ -90,6 +93,7 @@ from ray.data.datasource import (
     _TFRecordDatasink,
     _WebDatasetDatasink,
 )
+from ray.data.datasource.file_datasink import _FileDatasink
 from ray.data.iterator import DataIterator
 from ray.data.random_access_dataset import RandomAccessDataset
 from ray.types import ObjectRef
@@ -125,6 +129,9 @@ TensorFlowTensorBatchType = Union["tf.Tensor", Dict[str, "tf.Tensor"]]
 CollatedData = TypeVar("CollatedData")
 TorchBatchType = Union[Dict[str, "torch.Tensor"], CollatedData]
 
+# The file that marks a complete cache written by `Dataset.cache`.
+_CACHE_SUCCESS_FILE = "_SUCCESS"
+
 
 @PublicAPI
 class Dataset:
@@ -655,7 +662,10 @@ class Dataset:
     def add_column(
         self,
         col: str,
-        fn: Callable[["pandas.DataFrame"], "pandas.Series"],
+        fn: Union[
+            Callable[["pandas.DataFrame"], "pandas.Series"],
+            "pyarrow.dataset.Expression",
+        ],
         *,
         compute: Optional[str] = None,
         concurrency: Optional[Union[int, Tuple[int, int]]] = None,
@@ -663,8 +673,9 @@ class Dataset:
     ) -> "Dataset":
         """Add the given column to the dataset.
 
-        A function generating the new column values given the batch in pandas
-        format must be specified.
+        Either a function generating the new column values given the batch in
+        pandas format, or an Arrow expression computing the new column values must
+        be specified.
 
         Examples:
 
@@ -689,13 +700,22 @@ class Dataset:
             >>> ds.add_column("id", lambda df: 0).take(3)
             [{'id': 0}, {'id': 0}, {'id': 0}]
 
+            Compute the new column with an Arrow expression instead of a Python
+            function. Expressions are evaluated with vectorized Arrow kernels,
+            without converting blocks to pandas.
+
+            >>> import pyarrow.compute as pc
+            >>> ds.add_column("even", pc.field("id") % 2 == 0).take(2)
+            [{'id': 0, 'even': True}, {'id': 1, 'even': False}]
+
         Time complexity: O(dataset size / parallelism)
 
         Args:
             col: Name of the column to add. If the name already exists, the
                 column is overwritten.
             fn: Map function generating the column values given a batch of
-                records in pandas format.
+                records in pandas format, or an Arrow expression that evaluates to
+                the column values.
             compute: This argument is deprecated. Use ``concurrency`` argument.
             concurrency: The number of Ray workers to use concurrently. For a
                 fixed-sized worker pool of size ``n``, specify ``concurrency=n``. For
@@ -705,12 +725,33 @@ class Dataset:
                 ray (e.g., num_gpus=1 to request GPUs for the map tasks).
         """
 
+        import pyarrow.dataset as pds
+
+        if isinstance(fn, pds.Expression):
+            compute = get_compute_strategy(
+                None,
+                compute=compute,
+                concurrency=concurrency,
+            )
+            plan = self._plan.copy()
+            op = AddColumn(
+                self._logical_plan.dag,
+                col=col,
+                expr=fn,
+                compute=compute,
+                ray_remote_args=ray_remote_args,
+            )
+            logical_plan = LogicalPlan(op)
+            return Dataset(plan, logical_plan)
+
         def add_column(batch: "pandas.DataFrame") -> "pandas.DataFrame":
             batch.loc[:, col] = fn(batch)
             return batch
 
         if not callable(fn):
-            raise ValueError("`fn` must be callable, got {}".format(fn))
+            raise ValueError(
+                "`fn` must be callable or an Arrow expression, got {}".format(fn)
+            )
 
         return self.map_batches(
             add_column,
@@ -764,16 +805,12 @@ class Dataset:
                 ray (e.g., num_gpus=1 to request GPUs for the map tasks).
         """  # noqa: E501
 
-        def drop_columns(batch):
-            return batch.drop(columns=cols)
-
-        return self.map_batches(
-            drop_columns,
-            batch_format="pandas",
-            zero_copy_batch=True,
+        return self._project(
+            cols,
+            drop=True,
             compute=compute,
             concurrency=concurrency,
-            **ray_remote_args,
+            ray_remote_args=ray_remote_args,
         )
 
     def select_columns(
@@ -819,18 +856,40 @@ class Dataset:
                 ray (e.g., num_gpus=1 to request GPUs for the map tasks).
         """  # noqa: E501
 
-        def select_columns(batch):
-            return BlockAccessor.for_block(batch).select(columns=cols)
+        return self._project(
+            cols,
+            drop=False,
+            compute=compute,
+            concurrency=concurrency,
+            ray_remote_args=ray_remote_args,
+        )
 
-        return self.map_batches(
-            select_columns,
-            batch_format="pandas",
-            zero_copy_batch=True,
+    def _project(
+        self,
+        cols: List[str],
+        *,
+        drop: bool,
+        compute: Optional[Union[str, ComputeStrategy]],
+        concurrency: Optional[Union[int, Tuple[int, int]]],
+        ray_remote_args: Dict[str, Any],
+    ) -> "Dataset":
+        compute = get_compute_strategy(
+            None,
             compute=compute,
             concurrency=concurrency,
-            **ray_remote_args,
         )
 
+        plan = self._plan.copy()
+        op = Project(
+            self._logical_plan.dag,
+            cols=cols,
+            drop=drop,
+            compute=compute,
+            ray_remote_args=ray_remote_args,
+        )
+        logical_plan = LogicalPlan(op)
+        return Dataset(plan, logical_plan)
+
     def flat_map(
         self,
         fn: UserDefinedFunction[Dict[str, Any], List[Dict[str, Any]]],
@@ -952,8 +1011,9 @@ class Dataset:
 
     def filter(
         self,
-        fn: UserDefinedFunction[Dict[str, Any], bool],
+        fn: Optional[UserDefinedFunction[Dict[str, Any], bool]] = None,
         *,
+        expr: Optional["pyarrow.dataset.Expression"] = None,
         compute: Union[str, ComputeStrategy] = None,
         concurrency: Optional[Union[int, Tuple[int, int]]] = None,
         ray_remote_args_fn: Optional[Callable[[], Dict[str, Any]]] = None,
@@ -978,11 +1038,21 @@ class Dataset:
             >>> ds.filter(lambda row: row["id"] % 2 == 0).take_all()
             [{'id': 0}, {'id': 2}, {'id': 4}, ...]
 
+            Filter with an Arrow expression instead of a Python function. Expressions
+            are evaluated with vectorized Arrow kernels, and Ray Data pushes them
+            down into datasources like Parquet to skip reading unneeded data.
+
+            >>> import pyarrow.compute as pc
+            >>> ds.filter(expr=pc.field("id") < 3).take_all()
+            [{'id': 0}, {'id': 1}, {'id': 2}]
+
         Time complexity: O(dataset size / parallelism)
 
         Args:
             fn: The predicate to apply to each row, or a class type
                 that can be instantiated to create such a callable.
+            expr: An Arrow expression that evaluates to a boolean for each row.
+                Specify either ``fn`` or ``expr``, but not both.
             compute: This argument is deprecated. Use ``concurrency`` argument.
             concurrency: The number of Ray workers to use concurrently. For a
                 fixed-sized worker pool of size ``n``, specify ``concurrency=n``.
@@ -997,6 +1067,9 @@ class Dataset:
             ray_remote_args: Additional resource requirements to request from
                 ray (e.g., num_gpus=1 to request GPUs for the map tasks).
         """
+        if (fn is None) == (expr is None):
+            raise ValueError("Exactly one of `fn` and `expr` must be specified.")
+
         compute = get_compute_strategy(
             fn,
             compute=compute,
@@ -1007,6 +1080,7 @@ class Dataset:
         op = Filter(
             input_op=self._logical_plan.dag,
             fn=fn,
+            filter_expr=expr,
             compute=compute,
             ray_remote_args_fn=ray_remote_args_fn,
             ray_remote_args=ray_remote_args,
@@ -1020,6 +1094,7 @@ class Dataset:
         num_blocks: int,
         *,
         shuffle: bool = False,
+        keys: Optional[Union[str, List[str]]] = None,
     ) -> "Dataset":
         """Repartition the :class:`Dataset` into exactly this number of :ref:`blocks <dataset_concept>`.
 
@@ -1036,6 +1111,12 @@ class Dataset:
             minimal data movement needed to equalize block sizes. Otherwise, Ray Data
             performs a full distributed shuffle.
 
+            If ``keys`` are given, Ray Data performs a full distributed shuffle that
+            puts the rows with the same key values in the same block. It samples the
+            keys first, to balance the blocks by their size in bytes. A key's rows
+            are never split, so a block with a hot key can be larger than the
+            others.
+
             .. image:: /data/images/dataset-shuffle.svg
                 :align: center
 
@@ -1058,15 +1139,24 @@ class Dataset:
                 requires all-to-all data movement. When shuffle is disabled,
                 output blocks are created from adjacent input blocks,
                 minimizing data movement.
+            keys: The column or columns to partition the rows by. If specified,
+                a full distributed shuffle is always performed.
 
         Returns:
             The repartitioned :class:`Dataset`.
         """  # noqa: E501
+        if keys is not None:
+            keys = [keys] if isinstance(keys, str) else list(keys)
+            if not keys:
+                raise ValueError("`keys` must specify at least one column.")
+            shuffle = True
+
         plan = self._plan.copy()
         op = Repartition(
             self._logical_plan.dag,
             num_outputs=num_blocks,
             shuffle=shuffle,
+            keys=keys,
         )
         logical_plan = LogicalPlan(op)
         return Dataset(plan, logical_plan)
@@ -1218,6 +1308,7 @@ class Dataset:
         *,
         equal: bool = False,
         locality_hints: Optional[List["NodeIdStr"]] = None,
+        prefetch_bytes: Optional[int] = None,
     ) -> List[DataIterator]:
         """Returns ``n`` :class:`DataIterators <ray.data.DataIterator>` that can
         be used to read disjoint subsets of the dataset in parallel.
@@ -1291,6 +1382,12 @@ class Dataset:
                 iterator output locations. This list must have length ``n``. You can
                 get the current node id of a task or actor by calling
                 ``ray.get_runtime_context().get_node_id()``.
+            prefetch_bytes: If set, each iterator fetches its upcoming blocks from
+                the coordinator and pulls them to its own node in the background,
+                ahead of ``next`` calls, until the fetched blocks that weren't
+                returned yet reach this many bytes. This hides cross-node transfers
+                from consumers like GPU trainers. By default, blocks are fetched when
+                ``next`` is called.
 
         Returns:
             The output iterator splits. These iterators are Ray-serializable and can
@@ -1302,7 +1399,9 @@ class Dataset:
                 Unlike :meth:`~Dataset.streaming_split`, :meth:`~Dataset.split`
                 materializes the dataset in memory.
         """
-        return StreamSplitDataIterator.create(self, n, equal, locality_hints)
+        return StreamSplitDataIterator.create(
+            self, n, equal, locality_hints, prefetch_bytes
+        )
 
     @ConsumptionAPI
     def split(
@@ -2256,6 +2355,101 @@ class Dataset:
         logical_plan = LogicalPlan(op)
         return Dataset(plan, logical_plan)
 
+    def join(
+        self,
+        other: "Dataset",
+        on: Union[str, List[str]],
+        how: Literal["inner", "left", "outer"] = "inner",
+        *,
+        broadcast: Optional[bool] = None,
+        num_partitions: Optional[int] = None,
+        right_suffix: str = "_right",
+    ) -> "Dataset":
+        """Join the rows of this dataset with the rows of another dataset on key
+        columns.
+
+        The join runs in one of two modes:
+
+        * **Broadcast**: The right dataset is combined into a single block, which
+          is joined with every block of the left dataset. No data is shuffled, so
+          this is efficient if the right dataset is small.
+        * **Shuffle**: Both datasets are hash-partitioned on the key columns with
+          a distributed shuffle, and matching partitions are joined in parallel.
+          This scales to datasets that don't fit in the memory of a single node.
+
+        By default, the right dataset is broadcast if its size is at most
+        ``DataContext.broadcast_join_threshold_bytes``, and the join type
+        supports broadcasting.
+
+        .. note::
+            This operation requires all inputs to be materialized in object store
+            for it to execute, and the order of the output rows isn't
+            deterministic.
+
+        Examples:
+            >>> import ray
+            >>> users = ray.data.from_items([
+            ...     {"user_id": 1, "name": "Alice"},
+            ...     {"user_id": 2, "name": "Bob"},
+            ... ])
+            >>> orders = ray.data.from_items([
+            ...     {"user_id": 1, "item": "apple"},
+            ...     {"user_id": 1, "item": "pear"},
+            ...     {"user_id": 3, "item": "plum"},
+            ... ])
+            >>> users.join(orders, on="user_id").sort("item").take_all()
+            [{'user_id': 1, 'name': 'Alice', 'item': 'apple'}, {'user_id': 1, 'name': 'Alice', 'item': 'pear'}]
+
+        Time complexity: O(dataset size / parallelism)
+
+        Args:
+            other: The dataset to join with on the right hand side.
+            on: The name of the column or the list of the names of the columns to
+                join on. These columns must exist in both datasets.
+            how: The type of join. ``"inner"`` only keeps rows with matching keys in
+                both datasets, ``"left"`` keeps all rows of this dataset, and
+                ``"outer"`` keeps all rows of both datasets. Columns without a
+                matching row are filled with nulls.
+            broadcast: Whether to broadcast the right dataset instead of shuffling
+                both datasets. If ``None``, this is decided based on the size of the
+                right dataset. Broadcasting isn't supported for outer joins.
+            num_partitions: The number of hash partitions to shuffle the datasets
+                into. Defaults to the larger number of blocks of the two datasets.
+                Only applies if the datasets are shuffled.
+            right_suffix: The suffix to append to non-key columns of the right
+                dataset whose names collide with columns of this dataset.
+
+        Returns:
+            A :class:`Dataset` containing the columns of both datasets for the
+            joined rows.
+        """  # noqa: E501
+        if how not in ("inner", "left", "outer"):
+            raise ValueError(
+                f"`how` must be one of 'inner', 'left', or 'outer', but got {how!r}."
+            )
+        if broadcast and how == "outer":
+            raise ValueError("Broadcast joins don't support `how='outer'`.")
+        if num_partitions is not None and num_partitions <= 0:
+            raise ValueError(
+                f"`num_partitions` must be positive, but got {num_partitions}."
+            )
+        key = [on] if isinstance(on, str) else list(on)
+        if not key:
+            raise ValueError("`on` must specify at least one column to join on.")
+
+        plan = self._plan.copy()
+        op = Join(
+            self._logical_plan.dag,
+            other._logical_plan.dag,
+            key=key,
+            how=how,
+            broadcast=broadcast,
+            num_partitions=num_partitions,
+            right_suffix=right_suffix,
+        )
+        logical_plan = LogicalPlan(op)
+        return Dataset(plan, logical_plan)
+
     def limit(self, limit: int) -> "Dataset":
         """Truncate the dataset to the first ``limit`` rows.
 
@@ -2637,8 +2831,12 @@ class Dataset:
         filename_provider: Optional[FilenameProvider] = None,
         arrow_parquet_args_fn: Callable[[], Dict[str, Any]] = lambda: {},
         num_rows_per_file: Optional[int] = None,
+        max_rows_per_file: Optional[int] = None,
+        target_file_size_bytes: Optional[int] = None,
+        partition_cols: Optional[List[str]] = None,
         ray_remote_args: Dict[str, Any] = None,
         concurrency: Optional[int] = None,
+        checkpoint_path: Optional[str] = None,
         **arrow_parquet_args,
     ) -> None:
         """Writes the :class:`~ray.data.Dataset` to parquet files under the provided ``path``.
@@ -2696,11 +2894,28 @@ class Dataset:
                 ``None``, Ray Data writes a system-chosen number of rows to each file.
                 The specified value is a hint, not a strict limit. Ray Data might write
                 more or fewer rows to each file.
+            max_rows_per_file: The maximum number of rows to write to each file. Unlike
+                ``num_rows_per_file``, this is a strict limit: each write task streams
+                its rows to a new file whenever the current file is full. If
+                ``num_rows_per_file`` isn't specified, write tasks are given at least
+                this many rows.
+            target_file_size_bytes: The target size of each file, in bytes. Each write
+                task streams its rows to a new file once the current file reaches this
+                size, so the files are about this size, apart from the last file of
+                each task. To write fewer, larger files, combine this with
+                ``num_rows_per_file`` so that each write task gets more rows.
+            partition_cols: Column names to partition the dataset by. Rows are written
+                to Hive-style directories like ``path/col1=value1/col2=value2/``, and
+                the partition columns are dropped from the files. The values are
+                URL-encoded, and null values are written to
+                ``__HIVE_DEFAULT_PARTITION__`` directories.
             ray_remote_args: Kwargs passed to :meth:`~ray.remote` in the write tasks.
             concurrency: The maximum number of Ray tasks to run concurrently. Set this
                 to control number of tasks to run concurrently. This doesn't change the
                 total number of tasks run. By default, concurrency is dynamically
                 decided based on the available resources.
+            checkpoint_path: A directory to record the input files that have been
+                written to. See :meth:`~ray.data.Dataset.write_datasink`.
             arrow_parquet_args: Options to pass to
                 `pyarrow.parquet.write_table() <https://arrow.apache.org/docs/python\
                     /generated/pyarrow.parquet.write_table.html\
@@ -2712,6 +2927,9 @@ class Dataset:
             arrow_parquet_args_fn=arrow_parquet_args_fn,
             arrow_parquet_args=arrow_parquet_args,
             num_rows_per_file=num_rows_per_file,
+            max_rows_per_file=max_rows_per_file,
+            target_file_size_bytes=target_file_size_bytes,
+            partition_cols=partition_cols,
             filesystem=filesystem,
             try_create_dir=try_create_dir,
             open_stream_args=arrow_open_stream_args,
@@ -2722,6 +2940,7 @@ class Dataset:
             datasink,
             ray_remote_args=ray_remote_args,
             concurrency=concurrency,
+            checkpoint_path=checkpoint_path,
         )
 
     @ConsumptionAPI
@@ -3501,6 +3720,7 @@ class Dataset:
         *,
         ray_remote_args: Dict[str, Any] = None,
         concurrency: Optional[int] = None,
+        checkpoint_path: Optional[str] = None,
     ) -> None:
         """Writes the dataset to a custom :class:`~ray.data.Datasink`.
 
@@ -3513,10 +3733,32 @@ class Dataset:
                 to control number of tasks to run concurrently. This doesn't change the
                 total number of tasks run. By default, concurrency is dynamically
                 decided based on the available resources.
+            checkpoint_path: A local or remote directory to record the input files
+                that have been written to. If the write is run again with the same
+                checkpoint, for example after the driver failed, the read tasks whose
+                input files are all recorded are skipped, so that only the remaining
+                rows are written. The resumed read splits the files into read tasks
+                with the parallelism of the first run, so that the files are grouped
+                the same way. The files written by file-based datasinks are
+                recorded before they're opened, so that the files of write tasks
+                that didn't complete are deleted before the write resumes. Other
+                datasinks may write the rows of those tasks twice. This requires the
+                dataset to be read from files, and the read to run in the same tasks
+                as the write, so it doesn't work across all-to-all operations or
+                actor-based transforms. Don't put the checkpoint under the
+                destination of the write, and don't run several writes with the
+                same checkpoint at the same time.
         """  # noqa: E501
         if ray_remote_args is None:
             ray_remote_args = {}
 
+        checkpoint = None
+        if checkpoint_path is not None:
+            checkpoint = WriteCheckpoint(checkpoint_path)
+            checkpoint.create()
+            if isinstance(datasink, _FileDatasink):
+                checkpoint.delete_incomplete_outputs(datasink.filesystem)
+
         if not datasink.supports_distributed_writes:
             if ray.util.client.ray.is_connected():
                 raise ValueError(
@@ -3534,6 +3776,7 @@ class Dataset:
             datasink,
             ray_remote_args=ray_remote_args,
             concurrency=concurrency,
+            checkpoint=checkpoint,
         )
         logical_plan = LogicalPlan(write_op)
 
@@ -3548,6 +3791,9 @@ class Dataset:
                 isinstance(block, pd.DataFrame) and len(block) == 1 for block in blocks
             )
             write_results = [block["write_result"][0] for block in blocks]
+            if checkpoint is not None and isinstance(datasink, _FileDatasink):
+                # Delete the files of the write task attempts that were retried.
+                checkpoint.delete_incomplete_outputs(datasink.filesystem)
 
             datasink.on_write_complete(write_results)
         except Exception as e:
@@ -3681,6 +3927,7 @@ class Dataset:
         drop_last: bool = False,
         local_shuffle_buffer_size: Optional[int] = None,
         local_shuffle_seed: Optional[int] = None,
+        reuse_buffers: bool = False,
     ) -> Iterable[TorchBatchType]:
         """Return an iterable over batches of data represented as Torch tensors.
 
@@ -3756,6 +4003,12 @@ class Dataset:
                 the buffer, the remaining rows in the buffer are drained.
                 ``batch_size`` must also be specified when using local shuffling.
             local_shuffle_seed: The seed to use for the local random shuffle.
+            reuse_buffers: If True, batches are copied into a ring of preallocated
+                CPU tensors that are reused across batches, instead of into new
+                tensors, to avoid allocating memory for each batch. The tensors of a
+                batch are overwritten after the next few batches are fetched, so the
+                tensors shouldn't be kept past the current iteration; clone them to
+                keep them. You can't use this parameter with ``collate_fn``.
 
         Returns:
             An iterable over Torch Tensor batches.
@@ -3773,6 +4026,7 @@ class Dataset:
             drop_last=drop_last,
             local_shuffle_buffer_size=local_shuffle_buffer_size,
             local_shuffle_seed=local_shuffle_seed,
+            reuse_buffers=reuse_buffers,
         )
 
     @ConsumptionAPI
@@ -4454,6 +4708,9 @@ class Dataset:
         self,
         key: str,
         num_workers: Optional[int] = None,
+        *,
+        index: str = "sort",
+        block_cache_bytes: Optional[int] = None,
     ) -> RandomAccessDataset:
         """Convert this dataset into a distributed RandomAccessDataset (EXPERIMENTAL).
 
@@ -4474,10 +4731,24 @@ class Dataset:
                 in the cluster by four. As a rule of thumb, you can expect each worker
                 to provide ~3000 records / second via ``get_async()``, and
                 ~10000 records / second via ``multiget()``.
+            index: How to index the dataset. ``"sort"`` sorts the dataset and
+                range-partitions it across the workers. ``"hash"`` hash-partitions
+                the dataset across the workers instead, which avoids the sort and
+                looks up keys in hash tables.
+            block_cache_bytes: If set, each worker fetches its blocks lazily and
+                keeps the most recently used blocks and their key indexes in a
+                cache of at most this many bytes. By default, each worker loads
+                all of its blocks up front.
         """
         if num_workers is None:
             num_workers = 4 * len(ray.nodes())
-        return RandomAccessDataset(self, key, num_workers=num_workers)
+        return RandomAccessDataset(
+            self,
+            key,
+            num_workers=num_workers,
+            index=index,
+            block_cache_bytes=block_cache_bytes,
+        )
 
     @ConsumptionAPI(pattern="store memory.", insert_after=True)
     def materialize(self) -> "MaterializedDataset":
@@ -4528,6 +4799,94 @@ class Dataset:
         output._plan.execute()  # No-op that marks the plan as fully executed.
         return output
 
+    @ConsumptionAPI(pattern="Args:")
+    def cache(
+        self,
+        location: str,
+        *,
+        key: Optional[str] = None,
+        filesystem: Optional["pyarrow.fs.FileSystem"] = None,
+    ) -> "Dataset":
+        """Execute this dataset and cache its blocks as Arrow IPC files.
+
+        The cache is keyed by a fingerprint of the logical plan of this dataset,
+        which covers the operators and their arguments, the code of the UDFs, and
+        the paths, sizes, and modification times of the input files. If the same
+        plan was cached in ``location`` before, even by another driver, the
+        returned dataset reads the cached files instead of re-executing the plan.
+        Local cache files are memory-mapped when read.
+
+        Changes to the data of datasources without input files, like databases,
+        can't be detected, so plans that read from them are only cached if a
+        ``key`` that identifies their data is given. If the plan has no stable
+        fingerprint, for example because it reads in-memory data, or reads from
+        such a datasource without a ``key``, this method falls back to
+        :meth:`Dataset.materialize`.
+
+        Examples:
+            >>> import ray
+            >>> ds = ray.data.read_csv("s3://anonymous@ray-example-data/iris.csv")
+            >>> ds = ds.map_batches(lambda batch: batch).cache("/tmp/ray_data_cache")
+            >>> ds.count()
+            150
+
+        Args:
+            location: The directory to write the cache files to. Each plan is
+                cached in a subdirectory named after its fingerprint.
+            key: A string that identifies the data of the datasources without
+                input files, such as a table version. It's included in the
+                fingerprint, so change it whenever the data changes.
+            filesystem: The pyarrow filesystem implementation to write the cache
+                files to. If not provided, the filesystem is inferred from
+                ``location``.
+
+        Returns:
+            A dataset that reads the cached blocks of this dataset.
+        """
+        from pyarrow.fs import FileType
+
+        from ray.data._internal.plan_fingerprint import fingerprint_plan
+        from ray.data.datasource.arrow_ipc_datasink import _ArrowIPCDatasink
+        from ray.data.datasource.arrow_ipc_datasource import _ArrowIPCDatasource
+        from ray.data.datasource.path_util import _resolve_paths_and_filesystem
+        from ray.data.read_api import read_datasource
+
+        fingerprint = fingerprint_plan(self._logical_plan.dag, key)
+        if fingerprint is None:
+            logger.warning(
+                "Can't cache this dataset, because its logical plan has values "
+                "without a stable fingerprint, like in-memory data, or reads from a "
+                "datasource without input files and no `key` is given. "
+                "Materializing the dataset in object store memory instead."
+            )
+            return self.materialize()
+
+        [location], filesystem = _resolve_paths_and_filesystem(location, filesystem)
+        cache_path = f"{location.rstrip('/')}/{fingerprint}"
+        success_path = f"{cache_path}/{_CACHE_SUCCESS_FILE}"
+        if filesystem.get_file_info(success_path).type == FileType.NotFound:
+            # Remove the files of a write that failed part way.
+            if filesystem.get_file_info(cache_path).type != FileType.NotFound:
+                filesystem.delete_dir(cache_path)
+            self.write_datasink(
+                _ArrowIPCDatasink(
+                    cache_path, filesystem=filesystem, dataset_uuid=fingerprint
+                )
+            )
+            filesystem.create_dir(cache_path, recursive=True)
+            # The marker is written last, so that readers only ever see complete
+            # caches.
+            with filesystem.open_output_stream(success_path):
+                pass
+        else:
+            logger.info(f"Reading the cached dataset from {cache_path}.")
+
+        return read_datasource(
+            _ArrowIPCDatasource(
+                cache_path, filesystem=filesystem, file_extensions=["arrow"]
+            )
+        )
+
     def stats(self) -> str:
         """Returns a string containing execution timing information.
 
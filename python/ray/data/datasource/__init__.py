@@ -41,6 +41,7 @@ from ray.data.datasource.parquet_meta_provider import ParquetMetadataProvider
 from ray.data.datasource.partitioning import (
     Partitioning,
     PartitionStyle,
+    PathPartitionEncoder,
     PathPartitionFilter,
     PathPartitionParser,
 )
@@ -88,6 +89,7 @@ __all__ = [
     "ParquetDatasource",
     "ParquetMetadataProvider",
     "PartitionStyle",
+    "PathPartitionEncoder",
     "PathPartitionFilter",
     "PathPartitionParser",
     "Partitioning",
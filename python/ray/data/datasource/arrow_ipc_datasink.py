@@ -0,0 +1,22 @@
+import pyarrow
+
+from ray.data.block import BlockAccessor
+from ray.data.datasource.file_datasink import BlockBasedFileDatasink
+
+
+class _ArrowIPCDatasink(BlockBasedFileDatasink):
+    """A datasink that writes each block to an Arrow IPC file."""
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        file_format: str = "arrow",
+        **file_datasink_kwargs,
+    ):
+        super().__init__(path, file_format=file_format, **file_datasink_kwargs)
+
+    def write_block_to_file(self, block: BlockAccessor, file: "pyarrow.NativeFile"):
+        table = block.to_arrow()
+        with pyarrow.ipc.new_file(file, table.schema) as writer:
+            writer.write_table(table)
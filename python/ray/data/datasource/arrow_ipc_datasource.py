@@ -0,0 +1,43 @@
+from typing import TYPE_CHECKING, Iterator, List, Union
+
+from ray.data.block import Block
+from ray.data.datasource.file_based_datasource import FileBasedDatasource
+
+if TYPE_CHECKING:
+    import pyarrow
+
+
+class _ArrowIPCDatasource(FileBasedDatasource):
+    """A datasource that reads Arrow IPC files, memory-mapping local files."""
+
+    _FILE_EXTENSIONS = ["arrow"]
+
+    def __init__(
+        self,
+        paths: Union[str, List[str]],
+        **file_based_datasource_kwargs,
+    ):
+        super().__init__(paths, **file_based_datasource_kwargs)
+
+    def _open_input_source(
+        self,
+        filesystem: "pyarrow.fs.FileSystem",
+        path: str,
+        **open_args,
+    ) -> "pyarrow.NativeFile":
+        import pyarrow as pa
+        from pyarrow.fs import LocalFileSystem
+
+        # The Arrow IPC file format requires random access.
+        if isinstance(filesystem, LocalFileSystem):
+            return pa.memory_map(path)
+        return filesystem.open_input_file(path)
+
+    def _read_stream(self, f: "pyarrow.NativeFile", path: str) -> Iterator[Block]:
+        import pyarrow as pa
+
+        reader = pa.ipc.open_file(f)
+        if reader.num_record_batches > 0:
+            yield pa.Table.from_batches(
+                [reader.get_batch(i) for i in range(reader.num_record_batches)]
+            )
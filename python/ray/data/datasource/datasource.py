@@ -113,6 +113,47 @@ class Datasource:
         """Return a list of input files, or ``None`` if unknown."""
         return None
 
+    def supports_projection_pushdown(self) -> bool:
+        """Whether the optimizer can push column projections into this datasource.
+
+        If ``True``, :meth:`~ray.data.Datasource.apply_projection` must be
+        implemented.
+        """
+        return False
+
+    def apply_projection(self, columns: List[str]) -> "Datasource":
+        """Return a copy of this datasource that only reads the given columns.
+
+        The returned datasource should produce blocks that contain exactly
+        ``columns``, so that columns that aren't needed are never fetched or
+        decoded. This datasource must not be modified, because it might be shared
+        by other datasets.
+
+        Args:
+            columns: The names of the columns to read.
+        """
+        raise NotImplementedError
+
+    def supports_predicate_pushdown(self) -> bool:
+        """Whether the optimizer can push row filters into this datasource.
+
+        If ``True``, :meth:`~ray.data.Datasource.apply_predicate` must be
+        implemented.
+        """
+        return False
+
+    def apply_predicate(self, predicate: "pyarrow.dataset.Expression") -> "Datasource":
+        """Return a copy of this datasource that only reads rows matching
+        ``predicate``.
+
+        This datasource must not be modified, because it might be shared by
+        other datasets.
+
+        Args:
+            predicate: An Arrow expression that evaluates to a boolean for each row.
+        """
+        raise NotImplementedError
+
 
 @Deprecated
 class Reader:
@@ -1,3 +1,4 @@
+import copy
 import io
 import logging
 from typing import (
@@ -163,6 +164,11 @@ class FileBasedDatasource(Datasource):
         self._paths_ref = ray.put(paths)
         self._file_sizes_ref = ray.put(file_sizes)
 
+        # Columns and row filter pushed down by the optimizer. These are applied
+        # inside the read tasks, so unneeded data never reaches the object store.
+        self._projection: Optional[List[str]] = None
+        self._predicate: Optional["pyarrow.dataset.Expression"] = None
+
     def _paths(self) -> List[str]:
         return ray.get(self._paths_ref)
 
@@ -201,6 +207,8 @@ class FileBasedDatasource(Datasource):
             open_stream_args = {}
 
         open_input_source = self._open_input_source
+        projection = self._projection
+        predicate = self._predicate
 
         def read_files(
             read_paths: Iterable[str],
@@ -227,6 +235,8 @@ class FileBasedDatasource(Datasource):
                             block = block_accessor.append_column(
                                 "path", [read_path] * block_accessor.num_rows()
                             )
+                        if projection is not None or predicate is not None:
+                            block = _apply_pushdowns(block, projection, predicate)
                         yield block
 
         def create_read_task_fn(read_paths, num_threads):
@@ -366,6 +376,54 @@ class FileBasedDatasource(Datasource):
     def input_files(self) -> Optional[List[str]]:
         return self._paths()
 
+    def supports_projection_pushdown(self) -> bool:
+        return True
+
+    def apply_projection(self, columns: List[str]) -> "FileBasedDatasource":
+        import pyarrow as pa
+
+        datasource = copy.copy(self)
+        datasource._projection = list(columns)
+        if isinstance(self._schema, pa.Schema):
+            if all(column in self._schema.names for column in columns):
+                datasource._schema = pa.schema(
+                    [self._schema.field(column) for column in columns],
+                    self._schema.metadata,
+                )
+            else:
+                # Partition and path columns aren't part of the user-provided
+                # schema, so the schema of the projected data is unknown.
+                datasource._schema = None
+        return datasource
+
+    def supports_predicate_pushdown(self) -> bool:
+        return True
+
+    def apply_predicate(
+        self, predicate: "pyarrow.dataset.Expression"
+    ) -> "FileBasedDatasource":
+        datasource = copy.copy(self)
+        if self._predicate is not None:
+            predicate = self._predicate & predicate
+        datasource._predicate = predicate
+        return datasource
+
+
+def _apply_pushdowns(
+    block: Block,
+    projection: Optional[List[str]],
+    predicate: Optional["pyarrow.dataset.Expression"],
+) -> Block:
+    """Apply the filter and column projection pushed down by the optimizer."""
+    from ray.data._internal.arrow_block import ArrowBlockAccessor
+
+    if predicate is not None:
+        table = BlockAccessor.for_block(block).to_arrow()
+        block = ArrowBlockAccessor(table).filter(predicate)
+    if projection is not None:
+        block = BlockAccessor.for_block(block).select(projection)
+    return block
+
 
 def _add_partitions(
     data: Union["pyarrow.Table", "pd.DataFrame"], partitions: Dict[str, Any]
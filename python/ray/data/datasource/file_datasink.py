@@ -190,6 +190,8 @@ class RowBasedFileDatasink(_FileDatasink):
                 row, ctx.task_idx, block_index, row_index
             )
             write_path = posixpath.join(self.path, filename)
+            if ctx.on_write_file is not None:
+                ctx.on_write_file(write_path)
 
             def write_row_to_path():
                 with self.open_output_stream(write_path) as file:
@@ -245,6 +247,8 @@ class BlockBasedFileDatasink(_FileDatasink):
             block, ctx.task_idx, block_index
         )
         write_path = posixpath.join(self.path, filename)
+        if ctx.on_write_file is not None:
+            ctx.on_write_file(write_path)
 
         def write_block_to_path():
             with self.open_output_stream(write_path) as file:
@@ -1,13 +1,17 @@
 import logging
 import posixpath
-from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Optional
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlparse
 
+from ray._private.utils import _add_creatable_buckets_param_if_s3_uri
 from ray.data._internal.execution.interfaces import TaskContext
 from ray.data._internal.util import call_with_retry
 from ray.data.block import Block, BlockAccessor
 from ray.data.context import DataContext
 from ray.data.datasource.file_datasink import _FileDatasink
 from ray.data.datasource.filename_provider import FilenameProvider
+from ray.data.datasource.partitioning import PartitionStyle, PathPartitionEncoder
 
 if TYPE_CHECKING:
     import pyarrow
@@ -15,6 +19,15 @@ if TYPE_CHECKING:
 WRITE_FILE_MAX_ATTEMPTS = 10
 WRITE_FILE_RETRY_MAX_BACKOFF_SECONDS = 32
 
+# The maximum number of partitions a write task writes to at the same time. Once
+# reached, the file of the least recently written partition is closed, and the
+# partition's next rows start a new file.
+MAX_OPEN_PARTITION_WRITERS = 64
+
+# The name of the partition directory of null partition values, like Hive and
+# `pyarrow.dataset.write_dataset`.
+NULL_PARTITION_VALUE = "__HIVE_DEFAULT_PARTITION__"
+
 logger = logging.getLogger(__name__)
 
 
@@ -26,6 +39,9 @@ class _ParquetDatasink(_FileDatasink):
         arrow_parquet_args_fn: Callable[[], Dict[str, Any]] = lambda: {},
         arrow_parquet_args: Optional[Dict[str, Any]] = None,
         num_rows_per_file: Optional[int] = None,
+        max_rows_per_file: Optional[int] = None,
+        target_file_size_bytes: Optional[int] = None,
+        partition_cols: Optional[List[str]] = None,
         filesystem: Optional["pyarrow.fs.FileSystem"] = None,
         try_create_dir: bool = True,
         open_stream_args: Optional[Dict[str, Any]] = None,
@@ -34,10 +50,22 @@ class _ParquetDatasink(_FileDatasink):
     ):
         if arrow_parquet_args is None:
             arrow_parquet_args = {}
+        if max_rows_per_file is not None and max_rows_per_file <= 0:
+            raise ValueError(
+                f"max_rows_per_file must be positive, got {max_rows_per_file}."
+            )
+        if target_file_size_bytes is not None and target_file_size_bytes <= 0:
+            raise ValueError(
+                "target_file_size_bytes must be positive, got "
+                f"{target_file_size_bytes}."
+            )
 
         self.arrow_parquet_args_fn = arrow_parquet_args_fn
         self.arrow_parquet_args = arrow_parquet_args
         self.num_rows_per_file = num_rows_per_file
+        self.max_rows_per_file = max_rows_per_file
+        self.target_file_size_bytes = target_file_size_bytes
+        self.partition_cols = partition_cols
 
         super().__init__(
             path,
@@ -54,6 +82,13 @@ class _ParquetDatasink(_FileDatasink):
         blocks: Iterable[Block],
         ctx: TaskContext,
     ) -> Any:
+        if (
+            self.max_rows_per_file is not None
+            or self.target_file_size_bytes is not None
+            or self.partition_cols
+        ):
+            return self._write_rolling_files(blocks, ctx)
+
         import pyarrow.parquet as pq
 
         blocks = list(blocks)
@@ -65,14 +100,21 @@ class _ParquetDatasink(_FileDatasink):
             blocks[0], ctx.task_idx, 0
         )
         write_path = posixpath.join(self.path, filename)
+        if ctx.on_write_file is not None:
+            ctx.on_write_file(write_path)
+        write_kwargs = self._get_write_kwargs()
+        schema = write_kwargs.pop("schema", None)
+        row_group_size = write_kwargs.pop("row_group_size", None)
 
         def write_blocks_to_path():
             with self.open_output_stream(write_path) as file:
-                schema = BlockAccessor.for_block(blocks[0]).to_arrow().schema
-                with pq.ParquetWriter(file, schema) as writer:
+                file_schema = schema
+                if file_schema is None:
+                    file_schema = BlockAccessor.for_block(blocks[0]).to_arrow().schema
+                with pq.ParquetWriter(file, file_schema, **write_kwargs) as writer:
                     for block in blocks:
                         table = BlockAccessor.for_block(block).to_arrow()
-                        writer.write_table(table)
+                        writer.write_table(table, row_group_size=row_group_size)
 
         logger.debug(f"Writing {write_path} file.")
         call_with_retry(
@@ -85,6 +127,297 @@ class _ParquetDatasink(_FileDatasink):
 
         return "ok"
 
+    def _write_rolling_files(self, blocks: Iterable[Block], ctx: TaskContext) -> Any:
+        """Stream the blocks to files of at most ``max_rows_per_file`` rows and
+        about ``target_file_size_bytes`` bytes, in a directory per partition.
+
+        At most ``MAX_OPEN_PARTITION_WRITERS`` files are open at a time. The rows
+        are written as they arrive and aren't buffered until the files are closed.
+        """
+        write_kwargs = self._get_write_kwargs()
+        # The writers of the partitions with an open file, from the least to the
+        # most recently written.
+        writers: "OrderedDict[Tuple, _RollingParquetWriter]" = OrderedDict()
+        created_dirs = set()
+        # The index of the next file of this task, across all partitions.
+        next_file_index = [0]
+
+        def next_file_path(dir_path: str, table: "pyarrow.Table") -> str:
+            filename = self.filename_provider.get_filename_for_block(
+                table, ctx.task_idx, next_file_index[0]
+            )
+            next_file_index[0] += 1
+            write_path = posixpath.join(dir_path, filename)
+            if ctx.on_write_file is not None:
+                ctx.on_write_file(write_path)
+            return write_path
+
+        if self.partition_cols:
+            encoder = PathPartitionEncoder.of(
+                style=PartitionStyle.HIVE, field_names=self.partition_cols
+            )
+
+        try:
+            for block in blocks:
+                if BlockAccessor.for_block(block).num_rows() == 0:
+                    continue
+                table = BlockAccessor.for_block(block).to_arrow()
+                if self.partition_cols:
+                    partitions = _split_by_partition(table, self.partition_cols)
+                else:
+                    partitions = [((), table)]
+                for partition_values, partition in partitions:
+                    writer = writers.pop(partition_values, None)
+                    if writer is None:
+                        if len(writers) >= MAX_OPEN_PARTITION_WRITERS:
+                            _, lru_writer = writers.popitem(last=False)
+                            lru_writer.close()
+                        dir_path = self.path
+                        if self.partition_cols:
+                            dir_path = posixpath.join(
+                                self.path, encoder(list(partition_values))
+                            )
+                            if dir_path not in created_dirs:
+                                self._create_partition_dir(dir_path)
+                                created_dirs.add(dir_path)
+                        writer = _RollingParquetWriter(
+                            self,
+                            dir_path,
+                            next_file_path,
+                            write_kwargs,
+                        )
+                    writers[partition_values] = writer
+                    writer.write(partition)
+        finally:
+            for writer in writers.values():
+                writer.close()
+
+        if next_file_index[0] == 0:
+            return "skip"
+        return "ok"
+
+    def _get_write_kwargs(self) -> Dict[str, Any]:
+        return {**self.arrow_parquet_args, **self.arrow_parquet_args_fn()}
+
+    def _create_partition_dir(self, dir_path: str):
+        # Like `on_write_start`, skip creating directories on S3 unless requested,
+        # because S3 has no directories and the permissions to create them may be
+        # missing.
+        if not self.try_create_dir or (
+            urlparse(self.path).scheme == "s3"
+            and not DataContext.get_current().s3_try_create_dir
+        ):
+            return
+        self.filesystem.create_dir(
+            _add_creatable_buckets_param_if_s3_uri(dir_path), recursive=True
+        )
+
     @property
     def num_rows_per_write(self) -> Optional[int]:
+        if self.num_rows_per_file is None and self.max_rows_per_file is not None:
+            # Bundle enough rows for each write task to fill at least one file.
+            return self.max_rows_per_file
         return self.num_rows_per_file
+
+
+class _RollingParquetWriter:
+    """Streams Arrow tables to a sequence of Parquet files in a directory.
+
+    The tables are written as row groups through an open file, and a new file is
+    started once the current one reaches ``max_rows_per_file`` rows or
+    ``target_file_size_bytes`` bytes. The rows aren't kept after they're written,
+    so only opening a file and writing its first row group is retried on errors in
+    ``DataContext.write_file_retry_on_errors``. If a later write fails, the
+    partial file is deleted and the error is raised, so that the write task is
+    retried.
+    """
+
+    def __init__(
+        self,
+        datasink: _ParquetDatasink,
+        dir_path: str,
+        next_file_path: Callable[[str, "pyarrow.Table"], str],
+        write_kwargs: Dict[str, Any],
+    ):
+        self._datasink = datasink
+        self._dir_path = dir_path
+        self._next_file_path = next_file_path
+        write_kwargs = dict(write_kwargs)
+        self._schema = write_kwargs.pop("schema", None)
+        self._row_group_size = write_kwargs.pop("row_group_size", None)
+        self._write_kwargs = write_kwargs
+
+        self._path: Optional[str] = None
+        self._file_schema: Optional["pyarrow.Schema"] = None
+        self._file = None
+        self._writer = None
+        self._file_num_rows = 0
+        # The number of bytes written to files per byte of the tables, to estimate
+        # the number of rows that fit in the current file.
+        self._file_bytes_per_table_byte = 1.0
+
+    def write(self, table: "pyarrow.Table"):
+        max_rows = self._datasink.max_rows_per_file
+        target_bytes = self._datasink.target_file_size_bytes
+        table_bytes_per_row = table.nbytes / table.num_rows
+
+        offset = 0
+        while offset < table.num_rows:
+            if self._path is None:
+                self._path = self._next_file_path(self._dir_path, table)
+                self._file_schema = (
+                    self._schema if self._schema is not None else table.schema
+                )
+                self._file_num_rows = 0
+            num_rows = table.num_rows - offset
+            if max_rows is not None:
+                num_rows = min(num_rows, max_rows - self._file_num_rows)
+            if target_bytes is not None:
+                remaining_bytes = target_bytes - self._file_size()
+                estimated_bytes_per_row = (
+                    table_bytes_per_row * self._file_bytes_per_table_byte
+                )
+                num_rows = min(
+                    num_rows,
+                    max(int(remaining_bytes // max(estimated_bytes_per_row, 1)), 1),
+                )
+
+            rows = table.slice(offset, num_rows)
+            start_bytes = self._file_size()
+            self._write_rows(rows)
+            if rows.nbytes > 0:
+                self._file_bytes_per_table_byte = (
+                    self._file_size() - start_bytes
+                ) / rows.nbytes
+            self._file_num_rows += num_rows
+            offset += num_rows
+
+            if (max_rows is not None and self._file_num_rows >= max_rows) or (
+                target_bytes is not None and self._file_size() >= target_bytes
+            ):
+                self.close()
+
+    def close(self):
+        if self._path is not None:
+            try:
+                self._writer.close()
+                self._file.close()
+            except Exception:
+                self._abort()
+                raise
+            self._writer = None
+            self._file = None
+            self._path = None
+
+    def _write_rows(self, rows: "pyarrow.Table"):
+        if self._writer is None:
+            # Nothing is written to the file yet, so it can be rewritten from the
+            # rows on retries.
+            call_with_retry(
+                lambda: self._open_and_write(rows),
+                description=f"write '{self._path}'",
+                match=DataContext.get_current().write_file_retry_on_errors,
+                max_attempts=WRITE_FILE_MAX_ATTEMPTS,
+                max_backoff_s=WRITE_FILE_RETRY_MAX_BACKOFF_SECONDS,
+            )
+            return
+        try:
+            self._writer.write_table(rows, row_group_size=self._row_group_size)
+        except Exception:
+            self._abort()
+            raise
+
+    def _open_and_write(self, rows: "pyarrow.Table"):
+        import pyarrow.parquet as pq
+
+        logger.debug(f"Writing {self._path} file.")
+        try:
+            self._file = self._datasink.open_output_stream(self._path)
+            self._writer = pq.ParquetWriter(
+                self._file, self._file_schema, **self._write_kwargs
+            )
+            self._writer.write_table(rows, row_group_size=self._row_group_size)
+        except Exception:
+            self._close_quietly()
+            raise
+
+    def _abort(self):
+        """Discard the current file after a failed write."""
+        self._close_quietly()
+        try:
+            self._datasink.filesystem.delete_file(self._path)
+        except Exception:
+            pass
+        self._path = None
+
+    def _close_quietly(self):
+        for closeable in (self._writer, self._file):
+            if closeable is not None:
+                try:
+                    closeable.close()
+                except Exception:
+                    pass
+        self._writer = None
+        self._file = None
+
+    def _file_size(self) -> int:
+        return self._file.tell() if self._file is not None else 0
+
+
+def _split_by_partition(
+    table: "pyarrow.Table", partition_cols: List[str]
+) -> List[Tuple[Tuple[str, ...], "pyarrow.Table"]]:
+    """Split a table by the values of its partition columns.
+
+    Like ``pyarrow.dataset.write_dataset``, the partition values are formatted by
+    casting the Arrow values to strings, so that they don't depend on how the
+    values would be converted to pandas.
+
+    Returns:
+        The string partition values of each partition, and the rows of the
+        partition without the partition columns.
+    """
+    import numpy as np
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    missing_cols = [col for col in partition_cols if col not in table.column_names]
+    if missing_cols:
+        raise ValueError(
+            f"Partition columns {missing_cols} aren't in the dataset schema: "
+            f"{table.column_names}."
+        )
+    dictionaries = []
+    codes = []
+    for col in partition_cols:
+        try:
+            values = pc.cast(table[col], pa.string())
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as e:
+            raise ValueError(
+                f"Partition column '{col}' of type {table[col].type} can't be "
+                "converted to strings."
+            ) from e
+        values = pc.fill_null(values, NULL_PARTITION_VALUE).combine_chunks()
+        encoded = values.dictionary_encode()
+        dictionaries.append(encoded.dictionary.to_pylist())
+        codes.append(encoded.indices.to_numpy())
+    # Number the partitions in the order of their first rows.
+    _, first_rows, partition_ids = np.unique(
+        np.stack(codes, axis=1), axis=0, return_index=True, return_inverse=True
+    )
+    partition_ids = partition_ids.reshape(-1)
+    rows = np.argsort(partition_ids, kind="stable")
+    ends = np.cumsum(np.bincount(partition_ids))
+
+    data = table.drop(partition_cols)
+    partitions = []
+    for partition_id in np.argsort(first_rows):
+        start = ends[partition_id - 1] if partition_id > 0 else 0
+        first_row = first_rows[partition_id]
+        partition_values = tuple(
+            dictionary[code[first_row]] for dictionary, code in zip(dictionaries, codes)
+        )
+        partitions.append(
+            (partition_values, data.take(rows[start : ends[partition_id]]))
+        )
+    return partitions
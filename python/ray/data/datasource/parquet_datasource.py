@@ -1,3 +1,4 @@
+import copy
 import logging
 from dataclasses import dataclass
 from typing import (
@@ -9,6 +10,7 @@ from typing import (
     List,
     Literal,
     Optional,
+    Tuple,
     Union,
 )
 
@@ -33,7 +35,10 @@ from ray.data.datasource._default_metadata_providers import (
 )
 from ray.data.datasource.datasource import ReadTask
 from ray.data.datasource.file_meta_provider import _handle_read_os_error
-from ray.data.datasource.parquet_meta_provider import ParquetMetadataProvider
+from ray.data.datasource.parquet_meta_provider import (
+    ParquetMetadataProvider,
+    _ParquetFileFragmentMetaData,
+)
 from ray.data.datasource.partitioning import PathPartitionFilter
 from ray.data.datasource.path_util import (
     _has_file_extension,
@@ -100,6 +105,15 @@ class _SerializedFragment:
         self._data = cloudpickle.dumps(
             (frag.format, frag.path, frag.filesystem, frag.partition_expression)
         )
+        self._partition_expression = frag.partition_expression
+        # The IDs of the row groups to read, or `None` to read all row groups.
+        self._row_group_ids: Optional[List[int]] = None
+
+    def subset(self, row_group_ids: List[int]) -> "_SerializedFragment":
+        """Return a copy of this fragment that only reads the given row groups."""
+        fragment = copy.copy(self)
+        fragment._row_group_ids = row_group_ids
+        return fragment
 
     def deserialize(self) -> "ParquetFileFragment":
         # Implicitly trigger S3 subsystem initialization by importing
@@ -109,7 +123,9 @@ class _SerializedFragment:
         (file_format, path, filesystem, partition_expression) = cloudpickle.loads(
             self._data
         )
-        return file_format.make_fragment(path, filesystem, partition_expression)
+        return file_format.make_fragment(
+            path, filesystem, partition_expression, row_groups=self._row_group_ids
+        )
 
 
 # Visible for test mocking.
@@ -191,6 +207,7 @@ class ParquetDatasource(Datasource):
             )
 
         paths, filesystem = _resolve_paths_and_filesystem(paths, filesystem)
+        self._filesystem = filesystem
 
         # HACK: PyArrow's `ParquetDataset` errors if input paths contain non-parquet
         # files. To avoid this, we expand the input paths with the default metadata
@@ -292,6 +309,7 @@ class ParquetDatasource(Datasource):
         # `_SerializedFragment()` implementation for more details.
         self._pq_fragments = [_SerializedFragment(p) for p in pq_ds.fragments]
         self._pq_paths = [p.path for p in pq_ds.fragments]
+        self._dataset_schema = pq_ds.schema
         self._meta_provider = meta_provider
         self._inferred_schema = inferred_schema
         self._block_udf = _block_udf
@@ -303,6 +321,9 @@ class ParquetDatasource(Datasource):
         if shuffle == "files":
             self._file_metadata_shuffler = np.random.default_rng()
 
+        if to_batch_kwargs.get("filter") is not None:
+            self._prune_row_groups(to_batch_kwargs["filter"])
+
         sample_infos = self._sample_fragments()
         self._encoding_ratio = _estimate_files_encoding_ratio(sample_infos)
         self._default_read_batch_size_rows = _estimate_default_read_batch_size_rows(
@@ -471,6 +492,139 @@ class ParquetDatasource(Datasource):
     def input_files(self) -> Optional[List[str]]:
         return self._pq_paths
 
+    def supports_projection_pushdown(self) -> bool:
+        # The block UDF consumes the full table, so we can't prune its input.
+        return self._block_udf is None
+
+    def apply_projection(self, columns: List[str]) -> "ParquetDatasource":
+        import pyarrow as pa
+
+        datasource = copy.copy(self)
+        # The path column isn't stored in the files. It's appended after reading.
+        include_paths = self._include_paths and "path" in columns
+        file_columns = [c for c in columns if not (include_paths and c == "path")]
+        schema = pa.schema(
+            [self._schema.field(column) for column in file_columns],
+            self._schema.metadata,
+        )
+        datasource._columns = file_columns
+        datasource._schema = schema
+        datasource._inferred_schema = schema
+        datasource._include_paths = include_paths
+        return datasource
+
+    def supports_predicate_pushdown(self) -> bool:
+        # Filters are evaluated while scanning the files, so they'd run before the
+        # block UDF, and they can't reference the path column, which is appended
+        # after reading. Arrow expressions don't expose the fields they reference,
+        # so no filters are pushed down if the path column is included.
+        return self._block_udf is None and not self._include_paths
+
+    def apply_predicate(
+        self, predicate: "pyarrow.dataset.Expression"
+    ) -> "ParquetDatasource":
+        datasource = copy.copy(self)
+        to_batches_kwargs = dict(self._to_batches_kwargs)
+        if to_batches_kwargs.get("filter") is not None:
+            predicate = to_batches_kwargs["filter"] & predicate
+        # Arrow evaluates the filter while scanning each fragment, so row groups
+        # whose statistics don't match the filter are skipped entirely.
+        to_batches_kwargs["filter"] = predicate
+        datasource._to_batches_kwargs = to_batches_kwargs
+        datasource._prune_row_groups(predicate)
+        return datasource
+
+    def _prune_row_groups(self, predicate: "pyarrow.dataset.Expression"):
+        """Drop the files and row groups that can't match the predicate, based on
+        the row group statistics in the prefetched metadata.
+
+        Unlike the pruning Arrow does while scanning, this happens before read tasks
+        are launched, so we don't schedule tasks for data that's skipped anyway.
+        """
+        if not self._metadata or len(self._metadata) != len(self._pq_fragments):
+            return
+
+        pruned = _prune_row_groups(
+            self._pq_fragments,
+            self._pq_paths,
+            self._metadata,
+            self._dataset_schema,
+            predicate,
+        )
+        if pruned is None:
+            return
+        num_row_groups = sum(m.num_row_groups for m in self._metadata)
+        self._pq_fragments, self._pq_paths, self._metadata = pruned
+        logger.debug(
+            f"Pruned Parquet row groups with filter {predicate}: reading "
+            f"{sum(m.num_row_groups for m in self._metadata)} of {num_row_groups} "
+            f"row groups in {len(self._pq_fragments)} files."
+        )
+
+
+def _prune_row_groups(
+    fragments: List[_SerializedFragment],
+    paths: List[str],
+    metadata: List[_ParquetFileFragmentMetaData],
+    schema: "pyarrow.lib.Schema",
+    predicate: "pyarrow.dataset.Expression",
+) -> Optional[
+    Tuple[List[_SerializedFragment], List[str], List[_ParquetFileFragmentMetaData]]
+]:
+    """Return the fragments, paths, and metadata of the row groups that might match
+    the predicate, or ``None`` if the predicate can't be evaluated.
+    """
+    import pyarrow as pa
+    import pyarrow.dataset as pds
+    import pyarrow.fs
+
+    # Let Arrow decide which row groups can be skipped. We describe each row group
+    # as a fragment whose "partition expression" is the guarantee derived from its
+    # statistics. Arrow drops fragments whose guarantee contradicts the predicate.
+    # The fragments are never read, so their paths just index the row groups.
+    file_format = pds.ParquetFileFormat()
+    filesystem = pyarrow.fs.LocalFileSystem()
+    row_group_fragments = []
+    row_group_index = []
+    for file_idx, (fragment, file_metadata) in enumerate(zip(fragments, metadata)):
+        for row_group in file_metadata.row_groups:
+            row_group_fragments.append(
+                file_format.make_fragment(
+                    str(len(row_group_index)),
+                    filesystem,
+                    row_group.to_guarantee(fragment._partition_expression),
+                )
+            )
+            row_group_index.append((file_idx, row_group.id))
+
+    try:
+        dataset = pds.FileSystemDataset(
+            row_group_fragments, schema, file_format, filesystem
+        )
+        matched = [int(f.path) for f in dataset.get_fragments(filter=predicate)]
+    except (pa.ArrowException, TypeError, ValueError):
+        logger.debug(
+            f"Failed to prune row groups with filter {predicate}", exc_info=True
+        )
+        return None
+
+    matched_row_groups: Dict[int, List[int]] = {}
+    for i in sorted(matched):
+        file_idx, row_group_id = row_group_index[i]
+        matched_row_groups.setdefault(file_idx, []).append(row_group_id)
+
+    pruned_fragments, pruned_paths, pruned_metadata = [], [], []
+    for file_idx, row_group_ids in matched_row_groups.items():
+        file_metadata = metadata[file_idx]
+        if len(row_group_ids) == file_metadata.num_row_groups:
+            pruned_fragments.append(fragments[file_idx])
+            pruned_metadata.append(file_metadata)
+        else:
+            pruned_fragments.append(fragments[file_idx].subset(row_group_ids))
+            pruned_metadata.append(file_metadata.subset(row_group_ids))
+        pruned_paths.append(paths[file_idx])
+    return pruned_fragments, pruned_paths, pruned_metadata
+
 
 def _read_fragments(
     block_udf,
@@ -584,7 +738,7 @@ def _estimate_files_encoding_ratio(sample_infos: List[_SampleInfo]) -> float:
 
     To avoid OOMs, it is safer to return an over-estimate than an underestimate.
     """
-    if not DataContext.get_current().decoding_size_estimation:
+    if not DataContext.get_current().decoding_size_estimation or not sample_infos:
         return PARQUET_ENCODING_RATIO_ESTIMATE_DEFAULT
 
     def compute_encoding_ratio(sample_info: _SampleInfo) -> float:
@@ -604,6 +758,9 @@ def _estimate_files_encoding_ratio(sample_infos: List[_SampleInfo]) -> float:
 
 
 def _estimate_default_read_batch_size_rows(sample_infos: List[_SampleInfo]) -> int:
+    if not sample_infos:
+        return PARQUET_READER_ROW_BATCH_SIZE
+
     def compute_batch_size_rows(sample_info: _SampleInfo) -> int:
         if sample_info.actual_bytes_per_row is None:
             return PARQUET_READER_ROW_BATCH_SIZE
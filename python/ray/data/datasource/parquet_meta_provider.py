@@ -1,4 +1,10 @@
-from typing import TYPE_CHECKING, List, Optional, Union
+import copy
+import itertools
+import logging
+import posixpath
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
 
 import ray.cloudpickle as cloudpickle
 from ray.data._internal.util import call_with_retry
@@ -14,6 +20,7 @@ if TYPE_CHECKING:
 
     from ray.data.datasource.parquet_datasource import _SerializedFragment
 
+logger = logging.getLogger(__name__)
 
 FRAGMENTS_PER_META_FETCH = 6
 PARALLELIZE_META_FETCH_THRESHOLD = 24
@@ -26,6 +33,76 @@ RETRY_EXCEPTIONS_FOR_META_FETCH_TASK = ["AWS Error ACCESS_DENIED", "Timeout"]
 RETRY_MAX_ATTEMPTS_FOR_META_FETCH_TASK = 32
 # Maximum retry back-off interval in seconds for failed metadata prefetching task.
 RETRY_MAX_BACKOFF_S_FOR_META_FETCH_TASK = 64
+# The maximum number of files whose metadata is cached in the driver process. Set to
+# 0 to disable the cache.
+FILE_METADATA_CACHE_CAPACITY = 100_000
+
+
+class _RowGroupMetaData:
+    """Class to store the size and column statistics of a Parquet row group.
+
+    The statistics are used to skip row groups that can't match a filter before
+    any read task is launched.
+    """
+
+    def __init__(
+        self,
+        row_group_id: int,
+        row_group_metadata: "pyarrow.parquet.RowGroupMetaData",
+        arrow_schema: "pyarrow.lib.Schema",
+    ):
+        import pyarrow as pa
+
+        self.id = row_group_id
+        self.num_rows = row_group_metadata.num_rows
+        self.total_byte_size = row_group_metadata.total_byte_size
+        # Column name -> (min, max, null count). Each item is `None` if unknown.
+        self.column_stats: Dict[
+            str, Tuple[Optional["pyarrow.Scalar"], Optional["pyarrow.Scalar"], int]
+        ] = {}
+        for column_idx in range(row_group_metadata.num_columns):
+            column = row_group_metadata.column(column_idx)
+            name = column.path_in_schema
+            stats = column.statistics
+            # Only top-level columns can be referenced by filters.
+            if stats is None or name not in arrow_schema.names:
+                continue
+            null_count = stats.null_count if stats.has_null_count else None
+            min_value, max_value = None, None
+            if stats.has_min_max:
+                field_type = arrow_schema.field(name).type
+                try:
+                    min_value = pa.scalar(stats.min, type=field_type)
+                    max_value = pa.scalar(stats.max, type=field_type)
+                except (pa.ArrowException, TypeError, ValueError):
+                    # The statistics can't be represented with the column type
+                    # (e.g., for extension types).
+                    min_value, max_value = None, None
+            self.column_stats[name] = (min_value, max_value, null_count)
+
+    def to_guarantee(
+        self, partition_expression: Optional["pyarrow.dataset.Expression"] = None
+    ) -> "pyarrow.dataset.Expression":
+        """Return an expression that holds for every row in this row group."""
+        import pyarrow.dataset as pds
+
+        guarantee = (
+            partition_expression
+            if partition_expression is not None
+            else pds.scalar(True)
+        )
+        for name, (min_value, max_value, null_count) in self.column_stats.items():
+            field = pds.field(name)
+            if min_value is not None and max_value is not None:
+                column_guarantee = (field >= min_value) & (field <= max_value)
+                if null_count is None or null_count > 0:
+                    column_guarantee = column_guarantee | field.is_null()
+            elif null_count is not None and null_count == self.num_rows:
+                column_guarantee = field.is_null()
+            else:
+                continue
+            guarantee = guarantee & column_guarantee
+        return guarantee
 
 
 class _ParquetFileFragmentMetaData:
@@ -34,7 +111,12 @@ class _ParquetFileFragmentMetaData:
     which is stored in `self.schema_pickled` as a pickled object from
     `cloudpickle.loads()`, used in deduplicating schemas across multiple fragments."""
 
-    def __init__(self, fragment_metadata: "pyarrow.parquet.FileMetaData"):
+    def __init__(
+        self,
+        fragment_metadata: "pyarrow.parquet.FileMetaData",
+        arrow_schema: Optional["pyarrow.lib.Schema"] = None,
+        mtime_ns: Optional[int] = None,
+    ):
         self.created_by = fragment_metadata.created_by
         self.format_version = fragment_metadata.format_version
         self.num_columns = fragment_metadata.num_columns
@@ -45,19 +127,95 @@ class _ParquetFileFragmentMetaData:
         # `self.set_schema_pickled()`. To get the underlying schema, use
         # `cloudpickle.loads(self.schema_pickled)`.
         self.schema_pickled = None
-
-        # Calculate the total byte size of the file fragment using the original
-        # object, as it is not possible to access row groups from this class.
-        self.total_byte_size = 0
-        for row_group_idx in range(fragment_metadata.num_row_groups):
-            row_group_metadata = fragment_metadata.row_group(row_group_idx)
-            self.total_byte_size += row_group_metadata.total_byte_size
+        # The modification time of the file before its metadata was read, if known.
+        # It's part of the key of the metadata in the driver's cache.
+        self.mtime_ns = mtime_ns
+
+        if arrow_schema is None:
+            arrow_schema = fragment_metadata.schema.to_arrow_schema()
+        # Keep the size and statistics of each row group, because it is not
+        # possible to access row groups from this class.
+        self.row_groups = [
+            _RowGroupMetaData(
+                row_group_idx, fragment_metadata.row_group(row_group_idx), arrow_schema
+            )
+            for row_group_idx in range(fragment_metadata.num_row_groups)
+        ]
+        self.total_byte_size = sum(
+            row_group.total_byte_size for row_group in self.row_groups
+        )
 
     def set_schema_pickled(self, schema_pickled: bytes):
         """Note: to get the underlying schema, use
         `cloudpickle.loads(self.schema_pickled)`."""
         self.schema_pickled = schema_pickled
 
+    def subset(self, row_group_ids: List[int]) -> "_ParquetFileFragmentMetaData":
+        """Return a copy of this metadata that only includes the given row groups."""
+        row_group_ids = set(row_group_ids)
+        metadata = copy.copy(self)
+        metadata.row_groups = [
+            row_group for row_group in self.row_groups if row_group.id in row_group_ids
+        ]
+        metadata.num_row_groups = len(metadata.row_groups)
+        metadata.num_rows = sum(row_group.num_rows for row_group in metadata.row_groups)
+        metadata.total_byte_size = sum(
+            row_group.total_byte_size for row_group in metadata.row_groups
+        )
+        return metadata
+
+
+class _FileMetadataCache:
+    """A thread-safe LRU cache of Parquet file metadata.
+
+    Entries are keyed by file path and modification time, so that metadata of
+    files that were overwritten is never used.
+    """
+
+    def __init__(self):
+        self._cache: "OrderedDict[Tuple[str, int], _ParquetFileFragmentMetaData]" = (
+            OrderedDict()
+        )
+        # The number of entries of each file path.
+        self._num_entries_by_path: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def contains_any(self, paths: List[str]) -> bool:
+        """Return whether any of the files have entries, regardless of their
+        modification times."""
+        with self._lock:
+            return any(path in self._num_entries_by_path for path in paths)
+
+    def get(self, key: Tuple[str, int]) -> Optional[_ParquetFileFragmentMetaData]:
+        with self._lock:
+            metadata = self._cache.get(key)
+            if metadata is not None:
+                self._cache.move_to_end(key)
+            return metadata
+
+    def put(self, key: Tuple[str, int], metadata: _ParquetFileFragmentMetaData):
+        with self._lock:
+            if key not in self._cache:
+                path = key[0]
+                self._num_entries_by_path[path] = (
+                    self._num_entries_by_path.get(path, 0) + 1
+                )
+            self._cache[key] = metadata
+            self._cache.move_to_end(key)
+            while len(self._cache) > FILE_METADATA_CACHE_CAPACITY:
+                (path, _), _ = self._cache.popitem(last=False)
+                self._num_entries_by_path[path] -= 1
+                if self._num_entries_by_path[path] == 0:
+                    del self._num_entries_by_path[path]
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+            self._num_entries_by_path.clear()
+
+
+_file_metadata_cache = _FileMetadataCache()
+
 
 @DeveloperAPI
 class ParquetMetadataProvider(FileMetadataProvider):
@@ -131,6 +289,47 @@ class ParquetMetadataProvider(FileMetadataProvider):
             must be returned in the same order as all input file fragments, such
             that `metadata[i]` always contains the metadata for `fragments[i]`.
         """
+        if not fragments or FILE_METADATA_CACHE_CAPACITY <= 0:
+            return self._fetch_file_metadata(fragments, **ray_remote_args)
+
+        if _file_metadata_cache.contains_any([f.path for f in fragments]):
+            cache_keys = _get_cache_keys(fragments)
+        else:
+            # Nothing can be found in the cache, so don't list the files to validate
+            # the cached entries. The fetch tasks get the modification times of the
+            # files in parallel instead.
+            cache_keys = [None] * len(fragments)
+        metadata = [
+            _file_metadata_cache.get(key) if key is not None else None
+            for key in cache_keys
+        ]
+        missing_indices = [i for i, m in enumerate(metadata) if m is None]
+        if missing_indices:
+            fetched_metadata = (
+                self._fetch_file_metadata(
+                    [fragments[i] for i in missing_indices], **ray_remote_args
+                )
+                or []
+            )
+            for i, fragment_metadata in zip(missing_indices, fetched_metadata):
+                metadata[i] = fragment_metadata
+                if fragment_metadata.mtime_ns is not None:
+                    _file_metadata_cache.put(
+                        (fragments[i].path, fragment_metadata.mtime_ns),
+                        fragment_metadata,
+                    )
+        else:
+            logger.debug(f"Using cached metadata for all {len(fragments)} files")
+
+        # The metadata must be returned in the same order as the fragments, so only
+        # return it up to the first fragment whose metadata is unavailable.
+        return list(itertools.takewhile(lambda m: m is not None, metadata))
+
+    def _fetch_file_metadata(
+        self,
+        fragments: List["pyarrow.dataset.ParquetFileFragment"],
+        **ray_remote_args,
+    ) -> Optional[List[_ParquetFileFragmentMetaData]]:
         from ray.data.datasource.parquet_datasource import _SerializedFragment
 
         if len(fragments) > PARALLELIZE_META_FETCH_THRESHOLD:
@@ -161,12 +360,48 @@ class ParquetMetadataProvider(FileMetadataProvider):
         return _dedupe_metadata(raw_metadata)
 
 
+def _get_cache_keys(
+    fragments: List["pyarrow.dataset.ParquetFileFragment"],
+) -> List[Optional[Tuple[str, int]]]:
+    """Return the (path, modification time) cache key of each fragment, or `None`
+    if the modification time is unknown.
+
+    For many files, the modification times are resolved by listing the parent
+    directories rather than querying each file, since a single list request returns
+    the info of many files on cloud storage.
+    """
+    from pyarrow.fs import FileSelector
+
+    filesystem = fragments[0].filesystem
+    mtimes = {}
+    try:
+        if len(fragments) <= PARALLELIZE_META_FETCH_THRESHOLD:
+            file_infos = filesystem.get_file_info([f.path for f in fragments])
+        else:
+            dirs = {posixpath.dirname(fragment.path) for fragment in fragments}
+            file_infos = itertools.chain.from_iterable(
+                filesystem.get_file_info(FileSelector(dir, allow_not_found=True))
+                for dir in dirs
+            )
+        for file_info in file_infos:
+            mtimes[file_info.path] = file_info.mtime_ns
+    except Exception:
+        logger.debug("Failed to get modification times of files", exc_info=True)
+        return [None] * len(fragments)
+
+    keys = []
+    for fragment in fragments:
+        mtime = mtimes.get(fragment.path)
+        keys.append((fragment.path, mtime) if mtime is not None else None)
+    return keys
+
+
 def _fetch_metadata_serialization_wrapper(
     fragments: List["_SerializedFragment"],
     retry_match: Optional[List[str]],
     retry_max_attempts: int,
     retry_max_interval: int,
-) -> List["pyarrow.parquet.FileMetaData"]:
+) -> List[Tuple["pyarrow.parquet.FileMetaData", Optional[int]]]:
     from ray.data.datasource.parquet_datasource import _deserialize_fragments_with_retry
 
     deserialized_fragments = _deserialize_fragments_with_retry(fragments)
@@ -212,18 +447,39 @@ def _fetch_metadata_serialization_wrapper(
 
 def _fetch_metadata(
     fragments: List["pyarrow.dataset.ParquetFileFragment"],
-) -> List["pyarrow.parquet.FileMetaData"]:
+) -> List[Tuple["pyarrow.parquet.FileMetaData", Optional[int]]]:
+    """Return the metadata of each fragment, with the modification time of its
+    file, if known.
+
+    The modification times are resolved before the metadata is read, so that the
+    metadata of a file that's overwritten in between isn't cached under the new
+    modification time.
+    """
+    mtimes = _get_mtimes(fragments)
     fragment_metadata = []
-    for f in fragments:
+    for f, mtime in zip(fragments, mtimes):
         try:
-            fragment_metadata.append(f.metadata)
+            fragment_metadata.append((f.metadata, mtime))
         except AttributeError:
             break
     return fragment_metadata
 
 
+def _get_mtimes(
+    fragments: List["pyarrow.dataset.ParquetFileFragment"],
+) -> List[Optional[int]]:
+    if not fragments:
+        return []
+    try:
+        file_infos = fragments[0].filesystem.get_file_info([f.path for f in fragments])
+    except Exception:
+        logger.debug("Failed to get modification times of files", exc_info=True)
+        return [None] * len(fragments)
+    return [file_info.mtime_ns for file_info in file_infos]
+
+
 def _dedupe_metadata(
-    raw_metadatas: List["pyarrow.parquet.FileMetaData"],
+    raw_metadatas: List[Tuple["pyarrow.parquet.FileMetaData", Optional[int]]],
 ) -> List[_ParquetFileFragmentMetaData]:
     """For datasets with a large number of columns, the FileMetaData
     (in particular the schema) can be very large. We can reduce the
@@ -233,10 +489,13 @@ def _dedupe_metadata(
     schema_to_id = {}  # schema_id -> serialized_schema
     id_to_schema = {}  # serialized_schema -> schema_id
     stripped_metadatas = []
-    for fragment_metadata in raw_metadatas:
-        stripped_md = _ParquetFileFragmentMetaData(fragment_metadata)
+    for fragment_metadata, mtime_ns in raw_metadatas:
+        arrow_schema = fragment_metadata.schema.to_arrow_schema()
+        stripped_md = _ParquetFileFragmentMetaData(
+            fragment_metadata, arrow_schema, mtime_ns
+        )
 
-        schema_ser = cloudpickle.dumps(fragment_metadata.schema.to_arrow_schema())
+        schema_ser = cloudpickle.dumps(arrow_schema)
         if schema_ser not in schema_to_id:
             schema_id = len(schema_to_id)
             schema_to_id[schema_ser] = schema_id
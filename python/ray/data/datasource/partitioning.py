@@ -2,6 +2,7 @@ import posixpath
 from dataclasses import dataclass
 from enum import Enum
 from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+from urllib.parse import quote, unquote
 
 from ray.util.annotations import DeveloperAPI, PublicAPI
 
@@ -259,7 +260,7 @@ class PathPartitionParser:
         dictionary for unpartitioned files.
         """
         dirs = [d for d in dir_path.split("/") if d and (d.count("=") == 1)]
-        kv_pairs = [d.split("=") for d in dirs] if dirs else []
+        kv_pairs = [[unquote(part) for part in d.split("=")] for d in dirs]
         field_names = self._scheme.field_names
         if field_names and kv_pairs:
             if len(kv_pairs) != len(field_names):
@@ -297,12 +298,135 @@ class PathPartitionParser:
         if not dirs:
             return {}
         return {
-            field: directory
+            field: unquote(directory)
             for field, directory in zip(field_names, dirs)
             if field is not None
         }
 
 
+@DeveloperAPI
+class PathPartitionEncoder:
+    """Callable that generates directory path strings for path-based partition formats.
+
+    Path-based partition formats embed all partition keys and values directly in
+    their dataset file paths.
+
+    Two path partition formats are currently supported - `HIVE` and `DIRECTORY`.
+
+    For `HIVE` Partitioning, all partition directories will be generated using a
+    `{key1}={value1}/{key2}={value2}` naming convention under the base directory.
+    An accompanying ordered list of partition key field names must also be
+    provided, where the order and length of all partition values must match the
+    order and length of field names.
+
+    For `DIRECTORY` Partitioning, all directories will be generated from partition
+    values using a `{value1}/{value2}` naming convention under the base directory.
+    """
+
+    @staticmethod
+    def of(
+        style: PartitionStyle = PartitionStyle.HIVE,
+        base_dir: Optional[str] = None,
+        field_names: Optional[List[str]] = None,
+        filesystem: Optional["pyarrow.fs.FileSystem"] = None,
+    ) -> "PathPartitionEncoder":
+        """Creates a new partition path encoder.
+
+        Args:
+            style: The partition style - may be either HIVE or DIRECTORY.
+            base_dir: "/"-delimited base directory that all partition paths will be
+                generated under (exclusive). Specify `None` or an empty string to
+                generate paths relative to the directory the files are written to.
+            field_names: The partition key field names (i.e. column names for tabular
+                datasets). Required for HIVE partition paths, optional for DIRECTORY
+                partition paths. When non-empty, the order and length of partition
+                key field names must match the order and length of partition values.
+            filesystem: Filesystem that will be used for partition path file I/O.
+
+        Returns:
+            The new partition path encoder.
+        """
+        scheme = Partitioning(style, base_dir, field_names, filesystem)
+        return PathPartitionEncoder(scheme)
+
+    def __init__(self, partitioning: Partitioning):
+        """Creates a new partition path encoder.
+
+        Args:
+            partitioning: The path-based partition scheme. All partition paths
+                will be generated under this scheme's base directory. Field names are
+                required for HIVE partitioning, and optional for DIRECTORY
+                partitioning. When non-empty, the order and length of partition key
+                field names must match the order and length of partition values.
+        """
+        style = partitioning.style
+        field_names = partitioning.field_names
+        if style == PartitionStyle.HIVE and not field_names:
+            raise ValueError(
+                "Hive partition path generation requires a corresponding list of "
+                "partition key field names. Please retry your request with one "
+                "or more field names specified."
+            )
+        generators = {
+            PartitionStyle.HIVE: self._as_hive_partition_dirs,
+            PartitionStyle.DIRECTORY: self._as_directory_partition_dirs,
+        }
+        self._encoder_fn: Callable[[List[str]], List[str]] = generators.get(style)
+        if self._encoder_fn is None:
+            raise ValueError(
+                f"Unsupported partition style: {style}. "
+                f"Supported styles: {generators.keys()}"
+            )
+        self._scheme = partitioning
+
+    def __call__(self, partition_values: List[str]) -> str:
+        """Returns the partition directory path for the given partition value strings.
+
+        All files for this partition should be written to this directory. If a base
+        directory is set, then the partitioned directory path returned will be rooted
+        in this base directory.
+
+        Args:
+            partition_values: The partition value strings to include in the partition
+                path. For HIVE partitioning, the order and length of these values must
+                match the order and length of partition field names.
+        Returns:
+            Partition directory path for the given partition values.
+        """
+        partition_dirs = self._encoder_fn(partition_values)
+        if not self._scheme.base_dir:
+            return posixpath.join(*partition_dirs)
+        return posixpath.join(self._scheme.normalized_base_dir, *partition_dirs)
+
+    @property
+    def scheme(self) -> Partitioning:
+        """Returns the partitioning for this encoder."""
+        return self._scheme
+
+    def _as_hive_partition_dirs(self, values: List[str]) -> List[str]:
+        """Creates HIVE directory names for the given values."""
+        field_names = self._scheme.field_names
+        if len(values) != len(field_names):
+            raise ValueError(
+                f"Expected {len(field_names)} partition value(s) but found "
+                f"{len(values)}: {values}."
+            )
+        return [
+            f"{field_names[i]}={_encode_partition_value(val)}"
+            for i, val in enumerate(values)
+        ]
+
+    def _as_directory_partition_dirs(self, values: List[str]) -> List[str]:
+        """Creates DIRECTORY partition directory names for the given values."""
+        field_names = self._scheme.field_names
+        if field_names and len(values) != len(field_names):
+            raise ValueError(
+                f"Expected {len(field_names)} partition value(s) but found "
+                f"{len(values)}: {values}."
+            )
+        return [_encode_partition_value(val) for val in values]
+
+
 @PublicAPI(stability="beta")
 class PathPartitionFilter:
     """Partition filter for path-based partition formats.
@@ -422,3 +546,9 @@ class PathPartitionFilter:
     def parser(self) -> PathPartitionParser:
         """Returns the path partition parser for this filter."""
         return self._parser
+
+
+def _encode_partition_value(value: str) -> str:
+    """URL-encode a partition value, so that values with characters like "/" or "="
+    map to a single directory name that the partition parsers decode."""
+    return quote(value, safe="")
@@ -269,6 +269,7 @@ class DataIterator(abc.ABC):
         drop_last: bool = False,
         local_shuffle_buffer_size: Optional[int] = None,
         local_shuffle_seed: Optional[int] = None,
+        reuse_buffers: bool = False,
     ) -> Iterable["TorchBatchType"]:
         """Return a batched iterable of Torch Tensors over the dataset.
 
@@ -345,12 +346,21 @@ class DataIterator(abc.ABC):
                 therefore ``batch_size`` must also be specified when using local
                 shuffling.
             local_shuffle_seed: The seed to use for the local random shuffle.
+            reuse_buffers: If True, batches are copied into a ring of preallocated
+                CPU tensors that are reused across batches, instead of into new
+                tensors, to avoid allocating memory for each batch. The tensors of a
+                batch are reused once the next batch is fetched, so the tensors
+                shouldn't be kept past the current iteration; clone them to keep
+                them. You can't use this parameter with ``collate_fn``.
 
         Returns:
             An iterable over Torch Tensor batches.
         """
 
+        import torch
+
         from ray.air._internal.torch_utils import (
+            TorchTensorBatchBuffers,
             convert_ndarray_batch_to_torch_tensor_batch,
         )
         from ray.train.torch import get_device
@@ -361,39 +371,65 @@ class DataIterator(abc.ABC):
                 "You should manually move the output Torch tensors to the"
                 "desired dtype and device outside of collate_fn."
             )
+        if collate_fn is not None and reuse_buffers:
+            raise ValueError("collate_fn cannot be used with reuse_buffers.")
 
         if device == "auto":
             # Use the appropriate device for Ray Train, or falls back to CPU if
             # Ray Train is not being used.
             device = get_device()
 
+        buffers = None
         if collate_fn is None:
             # The default collate_fn handles formatting and Tensor creation.
             # Here, we set device=None to defer host to device data transfer
             # to the subsequent finalize_fn.
-            def collate_fn(batch: Union[np.ndarray, Dict[str, np.ndarray]]):
-                return convert_ndarray_batch_to_torch_tensor_batch(
-                    batch,
+            if reuse_buffers:
+                # Besides the batch the user holds, batches are in use while being
+                # collated by each of the `prefetch_batches` threads, while waiting
+                # to be reordered after them, in the queues between the threads, and
+                # while being finalized. Batches that don't fit in the ring, such as
+                # those held up by a slow thread, are copied into new tensors.
+                buffers = TorchTensorBatchBuffers(
+                    num_slots=2 * prefetch_batches + 4,
                     dtypes=dtypes,
-                    device=None,
+                    pin_memory=device is not None
+                    and torch.device(device).type == "cuda",
                 )
 
+                def collate_fn(batch: Union[np.ndarray, Dict[str, np.ndarray]]):
+                    return buffers.convert(batch)
+
+            else:
+
+                def collate_fn(batch: Union[np.ndarray, Dict[str, np.ndarray]]):
+                    return convert_ndarray_batch_to_torch_tensor_batch(
+                        batch,
+                        dtypes=dtypes,
+                        device=None,
+                    )
+
             # The default finalize_fn handles the host to device data transfer.
             # This is executed in a 1-thread pool separately from collate_fn
             # to allow independent parallelism of these steps.
             def finalize_fn(batch: Union["torch.Tensor", Dict[str, "torch.Tensor"]]):
                 if device is not None:
+                    host_batch = dict(batch) if isinstance(batch, dict) else batch
                     if isinstance(batch, dict):
                         for k, t in batch.items():
                             batch[k] = t.to(device=device)
                     else:
                         batch = batch.to(device=device)
+                    if buffers is not None and torch.device(device).type != "cpu":
+                        # The batch was copied to the device, so its buffers can be
+                        # reused.
+                        buffers.release(host_batch)
                 return batch
 
         else:
             finalize_fn = None
 
-        return self.iter_batches(
+        batches = self.iter_batches(
             prefetch_batches=prefetch_batches,
             batch_size=batch_size,
             drop_last=drop_last,
@@ -402,6 +438,16 @@ class DataIterator(abc.ABC):
             _collate_fn=collate_fn,
             _finalize_fn=finalize_fn,
         )
+        if buffers is None:
+            return batches
+
+        def _release_buffers_after_use():
+            for batch in batches:
+                yield batch
+                # The user is done with the batch once they fetch the next one.
+                buffers.release(batch)
+
+        return _IterableFromIterator(_release_buffers_after_use)
 
     def iter_tf_batches(
         self,
@@ -2,14 +2,19 @@ import bisect
 import logging
 import random
 import time
-from collections import defaultdict
-from typing import TYPE_CHECKING, Any, List, Optional
+from collections import OrderedDict, defaultdict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
 import ray
+from ray.data._internal.delegating_block_builder import DelegatingBlockBuilder
+from ray.data._internal.planner.exchange.hash_shuffle_task_spec import (
+    hash_partition,
+    hash_partition_ids,
+)
 from ray.data._internal.remote_fn import cached_remote_fn
-from ray.data.block import BlockAccessor
+from ray.data.block import Block, BlockAccessor
 from ray.data.context import DataContext
 from ray.types import ObjectRef
 from ray.util.annotations import PublicAPI
@@ -20,6 +25,8 @@ except ImportError:
     pa = None
 
 if TYPE_CHECKING:
+    import pyarrow
+
     from ray.data import Dataset
 
 logger = logging.getLogger(__name__)
@@ -37,6 +44,8 @@ class RandomAccessDataset:
         ds: "Dataset",
         key: str,
         num_workers: int,
+        index: str = "sort",
+        block_cache_bytes: Optional[int] = None,
     ):
         """Construct a RandomAccessDataset (internal API).
 
@@ -46,31 +55,26 @@ class RandomAccessDataset:
         schema = ds.schema(fetch_if_missing=True)
         if schema is None or isinstance(schema, type):
             raise ValueError("RandomAccessDataset only supports Arrow-format blocks.")
+        if index not in ("sort", "hash"):
+            raise ValueError(f"index must be 'sort' or 'hash', but got {index!r}.")
+        if key not in schema.names:
+            raise ValueError(f"Key {key!r} not found in dataset columns.")
 
         start = time.perf_counter()
-        logger.info("[setup] Indexing dataset by sort key.")
-        sorted_ds = ds.sort(key)
-        get_bounds = cached_remote_fn(_get_bounds)
-        blocks = sorted_ds.get_internal_block_refs()
-
-        logger.info("[setup] Computing block range bounds.")
-        bounds = ray.get([get_bounds.remote(b, key) for b in blocks])
-        self._non_empty_blocks = []
-        self._lower_bound = None
-        self._upper_bounds = []
-        for i, b in enumerate(bounds):
-            if b:
-                self._non_empty_blocks.append(blocks[i])
-                if self._lower_bound is None:
-                    self._lower_bound = b[0]
-                self._upper_bounds.append(b[1])
+        self._key = key
+        self._index = index
+        self._schema = schema
+        if index == "sort":
+            self._build_sort_index(ds)
+        else:
+            self._build_hash_index(ds, num_workers)
 
         logger.info("[setup] Creating {} random access workers.".format(num_workers))
         ctx = DataContext.get_current()
         scheduling_strategy = ctx.scheduling_strategy
         self._workers = [
             _RandomAccessWorker.options(scheduling_strategy=scheduling_strategy).remote(
-                key
+                key, index, block_cache_bytes
             )
             for _ in range(num_workers)
         ]
@@ -97,6 +101,51 @@ class RandomAccessDataset:
         logger.info("[setup] Finished assigning blocks to workers.")
         self._build_time = time.perf_counter() - start
 
+    def _build_sort_index(self, ds: "Dataset"):
+        """Range-partition the dataset into sorted blocks."""
+        logger.info("[setup] Indexing dataset by sort key.")
+        sorted_ds = ds.sort(self._key)
+        get_bounds = cached_remote_fn(_get_bounds)
+        blocks = sorted_ds.get_internal_block_refs()
+
+        logger.info("[setup] Computing block range bounds.")
+        bounds = ray.get([get_bounds.remote(b, self._key) for b in blocks])
+        self._non_empty_blocks = []
+        self._lower_bound = None
+        self._upper_bounds = []
+        for i, b in enumerate(bounds):
+            if b:
+                self._non_empty_blocks.append(blocks[i])
+                if self._lower_bound is None:
+                    self._lower_bound = b[0]
+                self._upper_bounds.append(b[1])
+
+    def _build_hash_index(self, ds: "Dataset", num_partitions: int):
+        """Hash-partition the dataset into one block per partition.
+
+        Unlike the sort index, this doesn't need to sample and sort the keys, and
+        locating the partition of a batch of keys is vectorized. The workers look
+        up keys in per-block hash tables.
+        """
+        logger.info("[setup] Indexing dataset by key hash.")
+        blocks = ds.get_internal_block_refs()
+        partition_block = cached_remote_fn(
+            _hash_partition_block, num_returns=num_partitions
+        )
+        concat_blocks = cached_remote_fn(_concat_blocks)
+        partitions = [
+            partition_block.remote(b, self._key, num_partitions) for b in blocks
+        ]
+        if num_partitions == 1:
+            partitions = [[p] for p in partitions]
+        # Each partition is a block, including empty partitions, so that the index
+        # of the block that a key belongs to is its partition.
+        self._non_empty_blocks = [
+            concat_blocks.remote(*[p[i] for p in partitions])
+            for i in range(num_partitions)
+        ]
+        ray.wait(self._non_empty_blocks, num_returns=num_partitions, fetch_local=False)
+
     def _compute_block_to_worker_assignments(self):
         # Return values.
         block_to_workers: dict[int, List["ray.ActorHandle"]] = defaultdict(list)
@@ -137,7 +186,7 @@ class RandomAccessDataset:
         Returns:
             ObjectRef containing the record (in pydict form), or None if not found.
         """
-        block_index = self._find_le(key)
+        block_index = self._find_blocks([key])[0]
         if block_index is None:
             return ray.put(None)
         return self._worker_for(block_index).get.remote(block_index, key)
@@ -151,24 +200,71 @@ class RandomAccessDataset:
         Returns:
             List of found records (in pydict form), or None for missing records.
         """
-        batches = defaultdict(list)
-        for k in keys:
-            batches[self._find_le(k)].append(k)
-        futures = {}
-        for index, keybatch in batches.items():
+        results = [None] * len(keys)
+        for positions, future in self._multiget_by_worker(keys, "multiget"):
+            for i, value in zip(positions, ray.get(future)):
+                results[i] = value
+        return results
+
+    def multiget_table(self, keys: List[Any]) -> "pyarrow.Table":
+        """Synchronously find the records for a list of keys as an Arrow table.
+
+        The keys are grouped by the worker that serves them, so this makes at most
+        one call to each worker, and the workers return the records as Arrow tables
+        without converting them to Python objects.
+
+        Args:
+            keys: List of keys to find the records for.
+
+        Returns:
+            A table with one row for each key, in the same order as ``keys``. The
+            rows of missing records are null.
+        """
+        from ray.data._internal.arrow_ops import transform_pyarrow
+
+        positions = []
+        tables = []
+        futures = self._multiget_by_worker(keys, "multiget_table")
+        for worker_positions, (found, table) in zip(
+            [p for p, _ in futures], ray.get([f for _, f in futures])
+        ):
+            if found:
+                positions.extend(worker_positions[i] for i in found)
+                tables.append(table)
+
+        # Map each key to its row in the concatenated results, or to null.
+        indices = [None] * len(keys)
+        for row, i in enumerate(positions):
+            indices[i] = row
+        if tables:
+            table = transform_pyarrow.concat(tables)
+        elif isinstance(self._schema.base_schema, pa.Schema):
+            table = self._schema.base_schema.empty_table()
+        else:
+            table = pa.table({name: pa.nulls(0) for name in self._schema.names})
+        return table.take(pa.array(indices, type=pa.int64()))
+
+    def _multiget_by_worker(
+        self, keys: List[Any], method: str
+    ) -> List[Tuple[List[int], ObjectRef]]:
+        """Call ``method`` on each worker with the keys that it serves.
+
+        Returns:
+            The positions in ``keys`` of the keys sent to each worker, and the
+            future of the worker's results for these keys.
+        """
+        batches = defaultdict(lambda: ([], [], []))
+        for i, (key, index) in enumerate(zip(keys, self._find_blocks(keys))):
             if index is None:
                 continue
-            fut = self._worker_for(index).multiget.remote(
-                [index] * len(keybatch), keybatch
-            )
-            futures[index] = fut
-        results = {}
-        for i, fut in futures.items():
-            keybatch = batches[i]
-            values = ray.get(fut)
-            for k, v in zip(keybatch, values):
-                results[k] = v
-        return [results.get(k) for k in keys]
+            positions, block_indices, keybatch = batches[self._worker_for(index)]
+            positions.append(i)
+            block_indices.append(index)
+            keybatch.append(key)
+        return [
+            (positions, getattr(worker, method).remote(block_indices, keybatch))
+            for worker, (positions, block_indices, keybatch) in batches.items()
+        ]
 
     def stats(self) -> str:
         """Returns a string containing access timing information."""
@@ -188,11 +284,25 @@ class RandomAccessDataset:
         msg += "- Mean access time: {}us\n".format(
             int(total_time / (1 + sum(accesses)) * 1e6)
         )
+        cache_hits = sum(s["cache_hits"] for s in stats)
+        cache_misses = sum(s["cache_misses"] for s in stats)
+        msg += "- Block cache hits: {}, misses: {}\n".format(cache_hits, cache_misses)
         return msg
 
     def _worker_for(self, block_index: int):
         return random.choice(self._block_to_workers_map[block_index])
 
+    def _find_blocks(self, keys: List[Any]) -> List[Optional[int]]:
+        """Return the index of the block that may contain each key."""
+        if self._index == "hash":
+            import pandas as pd
+
+            if not keys:
+                return []
+            keys = pd.DataFrame({self._key: keys})
+            return hash_partition_ids(keys, len(self._non_empty_blocks)).tolist()
+        return [self._find_le(key) for key in keys]
+
     def _find_le(self, x: Any) -> int:
         i = bisect.bisect_left(self._upper_bounds, x)
         if i >= len(self._upper_bounds) or x < self._lower_bound:
@@ -202,14 +312,27 @@ class RandomAccessDataset:
 
 @ray.remote(num_cpus=0)
 class _RandomAccessWorker:
-    def __init__(self, key_field):
-        self.blocks = None
+    def __init__(self, key_field, index="sort", block_cache_bytes=None):
+        self.block_refs = None
         self.key_field = key_field
+        self.index = index
         self.num_accesses = 0
         self.total_time = 0
+        # LRU cache of block index -> (block, key index, size in bytes). The key
+        # index is a dict from key to row for hash indexes, and the sorted keys as
+        # a NumPy array for sort indexes.
+        self.block_cache: OrderedDict[int, Tuple[Block, Any, int]] = OrderedDict()
+        self.block_cache_bytes = block_cache_bytes
+        self.cached_bytes = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
 
     def assign_blocks(self, block_ref_dict):
-        self.blocks = {k: ray.get(ref) for k, ref in block_ref_dict.items()}
+        self.block_refs = block_ref_dict
+        if self.block_cache_bytes is None:
+            # Without a cache limit, load all blocks up front.
+            for block_index in block_ref_dict:
+                self._get_block(block_index)
 
     def get(self, block_index, key):
         start = time.perf_counter()
@@ -220,64 +343,122 @@ class _RandomAccessWorker:
 
     def multiget(self, block_indices, keys):
         start = time.perf_counter()
-        block = self.blocks[block_indices[0]]
-        if len(set(block_indices)) == 1 and isinstance(
-            self.blocks[block_indices[0]], pa.Table
-        ):
-            # Fast path: use np.searchsorted for vectorized search on a single block.
-            # This is ~3x faster than the naive case.
-            block = self.blocks[block_indices[0]]
-            col = block[self.key_field]
-            indices = np.searchsorted(col, keys)
+        result = [None] * len(keys)
+        for block_index, positions in _group_positions(block_indices).items():
+            block, rows = self._find_rows(block_index, [keys[i] for i in positions])
             acc = BlockAccessor.for_block(block)
-            result = [acc._get_row(i) for i in indices]
-            # assert result == [self._get(i, k) for i, k in zip(block_indices, keys)]
-        else:
-            result = [self._get(i, k) for i, k in zip(block_indices, keys)]
+            for i, row in zip(positions, rows):
+                if row is not None:
+                    result[i] = acc._get_row(row)
         self.total_time += time.perf_counter() - start
         self.num_accesses += 1
         return result
 
+    def multiget_table(
+        self, block_indices, keys
+    ) -> Tuple[List[int], Optional["pyarrow.Table"]]:
+        """Return the positions of the found keys, and a table of their records."""
+        from ray.data._internal.arrow_ops import transform_pyarrow
+
+        start = time.perf_counter()
+        found = []
+        tables = []
+        for block_index, positions in _group_positions(block_indices).items():
+            block, rows = self._find_rows(block_index, [keys[i] for i in positions])
+            found_rows = [
+                (i, row) for i, row in zip(positions, rows) if row is not None
+            ]
+            if found_rows:
+                found.extend(i for i, _ in found_rows)
+                table = BlockAccessor.for_block(block).to_arrow()
+                tables.append(table.take([row for _, row in found_rows]))
+        self.total_time += time.perf_counter() - start
+        self.num_accesses += 1
+        return found, transform_pyarrow.concat(tables) if tables else None
+
     def ping(self):
         return ray.get_runtime_context().get_node_id()
 
     def stats(self) -> dict:
         return {
-            "num_blocks": len(self.blocks),
+            "num_blocks": len(self.block_refs),
             "num_accesses": self.num_accesses,
             "total_time": self.total_time,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
         }
 
     def _get(self, block_index, key):
         if block_index is None:
             return None
-        block = self.blocks[block_index]
-        column = block[self.key_field]
-        if isinstance(block, pa.Table):
-            column = _ArrowListWrapper(column)
-        i = _binary_search_find(column, key)
-        if i is None:
+        block, [row] = self._find_rows(block_index, [key])
+        if row is None:
             return None
         acc = BlockAccessor.for_block(block)
-        return acc._get_row(i)
+        return acc._get_row(row)
+
+    def _find_rows(
+        self, block_index: int, keys: List[Any]
+    ) -> Tuple[Block, List[Optional[int]]]:
+        """Return the block and the row of each key in it, or None if missing."""
+        block, key_index, _ = self._get_block(block_index)
+        if self.index == "hash":
+            return block, [key_index.get(key) for key in keys]
+        rows = np.searchsorted(key_index, keys)
+        return block, [
+            row if row < len(key_index) and key_index[row] == key else None
+            for row, key in zip(rows.tolist(), keys)
+        ]
 
+    def _get_block(self, block_index: int) -> Tuple[Block, Any, int]:
+        if block_index in self.block_cache:
+            self.cache_hits += 1
+            self.block_cache.move_to_end(block_index)
+            return self.block_cache[block_index]
 
-def _binary_search_find(column, x):
-    i = bisect.bisect_left(column, x)
-    if i != len(column) and column[i] == x:
-        return i
-    return None
+        self.cache_misses += 1
+        block = ray.get(self.block_refs[block_index])
+        acc = BlockAccessor.for_block(block)
+        if acc.num_rows() == 0:
+            keys = []
+        else:
+            keys = block[self.key_field].to_numpy()
+        if self.index == "hash":
+            key_index = {key: row for row, key in enumerate(np.asarray(keys).tolist())}
+        else:
+            key_index = np.asarray(keys)
+        entry = (block, key_index, acc.size_bytes())
+        self.block_cache[block_index] = entry
+        self.cached_bytes += entry[2]
+        # Evict the least recently used blocks, but always keep the current one.
+        while (
+            self.block_cache_bytes is not None
+            and self.cached_bytes > self.block_cache_bytes
+            and len(self.block_cache) > 1
+        ):
+            _, (_, _, size_bytes) = self.block_cache.popitem(last=False)
+            self.cached_bytes -= size_bytes
+        return entry
+
+
+def _group_positions(block_indices: List[int]) -> Dict[int, List[int]]:
+    """Group the positions in ``block_indices`` by block index."""
+    groups = defaultdict(list)
+    for i, block_index in enumerate(block_indices):
+        groups[block_index].append(i)
+    return groups
 
 
-class _ArrowListWrapper:
-    def __init__(self, arrow_col):
-        self.arrow_col = arrow_col
+def _hash_partition_block(block: Block, key: str, num_partitions: int) -> List[Block]:
+    partitions = hash_partition(block, [key], num_partitions)
+    return partitions[0] if num_partitions == 1 else partitions
 
-    def __getitem__(self, i):
-        return self.arrow_col[i].as_py()
 
-    def __len__(self):
-        return len(self.arrow_col)
+def _concat_blocks(*blocks: Block) -> Block:
+    builder = DelegatingBlockBuilder()
+    for block in blocks:
+        builder.add_block(block)
+    return builder.build()
 
 
 def _get_bounds(block, key):
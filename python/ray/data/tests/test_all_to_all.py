@@ -10,8 +10,20 @@ import pyarrow as pa
 import pytest
 
 import ray
-from ray.data._internal.aggregate import Count, Max, Mean, Min, Quantile, Std, Sum
+from ray.data._internal.aggregate import (
+    ApproxDistinct,
+    ApproxQuantile,
+    ApproxTopK,
+    Count,
+    Max,
+    Mean,
+    Min,
+    Quantile,
+    Std,
+    Sum,
+)
 from ray.data.aggregate import AggregateFn
+from ray.data.block import BlockAccessor
 from ray.data.context import DataContext
 from ray.data.tests.conftest import *  # noqa
 from ray.data.tests.util import named_values
@@ -102,6 +114,33 @@ def test_repartition_shuffle_arrow(ray_start_regular_shared):
     assert large._block_num_rows() == [500] * 20
 
 
+def test_repartition_keys(ray_start_regular_shared, restore_data_context):
+    # Half of the rows have the hot key 0, and the other keys are small.
+    df = pd.DataFrame(
+        {"k": [0 if i % 2 == 0 else i for i in range(2000)], "v": range(2000)}
+    )
+    ds = ray.data.from_pandas(df).repartition(10)
+
+    def block_keys(ds):
+        return [
+            set(BlockAccessor.for_block(ray.get(block)).to_pandas()["k"])
+            for block in ds.get_internal_block_refs()
+        ]
+
+    # Each key is in a single block, even if hot keys are split for joins.
+    DataContext.get_current().shuffle_hot_key_threshold = 1.0
+    ds2 = ds.repartition(4, keys="k").materialize()
+    assert ds2._plan.initial_num_blocks() == 4
+    assert sorted(ds2.to_pandas()["v"]) == list(range(2000))
+    keys = block_keys(ds2)
+    for key in [0] + list(range(1, 2000, 2)):
+        assert sum(key in k for k in keys) == 1
+    assert max(ds2._block_num_rows()) >= 1000
+
+    with pytest.raises(ValueError):
+        ds.repartition(4, keys=[])
+
+
 def test_unique(ray_start_regular_shared):
     ds = ray.data.from_items([3, 2, 3, 1, 2, 3])
     assert set(ds.unique("item")) == {1, 2, 3}
@@ -900,6 +939,59 @@ def test_groupby_arrow_multi_agg_alias(ray_start_regular_shared, num_parts):
             assert result == expected
 
 
+@pytest.mark.parametrize("num_parts", [1, 30])
+def test_groupby_approx_agg(ray_start_regular_shared, num_parts):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "A": np.arange(10_000) % 2,
+            "B": rng.integers(0, 2_000, 10_000),
+            "C": rng.zipf(2, 10_000),
+            "D": rng.normal(size=10_000),
+        }
+    )
+    agg_df = (
+        ray.data.from_pandas(df)
+        .repartition(num_parts)
+        .groupby("A")
+        .aggregate(
+            ApproxDistinct("B"),
+            ApproxQuantile("D", q=[0.1, 0.5, 0.99]),
+            ApproxTopK("C", k=3),
+        )
+        .to_pandas()
+    )
+    assert agg_df["A"].tolist() == [0, 1]
+    for a, group in df.groupby("A"):
+        row = agg_df[agg_df["A"] == a].iloc[0]
+        expected_distinct = group["B"].nunique()
+        assert abs(row["approx_distinct(B)"] - expected_distinct) < (
+            0.05 * expected_distinct
+        )
+        np.testing.assert_allclose(
+            list(row["approx_quantile(D)"]),
+            group["D"].quantile([0.1, 0.5, 0.99]).tolist(),
+            atol=0.05,
+        )
+        expected_top_k = group["C"].value_counts().head(3)
+        assert [item["value"] for item in row["approx_top_k(C)"]] == (
+            expected_top_k.index.tolist()
+        )
+        for item in row["approx_top_k(C)"]:
+            assert item["count"] <= expected_top_k[item["value"]]
+
+    # Test global aggregation and null handling.
+    ds = ray.data.from_items([{"A": x} for x in [1, 2, 2, None, 3, 3, 3]])
+    result = ds.aggregate(
+        ApproxDistinct("A"), ApproxQuantile("A", q=0.5), ApproxTopK("A", k=1)
+    )
+    assert result["approx_distinct(A)"] == 3
+    assert result["approx_quantile(A)"] == pytest.approx(2.5, abs=0.5)
+    assert result["approx_top_k(A)"] == [{"value": 3, "count": 3}]
+    result = ds.aggregate(ApproxDistinct("A", ignore_nulls=False))
+    assert result["approx_distinct(A)"] is None
+
+
 @pytest.mark.parametrize("num_parts", [1, 2, 30])
 def test_groupby_map_groups_for_none_groupkey(ray_start_regular_shared, num_parts):
     ds = ray.data.from_items(list(range(100)))
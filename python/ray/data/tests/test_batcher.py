@@ -4,7 +4,11 @@ import pyarrow as pa
 import pytest
 
 import ray
-from ray.data._internal.batcher import Batcher, ShufflingBatcher
+from ray.data._internal.batcher import (
+    SHUFFLE_BUFFER_COMPACTION_RATIO,
+    Batcher,
+    ShufflingBatcher,
+)
 
 
 def gen_block(num_rows):
@@ -44,10 +48,10 @@ def test_shuffling_batcher():
 
         if no_nexting_yet:
             # Check that no shuffle buffer has been materialized yet.
-            assert batcher._shuffle_buffer is None
+            assert not batcher._shuffle_buffer
             assert batcher._batch_head == 0
 
-        assert batcher._builder.num_rows() == pending_buffer_size
+        assert batcher._num_pending_rows == pending_buffer_size
         assert batcher._materialized_buffer_size() == materialized_buffer_size
 
     def next_and_check(
@@ -63,14 +67,14 @@ def test_shuffling_batcher():
         else:
             batcher.has_any()
         if new_data_added:
-            # If new data was added, the builder should be non-empty.
-            assert batcher._builder.num_rows() > 0
+            # If new data was added, there should be pending rows.
+            assert batcher._num_pending_rows > 0
         batch = batcher.next_batch()
 
         if should_batch_be_full:
             assert len(batch) == batch_size
 
-        assert batcher._builder.num_rows() == pending_buffer_size
+        assert batcher._num_pending_rows == pending_buffer_size
         assert batcher._materialized_buffer_size() == materialized_buffer_size
 
         if should_have_batch_after:
@@ -168,6 +172,39 @@ def test_shuffling_batcher():
     )
 
 
+@pytest.mark.parametrize(
+    "batch_size,buffer_size",
+    [(1, 1), (5, 20), (7, 13), (10, 1000), (1000, 10)],
+)
+def test_shuffling_batcher_permutation(batch_size, buffer_size):
+    block_size = 37
+    num_blocks = 40
+    batcher = ShufflingBatcher(
+        batch_size=batch_size, shuffle_buffer_min_size=buffer_size, shuffle_seed=0
+    )
+    # The rows of a window can be yielded before the buffer is rebuilt, so a window
+    # spans at most the rows added since the last rebuild and one more batch.
+    max_window_size = (
+        SHUFFLE_BUFFER_COMPACTION_RATIO * max(buffer_size, batch_size)
+        + block_size
+        + batch_size
+    )
+
+    output = []
+    for i in range(num_blocks):
+        batcher.add(pa.table({"id": range(i * block_size, (i + 1) * block_size)}))
+        while batcher.has_batch():
+            output.extend(batcher.next_batch()["id"].to_pylist())
+            assert batcher._window_size <= max_window_size
+    batcher.done_adding()
+    while batcher.has_any():
+        output.extend(batcher.next_batch()["id"].to_pylist())
+
+    num_rows = block_size * num_blocks
+    assert sorted(output) == list(range(num_rows))
+    assert output != list(range(num_rows))
+
+
 def test_batching_pyarrow_table_with_many_chunks():
     """Make sure batching a pyarrow table with many chunks is fast.
 
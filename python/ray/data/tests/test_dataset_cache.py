@@ -0,0 +1,143 @@
+import os
+import sys
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+import ray
+from ray.data._internal.plan_fingerprint import fingerprint_plan
+from ray.data.block import BlockMetadata
+from ray.data.dataset import MaterializedDataset
+from ray.data.datasource import Datasource, ReadTask
+from ray.data.tests.conftest import *  # noqa
+from ray.tests.conftest import *  # noqa
+
+
+def _fingerprint(ds, key=None):
+    return fingerprint_plan(ds._logical_plan.dag, key)
+
+
+class _NoInputFilesDatasource(Datasource):
+    def estimate_inmemory_data_size(self):
+        return None
+
+    def get_read_tasks(self, parallelism):
+        meta = BlockMetadata(
+            num_rows=1, size_bytes=8, schema=None, input_files=None, exec_stats=None
+        )
+        return [ReadTask(lambda: [pa.table({"a": [1]})], meta)]
+
+
+def test_fingerprint_stable(ray_start_regular_shared):
+    def add_one(row):
+        return {"id": row["id"] + 1}
+
+    assert _fingerprint(ray.data.range(10).map(add_one)) == _fingerprint(
+        ray.data.range(10).map(add_one)
+    )
+    # Different arguments.
+    assert _fingerprint(ray.data.range(10).map(add_one)) != _fingerprint(
+        ray.data.range(11).map(add_one)
+    )
+    # Different operators.
+    assert _fingerprint(ray.data.range(10).map(add_one)) != _fingerprint(
+        ray.data.range(10).map_batches(add_one)
+    )
+
+
+def test_fingerprint_udf_code(ray_start_regular_shared):
+    def make_udf(offset):
+        def add(row):
+            return {"id": row["id"] + offset}
+
+        return add
+
+    def add_two(row):
+        return {"id": row["id"] + 2}
+
+    ds = ray.data.range(10)
+    # Same code, different closure.
+    assert _fingerprint(ds.map(make_udf(1))) == _fingerprint(ds.map(make_udf(1)))
+    assert _fingerprint(ds.map(make_udf(1))) != _fingerprint(ds.map(make_udf(2)))
+    # Same result, different code.
+    assert _fingerprint(ds.map(make_udf(2))) != _fingerprint(ds.map(add_two))
+
+
+def test_fingerprint_input_files(ray_start_regular_shared, tmp_path):
+    path = os.path.join(tmp_path, "test.parquet")
+    pq.write_table(pa.table({"a": [1, 2, 3]}), path)
+    before = _fingerprint(ray.data.read_parquet(path))
+    assert before == _fingerprint(ray.data.read_parquet(path))
+
+    pq.write_table(pa.table({"a": [1, 2, 3, 4]}), path)
+    os.utime(path, ns=(0, 0))
+    assert _fingerprint(ray.data.read_parquet(path)) != before
+
+
+def test_fingerprint_unsupported(ray_start_regular_shared):
+    # In-memory data has no stable fingerprint.
+    assert _fingerprint(ray.data.from_items([1, 2, 3])) is None
+    # Nor does the data of datasources without input files, unless a key is given.
+    ds = ray.data.read_datasource(_NoInputFilesDatasource())
+    assert _fingerprint(ds) is None
+    assert _fingerprint(ds, key="v1") is not None
+    assert _fingerprint(ds, key="v1") == _fingerprint(ds, key="v1")
+    assert _fingerprint(ds, key="v1") != _fingerprint(ds, key="v2")
+
+
+def test_cache(ray_start_regular_shared, tmp_path):
+    cache_dir = os.path.join(tmp_path, "cache")
+    counter_dir = os.path.join(tmp_path, "counter")
+    os.makedirs(counter_dir)
+
+    def count_calls(batch):
+        # Record every call in a file, since UDFs run in other processes.
+        open(os.path.join(counter_dir, str(os.getpid()) + str(id(batch))), "w")
+        return batch
+
+    def make_ds():
+        return ray.data.range(100, override_num_blocks=4).map_batches(count_calls)
+
+    ds = make_ds().cache(cache_dir)
+    assert sorted(ds.take_all(), key=lambda row: row["id"]) == [
+        {"id": i} for i in range(100)
+    ]
+    num_calls = len(os.listdir(counter_dir))
+    assert num_calls > 0
+    (fingerprint,) = os.listdir(cache_dir)
+    assert os.path.exists(os.path.join(cache_dir, fingerprint, "_SUCCESS"))
+
+    # A cache hit doesn't re-run the UDF.
+    ds = make_ds().cache(cache_dir)
+    assert ds.count() == 100
+    assert ds.sum("id") == sum(range(100))
+    assert len(os.listdir(counter_dir)) == num_calls
+
+    # A different plan is cached separately.
+    ds = make_ds().filter(lambda row: row["id"] < 10).cache(cache_dir)
+    assert ds.count() == 10
+    assert len(os.listdir(cache_dir)) == 2
+
+
+def test_cache_incomplete(ray_start_regular_shared, tmp_path):
+    ds = ray.data.range(10)
+    partial_path = os.path.join(tmp_path, _fingerprint(ds))
+    os.makedirs(partial_path)
+    # Files of a failed write without the success marker are discarded.
+    with open(os.path.join(partial_path, "partial.arrow"), "w") as f:
+        f.write("garbage")
+
+    assert ds.cache(str(tmp_path)).count() == 10
+    assert not os.path.exists(os.path.join(partial_path, "partial.arrow"))
+
+
+def test_cache_unsupported(ray_start_regular_shared, tmp_path):
+    ds = ray.data.from_items([{"a": 1}, {"a": 2}]).cache(str(tmp_path))
+    assert isinstance(ds, MaterializedDataset)
+    assert ds.take_all() == [{"a": 1}, {"a": 2}]
+    assert os.listdir(tmp_path) == []
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(["-v", __file__]))
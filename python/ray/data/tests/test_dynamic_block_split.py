@@ -10,6 +10,7 @@ import pytest
 import ray
 from ray.data import Dataset
 from ray.data._internal.arrow_block import ArrowBlockAccessor
+from ray.data._internal.output_buffer import BlockOutputBuffer
 from ray.data.block import BlockMetadata
 from ray.data.datasource import Datasource
 from ray.data.datasource.csv_datasource import CSVDatasource
@@ -544,6 +545,51 @@ def test_dynamic_block_split_deterministic(
             assert block_map[block["id"][0]] == block
 
 
+@pytest.mark.parametrize("finalize", [True, False])
+def test_output_buffer_splits_large_block(finalize):
+    # 1000 rows of 8 bytes, with room for 64 rows per block.
+    target_max_block_size = 512
+    buffer = BlockOutputBuffer(target_max_block_size)
+    buffer.add_block(pa.table({"id": np.arange(1000, dtype=np.int64)}))
+    if finalize:
+        buffer.finalize()
+
+    blocks = []
+    while buffer.has_next():
+        blocks.append(buffer.next())
+    num_rows = [block.num_rows for block in blocks]
+    if finalize:
+        # The rows are balanced evenly across the blocks.
+        assert len(blocks) == 16
+        assert max(num_rows) - min(num_rows) <= 1
+    else:
+        # Only full blocks are yielded, and the remainder is kept in the buffer
+        # to merge with the following inputs.
+        assert num_rows == [64] * 15
+        buffer.add_block(pa.table({"id": np.arange(1000, 1010, dtype=np.int64)}))
+        buffer.finalize()
+        assert buffer.has_next()
+        blocks.append(buffer.next())
+        assert blocks[-1].num_rows == 50
+        assert not buffer.has_next()
+
+    ids = pa.concat_tables(blocks)["id"].to_pylist()
+    assert ids == list(range(1000 if finalize else 1010))
+
+
+def test_output_buffer_merges_small_remainder():
+    # 1010 rows of 8 bytes, with room for 125 rows per block. The remainder of 10
+    # rows is merged into the last block instead of being yielded on its own.
+    buffer = BlockOutputBuffer(1000)
+    buffer.add_block(pa.table({"id": np.arange(1010, dtype=np.int64)}))
+    blocks = []
+    while buffer.has_next():
+        blocks.append(buffer.next())
+    assert [block.num_rows for block in blocks] == [125] * 7 + [135]
+    buffer.finalize()
+    assert not buffer.has_next()
+
+
 if __name__ == "__main__":
     import sys
 
@@ -48,6 +48,7 @@ from ray.data._internal.logical.operators.map_operator import (
 from ray.data._internal.logical.operators.n_ary_operator import Union, Zip
 from ray.data._internal.logical.operators.write_operator import Write
 from ray.data._internal.logical.optimizers import PhysicalOptimizer
+from ray.data._internal.logical.rules.hash_aggregate import HashAggregateRule
 from ray.data._internal.logical.util import (
     _op_name_white_list,
     _recorded_operators,
@@ -329,7 +330,7 @@ def test_column_ops_e2e(ray_start_regular_shared):
 
     ds = ds.drop_columns(cols=["new_col"])
     assert ds.take_all() == [{"id": 0}, {"id": 1}], ds
-    _check_usage_record(["ReadRange", "MapBatches"])
+    _check_usage_record(["ReadRange", "MapBatches", "Project"])
 
 
 def test_random_sample_e2e(ray_start_regular_shared):
@@ -1094,6 +1095,47 @@ def test_aggregate_e2e(ray_start_regular_shared, use_push_based_shuffle):
     _check_usage_record(["ReadRange", "Aggregate"])
 
 
+def test_hash_aggregate_rule(ray_start_regular_shared):
+    read_op = get_parquet_read_logical_op()
+    agg_op = Aggregate(read_op, key="col1", aggs=[Count()])
+
+    # The outputs of a plain aggregate are sorted by key.
+    plan = HashAggregateRule().apply(LogicalPlan(agg_op))
+    assert plan.dag._ordered
+
+    # A sort after the aggregate doesn't depend on its output order.
+    sort_op = Sort(agg_op, SortKey("col1"))
+    plan = HashAggregateRule().apply(LogicalPlan(sort_op))
+    assert not plan.dag.input_dependencies[0]._ordered
+    # The original operator isn't modified, since it can be shared by other plans.
+    assert agg_op._ordered
+
+    # A global aggregate doesn't shuffle, so it's left as is.
+    global_agg_op = Aggregate(read_op, key=None, aggs=[Count()])
+    plan = HashAggregateRule().apply(LogicalPlan(RandomShuffle(global_agg_op)))
+    assert plan.dag.input_dependencies[0] is global_agg_op
+
+
+@pytest.mark.parametrize("sort_groupby_outputs", [False, True])
+def test_hash_aggregate_e2e(
+    ray_start_regular_shared,
+    restore_data_context,
+    use_push_based_shuffle,
+    sort_groupby_outputs,
+):
+    DataContext.get_current().sort_groupby_outputs = sort_groupby_outputs
+    ds = ray.data.range(100, override_num_blocks=4)
+    ds = ds.map(lambda row: {"key": row["id"] % 7, "value": row["id"]})
+    agg_ds = ds.groupby("key").sum("value")
+    expected = [{"key": k, "sum(value)": sum(range(k, 100, 7))} for k in range(7)]
+    rows = agg_ds.take_all()
+    if sort_groupby_outputs:
+        assert rows == expected
+    else:
+        assert sorted(rows, key=lambda row: row["key"]) == expected
+    assert agg_ds.sort("key").take_all() == expected
+
+
 def test_aggregate_validate_keys(ray_start_regular_shared):
     ds = ray.data.range(10)
     invalid_col_name = "invalid_column"
@@ -1608,5 +1650,143 @@ def test_zero_copy_fusion_eliminate_build_output_blocks(ray_start_regular_shared
     )
 
 
+def test_filter_expr_e2e(ray_start_regular_shared):
+    import pyarrow.compute as pc
+
+    ds = ray.data.range(10).filter(expr=pc.field("id") >= 7)
+    assert extract_values("id", ds.take_all()) == [7, 8, 9]
+    _check_usage_record(["ReadRange", "Filter"])
+
+    with pytest.raises(ValueError):
+        ray.data.range(10).filter(lambda row: True, expr=pc.field("id") >= 7)
+
+
+def test_read_pushdown(ray_start_regular_shared, tmp_path):
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+
+    table = pa.table({"a": list(range(10)), "b": [str(i) for i in range(10)]})
+    table = table.append_column("c", pa.array([float(i) for i in range(10)]))
+    pq.write_table(table, tmp_path / "data.parquet", row_group_size=2)
+
+    # Projections and filter expressions are absorbed into the read.
+    ds = (
+        ray.data.read_parquet(str(tmp_path))
+        .filter(expr=pc.field("a") >= 6)
+        .select_columns(["c", "a"])
+    )
+    _check_valid_plan_and_result(
+        ds,
+        "Read[ReadParquet]",
+        [{"c": float(i), "a": i} for i in range(6, 10)],
+    )
+    read_op = ds._plan._logical_plan.dag
+    assert read_op.schema().names == ["c", "a"]
+
+    ds = ray.data.read_parquet(str(tmp_path)).drop_columns(["b"])
+    _check_valid_plan_and_result(
+        ds,
+        "Read[ReadParquet]",
+        [{"a": i, "c": float(i)} for i in range(10)],
+    )
+
+    # The path column is appended after reading, so the projection is kept to
+    # restore the requested column order.
+    ds = ray.data.read_parquet(str(tmp_path), include_paths=True).select_columns(
+        ["path", "a"]
+    )
+    rows = ds.take_all()
+    assert str(ds._plan._logical_plan.dag) == "Read[ReadParquet] -> Project[Project]"
+    assert list(rows[0].keys()) == ["path", "a"]
+    assert extract_values("a", rows) == list(range(10))
+
+    # Filters on the path column can't be evaluated while scanning the files, so
+    # they aren't pushed down.
+    path = str(tmp_path / "data.parquet")
+    ds = ray.data.read_parquet(str(tmp_path), include_paths=True).filter(
+        expr=(pc.field("path") == path) & (pc.field("a") < 2)
+    )
+    rows = ds.take_all()
+    assert str(ds._plan._logical_plan.dag).startswith(
+        "Read[ReadParquet] -> Filter[Filter("
+    )
+    assert extract_values("a", rows) == [0, 1]
+
+    # Neither are filters on datasources with a block UDF, which must run first.
+    ds = ray.data.read_parquet(
+        str(tmp_path),
+        _block_udf=lambda block: block.set_column(0, "a", pc.add(block["a"], 100)),
+    ).filter(expr=pc.field("a") >= 108)
+    rows = ds.take_all()
+    assert str(ds._plan._logical_plan.dag).startswith(
+        "Read[ReadParquet] -> Filter[Filter("
+    )
+    assert extract_values("a", rows) == [108, 109]
+
+    # Python UDF filters are opaque, so they aren't pushed down.
+    ds = ray.data.read_parquet(str(tmp_path)).filter(lambda row: row["a"] < 2)
+    _check_valid_plan_and_result(
+        ds,
+        "Read[ReadParquet] -> Filter[Filter(<lambda>)]",
+        [{"a": 0, "b": "0", "c": 0.0}, {"a": 1, "b": "1", "c": 1.0}],
+    )
+
+    # Operators with custom resources aren't pushed down.
+    ds = ray.data.read_parquet(str(tmp_path)).select_columns(["a"], num_cpus=0.5)
+    _check_valid_plan_and_result(
+        ds,
+        "Read[ReadParquet] -> Project[Project]",
+        [{"a": i} for i in range(10)],
+    )
+
+    # Missing columns still raise an error.
+    with pytest.raises(Exception):
+        ray.data.read_parquet(str(tmp_path)).select_columns(["d"]).take_all()
+
+    # Filters on columns that were projected away aren't pushed down, so they
+    # still raise an error.
+    ds = (
+        ray.data.read_parquet(str(tmp_path))
+        .select_columns(["a"])
+        .filter(expr=pc.field("b") == "1")
+    )
+    with pytest.raises(Exception):
+        ds.take_all()
+    assert str(ds._plan._logical_plan.dag).startswith(
+        "Read[ReadParquet] -> Filter[Filter("
+    )
+
+
+def test_read_pushdown_shared_lineage(ray_start_regular_shared, tmp_path):
+    import pyarrow.parquet as pq
+
+    pq.write_table(pa.table({"id": [3, 4], "b": [5, 6]}), tmp_path / "data.parquet")
+    range_ds = ray.data.range(3)
+    range_ds.map_batches(lambda batch: batch)
+    range_op = range_ds._logical_plan.dag
+
+    # Pushing the projection copies the union, but the operators of the other
+    # input aren't copied, so they must not be rewired.
+    ds = ray.data.read_parquet(str(tmp_path)).select_columns(["id"]).union(range_ds)
+    output_dependencies = list(range_op.output_dependencies)
+    assert len(output_dependencies) == 2
+    assert sorted(extract_values("id", ds.take_all())) == [0, 1, 2, 3, 4]
+    assert range_op.output_dependencies == output_dependencies
+
+
+def test_read_pushdown_file_based_datasource(ray_start_regular_shared, tmp_path):
+    import pyarrow.compute as pc
+
+    pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]}).to_csv(
+        tmp_path / "data.csv", index=False
+    )
+    ds = (
+        ray.data.read_csv(str(tmp_path))
+        .filter(expr=pc.field("a") > 1)
+        .select_columns(["b"])
+    )
+    _check_valid_plan_and_result(ds, "Read[ReadCSV]", [{"b": 5}, {"b": 6}])
+
+
 if __name__ == "__main__":
     sys.exit(pytest.main(["-v", __file__]))
@@ -0,0 +1,128 @@
+import pandas as pd
+import pytest
+
+import ray
+from ray.data.context import DataContext
+from ray.data.tests.conftest import *  # noqa
+from ray.tests.conftest import *  # noqa
+
+
+def _expected(left: pd.DataFrame, right: pd.DataFrame, on, how) -> pd.DataFrame:
+    return left.merge(right, on=on, how=how, suffixes=("", "_right"))
+
+
+def _sorted(df: pd.DataFrame) -> pd.DataFrame:
+    df = df[sorted(df.columns)]
+    return df.sort_values(list(df.columns)).reset_index(drop=True)
+
+
+def _assert_join_equal(ds, expected: pd.DataFrame):
+    result = ds.to_pandas()
+    assert sorted(result.columns) == sorted(expected.columns)
+    pd.testing.assert_frame_equal(_sorted(result), _sorted(expected), check_dtype=False)
+
+
+@pytest.mark.parametrize("how", ["inner", "left", "outer"])
+@pytest.mark.parametrize("broadcast", [None, True, False])
+def test_join(ray_start_regular_shared, how, broadcast):
+    if broadcast and how == "outer":
+        pytest.skip("Broadcast joins don't support outer joins.")
+    left = pd.DataFrame({"k": [i % 17 for i in range(100)], "v": list(range(100))})
+    right = pd.DataFrame({"k": list(range(5, 25)), "w": list(range(20))})
+    ds_left = ray.data.from_pandas(left).repartition(7)
+    ds_right = ray.data.from_pandas(right).repartition(3)
+
+    ds = ds_left.join(ds_right, on="k", how=how, broadcast=broadcast)
+    _assert_join_equal(ds, _expected(left, right, "k", how))
+
+
+def test_join_multiple_keys_and_suffix(ray_start_regular_shared):
+    left = pd.DataFrame(
+        {"a": [1, 1, 2, 2], "b": ["x", "y", "x", "y"], "v": [1, 2, 3, 4]}
+    )
+    right = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "x"], "v": [10, 20, 30]})
+    ds = ray.data.from_pandas(left).join(
+        ray.data.from_pandas(right), on=["a", "b"], broadcast=False, num_partitions=4
+    )
+    assert ds.schema().names == ["a", "b", "v", "v_right"]
+    _assert_join_equal(ds, _expected(left, right, ["a", "b"], "inner"))
+
+
+def test_join_mixed_key_types(ray_start_regular_shared):
+    # Integer and float keys with equal values are hashed to the same partition.
+    left = ray.data.range(50, override_num_blocks=5)
+    right = ray.data.from_items([{"id": float(i), "w": i} for i in range(0, 50, 2)])
+    ds = left.join(right, on="id", broadcast=False)
+    assert sorted(ds.to_pandas()["w"].tolist()) == list(range(0, 50, 2))
+
+
+@pytest.mark.parametrize("how", ["inner", "left", "outer"])
+def test_join_hot_keys(ray_start_regular_shared, restore_data_context, how):
+    # Most of the left rows have the hot key 0, which is split over several
+    # partitions for inner and left joins.
+    DataContext.get_current().shuffle_hot_key_threshold = 1.0
+    left = pd.DataFrame(
+        {"k": [0 if i % 4 else i for i in range(400)], "v": list(range(400))}
+    )
+    right = pd.DataFrame({"k": [0, 0, 4, 8, 1000], "w": list(range(5))})
+    ds_left = ray.data.from_pandas(left).repartition(8)
+    ds_right = ray.data.from_pandas(right).repartition(2)
+
+    ds = ds_left.join(ds_right, on="k", how=how, broadcast=False, num_partitions=4)
+    _assert_join_equal(ds, _expected(left, right, "k", how))
+
+
+def test_join_broadcast_threshold(ray_start_regular_shared, restore_data_context):
+    left = ray.data.range(20, override_num_blocks=4)
+    right = ray.data.range(10, override_num_blocks=2)
+
+    ds = left.join(right, on="id")
+    assert ds.count() == 10
+    assert "JoinMap" not in ds.stats()
+
+    DataContext.get_current().broadcast_join_threshold_bytes = 0
+    ds = left.join(right, on="id")
+    assert ds.count() == 10
+    assert "JoinMap" in ds.stats()
+
+
+def test_join_num_outputs(ray_start_regular_shared):
+    left = ray.data.range(20, override_num_blocks=4)
+    right = ray.data.range(10, override_num_blocks=2)
+
+    # A broadcast join outputs a block per block of the side that isn't broadcast.
+    ds = left.join(right, on="id", broadcast=True, num_partitions=2).materialize()
+    assert ds.num_blocks() == 4
+    assert ds.count() == 10
+
+    ds = left.join(right, on="id", broadcast=False, num_partitions=2).materialize()
+    assert ds.num_blocks() == 2
+    assert ds.count() == 10
+
+
+def test_join_empty(ray_start_regular_shared):
+    left = ray.data.range(10)
+    empty = ray.data.range(10).filter(lambda row: False)
+    assert left.join(empty, on="id").count() == 0
+    assert left.join(empty, on="id", how="left").count() == 10
+    assert empty.join(left, on="id", how="outer", broadcast=False).count() == 10
+
+
+def test_join_invalid_args(ray_start_regular_shared):
+    ds = ray.data.range(10)
+    with pytest.raises(ValueError):
+        ds.join(ds, on="id", how="cross")
+    with pytest.raises(ValueError):
+        ds.join(ds, on="id", how="outer", broadcast=True)
+    with pytest.raises(ValueError):
+        ds.join(ds, on=[])
+    with pytest.raises(ValueError):
+        ds.join(ds, on="id", num_partitions=0)
+    with pytest.raises(ValueError, match="isn't a column"):
+        ds.join(ds, on="missing").materialize()
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(pytest.main(["-v", __file__]))
@@ -306,6 +306,26 @@ def test_add_column(ray_start_regular_shared):
         ds = ray.data.range(5).add_column("id", 0)
 
 
+def test_add_column_expr(ray_start_regular_shared):
+    import pyarrow.compute as pc
+
+    ds = ray.data.range(5).add_column("foo", pc.field("id") * 2)
+    assert ds.take(2) == [{"id": 0, "foo": 0}, {"id": 1, "foo": 2}]
+
+    # Overwriting a column keeps the column order.
+    ds = ray.data.from_items([{"a": 1, "b": "x"}, {"a": 2, "b": "y"}])
+    ds = ds.add_column("a", pc.field("a") + 1)
+    assert ds.take_all() == [{"a": 2, "b": "x"}, {"a": 3, "b": "y"}]
+
+    # Pandas blocks are converted to Arrow.
+    ds = ray.data.from_pandas(pd.DataFrame({"a": [1, 2, 3]}))
+    ds = ds.add_column("big", pc.field("a") > 1).filter(expr=pc.field("big"))
+    assert ds.take_all() == [{"a": 2, "big": True}, {"a": 3, "big": True}]
+
+    with pytest.raises((UserCodeException, pa.ArrowInvalid)):
+        ray.data.range(5).add_column("foo", pc.field("missing")).materialize()
+
+
 def test_drop_columns(ray_start_regular_shared, tmp_path):
     df = pd.DataFrame({"col1": [1, 2, 3], "col2": [2, 3, 4], "col3": [3, 4, 5]})
     ds1 = ray.data.from_pandas(df)
@@ -786,6 +806,67 @@ def test_map_batches_batch_zero_copy(
             ds.materialize()
 
 
+@pytest.mark.parametrize("batch_size", [None, 2])
+def test_map_batches_tensor_writable(ray_start_regular_shared, batch_size):
+    # Test that UDFs can write to tensor columns, even when the batches are views of
+    # the blocks in the object store.
+    arr = np.arange(4 * 3 * 2).reshape(4, 3, 2)
+    ds = ray.data.from_numpy(arr).materialize()
+
+    def mutate(batch):
+        batch["data"] += 1
+        return batch
+
+    ds = ds.map_batches(mutate, batch_size=batch_size)
+    np.testing.assert_array_equal(
+        np.stack([row["data"] for row in ds.take_all()]), arr + 1
+    )
+
+
+def test_map_batches_tensor_zero_copy(ray_start_regular_shared):
+    from ray.data._internal.execution.operators.map_transformer import (
+        BlocksToBatchesMapTransformFn,
+    )
+
+    arr = np.arange(4 * 3 * 2).reshape(4, 3, 2)
+    ds = ray.data.from_numpy(arr).materialize()
+    [block_ref] = ds.get_internal_block_refs()
+    block = ray.get(block_ref)
+    tensor = block["data"].chunk(0).to_numpy()
+
+    # zero_copy_batch=True batches are read-only views of the block in the object
+    # store, and other batches are writable copies.
+    for zero_copy_batch in [True, False]:
+        to_batches = BlocksToBatchesMapTransformFn(
+            batch_size=None, batch_format="numpy", zero_copy_batch=zero_copy_batch
+        )
+        [batch] = list(to_batches([block], None))
+        assert np.shares_memory(batch["data"], tensor) == zero_copy_batch
+        assert batch["data"].flags.writeable != zero_copy_batch
+
+    def check_read_only(batch):
+        assert not batch["data"].flags.writeable
+        return {"data": batch["data"] + 1}
+
+    ds = ds.map_batches(check_read_only, batch_size=None, zero_copy_batch=True)
+    np.testing.assert_array_equal(
+        np.stack([row["data"] for row in ds.take_all()]), arr + 1
+    )
+
+
+def test_iter_batches_tensor_writable(ray_start_regular_shared):
+    arr = np.arange(4 * 3 * 2).reshape(4, 3, 2)
+    ds = ray.data.from_numpy(arr).materialize()
+
+    batches = []
+    for batch in ds.iter_batches(batch_size=None, batch_format="numpy"):
+        batch["data"] += 1
+        batches.append(batch["data"])
+    np.testing.assert_array_equal(np.concatenate(batches), arr + 1)
+    # Writing to the batches doesn't modify the dataset.
+    np.testing.assert_array_equal(np.stack([row["data"] for row in ds.take_all()]), arr)
+
+
 BLOCK_BUNDLING_TEST_CASES = [
     (block_size, batch_size)
     for batch_size in range(1, 8)
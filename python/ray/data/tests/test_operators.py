@@ -26,6 +26,7 @@ from ray.data._internal.execution.operators.input_data_buffer import InputDataBu
 from ray.data._internal.execution.operators.limit_operator import LimitOperator
 from ray.data._internal.execution.operators.map_operator import (
     MapOperator,
+    _AdaptiveReadTaskBundler,
     _BlockRefBundler,
 )
 from ray.data._internal.execution.operators.map_transformer import (
@@ -37,7 +38,7 @@ from ray.data._internal.execution.operators.task_pool_map_operator import (
 )
 from ray.data._internal.execution.operators.union_operator import UnionOperator
 from ray.data._internal.execution.util import make_ref_bundles
-from ray.data.block import Block
+from ray.data.block import Block, BlockMetadata
 from ray.data.context import DataContext
 from ray.data.tests.util import run_one_op_task, run_op_tasks_sync
 from ray.tests.conftest import *  # noqa
@@ -751,6 +752,95 @@ def test_block_ref_bundler_uniform(
     assert flat_out == list(range(n))
 
 
+def test_adaptive_read_task_bundler(ray_start_regular_shared):
+    def make_bundle(size_bytes):
+        metadata = BlockMetadata(
+            num_rows=None,
+            size_bytes=size_bytes,
+            schema=None,
+            input_files=[],
+            exec_stats=None,
+        )
+        return RefBundle([(ray.put(None), metadata)], owns_blocks=False)
+
+    bundler = _AdaptiveReadTaskBundler(
+        target_task_duration_s=2,
+        max_task_output_bytes=1000,
+        num_warmup_tasks=2,
+    )
+
+    # Before warmup, read tasks are sent one at a time.
+    for _ in range(2):
+        bundler.add_bundle(make_bundle(10))
+        assert bundler.has_bundle()
+        bundle = bundler.get_next_bundle()
+        assert len(bundle) == 1
+        bundler.on_task_finished(bundle, output_size_bytes=20, task_time_s=1)
+
+    # At 10 bytes/s, tasks of 2s read 20 bytes.
+    bundler.add_bundle(make_bundle(10))
+    assert not bundler.has_bundle()
+    bundler.add_bundle(make_bundle(5))
+    assert not bundler.has_bundle()
+    bundler.add_bundle(make_bundle(10))
+    assert bundler.has_bundle()
+    assert len(bundler.get_next_bundle()) == 2
+    assert not bundler.has_bundle()
+
+    # Tasks are capped by the size of their outputs, which are twice the size of
+    # their inputs.
+    bundler._max_task_output_bytes = 20
+    bundler.on_task_finished(make_bundle(10), output_size_bytes=20, task_time_s=1)
+    assert bundler.has_bundle()
+    assert len(bundler.get_next_bundle()) == 1
+
+    # Leftovers are sent when done.
+    bundler.add_bundle(make_bundle(5))
+    assert not bundler.has_bundle()
+    bundler.done_adding_bundles()
+    assert bundler.has_bundle()
+    assert len(bundler.get_next_bundle()) == 1
+    assert not bundler.has_bundle()
+
+
+def test_map_operator_adaptive_read_bundler_target_shrinks(ray_start_regular_shared):
+    input_op = InputDataBuffer(make_ref_bundles([[i] for i in range(10)]))
+    op = MapOperator.create(
+        _mul2_map_data_prcessor,
+        input_op=input_op,
+        name="TestMapper",
+    )
+    bundler = _AdaptiveReadTaskBundler(
+        target_task_duration_s=1, max_task_output_bytes=1000
+    )
+    op.set_block_ref_bundler(bundler)
+    op.start(ExecutionOptions())
+
+    # Read tasks are buffered while the target bundle size is large.
+    bundler._target_bundle_size_bytes = float("inf")
+    for _ in range(5):
+        op.add_input(input_op.get_next(), 0)
+    assert op.num_active_tasks() == 0
+
+    # Once the target shrinks, all the buffered read tasks are submitted.
+    bundler._target_bundle_size_bytes = 1
+    op.add_input(input_op.get_next(), 0)
+    assert op.num_active_tasks() == 6
+    assert not bundler.has_bundle()
+
+    # Leftovers of several bundles are all submitted when done.
+    bundler._target_bundle_size_bytes = float("inf")
+    while input_op.has_next():
+        op.add_input(input_op.get_next(), 0)
+    bundler._target_bundle_size_bytes = 1
+    op.all_inputs_done()
+    assert op.num_active_tasks() == 10
+    run_op_tasks_sync(op)
+
+    assert sorted(_take_outputs(op)) == [[i * 2] for i in range(10)]
+    assert op.completed()
+
+
 def test_operator_metrics():
     NUM_INPUTS = 100
     NUM_BLOCKS_PER_TASK = 5
@@ -807,6 +897,11 @@ def test_operator_metrics():
         assert metrics.bytes_outputs_taken == bytes_outputs_taken, i
         assert metrics.num_outputs_of_finished_tasks == num_outputs_taken, i
         assert metrics.bytes_outputs_of_finished_tasks == bytes_outputs_taken, i
+        # All output blocks are tiny, so they fall into the smallest bucket.
+        histogram = metrics.block_size_histogram
+        assert sum(histogram.values()) == num_outputs_taken, i
+        assert next(iter(histogram.values())) == num_outputs_taken, i
+        assert metrics.as_dict()["block_size_histogram"] == histogram, i
 
         # Check task metrics
         assert metrics.num_tasks_submitted == num_tasks_submitted, i
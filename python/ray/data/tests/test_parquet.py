@@ -1,3 +1,5 @@
+import json
+import logging
 import os
 import shutil
 import time
@@ -526,6 +528,83 @@ def test_parquet_read_partitioned_with_filter(ray_start_regular_shared, tmp_path
     assert ds.count() == 2
 
 
+def test_parquet_read_prune_row_groups(ray_start_regular_shared, tmp_path):
+    for i in range(4):
+        table = pa.table(
+            {"one": list(range(i * 100, (i + 1) * 100)), "two": [str(i)] * 100}
+        )
+        pq.write_table(table, tmp_path / f"test{i}.parquet", row_group_size=10)
+
+    def get_datasource(ds):
+        return ds._logical_plan.dag._datasource
+
+    # Whole files and row groups that can't match the filter are skipped before
+    # any read task is launched.
+    ds = ray.data.read_parquet(str(tmp_path), filter=pa.dataset.field("one") >= 285)
+    datasource = get_datasource(ds)
+    assert len(datasource._pq_fragments) == 2
+    assert sum(m.num_row_groups for m in datasource._metadata) == 12
+    assert datasource._pq_fragments[0]._row_group_ids == [8, 9]
+    assert sorted(row["one"] for row in ds.take_all()) == list(range(285, 400))
+
+    ds = ray.data.read_parquet(
+        str(tmp_path),
+        filter=(pa.dataset.field("two") == "1") & (pa.dataset.field("one") < 115),
+    )
+    assert get_datasource(ds).input_files() == [str(tmp_path / "test1.parquet")]
+    assert sorted(row["one"] for row in ds.take_all()) == list(range(100, 115))
+
+    # Filters pushed down by the optimizer are pruned as well.
+    ds = ray.data.read_parquet(str(tmp_path)).filter(expr=pa.dataset.field("one") < 5)
+    assert ds.take_all() == [{"one": i, "two": "0"} for i in range(5)]
+
+    ds = ray.data.read_parquet(str(tmp_path), filter=pa.dataset.field("one") < 0)
+    assert len(get_datasource(ds)._pq_fragments) == 0
+    assert ds.count() == 0
+
+
+def test_parquet_file_metadata_cache(ray_start_regular_shared, tmp_path, monkeypatch):
+    from ray.data.datasource import parquet_meta_provider
+    from ray.data.datasource.parquet_meta_provider import _file_metadata_cache
+
+    path = tmp_path / "test.parquet"
+    pq.write_table(pa.table({"one": [1, 2, 3]}), path)
+
+    class CountingMetadataProvider(ParquetMetadataProvider):
+        num_fetches = 0
+
+        def _fetch_file_metadata(self, fragments, **ray_remote_args):
+            CountingMetadataProvider.num_fetches += len(fragments)
+            return super()._fetch_file_metadata(fragments, **ray_remote_args)
+
+    num_listings = 0
+    get_cache_keys = parquet_meta_provider._get_cache_keys
+
+    def counting_get_cache_keys(fragments):
+        nonlocal num_listings
+        num_listings += 1
+        return get_cache_keys(fragments)
+
+    monkeypatch.setattr(
+        parquet_meta_provider, "_get_cache_keys", counting_get_cache_keys
+    )
+
+    _file_metadata_cache.clear()
+    provider = CountingMetadataProvider()
+    assert ray.data.read_parquet(str(path), meta_provider=provider).count() == 3
+    # The cache is empty, so the files aren't listed to look it up.
+    assert num_listings == 0
+    assert ray.data.read_parquet(str(path), meta_provider=provider).count() == 3
+    assert num_listings == 1
+    assert CountingMetadataProvider.num_fetches == 1
+
+    # Overwriting the file invalidates the cached metadata.
+    time.sleep(0.01)
+    pq.write_table(pa.table({"one": [1, 2, 3, 4]}), path)
+    assert ray.data.read_parquet(str(path), meta_provider=provider).count() == 4
+    assert CountingMetadataProvider.num_fetches == 2
+
+
 @pytest.mark.parametrize(
     "fs,data_path",
     [
@@ -1167,6 +1246,308 @@ def test_write_num_rows_per_file(tmp_path, ray_start_regular_shared, num_rows_pe
         assert len(table) == num_rows_per_file
 
 
+@pytest.mark.parametrize("max_rows_per_file", [3, 7, 25])
+def test_write_max_rows_per_file(tmp_path, ray_start_regular_shared, max_rows_per_file):
+    import pyarrow.parquet as pq
+
+    ray.data.range(100, override_num_blocks=4).write_parquet(
+        tmp_path, max_rows_per_file=max_rows_per_file
+    )
+
+    num_rows = [
+        len(pq.read_table(os.path.join(tmp_path, filename)))
+        for filename in os.listdir(tmp_path)
+    ]
+    assert sum(num_rows) == 100
+    assert all(n <= max_rows_per_file for n in num_rows)
+    assert sorted(ray.data.read_parquet(tmp_path).to_pandas()["id"]) == list(range(100))
+
+
+def test_write_target_file_size_bytes(tmp_path, ray_start_regular_shared):
+    target_file_size_bytes = 64 * 1024
+    ds = ray.data.range(100_000, override_num_blocks=1).map(
+        lambda row: {"id": row["id"], "text": str(row["id"]) * 10}
+    )
+    ds.write_parquet(
+        tmp_path, target_file_size_bytes=target_file_size_bytes, compression="none"
+    )
+
+    sizes = [
+        os.path.getsize(os.path.join(tmp_path, filename))
+        for filename in os.listdir(tmp_path)
+    ]
+    assert len(sizes) > 1
+    # Except for the last file, files only exceed the target by about one row
+    # group and the footer.
+    assert sum(size >= target_file_size_bytes // 2 for size in sizes) >= len(sizes) - 1
+    assert all(size < 2 * target_file_size_bytes for size in sizes)
+    assert ray.data.read_parquet(tmp_path).count() == 100_000
+
+
+def test_write_partition_cols(tmp_path, ray_start_regular_shared):
+    import pyarrow.parquet as pq
+
+    ds = ray.data.from_items(
+        [{"id": i, "key": [None, "a", "b"][i % 3], "group": i % 2} for i in range(30)]
+    )
+    ds.write_parquet(tmp_path, partition_cols=["key", "group"])
+
+    assert sorted(os.listdir(tmp_path)) == [
+        "key=__HIVE_DEFAULT_PARTITION__",
+        "key=a",
+        "key=b",
+    ]
+    for key_dir in os.listdir(tmp_path):
+        assert sorted(os.listdir(os.path.join(tmp_path, key_dir))) == [
+            "group=0",
+            "group=1",
+        ]
+
+    files = [
+        os.path.join(root, filename)
+        for root, _, filenames in os.walk(tmp_path)
+        for filename in filenames
+    ]
+    assert all(pq.read_schema(file).names == ["id"] for file in files)
+
+    table = pq.read_table(os.path.join(tmp_path, "key=a", "group=1"))
+    assert sorted(table["id"].to_pylist()) == [i for i in range(30) if i % 6 == 1]
+
+
+def test_write_partition_cols_nullable_int(tmp_path, ray_start_regular_shared):
+    # Only some of the blocks have null keys, so the keys of the others wouldn't be
+    # converted to floats by pandas.
+    ds = ray.data.from_arrow(
+        [
+            pa.table({"id": [0, 1], "key": pa.array([1, None], type=pa.int64())}),
+            pa.table({"id": [2, 3], "key": pa.array([2, 1], type=pa.int64())}),
+        ]
+    )
+    ds.write_parquet(tmp_path, partition_cols=["key"])
+
+    assert sorted(os.listdir(tmp_path)) == [
+        "key=1",
+        "key=2",
+        "key=__HIVE_DEFAULT_PARTITION__",
+    ]
+    assert sorted(pq.read_table(os.path.join(tmp_path, "key=1"))["id"].to_pylist()) == [
+        0,
+        3,
+    ]
+
+
+def test_write_partition_cols_special_characters(tmp_path, ray_start_regular_shared):
+    keys = ["a/b", "c=d", "e f%"]
+    ds = ray.data.from_items([{"id": i, "key": keys[i % 3]} for i in range(6)])
+    ds.write_parquet(tmp_path, partition_cols=["key"])
+
+    # The partition values are URL-encoded into a single directory name.
+    assert sorted(os.listdir(tmp_path)) == ["key=a%2Fb", "key=c%3Dd", "key=e%20f%25"]
+    rows = ray.data.read_parquet(tmp_path).take_all()
+    assert sorted((row["key"], row["id"]) for row in rows) == sorted(
+        (keys[i % 3], i) for i in range(6)
+    )
+
+
+def test_write_partition_cols_max_open_writers(tmp_path, monkeypatch):
+    from ray.data._internal.execution.interfaces import TaskContext
+    from ray.data.datasource import parquet_datasink
+
+    monkeypatch.setattr(parquet_datasink, "MAX_OPEN_PARTITION_WRITERS", 2)
+    datasink = parquet_datasink._ParquetDatasink(str(tmp_path), partition_cols=["key"])
+    datasink.on_write_start()
+    # Interleave the partitions, so that the least recently written partition's
+    # file is closed whenever another partition is written.
+    blocks = [pa.table({"id": [i], "key": [i % 4]}) for i in range(12)]
+    datasink.write(blocks, TaskContext(task_idx=0))
+
+    for key in range(4):
+        partition_path = os.path.join(tmp_path, f"key={key}")
+        assert len(os.listdir(partition_path)) == 3
+        assert sorted(pq.read_table(partition_path)["id"].to_pylist()) == [
+            i for i in range(12) if i % 4 == key
+        ]
+
+
+@pytest.mark.parametrize("failed_write", [3, 4])
+def test_write_rolling_files_retry(
+    tmp_path, monkeypatch, restore_data_context, failed_write
+):
+    from ray.data._internal.execution.interfaces import TaskContext
+    from ray.data.datasource.parquet_datasink import _ParquetDatasink
+
+    DataContext.get_current().write_file_retry_on_errors = ["transient error"]
+    num_writes = 0
+
+    class FlakyParquetWriter(pq.ParquetWriter):
+        def write_table(self, table, *args, **kwargs):
+            nonlocal num_writes
+            num_writes += 1
+            if num_writes == failed_write:
+                raise OSError("transient error")
+            super().write_table(table, *args, **kwargs)
+
+    monkeypatch.setattr(pq, "ParquetWriter", FlakyParquetWriter)
+    datasink = _ParquetDatasink(str(tmp_path), max_rows_per_file=10)
+    datasink.on_write_start()
+    blocks = [pa.table({"id": list(range(i * 4, (i + 1) * 4))}) for i in range(5)]
+
+    if failed_write == 3:
+        # The third write fails midway through the first file. The written rows
+        # aren't kept, so the task fails and the partial file is deleted.
+        with pytest.raises(OSError, match="transient error"):
+            datasink.write(blocks, TaskContext(task_idx=0))
+        assert os.listdir(tmp_path) == []
+        return
+
+    # The fourth write is the first one of the second file, which is rewritten.
+    datasink.write(blocks, TaskContext(task_idx=0))
+    tables = [pq.read_table(os.path.join(tmp_path, f)) for f in os.listdir(tmp_path)]
+    assert sorted(len(table) for table in tables) == [10, 10]
+    assert sorted(i for table in tables for i in table["id"].to_pylist()) == list(
+        range(20)
+    )
+
+
+def test_write_parquet_checkpoint(tmp_path, ray_start_regular_shared):
+    from ray.data._internal.write_checkpoint import WriteCheckpoint
+
+    input_path = os.path.join(tmp_path, "input")
+    os.mkdir(input_path)
+    for i in range(4):
+        pq.write_table(
+            pa.table({"id": list(range(i * 10, (i + 1) * 10))}),
+            os.path.join(input_path, f"{i}.parquet"),
+        )
+    input_files = sorted(
+        os.path.join(input_path, filename) for filename in os.listdir(input_path)
+    )
+
+    # The input files of the written rows are recorded.
+    checkpoint_path = os.path.join(tmp_path, "checkpoint")
+    output_path = os.path.join(tmp_path, "output")
+    ray.data.read_parquet(input_path).map_batches(lambda batch: batch).write_parquet(
+        output_path, checkpoint_path=checkpoint_path
+    )
+    checkpoint = WriteCheckpoint(checkpoint_path)
+    assert sorted(checkpoint.completed_input_files()) == input_files
+    assert sorted(ray.data.read_parquet(output_path).to_pandas()["id"]) == list(
+        range(40)
+    )
+
+    # Resuming from a checkpoint only writes the rows of the remaining files, and
+    # deletes the files of the write tasks that didn't complete.
+    checkpoint_path = os.path.join(tmp_path, "partial_checkpoint")
+    output_path = os.path.join(tmp_path, "partial_output")
+    os.mkdir(output_path)
+    checkpoint = WriteCheckpoint(checkpoint_path)
+    checkpoint.create()
+    checkpoint.record_read_parallelism(4)
+    checkpoint.record("completed", input_files[:2])
+    interrupted_file = os.path.join(output_path, "interrupted.parquet")
+    checkpoint.record_pending("interrupted", input_files[2:3], [interrupted_file])
+    pq.write_table(pa.table({"id": list(range(20, 25))}), interrupted_file)
+    ray.data.read_parquet(input_path).write_parquet(
+        output_path, checkpoint_path=checkpoint_path
+    )
+    assert not os.path.exists(interrupted_file)
+    assert sorted(ray.data.read_parquet(output_path).to_pandas()["id"]) == list(
+        range(20, 40)
+    )
+    assert sorted(checkpoint.completed_input_files()) == input_files
+    assert not [f for f in os.listdir(checkpoint_path) if f.endswith(".pending.json")]
+
+
+def test_write_parquet_checkpoint_different_parallelism(
+    tmp_path, ray_start_regular_shared
+):
+    from ray.data._internal.write_checkpoint import WriteCheckpoint
+
+    input_path = os.path.join(tmp_path, "input")
+    os.mkdir(input_path)
+    for i in range(8):
+        pq.write_table(
+            pa.table({"id": list(range(i * 10, (i + 1) * 10))}),
+            os.path.join(input_path, f"{i}.parquet"),
+        )
+    checkpoint_path = os.path.join(tmp_path, "checkpoint")
+    output_path = os.path.join(tmp_path, "output")
+    ray.data.read_parquet(input_path, override_num_blocks=4).write_parquet(
+        output_path, checkpoint_path=checkpoint_path
+    )
+    assert WriteCheckpoint(checkpoint_path).read_parallelism() == 4
+
+    # Simulate a write interrupted after half of its tasks completed, by deleting
+    # the records and the output files of the other tasks.
+    records = sorted(
+        filename
+        for filename in os.listdir(checkpoint_path)
+        if not filename.startswith("_")
+    )
+    assert len(records) == 4
+    for record in records[:2]:
+        with open(os.path.join(checkpoint_path, record)) as f:
+            for output_file in json.load(f)["output_files"]:
+                os.remove(output_file)
+        os.remove(os.path.join(checkpoint_path, record))
+
+    # The resumed write reads the files in the same 4 read tasks, so that each row
+    # is written once.
+    ray.data.read_parquet(input_path, override_num_blocks=8).write_parquet(
+        output_path, checkpoint_path=checkpoint_path
+    )
+    assert sorted(ray.data.read_parquet(output_path).to_pandas()["id"]) == list(
+        range(80)
+    )
+
+
+def test_write_parquet_checkpoint_partly_recorded_read_task(
+    tmp_path, ray_start_regular_shared
+):
+    from ray.data._internal.write_checkpoint import WriteCheckpoint
+
+    input_path = os.path.join(tmp_path, "input")
+    os.mkdir(input_path)
+    for i in range(2):
+        pq.write_table(pa.table({"id": [i]}), os.path.join(input_path, f"{i}.parquet"))
+    checkpoint_path = os.path.join(tmp_path, "checkpoint")
+    checkpoint = WriteCheckpoint(checkpoint_path)
+    checkpoint.create()
+    checkpoint.record_read_parallelism(1)
+    checkpoint.record("completed", [os.path.join(input_path, "0.parquet")])
+
+    # Both files are read by the same read task, but only one of them is recorded.
+    with pytest.raises(ValueError, match="records only some of the input files"):
+        ray.data.read_parquet(input_path).write_parquet(
+            os.path.join(tmp_path, "output"), checkpoint_path=checkpoint_path
+        )
+
+
+def test_write_parquet_checkpoint_unfused(
+    tmp_path, ray_start_regular_shared, propagate_logs, caplog
+):
+    input_path = os.path.join(tmp_path, "input")
+    os.mkdir(input_path)
+    pq.write_table(
+        pa.table({"id": list(range(10))}), os.path.join(input_path, "0.parquet")
+    )
+
+    # The write doesn't run in the same tasks as the read, so no progress is
+    # recorded.
+    class Identity:
+        def __call__(self, batch):
+            return batch
+
+    with caplog.at_level(logging.WARNING, logger="ray.data"):
+        ray.data.read_parquet(input_path).map_batches(
+            Identity, concurrency=1
+        ).write_parquet(
+            os.path.join(tmp_path, "output"),
+            checkpoint_path=os.path.join(tmp_path, "checkpoint"),
+        )
+    assert "won't record any progress" in caplog.text
+
+
 if __name__ == "__main__":
     import sys
 
@@ -6,7 +6,8 @@ from ray.tests.conftest import *  # noqa
 
 
 @pytest.mark.parametrize("pandas", [False, True])
-def test_basic(ray_start_regular_shared, pandas):
+@pytest.mark.parametrize("index", ["sort", "hash"])
+def test_basic(ray_start_regular_shared, pandas, index):
     ds = ray.data.range(100, override_num_blocks=10)
     ds = ds.add_column("embedding", lambda b: b["id"] ** 2)
     if not pandas:
@@ -14,7 +15,7 @@ def test_basic(ray_start_regular_shared, pandas):
             lambda df: pyarrow.Table.from_pandas(df), batch_format="pandas"
         )
 
-    rad = ds.to_random_access_dataset("id", num_workers=1)
+    rad = ds.to_random_access_dataset("id", num_workers=1, index=index)
 
     # Test get.
     assert ray.get(rad.get_async(-1)) is None
@@ -30,6 +31,53 @@ def test_basic(ray_start_regular_shared, pandas):
     assert results == [None] + [expected(i) for i in range(10)] + [None]
 
 
+@pytest.mark.parametrize("index", ["sort", "hash"])
+def test_multiget_table(ray_start_regular_shared, index):
+    ds = ray.data.range(100, override_num_blocks=10)
+    ds = ds.add_column("embedding", lambda b: b["id"] ** 2)
+    rad = ds.to_random_access_dataset("id", num_workers=3, index=index)
+
+    keys = [5, -1, 99, 42, 5, 100]
+    table = rad.multiget_table(keys)
+    assert table.column_names == ["id", "embedding"]
+    assert table.to_pylist() == [
+        {"id": 5, "embedding": 25},
+        {"id": None, "embedding": None},
+        {"id": 99, "embedding": 99**2},
+        {"id": 42, "embedding": 42**2},
+        {"id": 5, "embedding": 25},
+        {"id": None, "embedding": None},
+    ]
+    assert rad.multiget_table([-1]).to_pylist() == [{"id": None, "embedding": None}]
+    assert rad.multiget_table([]).num_rows == 0
+
+
+def test_hash_index_string_keys(ray_start_regular_shared):
+    ds = ray.data.from_items([{"name": f"user_{i}", "value": i} for i in range(50)])
+    rad = ds.to_random_access_dataset("name", num_workers=2, index="hash")
+    assert ray.get(rad.get_async("user_7")) == {"name": "user_7", "value": 7}
+    assert ray.get(rad.get_async("missing")) is None
+    assert rad.multiget(["user_1", "user_49", "missing"]) == [
+        {"name": "user_1", "value": 1},
+        {"name": "user_49", "value": 49},
+        None,
+    ]
+
+
+@pytest.mark.parametrize("index", ["sort", "hash"])
+def test_block_cache(ray_start_regular_shared, index):
+    ds = ray.data.range(100, override_num_blocks=10)
+    # A tiny cache keeps only the most recently used block.
+    rad = ds.to_random_access_dataset(
+        "id", num_workers=1, index=index, block_cache_bytes=1
+    )
+    assert "Block cache hits: 0, misses: 0" in rad.stats()
+    for i in range(100):
+        assert ray.get(rad.get_async(i)) == {"id": i}
+    assert rad.multiget(list(range(100))) == [{"id": i} for i in range(100)]
+    assert "Block cache hits: 0, misses: 0" not in rad.stats()
+
+
 def test_empty_blocks(ray_start_regular_shared):
     ds = ray.data.range(10).repartition(20)
     assert ds._plan.initial_num_blocks() == 20
@@ -42,6 +90,8 @@ def test_errors(ray_start_regular_shared):
     ds = ray.data.range(10)
     with pytest.raises(ValueError):
         ds.to_random_access_dataset("invalid")
+    with pytest.raises(ValueError):
+        ds.to_random_access_dataset("id", index="invalid")
 
 
 def test_stats(ray_start_regular_shared):
@@ -16,6 +16,7 @@ from ray.data._internal.execution.operators.union_operator import UnionOperator
 from ray.data._internal.execution.resource_manager import (
     ReservationOpResourceAllocator,
     ResourceManager,
+    ThroughputOpResourceAllocator,
 )
 from ray.data._internal.execution.streaming_executor_state import (
     build_streaming_topology,
@@ -553,6 +554,92 @@ class TestReservationOpResourceAllocator:
         assert not resource_manager.op_resource_allocator_enabled()
 
 
+class TestThroughputOpResourceAllocator:
+    """Tests for ThroughputOpResourceAllocator."""
+
+    def test_basic(self, restore_data_context):
+        ctx = DataContext.get_current()
+        ctx.op_resource_reservation_enabled = True
+        ctx.op_resource_reservation_ratio = 0.5
+        ctx.op_resource_allocator = "throughput"
+
+        o1 = InputDataBuffer([])
+        o2 = mock_map_op(o1, incremental_resource_usage=ExecutionResources(1, 0, 15))
+        o3 = mock_map_op(o2, incremental_resource_usage=ExecutionResources(1, 0, 10))
+        topo, _ = build_streaming_topology(o3, ExecutionOptions())
+
+        resource_manager = ResourceManager(topo, ExecutionOptions())
+        resource_manager.get_op_usage = MagicMock(
+            return_value=ExecutionResources.zero()
+        )
+        resource_manager._mem_op_internal = {op: 0 for op in [o1, o2, o3]}
+        resource_manager._mem_op_outputs = {op: 0 for op in [o1, o2, o3]}
+        resource_manager.get_global_limits = MagicMock(
+            return_value=ExecutionResources(cpu=16, gpu=0, object_store_memory=1000)
+        )
+
+        allocator = resource_manager._op_resource_allocator
+        assert isinstance(allocator, ThroughputOpResourceAllocator)
+
+        # Without measurements, the shared resources are divided equally.
+        allocator.update_usages()
+        assert allocator._op_budgets[o2] == ExecutionResources(8, float("inf"), 375)
+        assert allocator._op_budgets[o3] == ExecutionResources(8, float("inf"), 375)
+
+        # o2 outputs as many bytes as it receives, in 1s of task time.
+        o2.metrics.bytes_task_inputs_processed = 100
+        o2.metrics.bytes_outputs_of_finished_tasks = 100
+        o2.metrics.bytes_task_outputs_generated = 100
+        o2.metrics.block_generation_time = 1
+        # o3 outputs 3x the bytes it receives, in 9s of task time.
+        o3.metrics.bytes_task_inputs_processed = 100
+        o3.metrics.bytes_outputs_of_finished_tasks = 300
+        o3.metrics.bytes_task_outputs_generated = 300
+        o3.metrics.block_generation_time = 9
+
+        allocator.update_usages()
+        # The shared 8 CPUs are divided 1:9 by task time, and the shared 500 bytes
+        # of memory are divided 1:3 by output bytes.
+        assert allocator._op_budgets[o2].cpu == pytest.approx(4 + 0.8)
+        assert allocator._op_budgets[o2].object_store_memory == pytest.approx(250)
+        assert allocator._op_budgets[o3].cpu == pytest.approx(4 + 7.2)
+        assert allocator._op_budgets[o3].object_store_memory == pytest.approx(500)
+
+    def test_invalid_allocator(self, restore_data_context):
+        ctx = DataContext.get_current()
+        ctx.op_resource_reservation_enabled = True
+        ctx.op_resource_allocator = "fastest"
+
+        o1 = InputDataBuffer([])
+        o2 = mock_map_op(o1)
+        topo, _ = build_streaming_topology(o2, ExecutionOptions())
+        with pytest.raises(ValueError, match="op_resource_allocator"):
+            ResourceManager(topo, ExecutionOptions())
+
+    def test_min_weight(self, restore_data_context):
+        ctx = DataContext.get_current()
+        ctx.op_resource_reservation_enabled = True
+        ctx.op_resource_allocator = "throughput"
+
+        o1 = InputDataBuffer([])
+        o2 = mock_map_op(o1, incremental_resource_usage=ExecutionResources(1, 0, 0))
+        o3 = mock_map_op(o2, incremental_resource_usage=ExecutionResources(0, 1, 0))
+        topo, _ = build_streaming_topology(o3, ExecutionOptions())
+        resource_manager = ResourceManager(topo, ExecutionOptions())
+        allocator = resource_manager._op_resource_allocator
+
+        # Operators that don't use a resource get no weight for it, and
+        # operators that are much cheaper than the others are raised to the
+        # minimum weight.
+        weights = allocator._normalize_weights({o2: 0.0, o3: 1.0})
+        assert weights == {o2: 0.0, o3: 1.0}
+        weights = allocator._normalize_weights({o2: 0.001, o3: 1.999})
+        assert weights[o2] == pytest.approx(0.1)
+        # Operators without measurements get the average weight.
+        weights = allocator._normalize_weights({o2: None, o3: 2.0})
+        assert weights == {o2: 2.0, o3: 2.0}
+
+
 if __name__ == "__main__":
     import sys
 
@@ -1,6 +1,7 @@
 import logging
 import random
 from collections import defaultdict
+from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
@@ -9,6 +10,10 @@ import pytest
 
 import ray
 from ray.data import Dataset
+from ray.data._internal.arrow_ops import transform_pyarrow
+from ray.data._internal.planner.exchange.external_sort_task_spec import (
+    external_merge_sorted_blocks,
+)
 from ray.data._internal.planner.exchange.push_based_shuffle_task_scheduler import (
     PushBasedShuffleTaskScheduler,
 )
@@ -302,6 +307,106 @@ def test_sort_with_one_block(shutdown_only, use_push_based_shuffle):
     ).sum("token_counts")
 
 
+@pytest.mark.parametrize("descending", [False, True])
+def test_external_merge_sorted_blocks(tmp_path, descending, monkeypatch):
+    from ray.data._internal.planner.exchange import external_sort_task_spec
+
+    # Read the sorted runs in batches of a few rows, so that the merge takes many
+    # windows.
+    monkeypatch.setattr(
+        external_sort_task_spec, "EXTERNAL_SORT_MERGE_BUFFER_SIZE", 4 * 8 * 3 * 2
+    )
+    sort_key = SortKey(["a", "b"], descending=descending)
+    rows = [(random.randint(0, 10), random.randint(0, 10)) for _ in range(300)]
+    blocks = []
+    for i in range(3):
+        block = pa.table(
+            {
+                "a": [a for a, _ in rows[i * 100 : (i + 1) * 100]],
+                "b": [b for _, b in rows[i * 100 : (i + 1) * 100]],
+            }
+        )
+        blocks.append(
+            BlockAccessor.for_block(block).sort_and_partition([], sort_key)[0]
+        )
+
+    block, meta = external_merge_sorted_blocks(blocks, sort_key, str(tmp_path))
+    assert meta.num_rows == 300
+    merged = list(zip(block["a"].to_pylist(), block["b"].to_pylist()))
+    assert merged == sorted(rows, reverse=descending)
+    # The inputs are released once they're written to disk, and the sorted runs
+    # are removed from disk.
+    assert blocks == [None, None, None]
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize("descending", [False, True])
+def test_external_merge_sorted_blocks_with_nulls(tmp_path, descending, monkeypatch):
+    from ray.data._internal.planner.exchange import external_sort_task_spec
+
+    monkeypatch.setattr(
+        external_sort_task_spec, "EXTERNAL_SORT_MERGE_BUFFER_SIZE", 4 * 8 * 3
+    )
+    sort_key = SortKey("a", descending=descending)
+    values = [None, 1.0, float("nan"), 2.0, None, 3.0, 1.0, None, 0.0] * 10
+    random.shuffle(values)
+    blocks = [
+        transform_pyarrow.sort(pa.table({"a": values[i::3]}), sort_key)
+        for i in range(3)
+    ]
+    expected = transform_pyarrow.sort(pa.concat_tables(blocks), sort_key)
+
+    block, _ = external_merge_sorted_blocks(blocks, sort_key, str(tmp_path))
+    # Nulls and NaNs are placed at the end, as in the sorted runs.
+    assert str(block["a"].to_pylist()) == str(expected["a"].to_pylist())
+    assert block["a"].null_count == values.count(None)
+
+
+def test_external_sort(
+    ray_start_regular, restore_data_context, use_push_based_shuffle, tmp_path
+):
+    ctx = DataContext.get_current()
+    ctx.use_external_sort = True
+    ctx.external_sort_spill_dir = str(tmp_path)
+    ctx.target_shuffle_max_block_size = 1000
+
+    num_items = 1000
+    xs = list(range(num_items))
+    random.shuffle(xs)
+    ds = ray.data.from_items([{"id": x} for x in xs], override_num_blocks=2)
+    sorted_ds = ds.sort("id").materialize()
+    assert extract_values("id", sorted_ds.take_all()) == list(range(num_items))
+    # There are enough output partitions for each of them to fit in a shuffle
+    # block.
+    assert sorted_ds.num_blocks() > 2
+    assert extract_values("id", ds.sort("id", descending=True).take_all()) == list(
+        reversed(range(num_items))
+    )
+    # The sorted runs are removed from the spill directory.
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_sample_boundaries_cache(ray_start_regular, restore_data_context):
+    ds = ray.data.range(100, override_num_blocks=4).materialize()
+    blocks = ds.get_internal_block_refs()
+    sort_key = SortKey("id")
+
+    boundaries = SortTaskSpec.sample_boundaries(blocks, sort_key, 4)
+    with patch.object(
+        SortTaskSpec, "_sample_boundaries", side_effect=AssertionError
+    ) as sample:
+        # The boundaries of the same blocks and key are cached.
+        boundaries.reverse()
+        assert SortTaskSpec.sample_boundaries(blocks, sort_key, 4) == list(
+            reversed(boundaries)
+        )
+        assert not sample.called
+
+        # A different number of reducers requires sampling again.
+        with pytest.raises(AssertionError):
+            SortTaskSpec.sample_boundaries(blocks, sort_key, 3)
+
+
 def test_push_based_shuffle_schedule():
     def _test(num_input_blocks, merge_factor, num_cpus_per_node_map):
         num_cpus = sum(v for v in num_cpus_per_node_map.values())
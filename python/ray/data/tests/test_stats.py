@@ -49,6 +49,7 @@ def gen_expected_metrics(
             "'num_task_outputs_generated': N",
             "'bytes_task_outputs_generated': N",
             "'rows_task_outputs_generated': N",
+            "'block_size_histogram': H",
             "'num_outputs_taken': N",
             "'bytes_outputs_taken': N",
             "'num_outputs_of_finished_tasks': N",
@@ -179,6 +180,12 @@ EXECUTION_STRING = "N tasks executed, N blocks produced in T"
 def canonicalize(stats: str, filter_global_stats: bool = True) -> str:
     # Dataset UUID expression.
     canonicalized_stats = re.sub("([a-f\d]{32})", "U", stats)
+    # The counts of the block size histogram depend on the sizes of the blocks.
+    canonicalized_stats = re.sub(
+        r"'block_size_histogram': \{[^}]*\}",
+        "'block_size_histogram': H",
+        canonicalized_stats,
+    )
     # Time expressions.
     canonicalized_stats = re.sub("[0-9\.]+(ms|us|s)", "T", canonicalized_stats)
     # Memory expressions.
@@ -1349,6 +1356,43 @@ def test_runtime_metrics(ray_start_regular_shared):
         assert isclose(percent, time_s / total_time * 100, rel_tol=0.01)
 
 
+def test_task_profiling(ray_start_regular_shared, restore_data_context):
+    DataContext.get_current().enable_task_profiling = True
+    DataContext.get_current().task_profiling_interval_s = 0.001
+
+    def busy_udf(batch):
+        start = time.perf_counter()
+        while time.perf_counter() - start < 0.05:
+            pass
+        return batch
+
+    ds = ray.data.range(100, override_num_blocks=4).map_batches(busy_udf)
+    ds = ds.materialize()
+    stats = ds.stats()
+    assert "* Sampled task time:" in stats
+    assert "* UDF:" in stats
+
+    summary = ds._get_stats_summary()
+    operator_stats = summary.operators_stats[-1]
+    category_time_s = operator_stats.profile.category_time_s()
+    assert category_time_s["UDF"] > max(
+        time_s for category, time_s in category_time_s.items() if category != "UDF"
+    )
+
+    speedscope = summary.to_speedscope()
+    frames = speedscope["shared"]["frames"]
+    [profile] = [
+        p for p in speedscope["profiles"] if p["name"] == operator_stats.operator_name
+    ]
+    assert profile["type"] == "sampled"
+    assert len(profile["samples"]) == len(profile["weights"])
+    assert any(
+        frames[sample[0]]["name"] == "[UDF]"
+        and frames[sample[-1]]["name"] == "busy_udf"
+        for sample in profile["samples"]
+    )
+
+
 # NOTE: All tests above share a Ray cluster, while the tests below do not. These
 # tests should only be carefully reordered to retain this invariant!
 
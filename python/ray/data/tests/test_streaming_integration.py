@@ -225,6 +225,25 @@ def test_streaming_split_e2e(ray_start_10_cpus_shared):
                 assert lengths == [300, 300, 400], lengths
 
 
+@pytest.mark.parametrize("prefetch_bytes", [1, 1024 * 1024])
+def test_streaming_split_prefetch(ray_start_10_cpus_shared, prefetch_bytes):
+    ds = ray.data.range(1000, override_num_blocks=20)
+    i1, i2 = ds.streaming_split(2, equal=True, prefetch_bytes=prefetch_bytes)
+
+    @ray.remote
+    def consume(it, times):
+        ids = []
+        for _ in range(times):
+            for batch in it.iter_batches():
+                ids.extend(batch["id"])
+        return ids
+
+    ids1, ids2 = ray.get([consume.remote(i1, 2), consume.remote(i2, 2)])
+    assert len(ids1) == len(ids2) == 1000
+    assert sorted(ids1[:500] + ids2[:500]) == list(range(1000))
+    assert sorted(ids1[500:] + ids2[500:]) == list(range(1000))
+
+
 def test_streaming_split_barrier(ray_start_10_cpus_shared):
     ds = ray.data.range(20, override_num_blocks=20)
     (
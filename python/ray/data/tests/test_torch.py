@@ -1,3 +1,6 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -303,6 +306,77 @@ def test_iter_torch_batches_tensor_ds(ray_start_10_cpus_shared):
         np.testing.assert_array_equal(arr, combined_iterations)
 
 
+@pytest.mark.parametrize("prefetch_batches", [0, 2])
+def test_iter_torch_batches_reuse_buffers(ray_start_10_cpus_shared, prefetch_batches):
+    import torch
+
+    ds = ray.data.range(100, override_num_blocks=7).map(
+        lambda row: {"id": row["id"], "data": np.full((2, 2), row["id"])}
+    )
+
+    for _ in range(2):
+        ids = []
+        data_ptrs = set()
+        for batch in ds.iter_torch_batches(
+            batch_size=8,
+            dtypes={"id": torch.float32, "data": torch.int64},
+            device="cpu",
+            prefetch_batches=prefetch_batches,
+            reuse_buffers=True,
+        ):
+            assert batch["id"].dtype == torch.float32
+            assert batch["data"].shape[1:] == (2, 2)
+            np.testing.assert_array_equal(
+                batch["data"][:, 0, 0].numpy(), batch["id"].numpy()
+            )
+            ids.extend(batch["id"].tolist())
+            data_ptrs.add(batch["data"].data_ptr())
+        assert ids == list(range(100))
+        # The batches are copied into a fixed ring of buffers.
+        assert len(data_ptrs) <= 2 * prefetch_batches + 4
+
+    with pytest.raises(ValueError):
+        ds.iter_torch_batches(collate_fn=lambda batch: batch, reuse_buffers=True)
+
+
+def test_torch_tensor_batch_buffers_out_of_order():
+    import torch
+
+    from ray.air._internal.torch_utils import TorchTensorBatchBuffers
+
+    num_batches = 20
+    buffers = TorchTensorBatchBuffers(num_slots=4, dtypes=torch.int64)
+    first_batch_ready = threading.Event()
+
+    def convert(i):
+        if i == 0:
+            # A slow thread holds up the first batch, so all the batches after it
+            # are in use while waiting to be reordered.
+            first_batch_ready.wait()
+        return buffers.convert({"data": np.full((8, 2), i)})
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(convert, i) for i in range(num_batches)]
+        for future in futures[1:]:
+            future.result()
+        first_batch_ready.set()
+        batches = [future.result() for future in futures]
+
+    # The batches that didn't fit in the ring are copied into new tensors instead
+    # of overwriting the batches in use.
+    for i, batch in enumerate(batches):
+        np.testing.assert_array_equal(batch["data"].numpy(), np.full((8, 2), i))
+        buffers.release(batch)
+
+    # Released slots are reused.
+    slot_ptrs = {
+        tensor.data_ptr() for slot in buffers._slots for tensor in slot.values()
+    }
+    batch = buffers.convert({"data": np.full((8, 2), num_batches)})
+    assert batch["data"].data_ptr() in slot_ptrs
+    np.testing.assert_array_equal(batch["data"].numpy(), np.full((8, 2), num_batches))
+
+
 # This test catches an error in stream_split_iterator dealing with empty blocks,
 # which is difficult to reproduce outside of TorchTrainer.
 def test_torch_trainer_crash(ray_start_10_cpus_shared):
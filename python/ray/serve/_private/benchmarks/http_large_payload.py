@@ -0,0 +1,146 @@
+"""Benchmarks the throughput and proxy memory usage of large HTTP request bodies.
+
+The proxy streams request bodies to the replica, buffering at most
+`RAY_SERVE_PROXY_MAX_BUFFERED_REQUEST_BYTES` per request. The replica fetches the
+next chunk of at most `RAY_SERVE_PROXY_REQUEST_CHUNK_BYTES` only once the app has
+received the previous one, so with `--processing-time-s`, the replica reads the body
+slower than it's uploaded, and the proxy's buffer fills up to its limit. To compare
+buffering limits, set these variables in the environment of the benchmark, e.g.
+`RAY_SERVE_PROXY_MAX_BUFFERED_REQUEST_BYTES=0` to disable the limit.
+"""
+
+import asyncio
+import logging
+import time
+from typing import List
+
+import aiohttp
+import click
+import numpy as np
+import psutil
+from starlette.requests import Request
+
+import ray
+from ray import serve
+from ray.util.state import list_actors
+
+
+@serve.deployment(max_ongoing_requests=100)
+class Upload:
+    def __init__(self, processing_time_s: float):
+        logging.getLogger("ray.serve").setLevel(logging.WARNING)
+        self._processing_time_s = processing_time_s
+
+    async def __call__(self, request: Request) -> int:
+        num_bytes = 0
+        async for chunk in request.stream():
+            num_bytes += len(chunk)
+            # Simulate a replica that consumes the body slower than it's uploaded,
+            # e.g. because it decodes audio while reading it. The next chunk isn't
+            # fetched from the proxy until this one is processed.
+            await asyncio.sleep(self._processing_time_s * len(chunk) / 2**20)
+
+        return num_bytes
+
+
+async def sample_peak_rss_bytes(pid: int, stop: asyncio.Event) -> int:
+    process = psutil.Process(pid)
+    peak_rss_bytes = 0
+    while not stop.is_set():
+        peak_rss_bytes = max(peak_rss_bytes, process.memory_info().rss)
+        await asyncio.sleep(0.01)
+
+    return peak_rss_bytes
+
+
+async def upload(
+    payload: bytes, num_requests: int, concurrency: int, url: str
+) -> List[float]:
+    latencies = []
+    semaphore = asyncio.Semaphore(concurrency)
+    async with aiohttp.ClientSession(raise_for_status=True) as session:
+
+        async def do_request():
+            async with semaphore:
+                start = time.perf_counter()
+                async with session.post(url, data=payload) as response:
+                    assert int(await response.text()) == len(payload)
+                latencies.append(time.perf_counter() - start)
+
+        await asyncio.gather(*[do_request() for _ in range(num_requests)])
+
+    return latencies
+
+
+async def run_benchmark(
+    payload_mb: int, num_requests: int, concurrency: int, url: str
+) -> None:
+    proxies = list_actors(filters=[("class_name", "=", "ProxyActor")])
+    assert len(proxies) == 1, "Run the benchmark on a single-node cluster."
+    proxy_pid = proxies[0].pid
+    baseline_rss_bytes = psutil.Process(proxy_pid).memory_info().rss
+
+    payload = b"x" * (payload_mb * 2**20)
+    stop = asyncio.Event()
+    sample_task = asyncio.create_task(sample_peak_rss_bytes(proxy_pid, stop))
+
+    start = time.perf_counter()
+    latencies = await upload(payload, num_requests, concurrency, url)
+    duration_s = time.perf_counter() - start
+
+    stop.set()
+    peak_rss_bytes = await sample_task
+
+    print(
+        f"Uploaded {num_requests} requests of {payload_mb} MB "
+        f"(concurrency={concurrency}) in {duration_s:.2f}s:"
+    )
+    print(f"\tThroughput: {num_requests / duration_s:.2f} requests/s")
+    print(f"\tThroughput: {num_requests * payload_mb / duration_s:.2f} MB/s")
+    print(f"\tLatency p50: {1000 * np.percentile(latencies, 50):.1f} ms")
+    print(f"\tLatency p99: {1000 * np.percentile(latencies, 99):.1f} ms")
+    print(
+        "\tProxy peak memory increase: "
+        f"{(peak_rss_bytes - baseline_rss_bytes) / 2**20:.1f} MB"
+    )
+
+
+@click.command(help="Benchmark uploading large HTTP request bodies through the proxy.")
+@click.option("--payload-mb", type=int, default=10)
+@click.option("--num-requests", type=int, default=100)
+@click.option("--concurrency", type=int, default=10)
+@click.option("--num-replicas", type=int, default=1)
+@click.option(
+    "--processing-time-s",
+    type=float,
+    default=0.0,
+    help=(
+        "Time the replica takes to process each MB of the request body, to fill up "
+        "the proxy's buffer."
+    ),
+)
+def main(
+    payload_mb: int,
+    num_requests: int,
+    concurrency: int,
+    num_replicas: int,
+    processing_time_s: float,
+):
+    serve.run(
+        Upload.options(num_replicas=num_replicas).bind(processing_time_s),
+        route_prefix="/upload",
+    )
+    asyncio.new_event_loop().run_until_complete(
+        run_benchmark(
+            payload_mb,
+            num_requests,
+            concurrency,
+            url="http://localhost:8000/upload",
+        )
+    )
+    serve.shutdown()
+    ray.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -222,6 +222,11 @@ class DeploymentConfig(BaseModel):
             if self.needs_pickle():
                 data["user_config"] = cloudpickle.dumps(data["user_config"])
         if data.get("autoscaling_config"):
+            # The policy is a private attribute, so it's not in `self.dict()`.
+            data["autoscaling_config"].update(
+                _serialized_policy_def=self.autoscaling_config._serialized_policy_def,
+                _policy=self.autoscaling_config._policy,
+            )
             data["autoscaling_config"] = AutoscalingConfigProto(
                 **data["autoscaling_config"]
             )
@@ -345,11 +350,12 @@ def handle_num_replicas_auto(
         # If autoscaling config was specified, values specified in
         # autoscaling config overrides the default configuration
         default_config = AutoscalingConfig.default().dict(exclude_unset=True)
-        autoscaling_config = (
-            autoscaling_config
-            if isinstance(autoscaling_config, dict)
-            else autoscaling_config.dict(exclude_unset=True)
-        )
+        if not isinstance(autoscaling_config, dict):
+            autoscaling_config = {
+                **autoscaling_config.dict(exclude_unset=True),
+                "_policy": autoscaling_config._policy,
+                "_serialized_policy_def": autoscaling_config._serialized_policy_def,
+            }
         default_config.update(autoscaling_config)
         autoscaling_config = AutoscalingConfig(**default_config)
 
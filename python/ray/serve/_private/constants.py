@@ -82,6 +82,9 @@ DEFAULT_LATENCY_BUCKET_MS = [
     600000,
 ]
 
+#: Histogram buckets for the sizes of batches run by `@serve.batch`.
+DEFAULT_BATCH_SIZE_BUCKETS = [1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024]
+
 #: Name of deployment health check method implemented by user.
 HEALTH_CHECK_METHOD = "check_health"
 
@@ -315,6 +318,24 @@ RAY_SERVE_QUEUE_LENGTH_CACHE_TIMEOUT_S = float(
     os.environ.get("RAY_SERVE_QUEUE_LENGTH_CACHE_TIMEOUT_S", 10.0)
 )
 
+# Feature flag to weigh replicas by the latency and error rate of their responses when
+# scheduling requests in each handle. See `LatencyAwareReplicaScheduler`.
+RAY_SERVE_ENABLE_LATENCY_AWARE_SCHEDULING = (
+    os.environ.get("RAY_SERVE_ENABLE_LATENCY_AWARE_SCHEDULING", "0") == "1"
+)
+
+# Weight of the latest response in the moving averages of replica latency and error
+# rate used for latency-aware scheduling.
+RAY_SERVE_REPLICA_LATENCY_EWMA_ALPHA = float(
+    os.environ.get("RAY_SERVE_REPLICA_LATENCY_EWMA_ALPHA", 0.2)
+)
+
+# Time constant with which the latency and error rate of a replica that isn't sent
+# requests decay toward the average of all replicas for latency-aware scheduling.
+RAY_SERVE_REPLICA_LATENCY_DECAY_S = float(
+    os.environ.get("RAY_SERVE_REPLICA_LATENCY_DECAY_S", 30.0)
+)
+
 # The default autoscaling policy to use if none is specified.
 DEFAULT_AUTOSCALING_POLICY = "ray.serve.autoscaling_policy:default_autoscaling_policy"
 
@@ -363,3 +384,16 @@ RAY_SERVE_ENABLE_TASK_EVENTS = (
 RAY_SERVE_USE_COMPACT_SCHEDULING_STRATEGY = (
     os.environ.get("RAY_SERVE_USE_COMPACT_SCHEDULING_STRATEGY", "0") == "1"
 )
+
+# Maximum number of bytes of request body messages that the proxy buffers for a
+# request before it stops reading the body from the client, until the replica has
+# received them. Set to 0 to disable the limit.
+RAY_SERVE_PROXY_MAX_BUFFERED_REQUEST_BYTES = int(
+    os.environ.get("RAY_SERVE_PROXY_MAX_BUFFERED_REQUEST_BYTES", 4 * 1024 * 1024)
+)
+
+# Maximum number of bytes of request body messages sent to the replica at a time.
+# Set to 0 to disable the limit.
+RAY_SERVE_PROXY_REQUEST_CHUNK_BYTES = int(
+    os.environ.get("RAY_SERVE_PROXY_REQUEST_CHUNK_BYTES", 1024 * 1024)
+)
@@ -146,6 +146,11 @@ class MessageQueue(Send):
 
     Implements the ASGI `Send` interface.
 
+    If `max_buffered_bytes` is set, producers can use `wait_for_capacity` to stop
+    putting messages on the queue while the payloads of the buffered messages
+    (HTTP body or websocket bytes) add up to `max_buffered_bytes` or more, until the
+    consumer has fetched them.
+
     This class:
         - Is *NOT* thread safe and should only be accessed from a single asyncio
           event loop.
@@ -153,24 +158,53 @@ class MessageQueue(Send):
           `get_messages_nowait` and `wait_for_message` is undefined behavior).
     """
 
-    def __init__(self):
+    def __init__(self, *, max_buffered_bytes: Optional[int] = None):
         self._message_queue = deque()
         self._new_message_event = asyncio.Event()
         self._closed = False
+        self._max_buffered_bytes = max_buffered_bytes
+        self._num_buffered_bytes = 0
+        self._capacity_available_event = asyncio.Event()
+        self._capacity_available_event.set()
+
+    @property
+    def num_buffered_bytes(self) -> int:
+        return self._num_buffered_bytes
+
+    @staticmethod
+    def _get_payload_size_bytes(message: Message) -> int:
+        if not isinstance(message, dict):
+            return 0
+
+        payload = message.get("body") or message.get("bytes")
+        return len(payload) if payload else 0
+
+    def _update_capacity_available(self):
+        if (
+            self._closed
+            or self._max_buffered_bytes is None
+            or self._num_buffered_bytes < self._max_buffered_bytes
+        ):
+            self._capacity_available_event.set()
+        else:
+            self._capacity_available_event.clear()
 
     def close(self):
         """Close the queue, rejecting new messages.
 
         Once the queue is closed, existing messages will be returned from
-        `get_messages_nowait` and subsequent calls to `wait_for_message` will
-        always return immediately.
+        `get_messages_nowait` and subsequent calls to `wait_for_message` and
+        `wait_for_capacity` will always return immediately.
         """
         self._closed = True
         self._new_message_event.set()
+        self._capacity_available_event.set()
 
     def put_nowait(self, message: Message):
         self._message_queue.append(message)
+        self._num_buffered_bytes += self._get_payload_size_bytes(message)
         self._new_message_event.set()
+        self._update_capacity_available()
 
     async def __call__(self, message: Message):
         """Send a message, putting it on the queue.
@@ -182,18 +216,35 @@ class MessageQueue(Send):
 
         self.put_nowait(message)
 
-    def get_messages_nowait(self) -> List[Message]:
+    def get_messages_nowait(self, *, max_bytes: Optional[int] = None) -> List[Message]:
         """Returns all messages that are currently available (non-blocking).
 
+        If `max_bytes` is set, only the oldest messages whose payloads add up to at
+        most `max_bytes` are returned (but always at least one message, if any are
+        available), and the rest are left on the queue.
+
         At least one message will be present if `wait_for_message` had previously
         returned and a subsequent call to `wait_for_message` blocks until at
         least one new message is available.
         """
         messages = []
+        num_bytes = 0
         while len(self._message_queue) > 0:
+            size_bytes = self._get_payload_size_bytes(self._message_queue[0])
+            if (
+                len(messages) > 0
+                and max_bytes is not None
+                and num_bytes + size_bytes > max_bytes
+            ):
+                break
+
             messages.append(self._message_queue.popleft())
+            num_bytes += size_bytes
 
-        self._new_message_event.clear()
+        self._num_buffered_bytes -= num_bytes
+        if len(self._message_queue) == 0:
+            self._new_message_event.clear()
+        self._update_capacity_available()
         return messages
 
     async def wait_for_message(self):
@@ -208,12 +259,25 @@ class MessageQueue(Send):
         if not self._closed:
             await self._new_message_event.wait()
 
+    async def wait_for_capacity(self):
+        """Wait until the buffered messages are under `max_buffered_bytes`.
+
+        Returns immediately if `max_buffered_bytes` isn't set or the queue is closed.
+        """
+        if not self._closed:
+            await self._capacity_available_event.wait()
+
 
 class ASGIReceiveProxy:
     """Proxies ASGI receive from an actor.
 
     The `receive_asgi_messages` callback will be called repeatedly to fetch messages
-    until a disconnect message is received.
+    until a disconnect message is received. While the HTTP request body is
+    incomplete, the next messages are only fetched once the previous ones have been
+    received, so that an app that consumes the request body slowly applies
+    backpressure to the proxy instead of buffering the body. Once the body is
+    complete, and for websockets, messages are always fetched, so that a disconnect
+    is received even if the app doesn't receive.
     """
 
     def __init__(
@@ -227,6 +291,11 @@ class ASGIReceiveProxy:
         self._request_metadata = request_metadata
         self._receive_asgi_messages = receive_asgi_messages
         self._disconnect_message = None
+        # Set when all the fetched messages have been received.
+        self._messages_received_event = asyncio.Event()
+        self._messages_received_event.set()
+        # Whether the last fetched HTTP request body message has more body after it.
+        self._more_body = False
 
     def _get_default_disconnect_message(self) -> Message:
         """Return the appropriate disconnect message based on the connection type.
@@ -255,12 +324,22 @@ class ASGIReceiveProxy:
         messages will be received.
         """
         while True:
+            if self._more_body:
+                # Only fetch more of the body once the app has received the previous
+                # messages, so that at most one fetch's worth of the body is
+                # buffered here.
+                await self._messages_received_event.wait()
             try:
                 pickled_messages = await self._receive_asgi_messages(
                     self._request_metadata
                 )
-                for message in pickle.loads(pickled_messages):
+                messages = pickle.loads(pickled_messages)
+                if len(messages) > 0:
+                    self._messages_received_event.clear()
+                for message in messages:
                     self._queue.put_nowait(message)
+                    if message["type"] == "http.request":
+                        self._more_body = message.get("more_body", False)
 
                     if message["type"] in {"http.disconnect", "websocket.disconnect"}:
                         self._disconnect_message = message
@@ -287,6 +366,8 @@ class ASGIReceiveProxy:
             return self._disconnect_message
 
         message = await self._queue.get()
+        if self._queue.empty():
+            self._messages_received_event.set()
         if isinstance(message, Exception):
             raise message
 
@@ -35,6 +35,8 @@ from ray.serve._private.constants import (
     DEFAULT_UVICORN_KEEP_ALIVE_TIMEOUT_S,
     PROXY_MIN_DRAINING_PERIOD_S,
     RAY_SERVE_HTTP_PROXY_CALLBACK_IMPORT_PATH,
+    RAY_SERVE_PROXY_MAX_BUFFERED_REQUEST_BYTES,
+    RAY_SERVE_PROXY_REQUEST_CHUNK_BYTES,
     SERVE_CONTROLLER_NAME,
     SERVE_LOGGER_NAME,
     SERVE_MULTIPLEXED_MODEL_ID,
@@ -847,7 +849,9 @@ class HTTPProxy(GenericProxy):
             raise KeyError(f"Request ID {request_metadata.request_id} not found.")
 
         await queue.wait_for_message()
-        return queue.get_messages_nowait()
+        return queue.get_messages_nowait(
+            max_bytes=RAY_SERVE_PROXY_REQUEST_CHUNK_BYTES or None
+        )
 
     async def __call__(self, scope, receive, send):
         """Implements the ASGI protocol.
@@ -868,13 +872,26 @@ class HTTPProxy(GenericProxy):
         Once a disconnect message is received, the call exits and `receive` is no longer
         called.
 
+        While the HTTP request body is incomplete, the next body message is only
+        received once the queue has capacity, so the body is streamed to the replica
+        as it's consumed instead of being buffered in the proxy. A disconnect in the
+        middle of the body isn't noticed until the replica has received the buffered
+        messages. Once the body is complete, and for websockets, messages are always
+        received, so that disconnects are noticed even if the app never receives.
+
         For HTTP messages, `None` is always returned.
         For websocket messages, the disconnect code is returned if a disconnect code is
         received.
         """
         try:
+            more_body = False
             while True:
+                if more_body:
+                    await queue.wait_for_capacity()
                 msg = await receive()
+                more_body = msg["type"] == "http.request" and msg.get(
+                    "more_body", False
+                )
                 await queue(msg)
 
                 if msg["type"] == "http.disconnect":
@@ -961,7 +978,9 @@ class HTTPProxy(GenericProxy):
         # Proxy the receive interface by placing the received messages on a queue.
         # The downstream replica must call back into `receive_asgi_messages` on this
         # actor to receive the messages.
-        receive_queue = MessageQueue()
+        receive_queue = MessageQueue(
+            max_buffered_bytes=RAY_SERVE_PROXY_MAX_BUFFERED_REQUEST_BYTES or None
+        )
         self.asgi_receive_queues[internal_request_id] = receive_queue
         proxy_asgi_receive_task = get_or_create_event_loop().create_task(
             self.proxy_asgi_receive(proxy_request.receive, receive_queue)
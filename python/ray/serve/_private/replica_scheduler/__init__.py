@@ -3,6 +3,9 @@ from ray.serve._private.replica_scheduler.common import (  # noqa: F401
     ReplicaScheduler,
     ReplicaWrapper,
 )
+from ray.serve._private.replica_scheduler.latency_aware_scheduler import (  # noqa: F401
+    LatencyAwareReplicaScheduler,
+)
 from ray.serve._private.replica_scheduler.pow_2_scheduler import (  # noqa: F401
     PowerOfTwoChoicesReplicaScheduler,
 )
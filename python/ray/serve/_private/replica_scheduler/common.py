@@ -252,6 +252,10 @@ class ReplicaQueueLengthCache:
 class ReplicaScheduler(ABC):
     """Abstract interface for a replica scheduler (how the router calls it)."""
 
+    # Whether the router should report the requests sent to replicas and their
+    # results through `on_request_sent` and `on_request_completed`.
+    records_request_results: bool = False
+
     @abstractmethod
     async def choose_replica_for_request(
         self, pending_request: PendingRequest, *, is_retry: bool = False
@@ -275,3 +279,16 @@ class ReplicaScheduler(ABC):
     @abstractmethod
     def curr_replicas(self) -> Dict[str, ReplicaWrapper]:
         pass
+
+    def on_request_sent(self, replica_id: ReplicaID):
+        """Called when a request has been sent to the replica."""
+        pass
+
+    def on_request_completed(
+        self, replica_id: ReplicaID, latency_s: float, *, failed: bool
+    ):
+        """Called when a request sent to the replica has completed.
+
+        This may be called from a different thread than the scheduler's event loop.
+        """
+        pass
@@ -0,0 +1,208 @@
+import math
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Callable, DefaultDict, Dict, List, Optional, Set
+
+from ray.serve._private.common import ReplicaID
+from ray.serve._private.constants import (
+    RAY_SERVE_REPLICA_LATENCY_DECAY_S,
+    RAY_SERVE_REPLICA_LATENCY_EWMA_ALPHA,
+)
+from ray.serve._private.replica_scheduler.common import ReplicaWrapper
+from ray.serve._private.replica_scheduler.pow_2_scheduler import (
+    PowerOfTwoChoicesReplicaScheduler,
+)
+
+
+@dataclass(frozen=True)
+class ReplicaLatencyStatsEntry:
+    latency_s: Optional[float]
+    error_rate: float
+    timestamp: float
+
+
+class ReplicaLatencyStats:
+    """Moving averages of the latency and error rate of the requests to each replica.
+
+    The averages are exponentially weighted by `ewma_alpha` per response. Failed
+    requests only count toward the error rate, because they often fail fast.
+
+    The stats of a replica that hasn't responded for a while decay toward the
+    average of all replicas (with time constant `decay_s`), so that a replica that's
+    slow at some point isn't avoided forever.
+
+    This is updated from the threads that run the callbacks of completed requests, so
+    all access is guarded by a lock.
+    """
+
+    def __init__(
+        self,
+        *,
+        ewma_alpha: float = RAY_SERVE_REPLICA_LATENCY_EWMA_ALPHA,
+        decay_s: float = RAY_SERVE_REPLICA_LATENCY_DECAY_S,
+        get_curr_time_s: Optional[Callable[[], float]] = None,
+    ):
+        self._ewma_alpha = ewma_alpha
+        self._decay_s = decay_s
+        self._get_curr_time_s = (
+            get_curr_time_s if get_curr_time_s is not None else time.time
+        )
+        self._lock = threading.Lock()
+        self._stats: Dict[ReplicaID, ReplicaLatencyStatsEntry] = {}
+        self._num_in_flight: DefaultDict[ReplicaID, int] = defaultdict(int)
+
+    def _get_decay(self, entry: ReplicaLatencyStatsEntry) -> float:
+        if self._decay_s <= 0:
+            return 1.0
+
+        age_s = max(self._get_curr_time_s() - entry.timestamp, 0)
+        return math.exp(-age_s / self._decay_s)
+
+    def _get_average_latency_s(self) -> Optional[float]:
+        latencies = [
+            e.latency_s for e in self._stats.values() if e.latency_s is not None
+        ]
+        if len(latencies) == 0:
+            return None
+
+        return sum(latencies) / len(latencies)
+
+    def get_num_in_flight(self, replica_id: ReplicaID) -> int:
+        """Number of requests sent to the replica that haven't completed yet."""
+        with self._lock:
+            return self._num_in_flight.get(replica_id, 0)
+
+    def get_latency_s(self, replica_id: ReplicaID) -> Optional[float]:
+        """Get the expected latency of a request to the replica.
+
+        Replicas without responses yet are expected to have the average latency of all
+        replicas. Returns `None` if no replica has responded yet.
+        """
+        with self._lock:
+            average_latency_s = self._get_average_latency_s()
+            entry = self._stats.get(replica_id)
+            if entry is None or entry.latency_s is None:
+                return average_latency_s
+
+            decay = self._get_decay(entry)
+            return average_latency_s + (entry.latency_s - average_latency_s) * decay
+
+    def get_error_rate(self, replica_id: ReplicaID) -> float:
+        """Get the expected fraction of requests to the replica that fail."""
+        with self._lock:
+            entry = self._stats.get(replica_id)
+            if entry is None:
+                return 0.0
+
+            return entry.error_rate * self._get_decay(entry)
+
+    def on_request_sent(self, replica_id: ReplicaID):
+        with self._lock:
+            self._num_in_flight[replica_id] += 1
+
+    def on_request_completed(
+        self, replica_id: ReplicaID, latency_s: float, *, failed: bool
+    ):
+        with self._lock:
+            if self._num_in_flight.get(replica_id, 0) > 0:
+                self._num_in_flight[replica_id] -= 1
+
+            alpha = self._ewma_alpha
+            entry = self._stats.get(replica_id)
+            if entry is None:
+                new_latency_s = None if failed else latency_s
+                new_error_rate = float(failed)
+            else:
+                new_latency_s = entry.latency_s
+                if not failed:
+                    new_latency_s = (
+                        latency_s
+                        if new_latency_s is None
+                        else alpha * latency_s + (1 - alpha) * new_latency_s
+                    )
+                new_error_rate = alpha * failed + (1 - alpha) * entry.error_rate
+
+            self._stats[replica_id] = ReplicaLatencyStatsEntry(
+                new_latency_s, new_error_rate, self._get_curr_time_s()
+            )
+
+    def remove_inactive_replicas(self, *, active_replica_ids: Set[ReplicaID]):
+        """Removes entries for all replica IDs not in the provided active set."""
+        with self._lock:
+            for replica_id in list(self._stats.keys()):
+                if replica_id not in active_replica_ids:
+                    self._stats.pop(replica_id)
+            for replica_id in list(self._num_in_flight.keys()):
+                if replica_id not in active_replica_ids:
+                    self._num_in_flight.pop(replica_id)
+
+
+class LatencyAwareReplicaScheduler(PowerOfTwoChoicesReplicaScheduler):
+    """Chooses the candidate replica with the lowest expected completion time.
+
+    This follows the same "power of two choices" procedure as
+    `PowerOfTwoChoicesReplicaScheduler`, but instead of the candidate with the
+    shortest queue, it chooses the one that's expected to complete the request first:
+
+        (queue_len + 1) * latency_s / (1 - error_rate)
+
+    where `latency_s` and `error_rate` are moving averages of the responses of the
+    replica observed by this handle (see `ReplicaLatencyStats`). This avoids replicas
+    that respond slowly (e.g. because they're on overloaded nodes) or fail often, even
+    if they report the same queue length as the others.
+
+    The queue length of a replica is at least the number of requests this handle has
+    in flight to it, so that its cached queue length doesn't go stale between
+    probes. When the queue length cache is enabled, replicas with fresh cache entries
+    aren't probed.
+    """
+
+    # Lower bound on the expected success rate of a replica, so that replicas that
+    # always fail have a finite cost (and are still chosen if they're the only ones).
+    min_success_rate = 0.01
+
+    records_request_results = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._latency_stats = ReplicaLatencyStats(
+            get_curr_time_s=kwargs.get("get_curr_time_s"),
+        )
+
+    @property
+    def latency_stats(self) -> ReplicaLatencyStats:
+        return self._latency_stats
+
+    def update_replicas(self, replicas: List[ReplicaWrapper]):
+        super().update_replicas(replicas)
+        self._latency_stats.remove_inactive_replicas(
+            active_replica_ids=self._replica_id_set
+        )
+
+    def _get_replica_cost(self, replica: ReplicaWrapper, queue_len: int) -> float:
+        queue_len = max(
+            queue_len, self._latency_stats.get_num_in_flight(replica.replica_id)
+        )
+        if queue_len >= replica.max_ongoing_requests:
+            return math.inf
+
+        latency_s = self._latency_stats.get_latency_s(replica.replica_id)
+        if latency_s is None:
+            # No replica has responded yet, so fall back to the queue length.
+            latency_s = 1.0
+
+        success_rate = max(
+            1 - self._latency_stats.get_error_rate(replica.replica_id),
+            self.min_success_rate,
+        )
+        return (queue_len + 1) * latency_s / success_rate
+
+    def on_request_sent(self, replica_id: ReplicaID):
+        self._latency_stats.on_request_sent(replica_id)
+
+    def on_request_completed(
+        self, replica_id: ReplicaID, latency_s: float, *, failed: bool
+    ):
+        self._latency_stats.on_request_completed(replica_id, latency_s, failed=failed)
@@ -542,6 +542,13 @@ class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
         assert len(result) == len(replicas)
         return result
 
+    def _get_replica_cost(self, replica: ReplicaWrapper, queue_len: int) -> float:
+        """Cost of scheduling a request to the replica; the lowest cost is chosen.
+
+        Subclasses can override this to weigh candidates by other signals.
+        """
+        return queue_len
+
     async def select_from_candidate_replicas(
         self,
         candidates: List[ReplicaWrapper],
@@ -555,9 +562,9 @@ class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
         present in the cache, the replica will be actively probed and the cache updated.
 
         Among replicas that respond within the deadline and don't have full queues, the
-        one with the lowest queue length is chosen.
+        one with the lowest cost (by default, the queue length) is chosen.
         """
-        lowest_queue_len = math.inf
+        lowest_cost = math.inf
         chosen_replica_id: Optional[str] = None
         not_in_cache: List[ReplicaWrapper] = []
         if self._use_replica_queue_len_cache:
@@ -569,8 +576,11 @@ class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
                 # cache entries expire.
                 if queue_len is None or queue_len >= r.max_ongoing_requests:
                     not_in_cache.append(r)
-                elif queue_len < lowest_queue_len:
-                    lowest_queue_len = queue_len
+                    continue
+
+                cost = self._get_replica_cost(r, queue_len)
+                if cost < lowest_cost:
+                    lowest_cost = cost
                     chosen_replica_id = r.replica_id
         else:
             not_in_cache = candidates
@@ -586,8 +596,12 @@ class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
                     # None is returned if we failed to get the queue len.
                     continue
 
-                if queue_len < r.max_ongoing_requests and queue_len < lowest_queue_len:
-                    lowest_queue_len = queue_len
+                if queue_len >= r.max_ongoing_requests:
+                    continue
+
+                cost = self._get_replica_cost(r, queue_len)
+                if cost < lowest_cost:
+                    lowest_cost = cost
                     chosen_replica_id = r.replica_id
         elif len(not_in_cache) > 0:
             # If there are replicas without a valid cache entry, probe them in the
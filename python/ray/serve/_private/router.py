@@ -21,6 +21,7 @@ from ray.serve._private.config import DeploymentConfig
 from ray.serve._private.constants import (
     HANDLE_METRIC_PUSH_INTERVAL_S,
     RAY_SERVE_COLLECT_AUTOSCALING_METRICS_ON_HANDLE,
+    RAY_SERVE_ENABLE_LATENCY_AWARE_SCHEDULING,
     RAY_SERVE_ENABLE_QUEUE_LENGTH_CACHE,
     RAY_SERVE_ENABLE_STRICT_MAX_ONGOING_REQUESTS,
     RAY_SERVE_HANDLE_AUTOSCALING_METRIC_RECORD_PERIOD_S,
@@ -30,6 +31,7 @@ from ray.serve._private.constants import (
 from ray.serve._private.long_poll import LongPollClient, LongPollNamespace
 from ray.serve._private.metrics_utils import InMemoryMetricsStore, MetricsPusher
 from ray.serve._private.replica_scheduler import (
+    LatencyAwareReplicaScheduler,
     PendingRequest,
     PowerOfTwoChoicesReplicaScheduler,
     ReplicaScheduler,
@@ -347,7 +349,11 @@ class Router:
             )
 
         if replica_scheduler is None:
-            replica_scheduler = PowerOfTwoChoicesReplicaScheduler(
+            if RAY_SERVE_ENABLE_LATENCY_AWARE_SCHEDULING:
+                replica_scheduler_cls = LatencyAwareReplicaScheduler
+            else:
+                replica_scheduler_cls = PowerOfTwoChoicesReplicaScheduler
+            replica_scheduler = replica_scheduler_cls(
                 self._event_loop,
                 deployment_id,
                 _prefer_local_node_routing,
@@ -515,6 +521,19 @@ class Router:
                 pr, is_retry=True
             )
 
+    def _on_request_completed(
+        self, replica_id: ReplicaID, sent_at_s: float, result: Any
+    ):
+        """Report the result of a request to the scheduler.
+
+        The result is an exception object if the request failed.
+        """
+        self._replica_scheduler.on_request_completed(
+            replica_id,
+            time.time() - sent_at_s,
+            failed=isinstance(result, Exception),
+        )
+
     async def assign_request(
         self,
         request_meta: RequestMetadata,
@@ -544,19 +563,28 @@ class Router:
                     ),
                 )
 
+                if isinstance(ref, (ray.ObjectRef, FakeObjectRef)):
+                    completed_ref = ref
+                else:
+                    completed_ref = ref.completed()
+
                 # Keep track of requests that have been sent out to replicas
                 if RAY_SERVE_COLLECT_AUTOSCALING_METRICS_ON_HANDLE:
                     self._metrics_manager.inc_num_running_requests_for_replica(
                         replica_id
                     )
-                    callback = partial(
-                        self._metrics_manager.dec_num_running_requests_for_replica,
-                        replica_id,
+                    completed_ref._on_completed(
+                        partial(
+                            self._metrics_manager.dec_num_running_requests_for_replica,
+                            replica_id,
+                        )
+                    )
+
+                if self._replica_scheduler.records_request_results:
+                    self._replica_scheduler.on_request_sent(replica_id)
+                    completed_ref._on_completed(
+                        partial(self._on_request_completed, replica_id, time.time())
                     )
-                    if isinstance(ref, (ray.ObjectRef, FakeObjectRef)):
-                        ref._on_completed(callback)
-                    else:
-                        ref.completed()._on_completed(callback)
 
                 return ref
             except asyncio.CancelledError:
@@ -1,6 +1,8 @@
 import logging
 import math
-from typing import Any, Dict, Optional
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional
 
 from ray.serve._private.constants import CONTROL_LOOP_INTERVAL_S, SERVE_LOGGER_NAME
 from ray.serve.config import AutoscalingConfig
@@ -157,3 +159,370 @@ def replica_queue_length_autoscaling_policy(
 
 
 default_autoscaling_policy = replica_queue_length_autoscaling_policy
+
+
+class _HoltWintersForecaster:
+    """Forecasts a time series with additive Holt-Winters (triple exponential
+    smoothing).
+
+    The series is decomposed into a level, a linear trend, and a seasonal component
+    with a period of `season_length` observations, each of which is an exponentially
+    weighted moving average with its own smoothing factor. The seasonal component is
+    only learned once a full season has been observed; until then, this forecasts
+    with the level and trend only (Holt's linear method). If `season_length` is less
+    than 2, there's no seasonal component.
+    """
+
+    def __init__(
+        self,
+        *,
+        season_length: int,
+        level_smoothing: float,
+        trend_smoothing: float,
+        seasonal_smoothing: float,
+    ):
+        self._season_length = season_length
+        self._level_smoothing = level_smoothing
+        self._trend_smoothing = trend_smoothing
+        self._seasonal_smoothing = seasonal_smoothing
+
+        self._level: Optional[float] = None
+        self._trend = 0.0
+        self._seasonal: List[float] = [0.0] * season_length if season_length > 1 else []
+        self._num_observations = 0
+
+    @property
+    def num_observations(self) -> int:
+        return self._num_observations
+
+    def _has_seasonality(self) -> bool:
+        return bool(self._seasonal) and self._num_observations >= self._season_length
+
+    def observe(self, value: float):
+        """Update the forecast with the next value of the series."""
+        if self._level is None:
+            self._level = value
+            self._num_observations += 1
+            return
+
+        seasonal = 0.0
+        if self._has_seasonality():
+            seasonal = self._seasonal[self._num_observations % self._season_length]
+
+        prev_level = self._level
+        self._level = self._level_smoothing * (value - seasonal) + (
+            1 - self._level_smoothing
+        ) * (prev_level + self._trend)
+        self._trend = (
+            self._trend_smoothing * (self._level - prev_level)
+            + (1 - self._trend_smoothing) * self._trend
+        )
+        if self._has_seasonality():
+            self._seasonal[self._num_observations % self._season_length] = (
+                self._seasonal_smoothing * (value - self._level)
+                + (1 - self._seasonal_smoothing) * seasonal
+            )
+
+        self._num_observations += 1
+
+    def forecast(self, num_steps: float) -> float:
+        """Forecast the value of the series `num_steps` observations ahead.
+
+        Returns 0 if nothing has been observed yet. The forecast is never negative.
+        """
+        if self._level is None:
+            return 0.0
+
+        value = self._level + num_steps * self._trend
+        if self._has_seasonality():
+            index = self._num_observations - 1 + round(num_steps)
+            value += self._seasonal[index % self._season_length]
+
+        return max(value, 0.0)
+
+
+@PublicAPI(stability="alpha")
+class PredictiveAutoscalingPolicy:
+    """An autoscaling policy that scales ahead of forecasted demand.
+
+    Replicas take a while to start, so a policy that reacts to the current number
+    of ongoing requests always lags traffic that ramps up steadily, such as diurnal
+    traffic. This policy forecasts the number of ongoing requests (which is
+    proportional to the request rate for a fixed request latency) with Holt-Winters
+    exponential smoothing of the metrics history of the deployment, and scales to
+    the number of replicas needed for the forecasted demand by the time new replicas
+    would be running: `upscale_delay_s + replica_startup_s` seconds ahead.
+
+    The forecast is only used to scale up earlier. The decisions are made by
+    `replica_queue_length_autoscaling_policy` for the larger of the current and
+    forecasted number of ongoing requests, so all the other autoscaling config
+    options (including `downscale_delay_s`) apply as usual, and the deployment is
+    never scaled down below what the current traffic needs.
+
+    The history is sampled every `metrics_interval_s`, which is how often the
+    metrics are updated. Like the default policy, this assumes it's called once
+    every control loop iteration.
+
+    To use this policy with the default parameters, set the `_policy` of the
+    `AutoscalingConfig` to
+    `"ray.serve.autoscaling_policy:predictive_autoscaling_policy"`. To tune its
+    parameters, pass an instance of this class instead, and use
+    `simulate_autoscaling_policy` to compare parameters on recorded traffic offline.
+
+    Arguments:
+        season_period_s: the period of the seasonality of the traffic, e.g. one day
+            for diurnal traffic. If `None`, only the level and trend of the traffic
+            are forecasted.
+        replica_startup_s: the expected time it takes to start a replica.
+        level_smoothing: the smoothing factor of the level of the traffic, between
+            0 and 1. Higher values adapt faster to changes in traffic.
+        trend_smoothing: the smoothing factor of the trend of the traffic, between
+            0 and 1.
+        seasonal_smoothing: the smoothing factor of the seasonal component of the
+            traffic, between 0 and 1.
+    """
+
+    def __init__(
+        self,
+        *,
+        season_period_s: Optional[float] = 24 * 60 * 60,
+        replica_startup_s: float = 30.0,
+        level_smoothing: float = 0.5,
+        trend_smoothing: float = 0.1,
+        seasonal_smoothing: float = 0.1,
+    ):
+        if season_period_s is not None and season_period_s <= 0:
+            raise ValueError(
+                f"season_period_s must be a float > 0 or None, got {season_period_s}"
+            )
+        if replica_startup_s < 0:
+            raise ValueError(
+                f"replica_startup_s must be a float >= 0, got {replica_startup_s}"
+            )
+        for name, value in [
+            ("level_smoothing", level_smoothing),
+            ("trend_smoothing", trend_smoothing),
+            ("seasonal_smoothing", seasonal_smoothing),
+        ]:
+            if not 0 <= value <= 1:
+                raise ValueError(f"{name} must be between 0 and 1, got {value}")
+
+        self.season_period_s = season_period_s
+        self.replica_startup_s = replica_startup_s
+        self.level_smoothing = level_smoothing
+        self.trend_smoothing = trend_smoothing
+        self.seasonal_smoothing = seasonal_smoothing
+
+    def _get_forecaster(
+        self, config: AutoscalingConfig, policy_state: Dict[str, Any]
+    ) -> _HoltWintersForecaster:
+        forecaster = policy_state.get("forecaster")
+        if forecaster is None:
+            season_length = 0
+            if self.season_period_s is not None:
+                season_length = round(self.season_period_s / config.metrics_interval_s)
+            forecaster = _HoltWintersForecaster(
+                season_length=season_length,
+                level_smoothing=self.level_smoothing,
+                trend_smoothing=self.trend_smoothing,
+                seasonal_smoothing=self.seasonal_smoothing,
+            )
+            policy_state["forecaster"] = forecaster
+
+        return forecaster
+
+    def __call__(
+        self,
+        curr_target_num_replicas: int,
+        total_num_requests: int,
+        num_running_replicas: int,
+        config: Optional[AutoscalingConfig],
+        capacity_adjusted_min_replicas: int,
+        capacity_adjusted_max_replicas: int,
+        policy_state: Dict[str, Any],
+    ) -> int:
+        forecaster = self._get_forecaster(config, policy_state)
+
+        # Sample the history once per metrics update.
+        forecast_counter = policy_state.get("forecast_counter", 0)
+        if forecast_counter == 0:
+            forecaster.observe(total_num_requests)
+        policy_state["forecast_counter"] = (forecast_counter + 1) % max(
+            round(config.metrics_interval_s / CONTROL_LOOP_INTERVAL_S), 1
+        )
+
+        lookahead_s = config.upscale_delay_s + self.replica_startup_s
+        forecasted_num_requests = forecaster.forecast(
+            lookahead_s / config.metrics_interval_s
+        )
+        if forecasted_num_requests > total_num_requests:
+            logger.debug(
+                f"Forecasted {forecasted_num_requests:.1f} ongoing requests in "
+                f"{lookahead_s:.0f}s, currently {total_num_requests:.1f}."
+            )
+
+        return replica_queue_length_autoscaling_policy(
+            curr_target_num_replicas=curr_target_num_replicas,
+            total_num_requests=max(total_num_requests, forecasted_num_requests),
+            num_running_replicas=num_running_replicas,
+            config=config,
+            capacity_adjusted_min_replicas=capacity_adjusted_min_replicas,
+            capacity_adjusted_max_replicas=capacity_adjusted_max_replicas,
+            policy_state=policy_state,
+        )
+
+
+predictive_autoscaling_policy = PredictiveAutoscalingPolicy()
+
+
+@PublicAPI(stability="alpha")
+@dataclass
+class AutoscalingSimulationResult:
+    """The result of `simulate_autoscaling_policy`.
+
+    The time series are sampled every `metrics_interval_s` of the config.
+    """
+
+    timestamps_s: List[float] = field(default_factory=list)
+    num_ongoing_requests: List[float] = field(default_factory=list)
+    target_num_replicas: List[int] = field(default_factory=list)
+    num_running_replicas: List[int] = field(default_factory=list)
+    # The total running time of all replicas, including the time they're starting.
+    replica_s: float = 0.0
+    # The total time during which there were more ongoing requests per running
+    # replica than `target_ongoing_requests`.
+    underprovisioned_s: float = 0.0
+
+
+@PublicAPI(stability="alpha")
+def simulate_autoscaling_policy(
+    policy: Callable[..., int],
+    config: AutoscalingConfig,
+    request_rates: List[float],
+    *,
+    request_rate_interval_s: float = 60.0,
+    request_latency_s: float = 1.0,
+    replica_startup_s: float = 30.0,
+    initial_replicas: Optional[int] = None,
+) -> AutoscalingSimulationResult:
+    """Replay a recorded request rate against an autoscaling policy offline.
+
+    This simulates the autoscaling control loop for a single deployment: the policy
+    is called every control loop iteration with the number of ongoing requests
+    averaged over `look_back_period_s`, which is updated every `metrics_interval_s`.
+    New replicas start running `replica_startup_s` after they're added, and
+    replicas are removed immediately (starting replicas first). The number of
+    ongoing requests is `request_rate * request_latency_s` (by Little's law), i.e.
+    queueing in overloaded replicas isn't modeled.
+
+    The result has the replica time the policy used and the time it left the
+    deployment underprovisioned, which can be used to compare policies or tune their
+    parameters.
+
+    Example:
+
+    .. code-block:: python
+
+            from ray.serve.autoscaling_policy import (
+                PredictiveAutoscalingPolicy,
+                simulate_autoscaling_policy,
+            )
+            from ray.serve.config import AutoscalingConfig
+
+            # Requests per second, for every minute of a recorded day.
+            request_rates = [...]
+            config = AutoscalingConfig(
+                min_replicas=1, max_replicas=100, target_ongoing_requests=2
+            )
+            for replica_startup_s in [30, 60, 120]:
+                result = simulate_autoscaling_policy(
+                    PredictiveAutoscalingPolicy(replica_startup_s=replica_startup_s),
+                    config,
+                    request_rates,
+                    request_latency_s=0.5,
+                    replica_startup_s=60,
+                )
+                print(result.replica_s, result.underprovisioned_s)
+
+    Arguments:
+        policy: the autoscaling policy to simulate.
+        config: the autoscaling config of the deployment.
+        request_rates: the request rate (requests per second) of each interval of
+            `request_rate_interval_s` seconds of the traffic.
+        request_rate_interval_s: the length of each interval of `request_rates`.
+        request_latency_s: the average latency of a request.
+        replica_startup_s: the time it takes to start a replica.
+        initial_replicas: the number of replicas running at the start. Defaults to
+            the `initial_replicas` of the config, or else its `min_replicas`.
+    """
+    interval_s = CONTROL_LOOP_INTERVAL_S
+    num_steps_per_rate = max(round(request_rate_interval_s / interval_s), 1)
+    num_steps_per_metrics_update = max(round(config.metrics_interval_s / interval_s), 1)
+
+    if initial_replicas is None:
+        initial_replicas = (
+            config.initial_replicas
+            if config.initial_replicas is not None
+            else config.min_replicas
+        )
+    target_num_replicas = initial_replicas
+    num_running_replicas = initial_replicas
+    # The times at which the starting replicas start running, in order.
+    starting_replicas: Deque[float] = deque()
+    num_requests_window: Deque[float] = deque(
+        maxlen=max(round(config.look_back_period_s / interval_s), 1)
+    )
+    total_num_requests = 0.0
+    policy_state: Dict[str, Any] = {}
+
+    result = AutoscalingSimulationResult()
+    for step in range(len(request_rates) * num_steps_per_rate):
+        curr_time_s = step * interval_s
+        while starting_replicas and starting_replicas[0] <= curr_time_s:
+            starting_replicas.popleft()
+            num_running_replicas += 1
+
+        num_ongoing_requests = (
+            request_rates[step // num_steps_per_rate] * request_latency_s
+        )
+        num_requests_window.append(num_ongoing_requests)
+        if step % num_steps_per_metrics_update == 0:
+            total_num_requests = sum(num_requests_window) / len(num_requests_window)
+
+        decision_num_replicas = policy(
+            curr_target_num_replicas=target_num_replicas,
+            total_num_requests=total_num_requests,
+            num_running_replicas=num_running_replicas,
+            config=config,
+            capacity_adjusted_min_replicas=config.min_replicas,
+            capacity_adjusted_max_replicas=config.max_replicas,
+            policy_state=policy_state,
+        )
+        decision_num_replicas = max(
+            config.min_replicas, min(config.max_replicas, decision_num_replicas)
+        )
+        if decision_num_replicas > target_num_replicas:
+            for _ in range(decision_num_replicas - target_num_replicas):
+                starting_replicas.append(curr_time_s + replica_startup_s)
+        else:
+            num_to_stop = target_num_replicas - decision_num_replicas
+            while num_to_stop > 0 and starting_replicas:
+                starting_replicas.pop()
+                num_to_stop -= 1
+            num_running_replicas -= num_to_stop
+        target_num_replicas = decision_num_replicas
+
+        if step % num_steps_per_metrics_update == 0:
+            result.timestamps_s.append(curr_time_s)
+            result.num_ongoing_requests.append(num_ongoing_requests)
+            result.target_num_replicas.append(target_num_replicas)
+            result.num_running_replicas.append(num_running_replicas)
+
+        result.replica_s += target_num_replicas * interval_s
+        if (
+            num_ongoing_requests
+            > num_running_replicas * config.get_target_ongoing_requests()
+        ):
+            result.underprovisioned_s += interval_s
+
+    return result
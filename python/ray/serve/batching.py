@@ -3,7 +3,7 @@ import io
 import logging
 import time
 from collections import deque
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import wraps
 from inspect import isasyncgenfunction, iscoroutinefunction
 from typing import (
@@ -26,7 +26,12 @@ from typing import (
 from ray import serve
 from ray._private.signature import extract_signature, flatten_args, recover_args
 from ray._private.utils import get_or_create_event_loop
-from ray.serve._private.constants import SERVE_LOGGER_NAME
+from ray.serve import metrics
+from ray.serve._private.constants import (
+    DEFAULT_BATCH_SIZE_BUCKETS,
+    DEFAULT_LATENCY_BUCKET_MS,
+    SERVE_LOGGER_NAME,
+)
 from ray.serve._private.utils import extract_self_if_method_call
 from ray.serve.exceptions import RayServeException
 from ray.util.annotations import PublicAPI
@@ -44,6 +49,7 @@ class _SingleRequest:
     self_arg: Any
     flattened_args: List[Any]
     future: asyncio.Future
+    enqueued_at_s: float = field(default_factory=time.time)
 
 
 @dataclass
@@ -77,12 +83,106 @@ def _batch_args_kwargs(
     return recover_args(batched_flattened_args)
 
 
+class _BatchLatencyModel:
+    """Learns how long the batch handler takes as a function of the batch size.
+
+    The latency is modeled as `a + b * batch_size`, fit by least squares to moving
+    averages of the observed batches (so the fit follows changes in the handler's
+    performance). Until batches of different sizes have been observed, the latency
+    is conservatively assumed to be proportional to the batch size, and larger
+    batches are explored if the observed batches are faster than needed.
+    """
+
+    # Weight of the latest batch in the moving averages.
+    ewma_alpha = 0.1
+    # The variance of the observed batch sizes below which they're considered to
+    # have the same size, so the fixed latency can't be fit.
+    min_size_variance = 1e-3
+    # How much larger than the observed batches to explore when they all have about
+    # the same size and run faster than needed.
+    exploration_factor = 2
+
+    def __init__(self):
+        self._num_batches = 0
+        self._mean_size = 0.0
+        self._mean_latency_s = 0.0
+        self._mean_size_sq = 0.0
+        self._mean_size_latency = 0.0
+
+    @property
+    def num_batches(self) -> int:
+        return self._num_batches
+
+    def record(self, batch_size: int, latency_s: float):
+        alpha = 1.0 if self._num_batches == 0 else self.ewma_alpha
+        self._num_batches += 1
+        self._mean_size += alpha * (batch_size - self._mean_size)
+        self._mean_latency_s += alpha * (latency_s - self._mean_latency_s)
+        self._mean_size_sq += alpha * (batch_size**2 - self._mean_size_sq)
+        self._mean_size_latency += alpha * (
+            batch_size * latency_s - self._mean_size_latency
+        )
+
+    def _get_size_variance(self) -> float:
+        return self._mean_size_sq - self._mean_size**2
+
+    def _get_coefficients(self) -> Tuple[float, float]:
+        """Returns the fixed latency and the latency per request."""
+        size_var = self._get_size_variance()
+        if size_var < self.min_size_variance:
+            return 0.0, self._mean_latency_s / self._mean_size
+
+        slope = (
+            self._mean_size_latency - self._mean_size * self._mean_latency_s
+        ) / size_var
+        slope = max(slope, 0.0)
+        intercept = max(self._mean_latency_s - slope * self._mean_size, 0.0)
+        return intercept, slope
+
+    def predict(self, batch_size: int) -> Optional[float]:
+        """Predicts the latency of a batch, or `None` if no batch was observed."""
+        if self._num_batches == 0:
+            return None
+
+        intercept, slope = self._get_coefficients()
+        return intercept + slope * batch_size
+
+    def get_max_batch_size(self, latency_s: float, max_batch_size: int) -> int:
+        """Returns the largest batch size predicted to run within the latency.
+
+        Batches of at least one request are always allowed. If all the observed
+        batches have about the same size, the fixed latency is unknown, so a handler
+        with a fixed cost would be stuck at the same batch size. In that case, if
+        the batches run within the latency, a larger batch is allowed to learn the
+        fixed latency.
+        """
+        if self._num_batches == 0:
+            return max_batch_size
+
+        intercept, slope = self._get_coefficients()
+        if slope <= 0:
+            return max_batch_size
+
+        batch_size = (latency_s - intercept) / slope
+        if (
+            self._get_size_variance() < self.min_size_variance
+            and self._mean_latency_s < latency_s
+        ):
+            batch_size = max(batch_size, self.exploration_factor * self._mean_size)
+        return int(min(max(batch_size, 1), max_batch_size))
+
+
 class _BatchQueue:
+    # Weight of the latest request in the moving average of the time between
+    # requests, which is used to estimate how long a batch takes to fill.
+    arrival_interval_ewma_alpha = 0.1
+
     def __init__(
         self,
         max_batch_size: int,
         batch_wait_timeout_s: float,
         handle_batch_func: Optional[Callable] = None,
+        target_latency_ms: Optional[float] = None,
     ) -> None:
         """Async queue that accepts individual items and returns batches.
 
@@ -90,6 +190,11 @@ class _BatchQueue:
         max_batch_size elements are available or the timeout has passed since
         the previous get.
 
+        If target_latency_ms is set, the batch size (up to max_batch_size) and
+        the timeout are instead chosen for each batch so that requests are
+        expected to complete within the target latency. See
+        `_get_adaptive_batch_params`.
+
         If handle_batch_func is passed in, a background coroutine will run to
         poll from the queue and call handle_batch_func on the results.
 
@@ -101,12 +206,38 @@ class _BatchQueue:
                 batch.
             handle_batch_func(Optional[Callable]): callback to run in the
                 background to handle batches if provided.
+            target_latency_ms: target for the time from when a request is
+                queued until its batch is handled.
         """
         self.queue: asyncio.Queue[_SingleRequest] = asyncio.Queue()
         self.max_batch_size = max_batch_size
         self.batch_wait_timeout_s = batch_wait_timeout_s
+        self.target_latency_ms = target_latency_ms
         self.requests_available_event = asyncio.Event()
 
+        # Used to choose the batch size and timeout if target_latency_ms is set.
+        self._latency_model = _BatchLatencyModel()
+        self._arrival_interval_s: Optional[float] = None
+        self._last_arrival_time_s: Optional[float] = None
+
+        function_name = getattr(handle_batch_func, "__qualname__", "")
+        self.batch_size_histogram = metrics.Histogram(
+            "serve_batch_size",
+            description="The number of requests in each batch run by @serve.batch.",
+            boundaries=DEFAULT_BATCH_SIZE_BUCKETS,
+            tag_keys=("function",),
+        )
+        self.batch_size_histogram.set_default_tags({"function": function_name})
+        self.batch_execution_time_histogram = metrics.Histogram(
+            "serve_batch_execution_time_ms",
+            description="The time it takes to handle each batch run by @serve.batch.",
+            boundaries=DEFAULT_LATENCY_BUCKET_MS,
+            tag_keys=("function",),
+        )
+        self.batch_execution_time_histogram.set_default_tags(
+            {"function": function_name}
+        )
+
         # Used for observability.
         self.curr_iteration_start_time = time.time()
 
@@ -140,9 +271,57 @@ class _BatchQueue:
         self._warn_if_max_batch_size_exceeds_max_ongoing_requests()
 
     def put(self, request: Tuple[_SingleRequest, asyncio.Future]) -> None:
+        now = time.time()
+        if self._last_arrival_time_s is not None:
+            interval_s = now - self._last_arrival_time_s
+            if self._arrival_interval_s is None:
+                self._arrival_interval_s = interval_s
+            else:
+                self._arrival_interval_s += self.arrival_interval_ewma_alpha * (
+                    interval_s - self._arrival_interval_s
+                )
+        self._last_arrival_time_s = now
+
         self.queue.put_nowait(request)
         self.requests_available_event.set()
 
+    def _get_adaptive_batch_params(
+        self, first_request: _SingleRequest
+    ) -> Tuple[int, float]:
+        """Chooses the batch size and timeout for the batch of `first_request`.
+
+        Batches are handled one at a time, so a request may have to wait for the
+        previous batch to be handled before its own batch is handled. The batch size
+        is the largest one whose predicted latency is at most half the target, so
+        that both fit in the target. Larger batches have higher throughput, since the
+        fixed cost of the handler is shared by more requests.
+
+        The timeout is the rest of the target latency of the first request after the
+        time it has already been queued and the time to handle the batch, but no
+        longer than it's expected to take to fill the batch at the recent request
+        rate, since waiting longer only adds latency.
+        """
+        target_latency_s = self.target_latency_ms / 1000
+        if self._latency_model.num_batches == 0:
+            # Run the first batch right away to start learning its latency.
+            return self.max_batch_size, 0.0
+
+        max_batch_size = self._latency_model.get_max_batch_size(
+            target_latency_s / 2, self.max_batch_size
+        )
+        wait_budget_s = (
+            target_latency_s
+            - self._latency_model.predict(max_batch_size)
+            - (time.time() - first_request.enqueued_at_s)
+        )
+        if self._arrival_interval_s is None:
+            fill_time_s = 0.0
+        else:
+            num_missing = max(max_batch_size - 1 - self.queue.qsize(), 0)
+            fill_time_s = num_missing * self._arrival_interval_s
+
+        return max_batch_size, max(min(wait_budget_s, fill_time_s), 0.0)
+
     async def wait_for_batch(self) -> List[Any]:
         """Wait for batch respecting self.max_batch_size and self.timeout_s.
 
@@ -158,8 +337,13 @@ class _BatchQueue:
         batch.append(await self.queue.get())
 
         # Cache current max_batch_size and batch_wait_timeout_s for this batch.
-        max_batch_size = self.max_batch_size
-        batch_wait_timeout_s = self.batch_wait_timeout_s
+        if self.target_latency_ms is None:
+            max_batch_size = self.max_batch_size
+            batch_wait_timeout_s = self.batch_wait_timeout_s
+        else:
+            max_batch_size, batch_wait_timeout_s = self._get_adaptive_batch_params(
+                batch[0]
+            )
 
         # Wait self.timeout_s seconds for new queue arrivals.
         batch_start_time = time.time()
@@ -292,6 +476,8 @@ class _BatchQueue:
         batch: List[_SingleRequest] = await self.wait_for_batch()
         assert len(batch) > 0
         futures = [item.future for item in batch]
+        self.batch_size_histogram.observe(len(batch))
+        start_time_s = time.time()
 
         # Most of the logic in the function should be wrapped in this try-
         # except block, so the futures' exceptions can be set if an exception
@@ -314,6 +500,9 @@ class _BatchQueue:
                 func_future = func_future_or_generator
                 await self._assign_func_results(func_future, futures, len(batch))
 
+            latency_s = time.time() - start_time_s
+            self._latency_model.record(len(batch), latency_s)
+            self.batch_execution_time_histogram.observe(latency_s * 1000)
         except Exception as e:
             logger.exception("_process_batch ran into an unexpected exception.")
 
@@ -346,11 +535,13 @@ class _LazyBatchQueueWrapper:
         max_batch_size: int = 10,
         batch_wait_timeout_s: float = 0.0,
         handle_batch_func: Optional[Callable] = None,
+        target_latency_ms: Optional[float] = None,
     ):
         self._queue: Optional[_BatchQueue] = None
         self.max_batch_size = max_batch_size
         self.batch_wait_timeout_s = batch_wait_timeout_s
         self.handle_batch_func = handle_batch_func
+        self.target_latency_ms = target_latency_ms
 
     @property
     def queue(self) -> _BatchQueue:
@@ -363,6 +554,7 @@ class _LazyBatchQueueWrapper:
                 self.max_batch_size,
                 self.batch_wait_timeout_s,
                 self.handle_batch_func,
+                self.target_latency_ms,
             )
         return self._queue
 
@@ -437,6 +629,21 @@ def _validate_max_batch_size(max_batch_size):
         )
 
 
+def _validate_target_latency_ms(target_latency_ms):
+    if target_latency_ms is None:
+        return
+
+    if not isinstance(target_latency_ms, (float, int)):
+        raise TypeError(
+            f"target_latency_ms must be a float > 0 or None, got {target_latency_ms}"
+        )
+
+    if target_latency_ms <= 0:
+        raise ValueError(
+            f"target_latency_ms must be a float > 0 or None, got {target_latency_ms}"
+        )
+
+
 def _validate_batch_wait_timeout_s(batch_wait_timeout_s):
     if not isinstance(batch_wait_timeout_s, (float, int)):
         raise TypeError(
@@ -496,6 +703,7 @@ def batch(
     /,
     max_batch_size: int = 10,
     batch_wait_timeout_s: float = 0.0,
+    target_latency_ms: Optional[float] = None,
 ) -> "_BatchDecorator":
     ...
 
@@ -532,6 +740,7 @@ def batch(
     /,
     max_batch_size: int = 10,
     batch_wait_timeout_s: float = 0.0,
+    target_latency_ms: Optional[float] = None,
 ) -> Callable:
     """Converts a function to asynchronously handle batches.
 
@@ -547,6 +756,15 @@ def batch(
     methods from the batch_handler (`set_max_batch_size` and
     `set_batch_wait_timeout_s`).
 
+    If `target_latency_ms` is set, the batch size and wait timeout are instead
+    chosen for each batch: Serve learns how long the function takes for
+    each batch size, and runs the largest batches (up to `max_batch_size`)
+    that are expected to complete each request within `target_latency_ms`
+    of when it was queued. `batch_wait_timeout_s` is ignored in this mode.
+
+    The sizes of the batches and the time to handle them are exported as the
+    `serve_batch_size` and `serve_batch_execution_time_ms` metrics.
+
     Example:
 
     .. code-block:: python
@@ -579,6 +797,9 @@ def batch(
             one call to the underlying function.
         batch_wait_timeout_s: the maximum duration to wait for
             `max_batch_size` elements before running the current batch.
+        target_latency_ms: the target time from when a request is queued
+            until the function returns its result. If set, the batch size and
+            wait timeout are adjusted to meet it.
     """
     # `_func` will be None in the case when the decorator is parametrized.
     # See the comment at the end of this function for a detailed explanation.
@@ -593,12 +814,14 @@ def batch(
 
     _validate_max_batch_size(max_batch_size)
     _validate_batch_wait_timeout_s(batch_wait_timeout_s)
+    _validate_target_latency_ms(target_latency_ms)
 
     def _batch_decorator(_func):
         lazy_batch_queue_wrapper = _LazyBatchQueueWrapper(
             max_batch_size,
             batch_wait_timeout_s,
             _func,
+            target_latency_ms,
         )
 
         async def batch_handler_generator(
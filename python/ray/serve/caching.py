@@ -0,0 +1,347 @@
+import asyncio
+import hashlib
+import inspect
+import logging
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import wraps
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional
+
+from starlette.requests import Request
+
+from ray import cloudpickle
+from ray.serve import metrics
+from ray.serve._private.constants import SERVE_LOGGER_NAME
+from ray.serve._private.utils import extract_self_if_method_call
+from ray.util.annotations import PublicAPI
+
+logger = logging.getLogger(SERVE_LOGGER_NAME)
+
+
+@dataclass
+class _CacheEntry:
+    value: Any
+    size_bytes: int
+    expires_at_s: float
+
+
+class _ResponseCache:
+    """A per-replica LRU cache of the results of a function, with a TTL.
+
+    Results are evicted in LRU order once there are more than `max_entries` of them
+    or their total size exceeds `max_size_bytes`. Concurrent calls with the same key
+    are coalesced into a single call of the function (single-flight), so a burst of
+    identical requests only computes the result once.
+
+    Cannot be pickled, so it must be constructed lazily inside the replica.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        ttl_s: Optional[float],
+        max_entries: int,
+        max_size_bytes: Optional[int],
+        get_curr_time_s: Optional[Callable[[], float]] = None,
+    ):
+        self._ttl_s = ttl_s
+        self._max_entries = max_entries
+        self._max_size_bytes = max_size_bytes
+        self._get_curr_time_s = (
+            get_curr_time_s if get_curr_time_s is not None else time.time
+        )
+
+        self._entries: "OrderedDict[Hashable, _CacheEntry]" = OrderedDict()
+        self._size_bytes = 0
+        # Calls of the function that are in progress, by key.
+        self._in_flight: Dict[Hashable, asyncio.Task] = {}
+
+        self.hits_counter = metrics.Counter(
+            "serve_response_cache_hits",
+            description=(
+                "The number of requests served from the response cache on the "
+                "current replica, including requests coalesced with an identical "
+                "request in flight."
+            ),
+            tag_keys=("function",),
+        )
+        self.hits_counter.set_default_tags({"function": name})
+        self.misses_counter = metrics.Counter(
+            "serve_response_cache_misses",
+            description=(
+                "The number of requests not found in the response cache on the "
+                "current replica."
+            ),
+            tag_keys=("function",),
+        )
+        self.misses_counter.set_default_tags({"function": name})
+        self.num_entries_gauge = metrics.Gauge(
+            "serve_response_cache_num_entries",
+            description="The number of results in the response cache.",
+            tag_keys=("function",),
+        )
+        self.num_entries_gauge.set_default_tags({"function": name})
+
+    @property
+    def num_entries(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size_bytes
+
+    def _get_size_bytes(self, value: Any) -> int:
+        if self._max_size_bytes is None:
+            return 0
+        elif isinstance(value, (bytes, bytearray, str)):
+            return len(value)
+
+        return len(cloudpickle.dumps(value))
+
+    def _pop(self, key: Hashable):
+        entry = self._entries.pop(key)
+        self._size_bytes -= entry.size_bytes
+
+    def get(self, key: Hashable) -> Optional[_CacheEntry]:
+        """Get the entry for the key, or `None` if there's none or it's expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        if entry.expires_at_s <= self._get_curr_time_s():
+            self._pop(key)
+            self.num_entries_gauge.set(len(self._entries))
+            return None
+
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: Hashable, value: Any):
+        """Insert or replace the result for the key, evicting LRU entries."""
+        size_bytes = self._get_size_bytes(value)
+        if self._max_size_bytes is not None and size_bytes > self._max_size_bytes:
+            logger.debug(
+                f"Not caching a result of {size_bytes} bytes, which is larger than "
+                f"the response cache (max_size_bytes={self._max_size_bytes})."
+            )
+            return
+
+        if key in self._entries:
+            self._pop(key)
+
+        expires_at_s = math.inf
+        if self._ttl_s is not None:
+            expires_at_s = self._get_curr_time_s() + self._ttl_s
+
+        self._entries[key] = _CacheEntry(value, size_bytes, expires_at_s)
+        self._size_bytes += size_bytes
+        while len(self._entries) > self._max_entries or (
+            self._max_size_bytes is not None and self._size_bytes > self._max_size_bytes
+        ):
+            self._pop(next(iter(self._entries)))
+
+        self.num_entries_gauge.set(len(self._entries))
+
+    async def _call_and_put(self, key: Hashable, func: Callable[[], Awaitable[Any]]):
+        try:
+            value = await func()
+            self.put(key, value)
+            return value
+        finally:
+            self._in_flight.pop(key, None)
+
+    async def get_or_call(
+        self, key: Hashable, func: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Get the cached result for the key, or call `func` to compute it.
+
+        If a call for the same key is already in progress, its result is awaited
+        instead. Calls are run in their own task, so that cancelling one of the
+        requests waiting for the result doesn't cancel the others. Exceptions aren't
+        cached.
+        """
+        entry = self.get(key)
+        if entry is not None:
+            self.hits_counter.inc()
+            return entry.value
+
+        task = self._in_flight.get(key)
+        if task is None:
+            self.misses_counter.inc()
+            task = asyncio.get_running_loop().create_task(self._call_and_put(key, func))
+            self._in_flight[key] = task
+        else:
+            self.hits_counter.inc()
+
+        return await asyncio.shield(task)
+
+
+async def _get_key_value(value: Any) -> Any:
+    """Get the value an argument is keyed on; HTTP requests are keyed on their
+    method, URL, headers, and body.
+    """
+    if isinstance(value, Request):
+        # Responses can depend on any header (e.g. Authorization, Accept, or Cookie),
+        # so all of them are part of the key. Starlette caches the body, so the
+        # function can still read it.
+        return (
+            value.method,
+            str(value.url),
+            sorted(value.headers.items()),
+            await value.body(),
+        )
+
+    return value
+
+
+def _validate_cache_args(
+    ttl_s: Optional[float],
+    max_entries: int,
+    max_size_bytes: Optional[int],
+):
+    if ttl_s is not None:
+        if not isinstance(ttl_s, (float, int)):
+            raise TypeError(f"ttl_s must be a float > 0 or None, got {ttl_s}")
+        if ttl_s <= 0:
+            raise ValueError(f"ttl_s must be a float > 0 or None, got {ttl_s}")
+
+    if not isinstance(max_entries, int):
+        raise TypeError(f"max_entries must be an integer >= 1, got {max_entries}")
+    if max_entries < 1:
+        raise ValueError(f"max_entries must be an integer >= 1, got {max_entries}")
+
+    if max_size_bytes is not None:
+        if not isinstance(max_size_bytes, int):
+            raise TypeError(
+                f"max_size_bytes must be an integer >= 1 or None, got {max_size_bytes}"
+            )
+        if max_size_bytes < 1:
+            raise ValueError(
+                f"max_size_bytes must be an integer >= 1 or None, got {max_size_bytes}"
+            )
+
+
+@PublicAPI(stability="alpha")
+def cache(
+    _func: Optional[Callable] = None,
+    /,
+    *,
+    key_args: Optional[List[str]] = None,
+    ttl_s: Optional[float] = 60.0,
+    max_entries: int = 1024,
+    max_size_bytes: Optional[int] = None,
+) -> Callable:
+    """Caches the results of a function or method in each replica.
+
+    Calls with the same arguments (or the same `key_args`) within `ttl_s` return the
+    cached result instead of calling the function again. Concurrent calls with the
+    same arguments are coalesced into a single call, whose result is returned to all
+    of them.
+
+    Arguments that are Starlette requests are compared by method, URL, headers, and
+    body, so decorating the `__call__` method of an HTTP deployment caches its
+    responses to identical HTTP requests. Requests that only differ by a header that
+    doesn't affect the response, e.g. a tracing header, aren't cached together; to
+    cache them together, key the cache on a function argument parsed from the
+    request instead. Other arguments are compared by their pickled value.
+
+    The function must be `async def`, and its results must be reusable: they're
+    returned to all callers with the same key without being copied, so they shouldn't
+    be modified by the callers. Exceptions aren't cached. Generators (streaming
+    responses) aren't supported.
+
+    The cache hits and misses are exported as the `serve_response_cache_hits` and
+    `serve_response_cache_misses` metrics.
+
+    Example:
+
+    .. code-block:: python
+
+            from ray import serve
+            from starlette.requests import Request
+
+            @serve.deployment
+            class Embedder:
+                @serve.cache(ttl_s=300, max_size_bytes=100 * 1024**2)
+                async def __call__(self, request: Request) -> List[float]:
+                    text = (await request.json())["text"]
+                    return self.model.embed(text)
+
+            app = Embedder.bind()
+
+    Arguments:
+        key_args: the names of the arguments to key the cache on. By default, the
+            cache is keyed on all arguments.
+        ttl_s: the time after which a cached result expires. If `None`, results only
+            expire when they're evicted.
+        max_entries: the maximum number of results to cache in each replica. Least
+            recently used results are evicted first.
+        max_size_bytes: the maximum total size of the results to cache in each
+            replica, as measured by their pickled size. Results larger than this
+            aren't cached. If `None`, the size of the cache isn't limited.
+    """
+    if _func is not None and not callable(_func):
+        raise TypeError(
+            "@serve.cache can only be used to decorate functions or methods."
+        )
+
+    _validate_cache_args(ttl_s, max_entries, max_size_bytes)
+
+    def _cache_decorator(_func):
+        if not inspect.iscoroutinefunction(_func):
+            raise TypeError("Functions decorated with @serve.cache must be 'async def'")
+
+        signature = inspect.signature(_func)
+        if key_args is not None:
+            unknown_args = set(key_args) - set(signature.parameters)
+            if unknown_args:
+                raise ValueError(
+                    f"key_args {sorted(unknown_args)} aren't arguments of "
+                    f"{_func.__qualname__}."
+                )
+
+        cache_attr = f"__serve_response_cache_{_func.__name__}"
+
+        async def get_key(bound_args: Dict[str, Any]) -> Hashable:
+            names = key_args if key_args is not None else list(bound_args)
+            key_values = [
+                (name, await _get_key_value(bound_args.get(name))) for name in names
+            ]
+            return hashlib.sha256(cloudpickle.dumps(key_values)).digest()
+
+        @wraps(_func)
+        async def cache_wrapper(*args, **kwargs):
+            # If the function is a method, the cache is stored in (and keyed on) the
+            # object it's called on.
+            self = extract_self_if_method_call(args, _func)
+            cache_object = cache_wrapper if self is None else self
+            response_cache: Optional[_ResponseCache] = getattr(
+                cache_object, cache_attr, None
+            )
+            if response_cache is None:
+                response_cache = _ResponseCache(
+                    _func.__qualname__,
+                    ttl_s=ttl_s,
+                    max_entries=max_entries,
+                    max_size_bytes=max_size_bytes,
+                )
+                setattr(cache_object, cache_attr, response_cache)
+
+            bound_args = signature.bind(*args, **kwargs)
+            bound_args.apply_defaults()
+            arguments = dict(bound_args.arguments)
+            if self is not None:
+                arguments.pop(next(iter(signature.parameters)))
+
+            return await response_cache.get_or_call(
+                await get_key(arguments), lambda: _func(*args, **kwargs)
+            )
+
+        return cache_wrapper
+
+    # Handle both non-parametrized (@serve.cache) and parametrized
+    # (@serve.cache(**kwargs)) usage. See the comment at the end of `serve.batch`.
+    return _cache_decorator(_func) if callable(_func) else _cache_decorator
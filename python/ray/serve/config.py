@@ -108,7 +108,14 @@ class AutoscalingConfig(BaseModel):
         return max_replicas
 
     def __init__(self, **kwargs):
+        # Private attributes aren't set from the keyword arguments by pydantic.
+        policy = kwargs.pop("_policy", None)
+        serialized_policy_def = kwargs.pop("_serialized_policy_def", None)
         super().__init__(**kwargs)
+        if policy:
+            self._policy = policy
+        if serialized_policy_def:
+            self._serialized_policy_def = serialized_policy_def
         self.serialize_policy()
 
     def serialize_policy(self) -> None:
@@ -117,18 +124,21 @@ class AutoscalingConfig(BaseModel):
         Import the policy if it's passed in as a string import path. Then cloudpickle
         the policy and set `serialized_policy_def` if it's empty.
         """
-        values = self.dict()
-        policy = values.get("_policy")
-        if isinstance(policy, Callable):
-            policy = f"{policy.__module__}.{policy.__name__}"
-
+        policy = self._policy
         if not policy:
             policy = DEFAULT_AUTOSCALING_POLICY
 
-        policy_path = policy
-        policy = import_attr(policy)
+        if isinstance(policy, str):
+            policy_path = policy
+            if not self._serialized_policy_def:
+                policy = import_attr(policy)
+        else:
+            # Policies can also be callable objects, such as a configured
+            # `PredictiveAutoscalingPolicy`, which don't have a `__name__`.
+            policy_name = getattr(policy, "__name__", type(policy).__name__)
+            policy_path = f"{policy.__module__}.{policy_name}"
 
-        if not values.get("_serialized_policy_def"):
+        if not self._serialized_policy_def:
             self._serialized_policy_def = cloudpickle.dumps(policy)
         self._policy = policy_path
 
@@ -15,6 +15,7 @@ from ray.serve._private.constants import (
     DEFAULT_UVICORN_KEEP_ALIVE_TIMEOUT_S,
     SERVE_NAMESPACE,
 )
+from ray.serve._private.http_util import MessageQueue
 from ray.serve._private.proxy import (
     DRAINING_MESSAGE,
     HEALTHY_MESSAGE,
@@ -627,6 +628,53 @@ class TestHTTPProxy:
 
         queue.close.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_proxy_asgi_receive_body_backpressure(self):
+        """Test HTTPProxy proxy_asgi_receive stops receiving the body when the queue
+        is full, and receives a disconnect once the body is complete, even if the
+        replica never receives the body."""
+        http_proxy = self.create_http_proxy()
+        receive = AsyncMock()
+        receive.side_effect = [
+            {"type": "http.request", "body": b"a" * 10, "more_body": True},
+            {"type": "http.request", "body": b"a" * 10, "more_body": False},
+            {"type": "http.disconnect"},
+        ]
+        queue = MessageQueue(max_buffered_bytes=10)
+        receive_task = asyncio.get_running_loop().create_task(
+            http_proxy.proxy_asgi_receive(receive=receive, queue=queue)
+        )
+
+        # The rest of the body isn't received until the buffered body is fetched.
+        await asyncio.sleep(0.01)
+        assert receive.await_count == 1
+        assert len(queue.get_messages_nowait()) == 1
+
+        # The last body message is over the limit, but the disconnect is received.
+        assert await asyncio.wait_for(receive_task, 1) is None
+        assert queue.num_buffered_bytes == 10
+
+    @pytest.mark.asyncio
+    async def test_proxy_asgi_receive_websocket_never_received(self):
+        """Test HTTPProxy proxy_asgi_receive receives a websocket disconnect, even if
+        the replica never receives the buffered messages."""
+        http_proxy = self.create_http_proxy()
+        receive = AsyncMock()
+        receive.side_effect = [
+            {"type": "websocket.connect"},
+            {"type": "websocket.receive", "bytes": b"a" * 10},
+            {"type": "websocket.receive", "bytes": b"a" * 10},
+            {"type": "websocket.disconnect", "code": 1001},
+        ]
+        queue = MessageQueue(max_buffered_bytes=10)
+        assert (
+            await asyncio.wait_for(
+                http_proxy.proxy_asgi_receive(receive=receive, queue=queue), 1
+            )
+            == 1001
+        )
+        assert queue.num_buffered_bytes == 20
+
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
         "disconnect",
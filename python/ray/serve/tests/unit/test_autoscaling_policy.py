@@ -4,8 +4,11 @@ import pytest
 
 from ray.serve._private.constants import CONTROL_LOOP_INTERVAL_S
 from ray.serve.autoscaling_policy import (
+    PredictiveAutoscalingPolicy,
     _calculate_desired_num_replicas,
+    _HoltWintersForecaster,
     replica_queue_length_autoscaling_policy,
+    simulate_autoscaling_policy,
 )
 from ray.serve.config import AutoscalingConfig
 
@@ -741,5 +744,106 @@ class TestReplicaQueueLengthPolicy:
         assert new_num_replicas == ongoing_requests / target_requests
 
 
+class TestPredictiveAutoscalingPolicy:
+    def test_forecast_trend(self):
+        forecaster = _HoltWintersForecaster(
+            season_length=0,
+            level_smoothing=0.5,
+            trend_smoothing=0.1,
+            seasonal_smoothing=0.1,
+        )
+        assert forecaster.forecast(10) == 0
+
+        for i in range(200):
+            forecaster.observe(3 * i)
+
+        assert forecaster.forecast(0) == pytest.approx(597)
+        assert forecaster.forecast(5) == pytest.approx(612)
+
+    def test_forecast_seasonality(self):
+        forecaster = _HoltWintersForecaster(
+            season_length=4,
+            level_smoothing=0.2,
+            trend_smoothing=0.05,
+            seasonal_smoothing=0.3,
+        )
+        season = [10, 20, 30, 20]
+        for i in range(400):
+            forecaster.observe(season[i % 4])
+
+        forecasts = [forecaster.forecast(i) for i in range(1, 9)]
+        assert forecasts == pytest.approx(season * 2, abs=0.1)
+
+    def test_invalid_parameters(self):
+        with pytest.raises(ValueError, match="season_period_s"):
+            PredictiveAutoscalingPolicy(season_period_s=0)
+
+        with pytest.raises(ValueError, match="replica_startup_s"):
+            PredictiveAutoscalingPolicy(replica_startup_s=-1)
+
+        with pytest.raises(ValueError, match="level_smoothing"):
+            PredictiveAutoscalingPolicy(level_smoothing=1.5)
+
+    def test_scales_ahead_of_ramp(self):
+        """The predictive policy scales up earlier than the default policy when the
+        traffic ramps up, so the deployment is underprovisioned for less time.
+        """
+        config = AutoscalingConfig(
+            min_replicas=1,
+            max_replicas=100,
+            target_ongoing_requests=2,
+            upscale_delay_s=30,
+        )
+        # Ramp up for 20 minutes, then stay at the peak for 10 minutes.
+        request_rates = [1 + 3 * i for i in range(20)] + [60] * 10
+
+        default_result = simulate_autoscaling_policy(
+            replica_queue_length_autoscaling_policy, config, request_rates
+        )
+        predictive_result = simulate_autoscaling_policy(
+            PredictiveAutoscalingPolicy(season_period_s=None),
+            config,
+            request_rates,
+        )
+
+        assert (
+            predictive_result.underprovisioned_s < default_result.underprovisioned_s / 2
+        )
+
+        # The predictive policy reaches 20 replicas at least 30 seconds earlier.
+        def time_to_20_replicas_s(result):
+            for timestamp_s, num_replicas in zip(
+                result.timestamps_s, result.target_num_replicas
+            ):
+                if num_replicas >= 20:
+                    return timestamp_s
+
+        assert time_to_20_replicas_s(predictive_result) + 30 <= time_to_20_replicas_s(
+            default_result
+        )
+        # Both settle at the number of replicas needed for the peak traffic.
+        assert default_result.num_running_replicas[-1] == 30
+        assert 30 <= predictive_result.num_running_replicas[-1] <= 33
+
+    def test_doesnt_scale_down_below_current_traffic(self):
+        config = AutoscalingConfig(
+            min_replicas=1,
+            max_replicas=100,
+            target_ongoing_requests=2,
+            upscale_delay_s=0,
+            downscale_delay_s=0,
+        )
+        # Ramp down from 60 requests per second.
+        request_rates = [60 - 3 * i for i in range(20)]
+
+        result = simulate_autoscaling_policy(
+            PredictiveAutoscalingPolicy(season_period_s=None),
+            config,
+            request_rates,
+            initial_replicas=30,
+        )
+        assert result.underprovisioned_s == 0
+
+
 if __name__ == "__main__":
     sys.exit(pytest.main(["-v", "-s", __file__]))
@@ -11,7 +11,7 @@ from ray._private.utils import get_or_create_event_loop
 from ray.serve._private.common import DeploymentID, ReplicaID
 from ray.serve._private.config import DeploymentConfig
 from ray.serve._private.constants import SERVE_LOGGER_NAME
-from ray.serve.batching import _BatchQueue
+from ray.serve.batching import _BatchLatencyModel, _BatchQueue, _SingleRequest
 from ray.serve.exceptions import RayServeException
 
 # Setup the global replica context for the test.
@@ -119,6 +119,25 @@ async def test_decorator_validation():
             async def method(self, requests):
                 pass
 
+    class TargetLatency:
+        @serve.batch(target_latency_ms=100)
+        async def method(self, requests):
+            pass
+
+    with pytest.raises(ValueError):
+
+        class ZeroTargetLatency:
+            @serve.batch(target_latency_ms=0)
+            async def method(self, requests):
+                pass
+
+    with pytest.raises(TypeError):
+
+        class NonTargetLatency:
+            @serve.batch(target_latency_ms="a")
+            async def method(self, requests):
+                pass
+
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize("use_class", [True, False])
@@ -845,6 +864,115 @@ def test_warn_if_max_batch_size_exceeds_max_ongoing_requests():
         stream.reset_message()
 
 
+def test_batch_latency_model():
+    model = _BatchLatencyModel()
+    assert model.predict(1) is None
+    assert model.get_max_batch_size(1.0, 32) == 32
+
+    # Until different batch sizes are observed, latency is proportional to size.
+    model.record(2, 0.02)
+    assert model.predict(4) == pytest.approx(0.04)
+    assert model.get_max_batch_size(0.05, 32) == 5
+
+    # The fixed and per-request latency are learned from different batch sizes.
+    for _ in range(50):
+        for batch_size in [1, 4, 8]:
+            model.record(batch_size, 0.01 + 0.001 * batch_size)
+    assert model.predict(16) == pytest.approx(0.026, rel=0.05)
+    assert model.get_max_batch_size(0.03, 32) in [19, 20, 21]
+    assert model.get_max_batch_size(0.005, 32) == 1
+    assert model.get_max_batch_size(1.0, 32) == 32
+
+
+@pytest.mark.asyncio
+async def test_adaptive_batch_params():
+    queue = _BatchQueue(
+        max_batch_size=32, batch_wait_timeout_s=1000, target_latency_ms=100
+    )
+
+    def fake_request(enqueued_at_s: float) -> _SingleRequest:
+        return _SingleRequest(None, [], None, enqueued_at_s)
+
+    # The first batch is run right away.
+    assert queue._get_adaptive_batch_params(fake_request(time.time())) == (32, 0)
+
+    # Batches are limited to half the target latency: 10ms + 2ms per request.
+    for batch_size in [1, 2, 4, 8]:
+        queue._latency_model.record(batch_size, 0.01 + 0.002 * batch_size)
+    queue._arrival_interval_s = 0.001
+    max_batch_size, timeout_s = queue._get_adaptive_batch_params(
+        fake_request(time.time())
+    )
+    assert max_batch_size in [19, 20]
+
+    # The timeout is the time it takes to fill the batch at the request rate...
+    assert timeout_s == pytest.approx((max_batch_size - 1) * 0.001, abs=0.001)
+
+    # ...but no longer than the rest of the target latency.
+    queue._arrival_interval_s = 1.0
+    _, timeout_s = queue._get_adaptive_batch_params(fake_request(time.time()))
+    assert timeout_s == pytest.approx(0.1 - 0.05, abs=0.005)
+
+    # Requests that have been queued for longer than the target are run right away.
+    _, timeout_s = queue._get_adaptive_batch_params(fake_request(time.time() - 1))
+    assert timeout_s == 0
+
+
+@pytest.mark.asyncio
+async def test_batch_target_latency():
+    batch_sizes = []
+
+    @serve.batch(max_batch_size=8, target_latency_ms=1000)
+    async def func(requests):
+        batch_sizes.append(len(requests))
+        await asyncio.sleep(0.01)
+        return requests
+
+    # All requests are handled, and queued requests are batched together.
+    for _ in range(3):
+        tasks = [get_or_create_event_loop().create_task(func(i)) for i in range(20)]
+        assert await asyncio.gather(*tasks) == list(range(20))
+
+    assert sum(batch_sizes) == 60
+    assert max(batch_sizes) == 8
+
+
+def test_batch_latency_model_explores_fixed_cost():
+    # A handler that takes 50ms + 1ms per request, with a target of 200ms, should
+    # run batches of about 50 requests, even if it only saw batches of 1 so far.
+    model = _BatchLatencyModel()
+    model.record(1, 0.051)
+    for _ in range(10):
+        batch_size = model.get_max_batch_size(0.1, 64)
+        model.record(batch_size, 0.05 + 0.001 * batch_size)
+    assert batch_size in [49, 50]
+
+    # Batches that already take as long as allowed aren't explored.
+    model = _BatchLatencyModel()
+    model.record(4, 0.1)
+    assert model.get_max_batch_size(0.1, 64) == 4
+
+
+@pytest.mark.asyncio
+async def test_batch_target_latency_fixed_cost():
+    batch_sizes = []
+
+    @serve.batch(max_batch_size=64, target_latency_ms=200)
+    async def func(requests):
+        batch_sizes.append(len(requests))
+        await asyncio.sleep(0.05 + 0.001 * len(requests))
+        return requests
+
+    # The first batch only has one request.
+    assert await func(0) == 0
+
+    # The queue is saturated, so the batches grow to the largest size that runs
+    # within half the target latency.
+    tasks = [get_or_create_event_loop().create_task(func(i)) for i in range(500)]
+    assert await asyncio.gather(*tasks) == list(range(500))
+    assert max(batch_sizes) >= 40
+
+
 if __name__ == "__main__":
     import sys
 
@@ -0,0 +1,202 @@
+import asyncio
+import sys
+from typing import List, Optional, Tuple
+
+import pytest
+from starlette.requests import Request
+
+import ray
+from ray import serve
+from ray._private.utils import get_or_create_event_loop
+from ray.serve._private.common import DeploymentID, ReplicaID
+from ray.serve._private.config import DeploymentConfig
+from ray.serve._private.test_utils import MockTimer
+from ray.serve.caching import _ResponseCache
+
+# Setup the global replica context for the test.
+ray.serve.context._set_internal_replica_context(
+    replica_id=ReplicaID(unique_id="test", deployment_id=DeploymentID(name="test")),
+    servable_object=None,
+    _deployment_config=DeploymentConfig(),
+)
+
+
+# We use a single event loop for the entire test session. Without this
+# fixture, the event loop is sometimes prematurely terminated by pytest.
+@pytest.fixture(scope="session")
+def event_loop():
+    loop = get_or_create_event_loop()
+    yield loop
+    loop.close()
+
+
+def fake_request(
+    body: bytes, path: str = "/", headers: Optional[List[Tuple[bytes, bytes]]] = None
+) -> Request:
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": path,
+        "query_string": b"",
+        "headers": headers or [],
+    }
+    return Request(scope, receive)
+
+
+def test_decorator_validation():
+    def sync_function():
+        pass
+
+    with pytest.raises(TypeError, match="async def"):
+        serve.cache(sync_function)
+
+    with pytest.raises(TypeError, match="async def"):
+        serve.cache(ttl_s=10)(sync_function)
+
+    with pytest.raises(ValueError, match="ttl_s"):
+        serve.cache(ttl_s=0)
+
+    with pytest.raises(ValueError, match="max_entries"):
+        serve.cache(max_entries=0)
+
+    with pytest.raises(TypeError, match="max_size_bytes"):
+        serve.cache(max_size_bytes=1.5)
+
+    with pytest.raises(ValueError, match="key_args"):
+
+        @serve.cache(key_args=["y"])
+        async def function(x):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_cache_ttl_and_lru():
+    timer = MockTimer()
+    cache = _ResponseCache(
+        "test", ttl_s=10, max_entries=2, max_size_bytes=None, get_curr_time_s=timer.time
+    )
+
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a").value == 1
+
+    # "b" is the least recently used entry, so it's evicted.
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a").value == 1
+    assert cache.get("c").value == 3
+
+    # Entries expire after the TTL.
+    timer.advance(11)
+    assert cache.get("a") is None
+    assert cache.num_entries == 1
+    assert cache.get("c") is None
+    assert cache.num_entries == 0
+
+
+@pytest.mark.asyncio
+async def test_cache_max_size_bytes():
+    cache = _ResponseCache("test", ttl_s=None, max_entries=10, max_size_bytes=10)
+
+    cache.put("a", b"x" * 4)
+    cache.put("b", b"x" * 4)
+    assert cache.size_bytes == 8
+
+    # Adding "c" exceeds the size, so "a" is evicted.
+    cache.put("c", b"x" * 4)
+    assert cache.get("a") is None
+    assert cache.size_bytes == 8
+
+    # Results that are larger than the cache aren't cached.
+    cache.put("d", b"x" * 11)
+    assert cache.get("d") is None
+    assert cache.get("b") is not None
+    assert cache.get("c") is not None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("use_class", [True, False])
+async def test_cache_coalesces_concurrent_calls(use_class):
+    num_calls = 0
+    event = asyncio.Event()
+
+    async def func(x: int, y: int = 0) -> int:
+        nonlocal num_calls
+        num_calls += 1
+        await event.wait()
+        return x + y
+
+    if use_class:
+
+        class Class:
+            @serve.cache
+            async def method(self, x: int, y: int = 0) -> int:
+                return await func(x, y)
+
+        cached_func = Class().method
+    else:
+        cached_func = serve.cache(func)
+
+    tasks = [get_or_create_event_loop().create_task(cached_func(1)) for _ in range(5)]
+    tasks.append(get_or_create_event_loop().create_task(cached_func(1, y=1)))
+    await asyncio.sleep(0.01)
+    assert num_calls == 2
+
+    event.set()
+    assert await asyncio.gather(*tasks) == [1] * 5 + [2]
+
+    # The result is cached, including when the default argument is passed.
+    assert await cached_func(1, 0) == 1
+    assert num_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_exceptions_not_cached():
+    num_calls = 0
+
+    @serve.cache
+    async def func(x: int):
+        nonlocal num_calls
+        num_calls += 1
+        if num_calls == 1:
+            raise ValueError("oops")
+        return x
+
+    with pytest.raises(ValueError, match="oops"):
+        await func(1)
+
+    assert await func(1) == 1
+    assert await func(1) == 1
+    assert num_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_key_args_and_requests():
+    num_calls = 0
+
+    @serve.cache(key_args=["request"])
+    async def func(request: Request, request_id: str):
+        nonlocal num_calls
+        num_calls += 1
+        return (await request.body()).decode()
+
+    assert await func(fake_request(b"hello"), "1") == "hello"
+    assert await func(fake_request(b"hello"), "2") == "hello"
+    assert num_calls == 1
+
+    # Requests with different bodies, paths, or headers have different keys.
+    assert await func(fake_request(b"world"), "3") == "world"
+    assert await func(fake_request(b"hello", path="/other"), "4") == "hello"
+    assert num_calls == 3
+    headers = [(b"authorization", b"Bearer token")]
+    assert await func(fake_request(b"hello", headers=headers), "5") == "hello"
+    assert num_calls == 4
+    assert await func(fake_request(b"hello", headers=headers), "6") == "hello"
+    assert num_calls == 4
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(["-v", "-s", __file__]))
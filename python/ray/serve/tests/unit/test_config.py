@@ -6,7 +6,10 @@ from ray._private.utils import import_attr
 from ray.serve._private.config import DeploymentConfig, ReplicaConfig, _proto_to_dict
 from ray.serve._private.constants import DEFAULT_AUTOSCALING_POLICY, DEFAULT_GRPC_PORT
 from ray.serve._private.utils import DEFAULT
-from ray.serve.autoscaling_policy import default_autoscaling_policy
+from ray.serve.autoscaling_policy import (
+    PredictiveAutoscalingPolicy,
+    default_autoscaling_policy,
+)
 from ray.serve.config import (
     AutoscalingConfig,
     DeploymentMode,
@@ -702,9 +705,31 @@ def test_autoscaling_policy_serializations(policy):
         config.to_proto_bytes()
     ).autoscaling_config.get_policy()
 
-    # Right now we don't allow modifying the autoscaling policy, so this will always
-    # be the default autoscaling policy
-    assert deserialized_autoscaling_policy == default_autoscaling_policy
+    if policy:
+        assert deserialized_autoscaling_policy() == fake_policy_return_value
+    else:
+        assert deserialized_autoscaling_policy == default_autoscaling_policy
+
+
+def test_autoscaling_policy_callable_object():
+    """Test that a callable object can be used as the autoscaling policy."""
+    policy = PredictiveAutoscalingPolicy(replica_startup_s=60)
+    autoscaling_config = AutoscalingConfig(_policy=policy)
+    assert autoscaling_config._policy == (
+        "ray.serve.autoscaling_policy.PredictiveAutoscalingPolicy"
+    )
+
+    config = DeploymentConfig.from_default(autoscaling_config=autoscaling_config)
+    deserialized_autoscaling_policy = DeploymentConfig.from_proto_bytes(
+        config.to_proto_bytes()
+    ).autoscaling_config.get_policy()
+    assert isinstance(deserialized_autoscaling_policy, PredictiveAutoscalingPolicy)
+    assert deserialized_autoscaling_policy.replica_startup_s == 60
+
+    autoscaling_config = AutoscalingConfig(
+        _policy="ray.serve.autoscaling_policy:predictive_autoscaling_policy"
+    )
+    assert isinstance(autoscaling_config.get_policy(), PredictiveAutoscalingPolicy)
 
 
 def test_autoscaling_policy_import_fails_for_non_existing_policy():
@@ -713,9 +738,9 @@ def test_autoscaling_policy_import_fails_for_non_existing_policy():
     This test will ensure non-existing policy will be caught. It can happen when we
     moved the default policy or when user pass in a non-existing policy.
     """
-    # Right now we don't allow modifying the autoscaling policy, so this will not fail
     policy = "i.dont.exist:fake_policy"
-    AutoscalingConfig(_policy=policy)
+    with pytest.raises(ModuleNotFoundError):
+        AutoscalingConfig(_policy=policy)
 
 
 def test_default_autoscaling_policy_import_path():
@@ -64,6 +64,49 @@ async def test_message_queue():
         assert queue.get_messages_nowait() == []
 
 
+@pytest.mark.asyncio
+async def test_message_queue_max_buffered_bytes():
+    queue = MessageQueue(max_buffered_bytes=10)
+    await asyncio.wait_for(queue.wait_for_capacity(), 0.001)
+
+    # Messages without a payload don't count towards the limit.
+    await queue({"type": "http.request.start"})
+    await queue({"type": "http.request", "body": b"x" * 6, "more_body": True})
+    assert queue.num_buffered_bytes == 6
+    await asyncio.wait_for(queue.wait_for_capacity(), 0.001)
+
+    # Once the limit is reached, wait_for_capacity hangs until messages are fetched.
+    await queue({"type": "http.request", "body": b"x" * 6, "more_body": True})
+    assert queue.num_buffered_bytes == 12
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(queue.wait_for_capacity(), 0.001)
+
+    # Fetching is limited to max_bytes, but returns at least one message.
+    assert len(queue.get_messages_nowait(max_bytes=4)) == 1
+    assert queue.num_buffered_bytes == 12
+    messages = queue.get_messages_nowait(max_bytes=8)
+    assert [len(m["body"]) for m in messages] == [6]
+    assert queue.num_buffered_bytes == 6
+    await asyncio.wait_for(queue.wait_for_capacity(), 0.001)
+    await asyncio.wait_for(queue.wait_for_message(), 0.001)
+
+    await queue({"type": "http.request", "body": b"x" * 6, "more_body": False})
+    waiting_task = asyncio.get_running_loop().create_task(queue.wait_for_capacity())
+    await asyncio.sleep(0.001)
+    assert not waiting_task.done()
+
+    assert len(queue.get_messages_nowait()) == 2
+    assert queue.num_buffered_bytes == 0
+    await waiting_task
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(queue.wait_for_message(), 0.001)
+
+    # Once the queue is closed, wait_for_capacity returns immediately.
+    await queue({"type": "websocket.receive", "bytes": b"x" * 20})
+    queue.close()
+    await asyncio.wait_for(queue.wait_for_capacity(), 0.001)
+
+
 @pytest.fixture
 @pytest.mark.asyncio
 def setup_receive_proxy(
@@ -160,6 +203,69 @@ class TestASGIReceiveProxy:
                     "code": 1005,
                 }
 
+    async def test_fetches_messages_once_received(self):
+        num_fetches = 0
+
+        async def receive_asgi_messages(request_id: str) -> bytes:
+            nonlocal num_fetches
+            num_fetches += 1
+            return pickle.dumps(
+                [{"type": "http.request", "body": b"x", "more_body": True}]
+            )
+
+        loop = get_or_create_event_loop()
+        asgi_receive_proxy = ASGIReceiveProxy(
+            {"type": "http"}, "", receive_asgi_messages
+        )
+        receiver_task = loop.create_task(asgi_receive_proxy.fetch_until_disconnect())
+
+        try:
+            # Messages aren't fetched ahead of the app receiving them.
+            await asyncio.sleep(0.01)
+            assert num_fetches == 1
+            for i in range(10):
+                assert (await asgi_receive_proxy())["body"] == b"x"
+                await asyncio.sleep(0.001)
+                assert num_fetches == i + 2
+            assert asgi_receive_proxy._queue.qsize() == 1
+        finally:
+            receiver_task.cancel()
+
+    @pytest.mark.parametrize(
+        "scope_type,messages",
+        [
+            (
+                "http",
+                [
+                    {"type": "http.request", "body": b"x", "more_body": False},
+                    {"type": "http.disconnect"},
+                ],
+            ),
+            (
+                "websocket",
+                [
+                    {"type": "websocket.connect"},
+                    {"type": "websocket.receive", "bytes": b"x"},
+                    {"type": "websocket.disconnect", "code": 1001},
+                ],
+            ),
+        ],
+    )
+    async def test_fetches_disconnect_without_receiving(self, scope_type, messages):
+        # Once the request body is complete, and for websockets, messages are fetched
+        # until the disconnect, even if the app doesn't receive them.
+        remaining_messages = list(messages)
+
+        async def receive_asgi_messages(request_id: str) -> bytes:
+            return pickle.dumps([remaining_messages.pop(0)])
+
+        asgi_receive_proxy = ASGIReceiveProxy(
+            {"type": scope_type}, "", receive_asgi_messages
+        )
+        await asyncio.wait_for(asgi_receive_proxy.fetch_until_disconnect(), 1)
+        for message in messages:
+            assert await asgi_receive_proxy() == message
+
     async def test_receive_asgi_messages_raises(self):
         async def receive_asgi_messages(request_id: str) -> bytes:
             raise RuntimeError("maybe actor crashed")
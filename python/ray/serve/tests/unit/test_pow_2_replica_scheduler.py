@@ -16,10 +16,14 @@ from ray.exceptions import ActorDiedError, ActorUnavailableError
 from ray.serve._private.common import DeploymentID, ReplicaID, RequestMetadata
 from ray.serve._private.constants import RAY_SERVE_QUEUE_LENGTH_CACHE_TIMEOUT_S
 from ray.serve._private.replica_scheduler import (
+    LatencyAwareReplicaScheduler,
     PendingRequest,
     PowerOfTwoChoicesReplicaScheduler,
     ReplicaWrapper,
 )
+from ray.serve._private.replica_scheduler.latency_aware_scheduler import (
+    ReplicaLatencyStats,
+)
 from ray.serve._private.replica_scheduler.pow_2_scheduler import ReplicaQueueLengthCache
 from ray.serve._private.test_utils import MockTimer
 
@@ -123,7 +127,11 @@ def pow_2_scheduler(request) -> PowerOfTwoChoicesReplicaScheduler:
     # In order to prevent issues like https://github.com/ray-project/ray/issues/40631,
     # construct the scheduler on a different loop to mimic the deployment handle path.
     async def construct_scheduler(loop: asyncio.AbstractEventLoop):
-        return PowerOfTwoChoicesReplicaScheduler(
+        if request.param.get("latency_aware", False):
+            scheduler_cls = LatencyAwareReplicaScheduler
+        else:
+            scheduler_cls = PowerOfTwoChoicesReplicaScheduler
+        return scheduler_cls(
             loop,
             DeploymentID(name="TEST_DEPLOYMENT"),
             prefer_local_node_routing=request.param.get("prefer_local_node", False),
@@ -1706,5 +1714,125 @@ async def test_replicas_actor_unavailable_error(
         assert (await s.choose_replica_for_request(fake_pending_request())) == r1
 
 
+@pytest.mark.asyncio
+async def test_replica_latency_stats():
+    TIMER.reset()
+
+    decay_s = 10.0
+    stats = ReplicaLatencyStats(
+        ewma_alpha=0.5, decay_s=decay_s, get_curr_time_s=TIMER.time
+    )
+
+    d_id = DeploymentID(name="TEST_DEPLOYMENT")
+    replica_id_1 = ReplicaID("r1", deployment_id=d_id)
+    replica_id_2 = ReplicaID("r2", deployment_id=d_id)
+
+    # No replica has responded yet.
+    assert stats.get_latency_s(replica_id_1) is None
+    assert stats.get_error_rate(replica_id_1) == 0
+
+    # Requests in flight are counted until they complete.
+    stats.on_request_sent(replica_id_1)
+    stats.on_request_sent(replica_id_1)
+    assert stats.get_num_in_flight(replica_id_1) == 2
+    stats.on_request_completed(replica_id_1, 1.0, failed=False)
+    assert stats.get_num_in_flight(replica_id_1) == 1
+
+    # Latencies are exponentially weighted, and failures only count as errors.
+    stats.on_request_completed(replica_id_1, 3.0, failed=False)
+    assert stats.get_latency_s(replica_id_1) == pytest.approx(2.0)
+    stats.on_request_completed(replica_id_1, 0.0, failed=True)
+    assert stats.get_latency_s(replica_id_1) == pytest.approx(2.0)
+    assert stats.get_error_rate(replica_id_1) == pytest.approx(0.5)
+    assert stats.get_num_in_flight(replica_id_1) == 0
+
+    # Replicas without responses are expected to have the average latency.
+    stats.on_request_completed(replica_id_2, 1.0, failed=False)
+    assert stats.get_latency_s(ReplicaID("r3", deployment_id=d_id)) == pytest.approx(
+        1.5
+    )
+
+    # Stats decay toward the average over time.
+    TIMER.advance(100 * decay_s)
+    assert stats.get_latency_s(replica_id_1) == pytest.approx(1.5)
+    assert stats.get_error_rate(replica_id_1) == pytest.approx(0)
+
+    stats.remove_inactive_replicas(active_replica_ids={replica_id_2})
+    assert stats.get_latency_s(replica_id_1) == pytest.approx(1.0)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "pow_2_scheduler",
+    [
+        {"latency_aware": True},
+        {"latency_aware": True, "use_replica_queue_len_cache": True},
+    ],
+    indirect=True,
+)
+async def test_latency_aware_choose_lower_completion_time(pow_2_scheduler):
+    """
+    The replica with the lowest expected completion time is chosen, even if it has a
+    longer queue.
+    """
+    s = pow_2_scheduler
+
+    r1 = FakeReplicaWrapper("r1")
+    r1.set_queue_len_response(0)
+    r2 = FakeReplicaWrapper("r2")
+    r2.set_queue_len_response(1)
+    s.update_replicas([r1, r2])
+
+    # Without latency stats, the shorter queue is chosen.
+    assert (await s.choose_replica_for_request(fake_pending_request())) == r1
+
+    s.on_request_completed(r1.replica_id, 1.0, failed=False)
+    s.on_request_completed(r2.replica_id, 0.1, failed=False)
+    for _ in range(10):
+        assert (await s.choose_replica_for_request(fake_pending_request())) == r2
+
+    # Replicas that fail often are avoided.
+    for _ in range(20):
+        s.on_request_completed(r2.replica_id, 0.1, failed=True)
+    for _ in range(10):
+        assert (await s.choose_replica_for_request(fake_pending_request())) == r1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "pow_2_scheduler",
+    [
+        {"latency_aware": True, "use_replica_queue_len_cache": True},
+    ],
+    indirect=True,
+)
+async def test_latency_aware_counts_requests_in_flight(pow_2_scheduler):
+    """
+    Replicas with fresh queue lengths in the cache aren't probed, but the requests
+    sent to them since then count toward their queue length.
+    """
+    s = pow_2_scheduler
+
+    r1 = FakeReplicaWrapper("r1")
+    r2 = FakeReplicaWrapper("r2")
+    s.update_replicas([r1, r2])
+    s.replica_queue_len_cache.update(r1.replica_id, 0)
+    s.replica_queue_len_cache.update(r2.replica_id, 1)
+
+    assert (await s.choose_replica_for_request(fake_pending_request())) == r1
+    s.on_request_sent(r1.replica_id)
+    s.on_request_sent(r1.replica_id)
+    assert (await s.choose_replica_for_request(fake_pending_request())) == r2
+
+    # Replicas with as many requests in flight as `max_ongoing_requests` are full.
+    for _ in range(DEFAULT_MAX_ONGOING_REQUESTS):
+        s.on_request_sent(r2.replica_id)
+    s.on_request_completed(r1.replica_id, 0.1, failed=False)
+    assert (await s.choose_replica_for_request(fake_pending_request())) == r1
+
+    assert r1.num_get_queue_len_calls == 0
+    assert r2.num_get_queue_len_calls == 0
+
+
 if __name__ == "__main__":
     sys.exit(pytest.main(["-v", "-s", __file__]))
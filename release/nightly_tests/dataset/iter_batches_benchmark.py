@@ -96,6 +96,19 @@ def run_iter_batches_benchmark(benchmark: Benchmark):
                     local_shuffle_buffer_size=shuffle_buffer_size,
                 )
 
+    # Test local shuffle with large buffer sizes, where the buffer spans several
+    # blocks.
+    for shuffle_buffer_size in [1024 * 1024, 2 * 1024 * 1024, 4 * 1024 * 1024]:
+        test_name = f"iter-batches-shuffle-large-buffer-{shuffle_buffer_size}"
+        benchmark.run_materialize_ds(
+            test_name,
+            iter_batches,
+            ds=ds,
+            batch_size=4 * 1024,
+            batch_format="numpy",
+            local_shuffle_buffer_size=shuffle_buffer_size,
+        )
+
     # Test block concatnation to create batches.
     # Total number of rows: 8,759,874
     # Avg rows per block: 17,108